@@ -0,0 +1,123 @@
+"""Helpers shared by the benchmark scripts: sample files, IFC file opening,
+timing and memory measures of a legacy code path versus the current one.
+
+Benchmark scripts are run from the repository root
+(`python benchmarks/bench_*.py`), which puts this directory first in
+`sys.path`: they import this module as `_common`.
+"""
+
+import gc
+from pathlib import Path
+import sys
+import timeit
+import tracemalloc
+
+import ifcopenshell
+
+from ifc_datareader.schema import get_schema
+
+
+SAMPLES_DIRPATH = Path(__file__).parent.parent / 'tests' / 'samples'
+SAMPLE_FILEPATH = SAMPLES_DIRPATH / 'sample_test.ifc'
+TRAPELO_FILEPATH = (
+    SAMPLES_DIRPATH / '20160125RME_2010_Trapelo_const-E20-F.ifc')
+# file read by the benchmarks when none is given on command line
+DEFAULT_FILEPATH = TRAPELO_FILEPATH
+
+
+def get_filepaths(default_filepaths=(DEFAULT_FILEPATH,)):
+    """Get the IFC file paths given on command line.
+
+    :param tuple default_filepaths: (optional, default (DEFAULT_FILEPATH,))
+        The file paths to read when none is given.
+    :return tuple: The file paths.
+    """
+    if len(sys.argv) > 1:
+        return tuple(Path(cur_arg) for cur_arg in sys.argv[1:])
+    return tuple(default_filepaths)
+
+
+def get_filepath(default_filepath=DEFAULT_FILEPATH):
+    """Get the IFC file path given on command line (the first one).
+
+    :param Path default_filepath: (optional, default DEFAULT_FILEPATH)
+        The file path to read when none is given.
+    :return Path: The file path.
+    """
+    return get_filepaths((default_filepath,))[0]
+
+
+def open_file(filepath):
+    """Open an IFC file with ifcopenshell, with the schema of its version.
+
+    :param Path filepath: The IFC file path.
+    :return tuple: (ifcopenshell.file, IfcSchema)
+    """
+    ifcos_file = ifcopenshell.open(str(filepath))
+    return ifcos_file, get_schema(ifcos_file.schema)
+
+
+def best_time(func, *, number=1, repeat=3, gc_enabled=False):
+    """Get the best time of a function call (see `timeit.repeat`).
+
+    :param callable func: The function, called without argument.
+    :param int number: (optional, default 1) The calls per measure.
+    :param int repeat: (optional, default 3) The measures.
+    :param bool gc_enabled: (optional, default False)
+        If True, garbage collection is enabled while measuring (so that
+        wrappers cycles are not kept between runs...).
+    :return float: The time of a call, in seconds.
+    """
+    return min(timeit.repeat(
+        func, setup='gc.enable()' if gc_enabled else 'pass',
+        number=number, repeat=repeat)) / number
+
+
+def format_time(seconds):
+    """Format a time, in the unit of its magnitude ('  12.34 ms'...)."""
+    for unit, factor in (('s ', 1,), ('ms', 1e3,), ('us', 1e6,),):
+        if seconds * factor >= 1:
+            return '{:8.2f} {}'.format(seconds * factor, unit)
+    return '{:8.0f} ns'.format(seconds * 1e9)
+
+
+def compare(label, legacy_name, legacy_func, name, func, *, number=1,
+            repeat=3, gc_enabled=False):
+    """Time a legacy code path versus the current one (see `best_time`),
+    and print both times and the speedup.
+
+    :param str label: What is measured.
+    :param str legacy_name: The legacy code path's name.
+    :param callable legacy_func: The legacy code path.
+    :param str name: The current code path's name.
+    :param callable func: The current code path.
+    :return tuple: (legacy time, time) in seconds.
+    """
+    legacy_time = best_time(
+        legacy_func, number=number, repeat=repeat, gc_enabled=gc_enabled)
+    new_time = best_time(
+        func, number=number, repeat=repeat, gc_enabled=gc_enabled)
+    print('{} | {}: {} | {}: {} | speedup: x{:.1f}'.format(
+        label, legacy_name, format_time(legacy_time), name,
+        format_time(new_time), legacy_time / new_time))
+    return legacy_time, new_time
+
+
+def traced_memory(func, *, peak=False):
+    """Get the memory allocated by a function call (see `tracemalloc`),
+    while its result is kept.
+
+    :param callable func: The function, called without argument.
+    :param bool peak: (optional, default False)
+        If True, get the peak memory of the call instead.
+    :return int: The memory, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()  # noqa
+        gc.collect()
+        current, peak_memory = tracemalloc.get_traced_memory()
+        return peak_memory if peak else current
+    finally:
+        tracemalloc.stop()
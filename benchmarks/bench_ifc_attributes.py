@@ -0,0 +1,79 @@
+"""Benchmark: entity wrappers reading attributes by position (schema's
+attribute tables) versus building the dict of all attributes (`get_info`) for
+every wrapper, on all the spaces and elements of the Trapelo sample file
+(which holds a single space).
+
+Usage (package installed): python benchmarks/bench_ifc_attributes.py [IFC_FILE]
+"""
+
+import contextlib
+
+from ifc_datareader import IfcObjectEntity
+from ifc_datareader.ifc_base_entity import IfcBaseEntity
+
+from _common import best_time, format_time, get_filepath, open_file
+
+ENTITY_TYPES = ('IfcSpace', 'IfcElement',)
+
+
+@contextlib.contextmanager
+def legacy_attributes():
+    """Restore former behavior: `get_info` is called by each wrapper's
+    constructor and attributes are read from its result."""
+    init = IfcBaseEntity.__init__
+    get_attribute = IfcBaseEntity.get_attribute
+
+    def _legacy_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        self.info
+
+    IfcBaseEntity.__init__ = _legacy_init
+    IfcBaseEntity.get_attribute = lambda self, name: self.info.get(name)
+    try:
+        yield
+    finally:
+        IfcBaseEntity.__init__ = init
+        IfcBaseEntity.get_attribute = get_attribute
+
+
+def build_wrappers(raw_objects, schema):
+    return [(obj.name, obj.global_id,)
+            for obj in (IfcObjectEntity(raw, schema) for raw in raw_objects)]
+
+
+def extract_properties(raw_objects, schema):
+    return [
+        (prop.name, prop.value, prop.unit,)
+        for obj in (IfcObjectEntity(raw, schema) for raw in raw_objects)
+        for pset in obj.property_sets or ()
+        for prop in pset.properties or ()]
+
+
+def main(filepath, *, number=1, repeat=3):
+    ifc_file, schema = open_file(filepath)
+    raw_objects = [
+        raw for type_name in ENTITY_TYPES
+        for raw in ifc_file.by_type(type_name)]
+    with legacy_attributes():
+        legacy_props = extract_properties(raw_objects, schema)
+    assert extract_properties(raw_objects, schema) == legacy_props
+
+    for label, func in (
+            ('wrappers', build_wrappers),
+            ('properties', extract_properties),):
+        # the same code path, with the legacy attributes patched in
+        with legacy_attributes():
+            legacy_time = best_time(
+                lambda: func(raw_objects, schema),
+                number=number, repeat=repeat)
+        new_time = best_time(
+            lambda: func(raw_objects, schema), number=number, repeat=repeat)
+        print('{} objects {:<10} | get_info: {} | by position: {}'
+              ' | speedup: x{:.1f}'.format(
+                  len(raw_objects), label, format_time(legacy_time),
+                  format_time(new_time), legacy_time / new_time))
+    print('{} properties extracted'.format(len(legacy_props)))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
@@ -0,0 +1,53 @@
+"""Benchmark: codenames of all the property set and property names of the
+Trapelo sample file (names repeat a lot), with the reader's codename intern
+table (one translation per distinct name) versus the former `build_codename`
+(a `replace` per punctuation character, on each call).
+
+Usage (package installed): python benchmarks/bench_ifc_codename_table.py
+"""
+
+import string
+
+from ifc_datareader.ifc_codename_table import IfcCodenameTable
+from ifc_datareader.tools import build_codename
+
+from _common import compare, get_filepath, open_file
+
+
+def legacy_build_codename(name):
+    """Former `clean_str` + `IfcBaseEntity.codename`."""
+    for cur_char in string.punctuation:
+        if cur_char in name:
+            name = name.replace(cur_char, '')
+    return name.lower().replace(' ', '')
+
+
+def main(filepath, *, number=1, repeat=3):
+    ifcos_file, _ = open_file(filepath)
+    names = [
+        cur_raw.Name for cur_type_name in ('IfcPropertySet', 'IfcProperty')
+        for cur_raw in ifcos_file.by_type(cur_type_name)
+        if cur_raw.Name is not None]
+
+    def _intern_all():
+        table = IfcCodenameTable()
+        return [table.get_codename(cur_name) for cur_name in names], table
+
+    codenames, table = _intern_all()
+    assert codenames == [legacy_build_codename(cur_name) for cur_name in names]
+    for label, func in (
+            ('build_codename (translation)',
+             lambda: [build_codename(cur_name) for cur_name in names]),
+            ('codename table', lambda: _intern_all()),):
+        compare(
+            '{} names'.format(len(names)), 'replace loop',
+            lambda: [legacy_build_codename(cur_name) for cur_name in names],
+            label, func, number=number, repeat=repeat)
+    print('{} names, {} distinct codenames, {} colliding codenames'.format(
+        len(names), len(table), len(table.get_collisions())))
+    for cur_codename, cur_names in table.get_collisions().items():
+        print('  {}: {}'.format(cur_codename, cur_names))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
@@ -0,0 +1,64 @@
+"""Benchmark: reading the spaces and elements of each storey with the reader's
+containment index versus wrapping all entities of the type and filtering them
+on their parent, on the Trapelo sample file.
+
+Usage (package installed): python benchmarks/bench_ifc_containment_index.py
+"""
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.ifc_containment_index import IfcContainmentIndex
+
+from _common import best_time, compare, format_time, get_filepath
+
+ENTITY_TYPES = ('IfcSpace', 'IfcElement',)
+
+
+def legacy_read_entities(data_reader, entity_name, parent_entity):
+    """Former `IfcDataReader._read_entities` (with a parent entity)."""
+    entities = tuple(
+        data_reader.get_object(cur_raw_entity)
+        for cur_raw_entity in data_reader._ifcos_file.by_type(entity_name))
+    return tuple(
+        cur_entity for cur_entity in entities
+        if cur_entity.parent is not None
+        and cur_entity.parent.global_id == parent_entity.global_id)
+
+
+def read_storeys_content(data_reader, read_func):
+    return [
+        sorted(cur_entity.global_id
+               for cur_entity in read_func(entity_name, cur_storey))
+        for cur_storey in data_reader.read_building_storeys()
+        for entity_name in ENTITY_TYPES]
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+
+    def _legacy_read(entity_name, parent_entity):
+        return legacy_read_entities(data_reader, entity_name, parent_entity)
+
+    def _read(entity_name, parent_entity):
+        return data_reader.read_entity(
+            entity_name, parent_entity=parent_entity)
+
+    assert (read_storeys_content(data_reader, _legacy_read)
+            == read_storeys_content(data_reader, _read))
+
+    compare(
+        '{} storeys read'.format(len(data_reader.read_building_storeys())),
+        'parent filtering',
+        lambda: read_storeys_content(data_reader, _legacy_read),
+        'containment index',
+        lambda: read_storeys_content(data_reader, _read),
+        number=number, repeat=repeat)
+    build_time = best_time(
+        lambda: IfcContainmentIndex(
+            data_reader._ifcos_file, data_reader.ifc_schema),
+        number=number, repeat=repeat)
+    print('containment index built once in {}'.format(
+        format_time(build_time).strip()))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
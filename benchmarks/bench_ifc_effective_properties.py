@@ -0,0 +1,84 @@
+"""Benchmark: properties of all typed objects merged with their type's ones
+(`IfcObjectEntity.effective_properties`, type properties read once per type by
+the reader's shared type wrapper) versus each occurrence wrapping its object
+type and reading its property sets again, on the sample files.
+
+Usage (package installed): python benchmarks/bench_ifc_effective_properties.py
+"""
+
+from pathlib import Path
+
+from ifc_datareader import IfcDataReader, IfcObjectEntity
+
+from _common import (
+    SAMPLE_FILEPATH, TRAPELO_FILEPATH, best_time, format_time, get_filepaths)
+
+
+def _get_typed_raw_objects(data_reader):
+    return [
+        cur_raw_obj
+        for cur_rel in data_reader._ifcos_file.by_type('IfcRelDefinesByType')
+        for cur_raw_obj in cur_rel.RelatedObjects]
+
+
+def legacy_merge(data_reader):
+    """Each occurrence (not known by the reader) wraps its own object type."""
+    merged_props_list = []
+    nb_type_props = 0
+    for cur_raw_obj in _get_typed_raw_objects(data_reader):
+        entity = IfcObjectEntity(cur_raw_obj, data_reader.ifc_schema)
+        merged_props = {}
+        for pset in entity.property_sets or ():
+            for prop in pset.properties or ():
+                merged_props.setdefault((pset.codename, prop.codename), prop)
+        for pset in entity.object_type.property_sets or ():
+            for prop in pset.properties or ():
+                nb_type_props += 1
+                merged_props.setdefault((pset.codename, prop.codename), prop)
+        merged_props_list.append(merged_props)
+    return merged_props_list, nb_type_props
+
+
+def merge(data_reader):
+    entities = [
+        data_reader.get_object(cur_raw_obj)
+        for cur_raw_obj in _get_typed_raw_objects(data_reader)]
+    merged_props_list = [
+        cur_entity.effective_properties for cur_entity in entities]
+    object_types = {
+        id(cur_entity.object_type): cur_entity.object_type
+        for cur_entity in entities}
+    nb_type_props = sum(
+        len(cur_type.effective_properties)
+        for cur_type in object_types.values())
+    return merged_props_list, nb_type_props
+
+
+def main(*filepaths, number=1, repeat=3):
+    for filepath in filepaths:
+        data_reader = IfcDataReader(filepath)
+        legacy_props_list, legacy_nb_type_props = legacy_merge(data_reader)
+        props_list, nb_type_props = merge(data_reader)
+        assert [
+            [(key, cur_prop.value) for key, cur_prop in cur_props.items()]
+            for cur_props in legacy_props_list] == [
+            [(key, cur_prop.value) for key, cur_prop in cur_props.items()]
+            for cur_props in props_list]
+        legacy_time = best_time(
+            lambda: legacy_merge(IfcDataReader(filepath)),
+            number=number, repeat=repeat)
+        new_time = best_time(
+            lambda: merge(IfcDataReader(filepath)),
+            number=number, repeat=repeat)
+        print('{} ({} typed objects)'.format(
+            Path(filepath).name, len(props_list)))
+        print('  type properties read: {:>7} per occurrence | {:>7} per'
+              ' type'.format(legacy_nb_type_props, nb_type_props))
+        print('  time: {} per occurrence | {} per type'
+              ' | speedup: x{:.1f}'.format(
+                  format_time(legacy_time), format_time(new_time),
+                  legacy_time / new_time))
+
+
+if __name__ == '__main__':
+    main(*get_filepaths((SAMPLE_FILEPATH, TRAPELO_FILEPATH,)))
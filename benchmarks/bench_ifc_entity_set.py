@@ -0,0 +1,70 @@
+"""Benchmark: set algebra on the elements of the Trapelo sample file (proxies
+among the elements of each storey, or not...), with the reader's entity sets
+(`IfcEntitySet`, sorted STEP id arrays) versus deduplicating and comparing
+lists of wrappers by equality scans.
+
+Usage (package installed): python benchmarks/bench_ifc_entity_set.py [FILE]
+"""
+
+from ifc_datareader import IfcDataReader
+
+from _common import compare, get_filepath
+
+
+def legacy_dedupe(entities):
+    """Deduplicate a list of (unhashable) wrappers, by equality scans."""
+    unique_entities = []
+    for cur_entity in entities:
+        if cur_entity not in unique_entities:
+            unique_entities.append(cur_entity)
+    return unique_entities
+
+
+def legacy_algebra(storeys_elements, proxies, elements):
+    # per storey: proxies, and the others, all deduplicated
+    result = []
+    for cur_elements in storeys_elements:
+        cur_proxies = [
+            cur_entity for cur_entity in cur_elements
+            if cur_entity in proxies]
+        cur_others = [
+            cur_entity for cur_entity in cur_elements
+            if cur_entity not in proxies]
+        result.append((len(cur_proxies), len(cur_others),))
+    result.append(len(legacy_dedupe(elements + proxies)))
+    return result
+
+
+def algebra(data_reader, storeys_elements, proxies, elements):
+    proxy_set = data_reader.get_entity_set(proxies)
+    result = []
+    for cur_elements in storeys_elements:
+        cur_set = data_reader.get_entity_set(cur_elements)
+        result.append((len(cur_set & proxy_set), len(cur_set - proxy_set),))
+    result.append(len(
+        data_reader.get_entity_set(elements) | proxy_set))
+    return result
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+    storeys_elements = [
+        data_reader.read_descendants(cur_storey, entity_name='IfcElement')
+        for cur_storey in data_reader.read_building_storeys()]
+    proxies = list(data_reader.read_entity('IfcBuildingElementProxy'))
+    elements = list(data_reader.read_entity('IfcFlowTerminal'))
+
+    assert legacy_algebra(storeys_elements, proxies, elements) == algebra(
+        data_reader, storeys_elements, proxies, elements)
+    compare(
+        '{} storeys, {} proxies, {} terminals'.format(
+            len(storeys_elements), len(proxies), len(elements)),
+        'equality scans',
+        lambda: legacy_algebra(storeys_elements, proxies, elements),
+        'entity sets',
+        lambda: algebra(data_reader, storeys_elements, proxies, elements),
+        number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main(get_filepath())
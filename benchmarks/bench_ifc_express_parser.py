@@ -0,0 +1,72 @@
+"""Benchmark: single-pass EXPRESS parser versus the former multi-regex scan.
+
+Usage (package installed): python benchmarks/bench_ifc_express_parser.py
+"""
+
+from pathlib import Path
+import re
+
+from ifc_datareader.schema import IFC_SCHEMAS
+from ifc_datareader.schema import ifc_express_parser
+from ifc_datareader.schema.ifc_express_parser import parse_schema
+
+from _common import compare
+
+
+_NO_ATTR = [
+    'WHERE', 'INVERSE', 'WR2', 'WR3', 'WR4', 'WR5', 'UNIQUE', 'DERIVE']
+
+_ATTR_TYPE_RE = (
+    '(?:(?:SET|LIST)\\s(?:\\[([0-9]+):([\\?0-9]+)\\])?(?:\\sOF\\s)?)?'
+    '(Ifc[a-zA-Z]+)(?:\\sFOR (.*))?$')
+
+
+def _legacy_scan_attributes(raw_str):
+    # former attributes (or inverse) extraction, of an entity section
+    for cur_iter in re.finditer('(.*?) : (.*?);', raw_str, re.DOTALL):
+        _, attr_type = [s.replace('\n\t', '') for s in cur_iter.groups()]
+        re.search(_ATTR_TYPE_RE, attr_type)
+
+
+def legacy_scan(raw_data):
+    """Scan schema text the way `IfcSchema` did before the EXPRESS parser
+    (elements are not built, only regexes are run)."""
+    re.findall('TYPE (.*) = (.*);', raw_data)
+    re.findall(
+        'TYPE (.*) = SELECT\\n\\t\\((.*(?:\\n\\t,.*)*)\\);', raw_data)
+    re.findall(
+        'TYPE (.*) = ENUMERATION OF\\n\\t\\((.*(?:\\n\\t,.*)*)\\);', raw_data)
+    for cur_iter in re.finditer(
+            'ENTITY (.*?)END_ENTITY;', raw_data, re.DOTALL):
+        raw_entity_str = cur_iter.groups()[0]
+        re.search('(.*?)[;|\\s]', raw_entity_str)
+        re.search('.*SUBTYPE OF \\((.*?)\\);', raw_entity_str)
+        inner_raw_data = re.search(
+            ';(.*?)$', raw_entity_str, re.DOTALL).groups()[0]
+        _legacy_scan_attributes(min([
+            inner_raw_data.partition('\n ' + noa)[0] for noa in _NO_ATTR]))
+        inverse_str = inner_raw_data.partition('\n INVERSE')[2]
+        _legacy_scan_attributes(min([
+            inverse_str.partition('\n ' + noa)[0] for noa in _NO_ATTR]))
+
+
+def _parse(raw_data):
+    # memoized type definitions are forgotten to measure a cold parse
+    ifc_express_parser._parse_normalized_type.cache_clear()
+    parse_schema(raw_data)
+
+
+def main(*, number=10, repeat=5):
+    schema_dirpath = Path(ifc_express_parser.__file__).parent
+    for schema_name in sorted(IFC_SCHEMAS):
+        with open(str(schema_dirpath / IFC_SCHEMAS[schema_name])) as f:
+            raw_data = f.read()
+        compare(
+            '{:<8}'.format(schema_name),
+            'regex scan', lambda: legacy_scan(raw_data),
+            'EXPRESS parser', lambda: _parse(raw_data),
+            number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: reader's identity map of entity wrappers versus a new wrapper on
+each access, navigating the Trapelo sample file (parent of each element, then
+storeys' kids and parent's property values).
+
+Usage (package installed): python benchmarks/bench_ifc_identity_map.py [FILE]
+"""
+
+import contextlib
+
+from ifc_datareader import IfcDataReader
+
+from _common import best_time, format_time, get_filepath
+
+
+@contextlib.contextmanager
+def legacy_wrappers():
+    """Restore former behavior: each access path builds a new wrapper."""
+    get_wrapper = IfcDataReader.get_wrapper
+
+    def _legacy_get_wrapper(self, raw_data, factory, **kwargs):
+        return factory(raw_data, schema=self.ifc_schema, **kwargs)
+
+    IfcDataReader.get_wrapper = _legacy_get_wrapper
+    try:
+        yield
+    finally:
+        IfcDataReader.get_wrapper = get_wrapper
+
+
+def navigate(data_reader):
+    elements = data_reader.read_entity('IfcElement')
+    parents = [element.parent for element in elements]
+    return [
+        (parent.name, len(parent.kids or ()),
+         parent.get_property_value('elevation'),)
+        for parent in parents if parent is not None]
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+    with legacy_wrappers():
+        legacy_res = navigate(data_reader)
+    res = navigate(data_reader)
+    assert res == legacy_res
+
+    with legacy_wrappers():
+        legacy_time = best_time(
+            lambda: navigate(data_reader), number=number, repeat=repeat)
+    new_time = best_time(
+        lambda: navigate(data_reader), number=number, repeat=repeat)
+    print('{} elements navigated | new wrappers: {} | identity map: {}'
+          ' | speedup: x{:.1f}'.format(
+              len(res), format_time(legacy_time), format_time(new_time),
+              legacy_time / new_time))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
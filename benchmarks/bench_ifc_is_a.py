@@ -0,0 +1,56 @@
+"""Benchmark: entity type checks, ifcopenshell `is_a` with a type name versus
+schema's precomputed type masks, on the Trapelo sample file.
+
+Usage (package installed): python benchmarks/bench_ifc_is_a.py [IFC_FILE]
+"""
+
+from ifc_datareader.ifc_base_entity import IfcBaseEntity
+
+from _common import compare, get_filepath, open_file
+
+# type checks done by the library's dispatch sites
+#  (`_get_relating_object`, `_load_property_sets`, `create` factories...)
+TYPE_NAMES = (
+    'IfcObject', 'IfcFeatureElementSubtraction', 'IfcElement',
+    'IfcObjectDefinition', 'IfcZone', 'IfcWall', 'IfcTypeObject',
+    'IfcRelDefinesByProperties', 'IfcElementQuantity', 'IfcPropertySet',
+    'IfcSimpleProperty', 'IfcPhysicalSimpleQuantity',)
+
+
+def check_with_strings(raw_entities):
+    return [raw.is_a(type_name)
+            for raw in raw_entities for type_name in TYPE_NAMES]
+
+
+def check_with_masks(raw_entities, schema):
+    # an entity wrapper asks its raw type's name once
+    results = []
+    for raw in raw_entities:
+        raw_type_name = raw.is_a()
+        results.extend(
+            IfcBaseEntity._is_a(
+                raw, type_name, schema, raw_type_name=raw_type_name)
+            for type_name in TYPE_NAMES)
+    return results
+
+
+def main(filepath, *, number=1, repeat=3):
+    ifc_file, schema = open_file(filepath)
+    raw_entities = (
+        ifc_file.by_type('IfcObjectDefinition') +
+        ifc_file.by_type('IfcRelDefines') +
+        ifc_file.by_type('IfcPropertySetDefinition') +
+        ifc_file.by_type('IfcProperty') +
+        ifc_file.by_type('IfcPhysicalQuantity'))
+    assert check_with_strings(raw_entities) == check_with_masks(
+        raw_entities, schema)
+
+    compare(
+        '{} type checks'.format(len(raw_entities) * len(TYPE_NAMES)),
+        'is_a(type_name)', lambda: check_with_strings(raw_entities),
+        'type masks', lambda: check_with_masks(raw_entities, schema),
+        number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main(get_filepath())
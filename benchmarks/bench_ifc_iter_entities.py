@@ -0,0 +1,43 @@
+"""Benchmark: streaming entity reads (`iter_entities`, one wrapper at a time,
+or in batches) versus materialized ones (`read_entity`, a tuple of all
+wrappers): peak memory and time to the first entity, on the Trapelo sample.
+
+Usage (package installed): python benchmarks/bench_ifc_iter_entities.py [FILE]
+"""
+
+from ifc_datareader import IfcDataReader
+
+from _common import best_time, format_time, get_filepath, traced_memory
+
+ENTITY_NAME = 'IfcElement'
+
+
+def main(filepath, *, number=5, repeat=3):
+    data_reader = IfcDataReader(filepath)
+
+    for label, read_func, first_func in (
+            ('read_entity',
+             lambda: [cur_ent.name for cur_ent in data_reader.read_entity(
+                 ENTITY_NAME)],
+             lambda: data_reader.read_entity(ENTITY_NAME)[0]),
+            ('iter_entities',
+             lambda: [cur_ent.name for cur_ent in data_reader.iter_entities(
+                 ENTITY_NAME)],
+             lambda: next(data_reader.iter_entities(ENTITY_NAME))),
+            ('iter (batches)',
+             lambda: [
+                 cur_ent.name for cur_batch in data_reader.iter_entities(
+                     ENTITY_NAME, batch_size=100)
+                 for cur_ent in cur_batch],
+             lambda: next(data_reader.iter_entities(
+                 ENTITY_NAME, batch_size=100))),):
+        first_time = best_time(first_func, number=number, repeat=repeat)
+        print('{:<15} {} names read | peak memory: {:6.2f} MB | first entity'
+              ' in {}'.format(
+                  label, len(read_func()),
+                  traced_memory(read_func, peak=True) / 1e6,
+                  format_time(first_time)))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
@@ -0,0 +1,66 @@
+"""Benchmark: property lookups over all objects with the reader's property
+index versus asking each object its property value (`get_property_value`),
+on the Trapelo sample file.
+
+Usage (package installed): python benchmarks/bench_ifc_property_index.py
+"""
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.ifc_property_index import IfcPropertyIndex
+
+from _common import best_time, compare, format_time, get_filepath
+
+# (label, pset codename, property codename, test on value, index lookup)
+QUERIES = (
+    ('equality', 'psetmanufacturertypeinformation', 'manufacturer',
+     lambda value: value == 'TECH',
+     lambda index: index.get_entity_ids_by_value(
+         'manufacturer', 'TECH',
+         pset_codename='psetmanufacturertypeinformation')),
+    ('existence', 'psetbuildingelementproxycommon', 'reference',
+     lambda value: True,
+     lambda index: index.get_entity_ids(
+         'reference', pset_codename='psetbuildingelementproxycommon')),
+    ('range', 'psetbuildingcommon', 'numberofstoreys',
+     lambda value: value is not None and 2 <= value <= 10,
+     lambda index: index.get_entity_ids_in_range(
+         'numberofstoreys', pset_codename='psetbuildingcommon',
+         min_value=2, max_value=10)),
+)
+
+
+def legacy_find_ids(data_reader, pset_codename, property_codename, test):
+    """Ask each object of the file its property value."""
+    found_ids = []
+    for cur_obj in data_reader.iter_entities('IfcObject'):
+        prop = cur_obj.get_property(
+            property_codename, pset_codename=pset_codename)
+        if prop is not None and test(prop.value):
+            found_ids.append(cur_obj._raw.id())
+    return found_ids
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+    build_time = best_time(
+        lambda: IfcPropertyIndex(
+            data_reader._ifcos_file, data_reader.ifc_schema),
+        number=number, repeat=repeat)
+    index = data_reader.property_index
+
+    for label, pset_codename, property_codename, test, lookup in QUERIES:
+        found_ids = lookup(index)
+        assert sorted(found_ids) == sorted(legacy_find_ids(
+            data_reader, pset_codename, property_codename, test))
+        compare(
+            '{:<10} ({:>4} objects)'.format(label, len(found_ids)),
+            'per object', lambda: legacy_find_ids(
+                data_reader, pset_codename, property_codename, test),
+            'index', lambda: lookup(index),
+            number=number, repeat=repeat)
+    print('property index built once in {}'.format(
+        format_time(build_time).strip()))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
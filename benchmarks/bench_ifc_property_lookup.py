@@ -0,0 +1,63 @@
+"""Benchmark: 10k `IfcObjectEntity.get_property_value` calls with codename hash
+indexes versus the former linear searches (recomputing codenames on each
+call), on the doors of the sample test file.
+
+Usage (package installed): python benchmarks/bench_ifc_property_lookup.py
+"""
+
+import copy
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.tools import build_codename
+
+from _common import SAMPLE_FILEPATH, compare, get_filepath
+
+NB_CALLS = 10000
+
+
+def legacy_get_property_value(entity, property_codename, *,
+                              pset_codename=None):
+    """Former `IfcObjectEntity.get_property_value` (linear searches)."""
+    props = ()
+    for pset in entity.property_sets or ():
+        if pset_codename is None or build_codename(pset.name) == pset_codename:
+            props += copy.copy(pset.properties) or ()
+    for prop in props:
+        if property_codename == build_codename(prop.name):
+            return (prop.value, prop.unit,)
+    return (None, None)
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+    doors = data_reader.read_entity('IfcDoor')
+    # (entity, property codename, pset codename) calls, looping on doors'
+    #  properties, looked for in all property sets or in their own
+    lookups = [
+        (cur_door, cur_prop_codename, cur_pset_codename,)
+        for cur_door in doors
+        for cur_pset in cur_door.property_sets
+        for cur_prop_codename in cur_pset.get_property_codenames()
+        for cur_pset_codename in (None, cur_pset.codename,)]
+    lookups = (lookups * (NB_CALLS // len(lookups) + 1))[:NB_CALLS]
+
+    def _run(func):
+        return [
+            func(cur_entity, cur_prop_codename,
+                 pset_codename=cur_pset_codename)
+            for cur_entity, cur_prop_codename, cur_pset_codename in lookups]
+
+    def _get_property_value(entity, property_codename, *, pset_codename):
+        return entity.get_property_value(
+            property_codename, pset_codename=pset_codename)
+
+    assert _run(legacy_get_property_value) == _run(_get_property_value)
+    compare(
+        '{} get_property_value calls'.format(NB_CALLS),
+        'linear search', lambda: _run(legacy_get_property_value),
+        'hash index', lambda: _run(_get_property_value),
+        number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main(get_filepath(SAMPLE_FILEPATH))
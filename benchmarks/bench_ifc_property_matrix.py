@@ -0,0 +1,106 @@
+"""Benchmark: a matrix of 20 property values (and units) over the spaces and
+walls of the sample files, with `IfcDataReader.get_property_matrix` (one walk
+over each entity's raw relations, no property wrappers) versus a
+`get_property_value` call per cell (property sets and properties wrapped):
+time and peak memory.
+
+The Trapelo sample has a single space and no walls: its elements are
+measured instead (their only properties are 'Reference' and 'Manufacturer',
+the other codenames are missing, as a full scan would find).
+
+Usage (package installed): python benchmarks/bench_ifc_property_matrix.py
+"""
+
+import sys
+
+from ifc_datareader import IfcDataReader
+
+from _common import (
+    SAMPLE_FILEPATH, TRAPELO_FILEPATH, best_time, format_time, get_filepaths,
+    traced_memory)
+
+
+# (file path, type names of the entities read)
+DEFAULT_FILEPATHS = (
+    (SAMPLE_FILEPATH, ('IfcSpace', 'IfcWall',),),
+    (TRAPELO_FILEPATH, ('IfcSpace', 'IfcWall', 'IfcElement',),),
+)
+
+PROPERTY_CODENAMES = (
+    'reference', 'manufacturer', 'isexternal', 'loadbearing',
+    'extendtostructure',
+    'firerating', 'acousticrating', 'combustible', 'surfacespreadofflame',
+    'thermaltransmittance', 'compartmentation', 'netfloorarea',
+    'grossfloorarea', 'height', 'finishceilingheight', 'publiclyaccessible',
+    'handicapaccessible', 'occupancytype', 'category', 'status',)
+
+
+def read_entities(data_reader, type_names):
+    # entities wrapped again at each run (property sets not loaded yet)
+    entities = []
+    for cur_type_name in type_names:
+        entities.extend(data_reader.read_entity(cur_type_name))
+    return entities
+
+
+def legacy_matrix(data_reader, type_names):
+    """A `get_property_value` call (a full scan) per cell."""
+    entities = read_entities(data_reader, type_names)
+    values = {cur_codename: [] for cur_codename in PROPERTY_CODENAMES}
+    units = {cur_codename: [] for cur_codename in PROPERTY_CODENAMES}
+    for cur_entity in entities:
+        for cur_codename in PROPERTY_CODENAMES:
+            value, unit = cur_entity.get_property_value(cur_codename)
+            values[cur_codename].append(value)
+            units[cur_codename].append(unit)
+    return values, units
+
+
+def matrix(data_reader, type_names):
+    return data_reader.get_property_matrix(
+        read_entities(data_reader, type_names), PROPERTY_CODENAMES)
+
+
+def main(filepaths=DEFAULT_FILEPATHS, *, number=1, repeat=3):
+    for cur_filepath, cur_type_names in filepaths:
+        data_reader = IfcDataReader(cur_filepath)
+        legacy_values, legacy_units = legacy_matrix(
+            data_reader, cur_type_names)
+        values, units = matrix(data_reader, cur_type_names)
+        for cur_codename in PROPERTY_CODENAMES:
+            assert all(
+                cur_value == cur_legacy_value or (
+                    cur_legacy_value is None and cur_value != cur_value)
+                for cur_value, cur_legacy_value in zip(
+                    values[cur_codename], legacy_values[cur_codename]))
+            assert list(units[cur_codename]) == legacy_units[cur_codename]
+
+        # garbage collection enabled: wrappers cycles are not kept between
+        #  runs (in the reader's identity map)
+        legacy_func, func = (
+            lambda: legacy_matrix(data_reader, cur_type_names),
+            lambda: matrix(data_reader, cur_type_names),)
+        legacy_time, new_time = (
+            best_time(
+                cur_func, number=number, repeat=repeat, gc_enabled=True)
+            for cur_func in (legacy_func, func,))
+        legacy_peak, new_peak = (
+            traced_memory(cur_func, peak=True)
+            for cur_func in (legacy_func, func,))
+        print('{} ({} rows x {} properties)\n'
+              '  get_property_value per cell: {} {:6.1f} MB\n'
+              '  property matrix:             {} {:6.1f} MB\n'
+              '  speedup: x{:.1f} | memory: x{:.1f}'.format(
+                  cur_filepath.name, len(values[PROPERTY_CODENAMES[0]]),
+                  len(PROPERTY_CODENAMES), format_time(legacy_time),
+                  legacy_peak / 1e6, format_time(new_time), new_peak / 1e6,
+                  legacy_time / new_time, legacy_peak / new_peak))
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        main(tuple(
+            (cur_filepath, ('IfcSpace', 'IfcWall',),)
+            for cur_filepath in get_filepaths()))
+    else:
+        main()
@@ -0,0 +1,75 @@
+"""Benchmark: reading the property sets (and properties) of all objects with
+the reader's pset-centric extraction (`IfcDataReader.load_property_sets`)
+versus each object reading its own property sets, on the sample files:
+wrappers count, memory and time.
+
+Usage (package installed): python benchmarks/bench_ifc_pset_extraction.py
+"""
+
+from pathlib import Path
+
+from ifc_datareader import IfcDataReader, IfcObjectEntity
+
+from _common import (
+    SAMPLE_FILEPATH, TRAPELO_FILEPATH, best_time, format_time, get_filepaths,
+    traced_memory)
+
+
+def legacy_read(data_reader):
+    """Each object (not known by the reader) reads its own property sets."""
+    entities = tuple(
+        IfcObjectEntity(cur_raw, data_reader.ifc_schema)
+        for cur_raw in data_reader._ifcos_file.by_type('IfcObject'))
+    for cur_entity in entities:
+        for cur_pset in cur_entity.property_sets or ():
+            cur_pset.properties
+    return entities
+
+
+def read(data_reader):
+    return data_reader.load_property_sets(
+        data_reader.iter_entities('IfcObject'))
+
+
+def count_wrappers(entities):
+    # distinct property set and property wrappers
+    psets = {
+        id(cur_pset): cur_pset for cur_entity in entities
+        for cur_pset in cur_entity.property_sets or ()}
+    nb_props = sum(
+        len(cur_pset.properties or ()) for cur_pset in psets.values())
+    return len(psets) + nb_props
+
+
+def measure_memory(func, filepath):
+    data_reader = IfcDataReader(filepath)
+    return traced_memory(lambda: func(data_reader))
+
+
+def main(*filepaths, number=1, repeat=3):
+    for filepath in filepaths:
+        # readers are kept alive while their entities are used
+        legacy_data_reader = IfcDataReader(filepath)
+        legacy_entities = legacy_read(legacy_data_reader)
+        data_reader = IfcDataReader(filepath)
+        entities = read(data_reader)
+        legacy_memory = measure_memory(legacy_read, filepath)
+        memory = measure_memory(read, filepath)
+        legacy_time = best_time(
+            lambda: legacy_read(IfcDataReader(filepath)),
+            number=number, repeat=repeat)
+        new_time = best_time(
+            lambda: read(IfcDataReader(filepath)),
+            number=number, repeat=repeat)
+        print('{} ({} objects)'.format(Path(filepath).name, len(entities)))
+        print('  wrappers: {:>7} per object | {:>7} shared'.format(
+            count_wrappers(legacy_entities), count_wrappers(entities)))
+        print('  memory:   {:7.1f} MB per object | {:7.1f} MB shared'.format(
+            legacy_memory / 2**20, memory / 2**20))
+        print('  time:    {} per object | {} shared | speedup: x{:.1f}'.format(
+            format_time(legacy_time), format_time(new_time),
+            legacy_time / new_time))
+
+
+if __name__ == '__main__':
+    main(*get_filepaths((SAMPLE_FILEPATH, TRAPELO_FILEPATH,)))
@@ -0,0 +1,111 @@
+"""Benchmark: takeoff of the simple quantities of all the elements of the
+Trapelo sample file, grouped by building storey, with the reader's quantity
+table (`IfcQuantityTable`, one pass over the quantity relations, columns of
+arrays) versus reading `IfcObjectEntity.quantities` wrappers element by
+element.
+
+The Trapelo sample only has quantities on its space: each of its elements is
+given a quantity set (length, area, volume and count) first, in a temporary
+copy of the file.
+
+Usage (package installed): python benchmarks/bench_ifc_quantity_table.py
+"""
+
+from pathlib import Path
+import tempfile
+
+import ifcopenshell.guid
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.ifc_quantity_table import IfcQuantityTable
+
+from _common import compare, get_filepath, open_file
+
+# (quantity type name, quantity name, value attribute)
+QUANTITIES = (
+    ('IfcQuantityLength', 'Width', 'LengthValue',),
+    ('IfcQuantityArea', 'NetSideArea', 'AreaValue',),
+    ('IfcQuantityVolume', 'NetVolume', 'VolumeValue',),
+    ('IfcQuantityCount', 'Count', 'CountValue',),
+)
+
+
+def write_sample(filepath, sample_filepath):
+    """Copy a file, with a quantity set related to each element."""
+    ifcos_file, _ = open_file(filepath)
+    owner_history = ifcos_file.by_type('IfcOwnerHistory')[0]
+    for cur_raw_elmt in ifcos_file.by_type('IfcElement'):
+        quantities = [
+            ifcos_file.create_entity(cur_type_name, **{
+                'Name': cur_name,
+                cur_value_name: float(cur_raw_elmt.id() % 97 + cur_index)})
+            for cur_index, (cur_type_name, cur_name, cur_value_name,)
+            in enumerate(QUANTITIES)]
+        ifcos_file.create_entity(
+            'IfcRelDefinesByProperties',
+            GlobalId=ifcopenshell.guid.new(), OwnerHistory=owner_history,
+            RelatedObjects=[cur_raw_elmt],
+            RelatingPropertyDefinition=ifcos_file.create_entity(
+                'IfcElementQuantity', GlobalId=ifcopenshell.guid.new(),
+                OwnerHistory=owner_history, Name='BaseQuantities',
+                Quantities=quantities))
+    ifcos_file.write(str(sample_filepath))
+
+
+def legacy_takeoff(data_reader):
+    """Quantity wrappers of each element, in lists by storey."""
+    rows_by_storey = {}
+    for cur_storey in data_reader.read_building_storeys():
+        rows = rows_by_storey[cur_storey._raw.id()] = []
+        for cur_elmt in data_reader.read_descendants(
+                cur_storey, entity_name='IfcElement'):
+            for cur_qty in cur_elmt.quantities or ():
+                rows.append((
+                    cur_elmt._raw.id(), cur_qty.codename, cur_qty.type_name,
+                    cur_qty.value,))
+    return rows_by_storey
+
+
+def takeoff(data_reader):
+    table = data_reader.read_quantity_table('IfcElement', group_by='storey')
+    return {
+        cur_storey_id: table.get_group(cur_storey_id).get_columns()
+        for cur_storey_id in table.groups}
+
+
+def get_rows(data_reader, columns):
+    """The (element id, codename, quantity type name, value) rows of
+    quantity table columns."""
+    get_codename = data_reader.codename_table.get_codename_by_code
+    return [
+        (int(cur_id), get_codename(int(cur_code)),
+         'IfcQuantity{}'.format(IfcQuantityTable.KINDS[cur_kind_code]),
+         float(cur_value),)
+        for cur_id, cur_code, cur_kind_code, cur_value in zip(
+            columns['object_id'], columns['codename_code'],
+            columns['kind_code'], columns['value'])]
+
+
+def main(filepath, *, number=1, repeat=3):
+    with tempfile.TemporaryDirectory() as tmp_dirpath:
+        sample_filepath = Path(tmp_dirpath) / 'quantities.ifc'
+        write_sample(filepath, sample_filepath)
+        data_reader = IfcDataReader(sample_filepath)
+
+        legacy_rows = legacy_takeoff(data_reader)
+        columns_by_storey = takeoff(data_reader)
+        for cur_storey_id, cur_rows in legacy_rows.items():
+            assert sorted(cur_rows) == sorted(get_rows(
+                data_reader, columns_by_storey[cur_storey_id]))
+        nb_quantities = sum(len(cur_rows) for cur_rows in legacy_rows.values())
+
+        compare(
+            '{} quantities of {} storeys'.format(
+                nb_quantities, len(legacy_rows)),
+            'wrappers', lambda: legacy_takeoff(data_reader),
+            'quantity table', lambda: takeoff(data_reader),
+            number=number, repeat=repeat, gc_enabled=True)
+
+
+if __name__ == '__main__':
+    main(get_filepath())
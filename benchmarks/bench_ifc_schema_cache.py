@@ -0,0 +1,29 @@
+"""Benchmark: IFC schema cold parsing versus compiled cache loading.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_cache.py
+"""
+
+import tempfile
+
+from ifc_datareader.schema import IfcSchema, IFC_SCHEMAS
+from ifc_datareader.schema.ifc_schema_cache import IfcSchemaCache
+
+from _common import compare
+
+
+def main(*, number=10, repeat=5):
+    with tempfile.TemporaryDirectory() as cache_dirpath:
+        schema_cache = IfcSchemaCache(cache_dirpath)
+        for schema_name in sorted(IFC_SCHEMAS):
+            # first load compiles and stores the schema
+            IfcSchema(schema_name, cache=schema_cache)
+            compare(
+                '{:<8}'.format(schema_name),
+                'cold parse', lambda: IfcSchema(schema_name, cache=False),
+                'cached load',
+                lambda: IfcSchema(schema_name, cache=schema_cache),
+                number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main()
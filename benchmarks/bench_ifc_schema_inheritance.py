@@ -0,0 +1,42 @@
+"""Benchmark: deep subtypes lookup of every IFC4 entity.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_inheritance.py
+"""
+
+from ifc_datareader.schema import IfcSchema
+
+from _common import compare
+
+
+def _legacy_inherits(entity, parent_entity_name):
+    # former recursive walk through supertypes
+    if entity.supertype_name == parent_entity_name:
+        return True
+    if entity.supertype is not None:
+        return _legacy_inherits(entity.supertype, parent_entity_name)
+    return False
+
+
+def legacy_get_subtypes(entity):
+    """Get deep subtypes the way `IfcSchemaEntity` did before the schema
+    inheritance index."""
+    return tuple(
+        cur_ent for cur_ent in entity.schema.entities
+        if _legacy_inherits(cur_ent, entity.name))
+
+
+def main(*, number=1, repeat=3):
+    ifc_schema = IfcSchema('IFC4')
+    entities = ifc_schema.entities
+    compare(
+        'IFC4 get_subtypes(deep_inheritance=True) x {} entities'.format(
+            len(entities)),
+        'recursive walk',
+        lambda: [legacy_get_subtypes(ent) for ent in entities],
+        'index',
+        lambda: [ent.get_subtypes(deep_inheritance=True) for ent in entities],
+        number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main()
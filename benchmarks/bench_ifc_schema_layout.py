@@ -0,0 +1,52 @@
+"""Benchmark: entity attribute and inverse layouts, memoized versus
+deep-copied on each call.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_layout.py
+"""
+
+import copy
+
+from ifc_datareader.schema import IfcSchema
+
+from _common import compare
+
+
+def _get_memo(entity):
+    # elements are deep-copied, not the schema they refer to (nor its lock)
+    return {id(entity.schema): entity.schema}
+
+
+def legacy_get_all_attributes(entity):
+    """Get all attributes the way `IfcSchemaEntity` did before layouts were
+    memoized."""
+    all_attrs = copy.deepcopy(entity.attributes, _get_memo(entity))
+    if entity.supertype is not None:
+        all_attrs = legacy_get_all_attributes(entity.supertype) + all_attrs
+    return all_attrs
+
+
+def legacy_get_all_inverse(entity):
+    """Get all inverse the way `IfcSchemaEntity` did before layouts were
+    memoized."""
+    all_inv = copy.deepcopy(entity.inverse, _get_memo(entity))
+    if entity.supertype is not None:
+        all_inv = legacy_get_all_inverse(entity.supertype) + all_inv
+    return all_inv
+
+
+def main(*, entity_name='IfcWallStandardCase', number=10, repeat=3):
+    ifc_schema = IfcSchema('IFC4')
+    entity = ifc_schema.get_entity(entity_name)
+    for label, legacy_func, func in (
+            ('get_all_attributes', legacy_get_all_attributes,
+             entity.get_all_attributes,),
+            ('get_all_inverse', legacy_get_all_inverse,
+             entity.get_all_inverse,),):
+        compare(
+            '{} {:<18}'.format(entity_name, label),
+            'deepcopy', lambda: legacy_func(entity), 'memoized', func,
+            number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main()
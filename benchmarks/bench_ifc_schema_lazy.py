@@ -0,0 +1,52 @@
+"""Benchmark: IfcDataReader startup with a lazy schema versus an eager one.
+
+Both modes load a private schema (not shared), from the compiled schema cache
+(warmed up first), so that the measure is the one of a new process reading a
+small file. Schema loading (with and without compiled cache) is also measured
+alone, as IFC file opening by ifcopenshell is a large part of reader startup.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_lazy.py
+"""
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.schema import IfcSchema
+
+from _common import SAMPLE_FILEPATH, best_time, traced_memory
+
+
+def _read(lazy_schema):
+    # read some objects, as a small job does
+    data_reader = IfcDataReader(
+        SAMPLE_FILEPATH, shared_schema=False, lazy_schema=lazy_schema)
+    for site in data_reader.read_sites():
+        site.get_property_value('name')
+    return data_reader
+
+
+def _print(label, eager_value, lazy_value, unit):
+    print('{:<16} eager: {:8.2f} {unit} | lazy: {:8.2f} {unit} | x{:.1f}'
+          .format(label, eager_value, lazy_value, eager_value / lazy_value,
+                  unit=unit))
+
+
+def main(*, number=10, repeat=5):
+    results = {}
+    for lazy_schema in (False, True,):
+        # warm up compiled schema cache
+        _read(lazy_schema)
+        results[lazy_schema] = tuple(
+            best_time(cur_func, number=number, repeat=repeat) * 1000
+            for cur_func in (
+                lambda: IfcSchema('IFC2X3', cache=False, lazy=lazy_schema),
+                lambda: IfcSchema('IFC2X3', lazy=lazy_schema),
+                lambda: _read(lazy_schema),)) + (
+            traced_memory(lambda: _read(lazy_schema)) / 1e6,)
+    for label, eager_value, lazy_value, unit in zip(
+            ('schema (parsed)', 'schema (cached)', 'reader startup',
+             'reader memory',),
+            results[False], results[True], ('ms', 'ms', 'ms', 'MB',)):
+        _print(label, eager_value, lazy_value, unit)
+
+
+if __name__ == '__main__':
+    main()
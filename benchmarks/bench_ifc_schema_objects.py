@@ -0,0 +1,68 @@
+"""Benchmark: precomputed schema element fields versus the former on-access
+computations, and memory held by a loaded schema.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_objects.py
+"""
+
+from pathlib import Path
+import re
+
+from ifc_datareader.schema import IfcSchema, IFC_SCHEMAS
+from ifc_datareader.schema import ifc_schema_reader
+
+from _common import compare, traced_memory
+
+
+_SIMPLE_TYPES = ['INTEGER', 'REAL', 'STRING', 'NUMBER', 'LOGICAL', 'BOOLEAN']
+
+
+def legacy_type_name(raw_value):
+    """Former `IfcSchemaDefinedType.type_name` (also run by `is_ref`)."""
+    raw_values = re.split(' |\\) |\\(', raw_value)
+    if len(set(raw_values) & set(_SIMPLE_TYPES)) <= 0:
+        return '#{}'.format(raw_value)
+    return raw_value
+
+
+def legacy_values(raw_values):
+    """Former `IfcSchemaEnum.values` (and `IfcSchemaSelectType`)."""
+    return tuple(sorted(raw_values.replace('\n\t', '').split(',')))
+
+
+def legacy_version(raw_data):
+    """Former `IfcSchema.version` (also run by `IfcSchema.__eq__`)."""
+    return re.search('SCHEMA (.*);', raw_data).groups()[0]
+
+
+def main(*, number=20000, repeat=5):
+    for schema_name in sorted(IFC_SCHEMAS):
+        schema_filepath = (
+            Path(ifc_schema_reader.__file__).parent /
+            IFC_SCHEMAS[schema_name])
+        with open(str(schema_filepath)) as schema_file:
+            raw_data = schema_file.read()
+        ifc_schema = IfcSchema(schema_name)
+        def_type = ifc_schema.get_defined_type('IfcPositiveLengthMeasure')
+        enum = ifc_schema.enumerations[0]
+        raw_values = ','.join(enum.values)
+
+        for label, legacy_func, func in (
+                ('type_name', lambda: legacy_type_name(def_type._raw_value),
+                 lambda: def_type.type_name),
+                ('enum values', lambda: legacy_values(raw_values),
+                 lambda: enum.values),
+                ('version', lambda: legacy_version(raw_data),
+                 lambda: ifc_schema.version),):
+            compare(
+                '{:<8} {:<12}'.format(schema_name, label),
+                'on access', legacy_func, 'precomputed', func,
+                number=number, repeat=repeat)
+        # memory held by a schema parsed from its file
+        memory = traced_memory(lambda: IfcSchema(schema_name, cache=False))
+        print('{:<8} schema memory: {:.2f} MB (schema file: {:.2f} MB, no'
+              ' longer kept)'.format(
+                  schema_name, memory / 1e6, len(raw_data) / 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark: resolved type table and unified element index versus walking
+defined type chains and trying each element dict in turn.
+
+Usage (package installed): python benchmarks/bench_ifc_schema_types.py
+"""
+
+from ifc_datareader.schema import IfcSchema, IFC_SCHEMAS
+from ifc_datareader.schema.ifc_schema_objects import IfcSchemaDefinedType
+
+from _common import compare
+
+
+def legacy_get_element(schema, element_name):
+    """Former `IfcSchema.get_element`."""
+    for get_func_name in ('get_defined_type', 'get_select_type',
+                          'get_enumeration', 'get_entity',):
+        try:
+            return getattr(schema, get_func_name)(element_name)
+        except KeyError:
+            pass
+    return None
+
+
+def legacy_resolve_kind(schema, type_name):
+    """Find what a type's values are made of, one element at a time."""
+    element = legacy_get_element(schema, type_name)
+    while isinstance(element, IfcSchemaDefinedType) and element.is_ref:
+        # `ref_type` fails on aggregates (LIST [...] OF IfcXxx)
+        ref_element = legacy_get_element(schema, element._raw_value)
+        if ref_element is None:
+            break
+        element = ref_element
+    if isinstance(element, IfcSchemaDefinedType):
+        return element.type_name.split('(')[0].split(' ')[-1]
+    return element.__class__.__name__
+
+
+def main(*, number=20, repeat=5):
+    for schema_name in sorted(IFC_SCHEMAS):
+        ifc_schema = IfcSchema(schema_name)
+        # all kinds of types, and some unknown names
+        type_names = (
+            ifc_schema.defined_type_names + ifc_schema.select_type_names +
+            ifc_schema.enumeration_names + ifc_schema.entity_names)
+        unknown_names = tuple(
+            '{}Unknown'.format(name) for name in type_names)
+
+        for label, legacy_func, func in (
+                ('resolve',
+                 lambda: [legacy_resolve_kind(ifc_schema, name)
+                          for name in type_names],
+                 lambda: [ifc_schema.resolve_type(name).kind
+                          for name in type_names]),
+                ('get_element',
+                 lambda: [legacy_get_element(ifc_schema, name)
+                          for name in type_names + unknown_names],
+                 lambda: [ifc_schema.get_element(name)
+                          for name in type_names + unknown_names]),):
+            compare(
+                '{:<8} {:<12}'.format(schema_name, label),
+                'legacy', legacy_func, 'indexed', func,
+                number=number, repeat=repeat)
+
+
+if __name__ == '__main__':
+    main()
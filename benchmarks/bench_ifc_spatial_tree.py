@@ -0,0 +1,83 @@
+"""Benchmark: per building and per storey rollups (recursive descendants of a
+type) and ancestor paths of all elements, with the reader's spatial tree
+versus walking `parent` links of entities, on the Trapelo sample file.
+
+Usage (package installed): python benchmarks/bench_ifc_spatial_tree.py [FILE]
+"""
+
+from ifc_datareader import IfcDataReader, IfcObjectEntity
+
+from _common import best_time, compare, format_time, get_filepath
+
+
+def legacy_ancestors(entity):
+    """Ancestor path by walking `parent` links."""
+    ancestors = ()
+    parent = entity.parent
+    while parent is not None:
+        ancestors += (parent,)
+        parent = parent.parent
+    return ancestors
+
+
+def legacy_rollups(data_reader, containers):
+    # scan all elements, looking for each container in their ancestors
+    elements = [
+        IfcObjectEntity(cur_raw, data_reader.ifc_schema)
+        for cur_raw in data_reader._ifcos_file.by_type('IfcElement')]
+    ancestor_ids_list = [
+        {cur_ancestor.global_id
+         for cur_ancestor in legacy_ancestors(cur_element)}
+        for cur_element in elements]
+    return [
+        sum(1 for cur_ancestor_ids in ancestor_ids_list
+            if cur_container.global_id in cur_ancestor_ids)
+        for cur_container in containers]
+
+
+def rollups(data_reader, containers):
+    return [
+        len(data_reader.read_descendants(
+            cur_container, entity_name='IfcElement'))
+        for cur_container in containers]
+
+
+def legacy_paths(data_reader, elements):
+    return [
+        tuple(cur_ancestor.global_id
+              for cur_ancestor in legacy_ancestors(
+                  IfcObjectEntity(cur_element._raw, data_reader.ifc_schema)))
+        for cur_element in elements]
+
+
+def paths(data_reader, elements):
+    return [
+        tuple(cur_ancestor.global_id
+              for cur_ancestor in data_reader.read_ancestors(cur_element))
+        for cur_element in elements]
+
+
+def main(filepath, *, number=1, repeat=3):
+    data_reader = IfcDataReader(filepath)
+    containers = (
+        data_reader.read_buildings() + data_reader.read_building_storeys())
+    elements = data_reader.read_entity('IfcElement')
+    # tree built once (and measured apart)
+    tree_time = best_time(
+        lambda: data_reader.spatial_tree, number=1, repeat=1)
+
+    for label, legacy_func, func, items in (
+            ('rollups', legacy_rollups, rollups, containers),
+            ('ancestor paths', legacy_paths, paths, elements),):
+        assert legacy_func(data_reader, items) == func(data_reader, items)
+        compare(
+            '{:<15} ({:>5} items)'.format(label, len(items)),
+            'parent links', lambda: legacy_func(data_reader, items),
+            'spatial tree', lambda: func(data_reader, items),
+            number=number, repeat=repeat)
+    print('spatial tree built once in {} ({} entities)'.format(
+        format_time(tree_time).strip(), len(data_reader.spatial_tree)))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
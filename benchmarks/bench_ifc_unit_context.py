@@ -0,0 +1,101 @@
+"""Benchmark: SI values of the quantities of all the elements of the Trapelo
+sample file (imperial units), with the reader's unit context (conversions
+resolved once per unit and measure type, applied to the quantity table's
+value column) versus resolving the project's unit of each quantity value.
+
+The quantities are the ones of `bench_ifc_quantity_table.py` (a quantity set
+given to each element, in a temporary copy of the file).
+
+Usage (package installed): python benchmarks/bench_ifc_unit_context.py
+"""
+
+from pathlib import Path
+import tempfile
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.ifc_unit_context import SI_PREFIX_FACTORS
+
+from _common import best_time, format_time, get_filepath
+from bench_ifc_quantity_table import write_sample
+
+UNIT_TYPES = {
+    'IfcQuantityLength': 'LENGTHUNIT',
+    'IfcQuantityArea': 'AREAUNIT',
+    'IfcQuantityVolume': 'VOLUMEUNIT',
+    'IfcQuantityWeight': 'MASSUNIT',
+    'IfcQuantityTime': 'TIMEUNIT',
+}
+
+
+def legacy_factor(raw_unit):
+    """SI factor of a unit, resolved on each call."""
+    if raw_unit.is_a('IfcSIUnit'):
+        factor = 1e-3 if raw_unit.Name == 'GRAM' else 1.
+        if raw_unit.Prefix is not None:
+            factor *= SI_PREFIX_FACTORS[raw_unit.Prefix] ** {
+                'SQUARE_METRE': 2, 'CUBIC_METRE': 3}.get(raw_unit.Name, 1)
+        return factor
+    measure = raw_unit.ConversionFactor
+    return measure.ValueComponent.wrappedValue * legacy_factor(
+        measure.UnitComponent)
+
+
+def legacy_values_si(data_reader, raw_project):
+    """Look for each quantity's project unit, and convert its value."""
+    values_si = []
+    for cur_elmt in data_reader.iter_entities('IfcElement'):
+        for cur_qty in cur_elmt.quantities or ():
+            raw_unit = cur_qty.unit
+            if raw_unit is None:
+                unit_type = UNIT_TYPES.get(cur_qty.type_name)
+                raw_unit = next((
+                    cur_raw_unit
+                    for cur_raw_unit in raw_project.UnitsInContext.Units
+                    if getattr(cur_raw_unit, 'UnitType', None) == unit_type),
+                    None)
+            values_si.append(
+                cur_qty.value if raw_unit is None
+                else cur_qty.value * legacy_factor(raw_unit))
+    return values_si
+
+
+def main(filepath, *, number=1, repeat=3):
+    with tempfile.TemporaryDirectory() as tmp_dirpath:
+        sample_filepath = Path(tmp_dirpath) / 'quantities.ifc'
+        write_sample(filepath, sample_filepath)
+        data_reader = IfcDataReader(sample_filepath)
+        raw_project = data_reader.ifc_project._raw
+        table = data_reader.read_quantity_table('IfcElement', group_by=None)
+
+        values_si = table.get_values_si(data_reader.unit_context)
+        legacy_values = legacy_values_si(data_reader, raw_project)
+        assert len(values_si) == len(legacy_values)
+        # (elements in STEP id order in the table)
+        assert all(
+            abs(cur_value - cur_legacy_value) <= 1e-9 * abs(cur_value)
+            for cur_value, cur_legacy_value in zip(
+                sorted(values_si), sorted(legacy_values)))
+
+        legacy_time = best_time(
+            lambda: legacy_values_si(data_reader, raw_project),
+            number=number, repeat=repeat, gc_enabled=True)
+        wrapper_time = best_time(
+            lambda: [
+                cur_qty.value_si
+                for cur_elmt in data_reader.iter_entities('IfcElement')
+                for cur_qty in cur_elmt.quantities or ()],
+            number=number, repeat=repeat, gc_enabled=True)
+        new_time = best_time(
+            lambda: table.get_values_si(data_reader.unit_context),
+            number=number, repeat=repeat)
+        print('{} quantities | unit resolved per value: {}\n'
+              '  value_si (cached conversions): {} | speedup: x{:.1f}\n'
+              '  quantity table column (table built once): {} |'
+              ' speedup: x{:.0f}'.format(
+                  len(values_si), format_time(legacy_time),
+                  format_time(wrapper_time), legacy_time / wrapper_time,
+                  format_time(new_time), legacy_time / new_time))
+
+
+if __name__ == '__main__':
+    main(get_filepath())
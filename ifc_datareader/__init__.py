@@ -9,6 +9,43 @@ by abstracting as much as possible all the specifications and tricks of the IFC
     Allows to read IFC data files (throught ifcopenshell)
     Returns `IfcObjectEntity` instances
 
+- IfcContainmentIndex:
+    Built once by `IfcDataReader` (one pass over the relations)
+    Gives the parent and children links of all the file entities, by STEP id
+
+- IfcSpatialTree:
+    Built once by `IfcDataReader` on top of the containment index
+    Gives the descendants (of a type) and the ancestors of a file entity
+
+- IfcPropertyIndex:
+    Built once by `IfcDataReader` (one pass over the property relations)
+    Finds objects by property value (equality, range) or property existence
+
+- IfcCodenameTable:
+    Shared by `IfcDataReader` entities and indexes
+    Interns the codenames of the names read (with integer codes),
+        detecting colliding names
+
+- IfcEntitySet:
+    Built by `IfcDataReader` (from a `read_*` result or directly from types)
+    A set of entities (sorted STEP ids) with a linear time set algebra
+
+- IfcEntityCollection:
+    Built by `IfcDataReader` (`query`, or from a `read_*` result)
+    A lazy chainable query (filter, within, select) read in a single pass,
+        projecting attributes and properties as columns (NumPy arrays if
+        installed)
+
+- IfcQuantityTable:
+    Built by `IfcDataReader` (one pass over the quantity relations)
+    The simple quantities of objects as columns of arrays, grouped (by type
+        or storey) in contiguous rows, sliced without copy
+
+- IfcUnitContext:
+    Built once by `IfcDataReader` (from the project's units)
+    Resolves units to their conversion to SI (per unit and measure type),
+        for entities' `value_si` and `unit_resolved` and for value columns
+
 - IfcBaseEntity:
     All classes below inherits from it
     Allows a quick access to main IFC entity attributes (type, name, ...)
@@ -3,7 +3,7 @@
 import abc
 import ifcopenshell
 
-from .tools import clean_str
+from .tools import build_codename
 
 
 class IfcBaseEntity(abc.ABC):
@@ -14,16 +14,24 @@ class IfcBaseEntity(abc.ABC):
     :param IfcSchema schema: The IFC schema specification description of data.
     :param tuple expected_types: (optional, default ('IfcObject',))
         A tuple of IFC types that validates `raw_obj_entity`.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by. When defined, related entities
+        are obtained from the reader's identity map (see
+        `IfcDataReader.get_wrapper`).
     :raises ValueError:
         When `raw_obj_entity`, `schema` or `expected_types` is not valid.
         When `raw_obj_entity` does not inherit from one of `expected_types`.
     """
 
+    # `info` keys that are not entity attributes
+    _INFO_ONLY_KEYS = ('id', 'type',)
+
     @abc.abstractmethod
-    def __init__(
-            self, raw_obj_entity, schema, *, expected_types=('IfcObject',)):
+    def __init__(self, raw_obj_entity, schema, *,
+                 expected_types=('IfcObject',), reader=None):
         self._raw = raw_obj_entity
         self._schema = schema
+        self._reader = reader
 
         if not isinstance(self._raw, ifcopenshell.entity_instance):
             raise ValueError('Invalid raw object entity: {}'.format(self._raw))
@@ -31,12 +39,16 @@ class IfcBaseEntity(abc.ABC):
             raise ValueError('Invalid expected types (must be defined): {}'
                              .format(expected_types))
 
+        self._type_name = self._raw.is_a()
         for cur_expected_type in expected_types:
-            if not self._raw.is_a(cur_expected_type):
+            if not self._is_a(self._raw, cur_expected_type, self._schema,
+                              raw_type_name=self._type_name):
                 raise ValueError('Invalid entity type: `{}`. {} expected.'
-                                 .format(self._raw.is_a(), expected_types))
+                                 .format(self._type_name, expected_types))
 
-        self.info = self._raw.get_info()
+        # attributes below are in 'lazy' load style (loaded on call)
+        self._info = None
+        self._codename = None
 
     def __repr__(self):
         return (
@@ -50,9 +62,14 @@ class IfcBaseEntity(abc.ABC):
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.global_id == other.global_id
+            return (self._raw.id() == other._raw.id()
+                    and self.global_id == other.global_id)
         return False
 
+    def __hash__(self):
+        # hashable by STEP identity (equal entities have the same STEP id)
+        return hash(self._raw.id())
+
     @property
     def schema_version(self):
         """Get the IFC version used by this entity."""
@@ -60,42 +77,103 @@ class IfcBaseEntity(abc.ABC):
             return self._schema.version
         return None
 
+    @property
+    def info(self):
+        """Get a dict of all the entity's attributes (with its 'id' and
+        'type'), built on first call."""
+        if self._info is None:
+            self._info = self._raw.get_info()
+        return self._info
+
     @property
     def type_name(self):
         """Get the entity's type (IFC class name)."""
-        return self.info.get('type')
+        return self._type_name
 
     @property
     def global_id(self):
         """Get the entity's `GlobalId` (`IfcRoot` attribute)."""
-        return self.info.get('GlobalId')
+        return self.get_attribute('GlobalId')
 
     @property
     def name(self):
         """Get the entity's `Name` (`IfcRoot` attribute)."""
-        return self.info.get('Name')
+        return self.get_attribute('Name')
 
     @property
     def description(self):
         """Get the entity's `Description` (`IfcRoot` attribute)."""
-        return self.info.get('Description')
+        return self.get_attribute('Description')
 
     @property
     def codename(self):
-        """Get a 'cleaned' name, as a python object attribute name."""
-        # get property codename 'lowered' and without spaces
-        return clean_str(self.name).lower().replace(' ', '')
+        """Get a 'cleaned' name, as a python object attribute name
+        (computed on first call, by the reader's codename table if any)."""
+        if self._codename is None:
+            name = self.name
+            if self._reader is not None and name is not None:
+                self._codename = self._reader.codename_table.get_codename(
+                    name)
+            else:
+                # get property codename 'lowered' and without spaces
+                self._codename = build_codename(name)
+        return self._codename
 
     @property
     def schema_metadata(self):
         """Get the entity's IFC schema metadata (its specification)."""
         return self._schema.get_entity(self.type_name)
 
+    def is_a(self, type_name):
+        """Return True if entity is a `type_name` (or one of its subtypes).
+
+        :param str type_name: An IFC entity class name.
+        :return bool: True if entity is a `type_name` instance, else False.
+        """
+        return self._is_a(
+            self._raw, type_name, self._schema, raw_type_name=self.type_name)
+
     def get_attribute(self, name):
         """Get a value in the definition of the base entity, given the
         attribute name"""
+        if (self._info is None and name not in self._INFO_ONLY_KEYS
+                and self._schema is not None):
+            # read attribute by its position, using schema
+            try:
+                return self._schema.get_raw_attribute(
+                    self._raw, name, type_name=self._type_name)
+            except KeyError:
+                # entity's type is not in schema
+                pass
         return self.info.get(name)
 
+    def _wrap(self, raw_data, factory, **kwargs):
+        # Wrap a related raw entity with `factory` (a wrapper class or its
+        #  `create` class method), sharing entity's schema and reader.
+        # Reader's identity map gives the canonical wrapper, if any.
+        if self._reader is not None:
+            return self._reader.get_wrapper(raw_data, factory, **kwargs)
+        return factory(raw_data, schema=self._schema, **kwargs)
+
+    def _get_unit_context(self):
+        # Units context of the reader's project (see `IfcUnitContext`), None
+        #  if no reader (no project's units).
+        if self._reader is not None:
+            return self._reader.unit_context
+        return None
+
+    @staticmethod
+    def _is_a(raw_data, type_name, schema, *, raw_type_name=None):
+        # Check an `ifcopenshell.entity_instance` type using schema's entity
+        #  type masks (a bitwise AND), instead of asking ifcopenshell to
+        #  compare type names through the inheritance tree on each call.
+        # `raw_type_name` (`raw_data.is_a()`) can be given when already known.
+        if schema is None:
+            return raw_data.is_a(type_name)
+        if raw_type_name is None:
+            raw_type_name = raw_data.is_a()
+        return schema.entity_is_a(raw_type_name, type_name)
+
     @staticmethod
     def _print_debug_warning(raw_data, *, item=''):
         # Print some debug alerts about an `ifcopenshell.entity_instance`.
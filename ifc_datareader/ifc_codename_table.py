@@ -0,0 +1,118 @@
+"""IFC codename intern table"""
+
+import sys
+
+from .tools import build_codename
+
+
+class IfcCodenameTable():
+    """Intern table of the codenames of raw names (see `build_codename`).
+
+    A raw name is normalized once, the first time it is met: its codename is
+    interned (a single string instance is shared by all the entities named
+    alike) and gets an integer code (codes are given in order of appearance,
+    from 0), which compact structures (columns, indexes...) can use instead of
+    strings.
+
+    Distinct raw names can give the same codename (for example 'Is External'
+    and 'IsExternal'): these collisions are recorded (see `get_collisions`).
+    """
+
+    def __init__(self):
+        # {raw name: codename}
+        self._codenames_by_name = {}
+        # {codename: code}
+        self._codes_by_codename = {}
+        # [codename] (by code)
+        self._codenames = []
+        # {codename: [raw names]}
+        self._names_by_codename = {}
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_names={nb_names}'
+            ', nb_codenames={nb_codenames}'
+            ')'.format(
+                self=self, nb_names=len(self._codenames_by_name),
+                nb_codenames=len(self._codenames)))
+
+    def __len__(self):
+        return len(self._codenames)
+
+    def __contains__(self, codename):
+        return codename in self._codes_by_codename
+
+    def _add(self, name):
+        # Normalize and intern a raw name met for the first time.
+        codename = sys.intern(build_codename(name))
+        self._codenames_by_name[name] = codename
+        names = self._names_by_codename.get(codename)
+        if names is None:
+            self._codes_by_codename[codename] = len(self._codenames)
+            self._codenames.append(codename)
+            self._names_by_codename[codename] = [name]
+        else:
+            names.append(name)
+        return codename
+
+    def get_codename(self, name):
+        """Get the codename of a raw name (normalized on first call).
+
+        :param str name: The raw name.
+        :return str: The interned codename, None if `name` is None.
+        """
+        codename = self._codenames_by_name.get(name)
+        if codename is None:
+            if name is None:
+                return None
+            codename = self._add(name)
+        return codename
+
+    def get_code(self, name):
+        """Get the integer code of a raw name's codename.
+
+        :param str name: The raw name.
+        :return int: The codename's code, None if `name` is None.
+        """
+        codename = self.get_codename(name)
+        if codename is None:
+            return None
+        return self._codes_by_codename[codename]
+
+    def get_codename_code(self, codename):
+        """Get the integer code of a codename already met.
+
+        :param str codename: The codename.
+        :return int: The codename's code, None if codename was never met.
+        """
+        return self._codes_by_codename.get(codename)
+
+    def get_codename_by_code(self, code):
+        """Get a codename from its integer code.
+
+        :param int code: The codename's code.
+        :return str: The codename.
+        :raises IndexError: When code is unknown.
+        """
+        if code < 0:
+            raise IndexError('Invalid codename code: {}'.format(code))
+        return self._codenames[code]
+
+    def get_names(self, codename):
+        """Get the raw names met that give a codename.
+
+        :param str codename: The codename.
+        :return tuple: The raw names, in order of appearance.
+        """
+        return tuple(self._names_by_codename.get(codename, ()))
+
+    def get_collisions(self):
+        """Get the codenames given by several distinct raw names met.
+
+        :return dict: The colliding raw names (tuple) by codename.
+        """
+        return {
+            cur_codename: tuple(cur_names)
+            for cur_codename, cur_names in self._names_by_codename.items()
+            if len(cur_names) > 1}
@@ -0,0 +1,98 @@
+"""IFC spatial containment index"""
+
+from collections import OrderedDict
+
+import ifcopenshell
+
+
+class IfcContainmentIndex():
+    """Index of the parent links of all the entities of an IFC file (as
+    `IfcObjectEntity.parent` reads them), and of the reverse links (parent to
+    children), built with one pass over the relations that describe them.
+
+    Entities are identified by their STEP id (`entity_instance.id()`).
+
+    :param ifcopenshell.file ifcos_file: The IFC file to index.
+    :param IfcSchema schema: The IFC schema specification description of data.
+    """
+
+    # Relations giving an entity's parent, by decreasing priority (see
+    #  `IfcObjectEntity._get_relating_object`):
+    #  (entity type, entity's inverse name, relation's relating attribute)
+    # Relation type and related attribute are read from the inverse's schema
+    #  definition (for example `Decomposes` is a set of `IfcRelDecomposes` in
+    #  IFC2X3, of `IfcRelAggregates` in IFC4).
+    PARENT_RELATIONS = (
+        ('IfcFeatureElementSubtraction', 'VoidsElements',
+         'RelatingBuildingElement',),
+        ('IfcElement', 'ContainedInStructure', 'RelatingStructure',),
+        ('IfcObjectDefinition', 'Decomposes', 'RelatingObject',),
+    )
+
+    def __init__(self, ifcos_file, schema):
+        self._parent_ids_by_id = self._read_parent_ids(ifcos_file, schema)
+        child_ids_by_id = OrderedDict()
+        for child_id, parent_id in self._parent_ids_by_id.items():
+            child_ids_by_id.setdefault(parent_id, []).append(child_id)
+        self._child_ids_by_id = OrderedDict(
+            (parent_id, tuple(child_ids),)
+            for parent_id, child_ids in child_ids_by_id.items())
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_children={nb_children}'
+            ', nb_parents={nb_parents}'
+            ')'.format(
+                self=self, nb_children=len(self._parent_ids_by_id),
+                nb_parents=len(self._child_ids_by_id)))
+
+    def _read_parent_ids(self, ifcos_file, schema):
+        # Read the parent of each entity, relation type by relation type, in
+        #  increasing priority order: a parent is set when an entity is
+        #  related once by a relation type, overriding a lower priority one.
+        parent_ids_by_id = OrderedDict()
+        for entity_name, inverse_name, relating_attr_name in reversed(
+                self.PARENT_RELATIONS):
+            inverse = schema.get_entity(entity_name).get_inverse(inverse_name)
+            parent_ids_by_rel_id = OrderedDict()
+            for cur_rel in ifcos_file.by_type(inverse.ifc_type_name):
+                related = getattr(cur_rel, inverse.for_attr)
+                if isinstance(related, ifcopenshell.entity_instance):
+                    related = (related,)
+                parent_id = getattr(cur_rel, relating_attr_name).id()
+                for cur_related in related:
+                    # the inverse only exists for `entity_name` entities
+                    if schema.entity_is_a(cur_related.is_a(), entity_name):
+                        parent_ids_by_rel_id.setdefault(
+                            cur_related.id(), []).append(parent_id)
+            for child_id, parent_ids in parent_ids_by_rel_id.items():
+                if len(parent_ids) == 1:
+                    parent_ids_by_id[child_id] = parent_ids[0]
+        return parent_ids_by_id
+
+    def get_parent_id(self, step_id):
+        """Get the STEP id of an entity's parent.
+
+        :param int step_id: The entity's STEP id.
+        :return int: The parent's STEP id, None if entity has no parent.
+        """
+        return self._parent_ids_by_id.get(step_id)
+
+    def get_root_ids(self):
+        """Get the STEP ids of the entities having children but no parent
+        (the project in a valid file).
+
+        :return tuple: The root STEP ids, in relations order.
+        """
+        return tuple(
+            cur_parent_id for cur_parent_id in self._child_ids_by_id
+            if cur_parent_id not in self._parent_ids_by_id)
+
+    def get_child_ids(self, step_id):
+        """Get the STEP ids of the entities having an entity as parent.
+
+        :param int step_id: The parent entity's STEP id.
+        :return tuple: The children STEP ids, in relations order.
+        """
+        return self._child_ids_by_id.get(step_id, ())
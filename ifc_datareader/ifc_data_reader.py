@@ -1,10 +1,23 @@
 """IFC data reader."""
 
+from collections import OrderedDict
+import itertools
 from pathlib import Path
+import weakref
 import ifcopenshell
 
+from .ifc_codename_table import IfcCodenameTable
+from .ifc_containment_index import IfcContainmentIndex
+from .ifc_entity_collection import IfcEntityCollection
+from .ifc_entity_set import IfcEntitySet
 from .ifc_object_entity import IfcObjectEntity
-from .schema import IfcSchema
+from .ifc_object_entity_pset import IfcObjectEntityPropertySetBase
+from .ifc_property_index import IfcPropertyIndex
+from .ifc_quantity_table import IfcQuantityTable
+from .ifc_spatial_tree import IfcSpatialTree
+from .ifc_unit_context import IfcUnitContext
+from .schema import IfcSchema, get_schema
+from .tools import build_column
 
 
 class IfcDataReader():
@@ -12,15 +25,51 @@ class IfcDataReader():
     Gives some features to ease IFC data access and navigation.
 
     :param str|Path filename: IFC full filename (absolute path) to read.
+    :param bool shared_schema: (optional, default True)
+        If True, the IFC schema instance is shared with all the other readers
+        of the process (see `IfcSchemaRegistry`). Else a private instance is
+        loaded.
+    :param bool lazy_schema: (optional, default True)
+        If True, schema entities are only parsed when first needed (see
+        `IfcSchema`), which speeds up reader's loading.
+
+    Entity wrappers are kept in an identity map, keyed by their STEP id
+    (see `get_wrapper`): a file entity is wrapped by a single instance, however
+    it is reached (`read_*`, `parent`, `kids`, `object_type`...), so that its
+    lazy loaded data is computed once. Wrappers of the entities shared by
+    many others (see `SHARED_TYPE_NAMES`) are kept for the reader's life, the
+    other ones while they are referenced.
     """
 
-    def __init__(self, filename):
+    # types of the entities shared by many others (the project, object
+    #  types): their wrappers are kept by the reader, so that their lazy
+    #  loaded data is computed once per file, even when the entities sharing
+    #  them are streamed (see `iter_entities`). Property sets and spatial
+    #  parents are not kept: their count grows with the file's size.
+    SHARED_TYPE_NAMES = ('IfcProject', 'IfcTypeObject',)
+
+    def __init__(self, filename, *, shared_schema=True, lazy_schema=True):
         self.filename = Path(filename)
         if not self.filename.is_file():
             raise ValueError('Invalid filename: {}'.format(filename))
 
         self._ifcos_file = ifcopenshell.open(str(self.filename))
-        self.ifc_schema = IfcSchema(self.schema_version)
+        if shared_schema:
+            self.ifc_schema = get_schema(
+                self.schema_version, lazy=lazy_schema)
+        else:
+            self.ifc_schema = IfcSchema(self.schema_version, lazy=lazy_schema)
+        # entity wrappers by STEP id (only while they are referenced)
+        self._entities_by_id = weakref.WeakValueDictionary()
+        # wrappers of shared entities by STEP id (for reader's life)
+        self._shared_entities_by_id = {}
+        # codenames of the names read in file (shared by entities and indexes)
+        self._codename_table = IfcCodenameTable()
+        # attributes below are in 'lazy' load style (loaded on call)
+        self._containment_index = None
+        self._spatial_tree = None
+        self._property_index = None
+        self._unit_context = None
         self.ifc_project = self._read_project()
 
     def __repr__(self):
@@ -41,6 +90,73 @@ class IfcDataReader():
             return ifcopenshell.schema_identifier[0]
         return None
 
+    @property
+    def codename_table(self):
+        """Get the intern table of the codenames of names read in file
+        (see `IfcCodenameTable`), filled as names are met."""
+        return self._codename_table
+
+    @property
+    def containment_index(self):
+        """Get the index of file entities' parent and children links
+        (see `IfcContainmentIndex`), built on first call."""
+        if self._containment_index is None:
+            self._containment_index = IfcContainmentIndex(
+                self._ifcos_file, self.ifc_schema)
+        return self._containment_index
+
+    @property
+    def spatial_tree(self):
+        """Get the tree of file entities, from the project to spaces and
+        elements (see `IfcSpatialTree`), built on first call."""
+        if self._spatial_tree is None:
+            self._spatial_tree = IfcSpatialTree(
+                self._ifcos_file, self.containment_index, self.ifc_schema)
+        return self._spatial_tree
+
+    @property
+    def property_index(self):
+        """Get the inverted index of objects' property values
+        (see `IfcPropertyIndex`), built on first call."""
+        if self._property_index is None:
+            self._property_index = IfcPropertyIndex(
+                self._ifcos_file, self.ifc_schema,
+                codename_table=self._codename_table)
+        return self._property_index
+
+    @property
+    def unit_context(self):
+        """Get the project's units, resolved to their conversion to SI
+        (see `IfcUnitContext`), on first call."""
+        if self._unit_context is None:
+            raw_units = ()
+            raw_unit_assignment = self.ifc_project.get_attribute(
+                'UnitsInContext')
+            if raw_unit_assignment is not None:
+                raw_units = raw_unit_assignment.Units
+            self._unit_context = IfcUnitContext(raw_units, self.ifc_schema)
+        return self._unit_context
+
+    def _check_entity_name(self, entity_name):
+        """Check that `entity_name` is an entity of reader's schema.
+
+        :param str entity_name: IFC entity class name.
+        :raises ValueError: When entity_name is not valid.
+        """
+        try:
+            self.ifc_schema.get_entity_type_id(entity_name)
+        except KeyError:
+            raise ValueError('Invalid entity name: {}'.format(entity_name))
+
+    def _check_entity(self, entity):
+        """Check that `entity` is an `IfcObjectEntity` instance.
+
+        :param IfcObjectEntity entity: An entity instance.
+        :raises ValueError: When entity instance is not valid.
+        """
+        if not isinstance(entity, IfcObjectEntity):
+            raise ValueError('Invalid entity instance: {}'.format(entity))
+
     def _read_project(self):
         """Get the unique `IfcProjet` entity."""
         res = self._read_entities('IfcProject')
@@ -49,35 +165,276 @@ class IfcDataReader():
                 'Invalid IFC file: must contain a unique `IfcProject` entity!')
         return res[0]
 
-    def _read_entities(self, entity_name, *, parent_entity=None):
+    def _read_entities(self, entity_name, *, include_subtypes=True,
+                       parent_entity=None):
         """Get a tuple of all `entity_name` entities, having `parent_entity` as
         family ascendant (if defined).
 
-        :param str entity_name: IFC entity class name.
+        :param str|tuple entity_name: IFC entity class name(s).
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `entity_name` subtypes are read too.
         :param IfcObjectEntity parent_entity: (optional, default None)
-            If defined it filters read entities having this value as parent.
+            If defined it filters read entities having this value as parent
+            (found with the containment index, in relations order).
         :raises ValueError:
             When entity_name is not valid.
             When parent_entity instance is not valid.
         """
-        if (parent_entity is not None
-                and not isinstance(parent_entity, IfcObjectEntity)):
-            raise ValueError(
-                'Invalid parent entity instance: {}'.format(parent_entity))
-        try:
-            # find entities using entity_name
-            entities = tuple(
-                IfcObjectEntity(cur_raw_entity, schema=self.ifc_schema)
-                for cur_raw_entity in self._ifcos_file.by_type(entity_name))
-            # filter found entities with parent entity matching
-            if parent_entity is not None:
-                entities = tuple(
-                    cur_entity for cur_entity in entities
-                    if cur_entity.parent.global_id == parent_entity.global_id)
-            return entities
-        except RuntimeError:
-            raise ValueError('Invalid entity name: {}'.format(entity_name))
-        return None
+        return tuple(self.iter_entities(
+            entity_name, include_subtypes=include_subtypes,
+            parent_entity=parent_entity))
+
+    def _resolve_type_names(self, type_names, *, include_subtypes=True):
+        """Resolve a set of type names through schema inheritance.
+
+        :param tuple type_names: IFC entity class names.
+        :param bool include_subtypes: (optional, default True)
+            If True, subtypes of `type_names` are accepted too.
+        :return tuple: (root_type_names, accepted_type_names,)
+            `root_type_names` are the type names that do not inherit from
+            another one of `type_names` (in `type_names` order): their
+            instances, subtypes included, are disjoint sets (IFC entities
+            have a single supertype) which contain all instances to read.
+            `accepted_type_names` is the set of the exact type names of the
+            instances to read.
+        :raises ValueError: When one of type_names is not valid.
+        """
+        for cur_type_name in type_names:
+            self._check_entity_name(cur_type_name)
+        type_name_set = set(type_names)
+        root_type_names = tuple(
+            cur_type_name for cur_type_name in OrderedDict.fromkeys(type_names)
+            if type_name_set.isdisjoint(
+                self.ifc_schema.get_entity_ancestor_names(cur_type_name)))
+        accepted_type_names = set(type_names)
+        if include_subtypes:
+            for cur_type_name in root_type_names:
+                accepted_type_names.update(
+                    self.ifc_schema.get_entity_subtype_names(
+                        cur_type_name, deep_inheritance=True))
+        return root_type_names, accepted_type_names
+
+    def _iter_raw_entities(self, type_names, *, include_subtypes=True,
+                           parent_entity=None):
+        """Get an iterator on the raw entities of `type_names` types (see
+        `iter_entities`), each entity being read once.
+
+        :param tuple type_names: IFC entity class names.
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `type_names` subtypes are read too.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent.
+        :return iterator: `ifcopenshell.entity_instance` instances.
+        :raises ValueError:
+            When one of type_names is not valid.
+            When parent_entity instance is not valid.
+        """
+        if parent_entity is not None:
+            self._check_entity(parent_entity)
+        root_type_names, accepted_type_names = self._resolve_type_names(
+            type_names, include_subtypes=include_subtypes)
+        if parent_entity is not None:
+            # only parent's children are read (and type checked)
+            raw_entities = map(
+                self._ifcos_file.by_id,
+                self.containment_index.get_child_ids(parent_entity._raw.id()))
+        else:
+            try:
+                # find entities of root types (`by_type` includes subtypes)
+                raw_entities = itertools.chain.from_iterable([
+                    self._ifcos_file.by_type(cur_type_name)
+                    for cur_type_name in root_type_names])
+            except RuntimeError:
+                raise ValueError(
+                    'Invalid entity name: {}'.format(type_names))
+            if include_subtypes:
+                return raw_entities
+        return (
+            cur_raw_entity for cur_raw_entity in raw_entities
+            if cur_raw_entity.is_a() in accepted_type_names)
+
+    @staticmethod
+    def _iter_batches(entities, batch_size):
+        """Get an iterator on tuples of `batch_size` entities (the last one can
+        be shorter).
+
+        :param iterator entities: An iterator on entities.
+        :param int batch_size: The number of entities of each batch.
+        """
+        batch = tuple(itertools.islice(entities, batch_size))
+        while len(batch) > 0:
+            yield batch
+            batch = tuple(itertools.islice(entities, batch_size))
+
+    def _stream(self, entities, *, undivided_only=False, batch_size=None):
+        """Get an iterator on entities (or batches of entities), filtered on
+        their `CompositionType`.
+
+        :param iterator entities: An iterator on `IfcObjectEntity` instances.
+        :param bool undivided_only: (optional, default False)
+            All entities must have an 'ELEMENT' as `CompositionType` value.
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :raises ValueError: When batch_size is not valid.
+        """
+        if batch_size is not None and (
+                not isinstance(batch_size, int) or batch_size <= 0):
+            raise ValueError('Invalid batch size: {}'.format(batch_size))
+        if undivided_only:
+            entities = (
+                cur_ent for cur_ent in entities if cur_ent.is_element)
+        if batch_size is not None:
+            return self._iter_batches(entities, batch_size)
+        return entities
+
+    def iter_entities(self, type_names, *, include_subtypes=True,
+                      parent_entity=None, batch_size=None):
+        """Get an iterator on all the entities of `type_names` types,
+        having `parent_entity` as family ascendant (if defined).
+
+        Entities are wrapped one at a time, while iterating: iteration can be
+        stopped at any time, and memory does not grow with the number of
+        entities read (as long as they are not kept by caller).
+        Each entity is read once, even when several of `type_names` match
+        it (for example 'IfcWall' and its subtype 'IfcWallStandardCase').
+
+        :param str|iterable type_names: IFC entity class name(s).
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `type_names` subtypes are read too (as
+            resolved by schema inheritance), else only `type_names` exact
+            types are read.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent
+            (found with the containment index, in relations order).
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded (the last
+            one can be shorter).
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        :raises ValueError:
+            When one of type_names is not valid.
+            When parent_entity instance is not valid.
+            When batch_size is not valid.
+        """
+        if isinstance(type_names, str):
+            type_names = (type_names,)
+        raw_entities = self._iter_raw_entities(
+            tuple(type_names), include_subtypes=include_subtypes,
+            parent_entity=parent_entity)
+        return self._stream(
+            map(self.get_object, raw_entities), batch_size=batch_size)
+
+    def iter_sites(self, *, undivided_only=True, batch_size=None):
+        """Get an iterator on all `IfcSite` entities in the file
+        (see `read_sites`).
+
+        :param bool undivided_only: (optional, default True)
+            All entities must have an 'ELEMENT' as `CompositionType` value.
+            Else the parent site is read, if it is an 'ELEMENT'.
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        def _iter_undivided_sites():
+            for cur_ent in self.iter_entities('IfcSite'):
+                if not undivided_only or cur_ent.is_element:
+                    yield cur_ent
+                elif (cur_ent.parent is not None
+                      and cur_ent.parent.is_element
+                      and cur_ent.parent.is_a('IfcSite')):
+                    yield cur_ent.parent
+
+        return self._stream(_iter_undivided_sites(), batch_size=batch_size)
+
+    def iter_buildings(self, *, undivided_only=True, parent_entity=None,
+                       batch_size=None):
+        """Get an iterator on all `IfcBuilding` entities in the file
+        (see `read_buildings`).
+
+        :param bool undivided_only: (optional, default True)
+            All entities must have an 'ELEMENT' as `CompositionType` value.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent.
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self._stream(
+            self.iter_entities('IfcBuilding', parent_entity=parent_entity),
+            undivided_only=undivided_only, batch_size=batch_size)
+
+    def iter_building_storeys(self, *, undivided_only=True,
+                              parent_entity=None, batch_size=None):
+        """Get an iterator on all `IfcBuildingStorey` entities in the file
+        (see `read_building_storeys`).
+
+        :param bool undivided_only: (optional, default True)
+            All entities must have an 'ELEMENT' as `CompositionType` value.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent.
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self._stream(
+            self.iter_entities(
+                'IfcBuildingStorey', parent_entity=parent_entity),
+            undivided_only=undivided_only, batch_size=batch_size)
+
+    def iter_spaces(self, *, undivided_only=True, parent_entity=None,
+                    batch_size=None):
+        """Get an iterator on all `IfcSpace` entities in the file
+        (see `read_spaces`).
+
+        :param bool undivided_only: (optional, default True)
+            All entities must have an 'ELEMENT' as `CompositionType` value.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent.
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self._stream(
+            self.iter_entities('IfcSpace', parent_entity=parent_entity),
+            undivided_only=undivided_only, batch_size=batch_size)
+
+    def iter_zones(self, *, batch_size=None):
+        """Get an iterator on all `IfcZone` entities in the file.
+
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self.iter_entities('IfcZone', batch_size=batch_size)
+
+    def iter_walls(self, *, batch_size=None):
+        """Get an iterator on all `IfcWall` entities in the file (subtypes,
+        such as `IfcWallStandardCase`, included).
+
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self.iter_entities('IfcWall', batch_size=batch_size)
+
+    def iter_slabs(self, *, batch_size=None):
+        """Get an iterator on all `IfcSlab` entities in the file (subtypes
+        included).
+
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self.iter_entities('IfcSlab', batch_size=batch_size)
+
+    def iter_windows(self, *, batch_size=None):
+        """Get an iterator on all `IfcWindow` entities in the file (subtypes
+        included).
+
+        :param int batch_size: (optional, default None)
+            If defined, tuples of `batch_size` entities are yielded.
+        :return iterator: IfcObjectEntity instances (or tuples of).
+        """
+        return self.iter_entities('IfcWindow', batch_size=batch_size)
 
     def read_sites(self, *, undivided_only=True):
         """Get a tuple of all `IfcSite` entities in the file.
@@ -86,14 +443,7 @@ class IfcDataReader():
             All entities must have an 'ELEMENT' as `CompositionType` value.
         :return tuple: All IfcObjectEntity instances found.
         """
-        site_entities = ()
-        for cur_ent in self._read_entities('IfcSite'):
-            if not undivided_only or (undivided_only and cur_ent.is_element):
-                site_entities += (cur_ent,)
-            elif (cur_ent.parent is not None and cur_ent.parent.is_element
-                  and cur_ent.parent.is_a('IfcSite')):
-                site_entities += (cur_ent.parent,)
-        return site_entities
+        return tuple(self.iter_sites(undivided_only=undivided_only))
 
     def read_buildings(self, *, undivided_only=True, parent_entity=None):
         """Get a tuple of all `IfcBuilding` entities in the file.
@@ -104,11 +454,8 @@ class IfcDataReader():
             If defined it filters read entities having this value as parent.
         :return tuple: All IfcObjectEntity instances found.
         """
-        return tuple(
-            cur_ent
-            for cur_ent in self._read_entities(
-                'IfcBuilding', parent_entity=parent_entity)
-            if not undivided_only or (undivided_only and cur_ent.is_element))
+        return tuple(self.iter_buildings(
+            undivided_only=undivided_only, parent_entity=parent_entity))
 
     def read_building_storeys(
             self, *, undivided_only=True, parent_entity=None):
@@ -120,11 +467,8 @@ class IfcDataReader():
             If defined it filters read entities having this value as parent.
         :return tuple: All IfcObjectEntity instances found.
         """
-        return tuple(
-            cur_ent
-            for cur_ent in self._read_entities(
-                'IfcBuildingStorey', parent_entity=parent_entity)
-            if not undivided_only or (undivided_only and cur_ent.is_element))
+        return tuple(self.iter_building_storeys(
+            undivided_only=undivided_only, parent_entity=parent_entity))
 
     def read_spaces(self, *, undivided_only=True, parent_entity=None):
         """Get a tuple of all `IfcSpace` entities in the file.
@@ -135,50 +479,448 @@ class IfcDataReader():
             If defined it filters read entities having this value as parent.
         :return tuple: All IfcObjectEntity instances found.
         """
-        return tuple(
-            cur_ent
-            for cur_ent in self._read_entities(
-                'IfcSpace', parent_entity=parent_entity)
-            if not undivided_only or (undivided_only and cur_ent.is_element))
+        return tuple(self.iter_spaces(
+            undivided_only=undivided_only, parent_entity=parent_entity))
 
     def read_zones(self):
         """Get a tuple of all `IfcZone` entities in the file.
 
         :return tuple: All IfcObjectEntity instances found.
         """
-        return self._read_entities('IfcZone')
+        return tuple(self.iter_zones())
 
     def read_walls(self):
-        """Get a tuple of all `IfcWall` and `IfcWallStandardCase` entities in
-        the file.
+        """Get a tuple of all `IfcWall` entities in the file (subtypes, such
+        as `IfcWallStandardCase`, included).
         :return tuple: All IfcObjectEntity instances found.
         """
-        return self._read_entities('IfcWall') +\
-            self._read_entities('IfcWallStandardCase')
+        return tuple(self.iter_walls())
 
     def read_slabs(self):
         """Get a tuple of all `Slab` entities in the file.
         :return tuple: All IfcObjectEntity instances found.
         """
-        return self._read_entities('IfcSlab')
+        return tuple(self.iter_slabs())
 
     def read_windows(self):
         """Get a tuple of all `IfcWindows` entities in
         the file.
         :return tuple: All IfcObjectEntity instances found.
         """
-        return self._read_entities('IfcWindow')
+        return tuple(self.iter_windows())
 
-    def read_entity(self, entity_name, *, parent_entity=None):
+    def read_entity(self, entity_name, *, include_subtypes=True,
+                    parent_entity=None):
         """Get a tuple of all `entity_name` entities in the file,
         having `parent_entity` as family ascendant (if defined).
 
-        :param str entity_name: An IFC entity class name.
+        :param str|iterable entity_name: IFC entity class name(s).
+            Each entity is read once, even when several names match it.
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `entity_name` subtypes are read too.
+        :param IfcObjectEntity parent_entity: (optional, default None)
+            If defined it filters read entities having this value as parent.
+        :return tuple: All IfcObjectEntity instances found.
+        """
+        return self._read_entities(
+            entity_name, include_subtypes=include_subtypes,
+            parent_entity=parent_entity)
+
+    def read_entity_set(self, type_names, *, include_subtypes=True,
+                        parent_entity=None):
+        """Get the set of all the entities of `type_names` types, having
+        `parent_entity` as family ascendant (if defined), as an
+        `IfcEntitySet` (see `iter_entities`). Entities are not wrapped.
+
+        :param str|iterable type_names: IFC entity class name(s).
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `type_names` subtypes are read too.
         :param IfcObjectEntity parent_entity: (optional, default None)
             If defined it filters read entities having this value as parent.
+        :return IfcEntitySet: The entity set.
+        :raises ValueError:
+            When one of type_names is not valid.
+            When parent_entity instance is not valid.
+        """
+        if isinstance(type_names, str):
+            type_names = (type_names,)
+        return IfcEntitySet(self, (
+            cur_raw_entity.id()
+            for cur_raw_entity in self._iter_raw_entities(
+                tuple(type_names), include_subtypes=include_subtypes,
+                parent_entity=parent_entity)))
+
+    def get_entity_set(self, entities):
+        """Convert entities (a `read_*` result...) to an `IfcEntitySet`,
+        without wrapping them again.
+
+        :param iterable entities: IfcObjectEntity instances.
+        :return IfcEntitySet: The entity set.
+        :raises ValueError: When an entity instance is not valid.
+        """
+        return IfcEntitySet.from_entities(self, entities)
+
+    def query(self, type_names=('IfcObject',)):
+        """Get a lazy query on all the entities of `type_names` types (see
+        `IfcEntityCollection`), to filter them and project their attributes
+        and properties in a single pass.
+
+        :param str|iterable type_names: (optional, default ('IfcObject',))
+            IFC entity class name(s) (subtypes included).
+        :return IfcEntityCollection: The entity collection.
+        :raises ValueError: When one of type_names is not valid.
+        """
+        return IfcEntityCollection(self, type_names)
+
+    def get_collection(self, entities):
+        """Convert entities (a `read_*` result...) to a lazy query (see
+        `IfcEntityCollection`).
+
+        :param iterable entities: IfcObjectEntity instances (of `IfcObject`
+            entities).
+        :return IfcEntityCollection: The entity collection.
+        :raises ValueError: When an entity instance is not valid.
+        """
+        return IfcEntityCollection.from_entities(self, entities)
+
+    def read_descendants(self, entity, *, entity_name=None):
+        """Get a tuple of all the descendants of an entity (its children,
+        their children...), using the spatial tree (see `spatial_tree`).
+
+        :param IfcObjectEntity entity: The ascendant entity.
+        :param str entity_name: (optional, default None)
+            If defined, only `entity_name` entities (or subtypes) are read.
+        :return tuple: All IfcObjectEntity instances found, in tree order.
+        :raises ValueError:
+            When entity instance or entity_name is not valid.
+        """
+        self._check_entity(entity)
+        if entity_name is not None:
+            self._check_entity_name(entity_name)
+        step_id = entity._raw.id()
+        if step_id not in self.spatial_tree:
+            return ()
+        return tuple(
+            self.get_object(self._ifcos_file.by_id(cur_id))
+            for cur_id in self.spatial_tree.get_descendant_ids(
+                step_id, entity_name=entity_name))
+
+    def read_ancestors(self, entity):
+        """Get a tuple of the ancestors of an entity, from its parent to the
+        project, using the spatial tree (see `spatial_tree`).
+
+        :param IfcObjectEntity entity: The descendant entity.
         :return tuple: All IfcObjectEntity instances found.
+        :raises ValueError: When entity instance is not valid.
         """
-        return self._read_entities(entity_name, parent_entity=parent_entity)
+        self._check_entity(entity)
+        step_id = entity._raw.id()
+        if step_id not in self.spatial_tree:
+            return ()
+        return tuple(
+            self.get_object(self._ifcos_file.by_id(cur_id))
+            for cur_id in self.spatial_tree.get_ancestor_ids(step_id))
+
+    def _get_objects(self, step_ids):
+        """Get a tuple of the objects of STEP ids.
+
+        :param tuple step_ids: Objects' STEP ids.
+        :return tuple: IfcObjectEntity instances.
+        """
+        return tuple(
+            self.get_object(self._ifcos_file.by_id(cur_id))
+            for cur_id in step_ids)
+
+    def read_entities_with_property(
+            self, property_codename, *, pset_codename=None):
+        """Get a tuple of all the objects having a property (whatever its
+        value), using the property index (see `property_index`).
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return tuple: All IfcObjectEntity instances found.
+        """
+        return self._get_objects(self.property_index.get_entity_ids(
+            property_codename, pset_codename=pset_codename))
+
+    def read_entities_by_property_value(
+            self, property_codename, value, *, pset_codename=None):
+        """Get a tuple of all the objects having a property value, using the
+        property index (see `property_index`).
+
+        :param str property_codename: The property's codename.
+        :param value: The property value (compared with equality, values of
+            another type never match: `True`, `1` and `1.0` are distinct).
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return tuple: All IfcObjectEntity instances found.
+        """
+        return self._get_objects(self.property_index.get_entity_ids_by_value(
+            property_codename, value, pset_codename=pset_codename))
+
+    def read_entities_by_property_range(
+            self, property_codename, *, pset_codename=None, min_value=None,
+            max_value=None):
+        """Get a tuple of all the objects having a numeric property value in
+        a range (bounds included), using the property index (see
+        `property_index`).
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :param float min_value: (optional, default None)
+            The range's lower bound. If `None`, the range has no lower bound.
+        :param float max_value: (optional, default None)
+            The range's upper bound. If `None`, the range has no upper bound.
+        :return tuple: All IfcObjectEntity instances found.
+        """
+        return self._get_objects(self.property_index.get_entity_ids_in_range(
+            property_codename, pset_codename=pset_codename,
+            min_value=min_value, max_value=max_value))
+
+    def load_property_sets(self, entities):
+        """Load the property sets of entities at once (pset-centric reading).
+
+        Instead of each entity reading its own relations (see
+        `IfcObjectEntity.property_sets`), the `IfcRelDefinesByProperties`
+        relations of the file are walked once: each property set (and its
+        properties) is wrapped and decoded once, and the same instance is
+        shared by all the entities it is related to.
+
+        :param iterable entities: The IfcObjectEntity instances.
+        :return tuple: The entities, with their property sets loaded.
+        :raises ValueError: When an entity instance is not valid.
+        """
+        entities = tuple(entities)
+        # {object STEP id: [raw property sets]} (relations order)
+        raw_psets_by_id = {}
+        for cur_entity in entities:
+            self._check_entity(cur_entity)
+            if (cur_entity._property_sets is None
+                    and cur_entity.is_a('IfcObject')):
+                raw_psets_by_id[cur_entity._raw.id()] = []
+            else:
+                # not read from relations (type objects...) or already read
+                cur_entity.property_sets
+        if len(raw_psets_by_id) > 0:
+            for cur_rel in self._ifcos_file.by_type(
+                    'IfcRelDefinesByProperties'):
+                cur_raw_pset = cur_rel.RelatingPropertyDefinition
+                # ignore `IfcElementQuantity` properties (see quantities)
+                if self.ifc_schema.entity_is_a(
+                        cur_raw_pset.is_a(), 'IfcElementQuantity'):
+                    continue
+                for cur_raw_obj in cur_rel.RelatedObjects:
+                    raw_psets = raw_psets_by_id.get(cur_raw_obj.id())
+                    if raw_psets is not None:
+                        raw_psets.append(cur_raw_pset)
+        # {property set STEP id: wrapper} (each one decoded once)
+        psets_by_id = {}
+        for cur_entity in entities:
+            raw_psets = raw_psets_by_id.pop(cur_entity._raw.id(), None)
+            if raw_psets is None:
+                continue
+            psets = ()
+            for cur_raw_pset in raw_psets:
+                pset_id = cur_raw_pset.id()
+                if pset_id not in psets_by_id:
+                    pset = self.get_wrapper(
+                        cur_raw_pset, IfcObjectEntityPropertySetBase.create)
+                    if pset is not None:
+                        pset.properties
+                    psets_by_id[pset_id] = pset
+                if psets_by_id[pset_id] is not None:
+                    psets += (psets_by_id[pset_id],)
+            # as `IfcObjectEntity._load_property_sets`, None when no pset
+            cur_entity._property_sets = psets or None
+        return entities
+
+    def _read_pset_property_values(self, raw_pset, property_codenames):
+        """Read (value, unit) of some simple properties of a property set
+        (as `IfcObjectEntitySimpleProperty` value and unit).
+
+        :param ifcopenshell.entity_instance raw_pset: An `IfcPropertySet`.
+        :param set property_codenames: The properties codenames.
+        :return dict: (value, unit) by property codename (of the first
+            property found, for each codename).
+        """
+        schema = self.ifc_schema
+        get_codename = self._codename_table.get_codename
+        values = {}
+        for cur_raw_prop in schema.get_raw_attribute(
+                raw_pset, 'HasProperties'):
+            if not schema.entity_is_a(
+                    cur_raw_prop.is_a(), 'IfcSimpleProperty'):
+                continue
+            prop_codename = get_codename(
+                schema.get_raw_attribute(cur_raw_prop, 'Name'))
+            if (prop_codename not in property_codenames
+                    or prop_codename in values):
+                continue
+            nominal_value = schema.get_raw_attribute(
+                cur_raw_prop, 'NominalValue')
+            values[prop_codename] = (
+                None if nominal_value is None
+                else nominal_value.wrappedValue,
+                schema.get_raw_attribute(cur_raw_prop, 'Unit'),)
+        return values
+
+    def _read_property_values(self, entity, property_codenames,
+                              pset_values_by_id, *, pset_codename=None):
+        """Read (value, unit) of some properties of an object, with one walk
+        over its `IsDefinedBy` relations, as `get_property_value` would (the
+        first property found, for each codename).
+
+        :param IfcObjectEntity entity: The entity.
+        :param set property_codenames: The properties codenames.
+        :param dict pset_values_by_id: Property sets already read (see
+            `_read_pset_property_values`), by STEP id, completed with the
+            ones of the entity (property sets are shared by objects).
+        :param str pset_codename: (optional, default None)
+            The property set's codename in which properties are searched.
+        :return dict: (value, unit) by property codename (of properties
+            found), None when entity's property sets are not all
+            `IfcPropertySet` (they need their wrappers to be read).
+        """
+        if not entity.is_a('IfcObject'):
+            return None
+        schema = self.ifc_schema
+        values = {}
+        for cur_rel in entity._raw.IsDefinedBy:
+            if not schema.entity_is_a(
+                    cur_rel.is_a(), 'IfcRelDefinesByProperties'):
+                continue
+            raw_pset = schema.get_raw_attribute(
+                cur_rel, 'RelatingPropertyDefinition')
+            pset_values = pset_values_by_id.get(raw_pset.id())
+            if pset_values is None:
+                raw_pset_type_name = raw_pset.is_a()
+                # ignore `IfcElementQuantity` properties (see quantities)
+                if schema.entity_is_a(
+                        raw_pset_type_name, 'IfcElementQuantity'):
+                    pset_values = {}
+                elif not schema.entity_is_a(
+                        raw_pset_type_name, 'IfcPropertySet'):
+                    return None
+                elif pset_codename is not None and (
+                        self._codename_table.get_codename(
+                            schema.get_raw_attribute(raw_pset, 'Name'))
+                        != pset_codename):
+                    pset_values = {}
+                else:
+                    pset_values = self._read_pset_property_values(
+                        raw_pset, property_codenames)
+                pset_values_by_id[raw_pset.id()] = pset_values
+            for cur_codename, cur_value in pset_values.items():
+                values.setdefault(cur_codename, cur_value)
+        return values
+
+    def get_property_matrix(self, entities, property_codenames, *,
+                            pset_codename=None):
+        """Get the values (and units) of some properties of entities, as a
+        table of columns (one per property).
+
+        Values are the ones `IfcObjectEntity.get_property_value` gives, read
+        with one walk over each entity's `IsDefinedBy` relations (entities
+        having other property sets than `IfcPropertySet` are read with
+        `get_property_value`).
+
+        :param iterable entities: IfcObjectEntity instances (table rows).
+        :param iterable property_codenames: The properties codenames (table
+            columns).
+        :param str pset_codename: (optional, default None)
+            The property set's codename in which properties are searched.
+            If `None`, properties are looked into all entity's property sets
+            (returning the first occurence found).
+        :return tuple: (values, units,) ordered dicts of columns by property
+            codename (in `property_codenames` order). Value columns of
+            numbers are NumPy arrays when NumPy is installed, other columns
+            are tuples (see `tools.build_column`). Missing values are None
+            (NaN in float arrays).
+        :raises ValueError: When an entity instance is not valid.
+        """
+        property_codenames = tuple(OrderedDict.fromkeys(property_codenames))
+        property_codename_set = set(property_codenames)
+        pset_values_by_id = {}
+        rows = []
+        for cur_entity in entities:
+            self._check_entity(cur_entity)
+            values = self._read_property_values(
+                cur_entity, property_codename_set, pset_values_by_id,
+                pset_codename=pset_codename)
+            if values is None:
+                values = {
+                    cur_codename: cur_entity.get_property_value(
+                        cur_codename, pset_codename=pset_codename)
+                    for cur_codename in property_codenames}
+            rows.append(values)
+        values = OrderedDict()
+        units = OrderedDict()
+        for cur_codename in property_codenames:
+            cells = [
+                cur_row.get(cur_codename, (None, None,)) for cur_row in rows]
+            values[cur_codename] = build_column(
+                [cur_value for cur_value, _ in cells])
+            units[cur_codename] = tuple(cur_unit for _, cur_unit in cells)
+        return values, units
+
+    def _get_storey_id(self, step_id):
+        """Get the STEP id of the building storey of an entity (the storey
+        itself, or its nearest storey ancestor in the spatial tree).
+
+        :param int step_id: The entity's STEP id.
+        :return int: The storey's STEP id, None if entity is not in a storey.
+        """
+        if step_id not in self.spatial_tree:
+            return None
+        for cur_id in itertools.chain(
+                (step_id,), self.spatial_tree.get_ancestor_ids(step_id)):
+            if self.ifc_schema.entity_is_a(
+                    self._ifcos_file.by_id(cur_id).is_a(),
+                    'IfcBuildingStorey'):
+                return cur_id
+        return None
+
+    def read_quantity_table(self, type_names=('IfcObject',), *,
+                            group_by='type'):
+        """Get the simple quantities of all the entities of `type_names`
+        types as a columnar table (see `IfcQuantityTable`), read with one
+        pass over the quantity relations. Entities are not wrapped.
+
+        :param str|iterable type_names: (optional, default ('IfcObject',))
+            IFC entity class name(s) (subtypes included).
+        :param str group_by: (optional, default 'type')
+            How rows are grouped (see `IfcQuantityTable.get_group`):
+            'type' by entity type name, 'storey' by building storey STEP id
+            (None for entities out of a storey, see `spatial_tree`), None for
+            a single group. Rows are contiguous for this grouping only (the
+            types within a storey are not): read another table to group them
+            another way.
+        :return IfcQuantityTable: The quantity table.
+        :raises ValueError: When one of type_names or group_by is not valid.
+        """
+        if isinstance(type_names, str):
+            type_names = (type_names,)
+        _, accepted_type_names = self._resolve_type_names(tuple(type_names))
+
+        def _get_type_name(raw_data):
+            return raw_data.is_a()
+
+        def _get_storey_id(raw_data):
+            return self._get_storey_id(raw_data.id())
+        group_keys = {
+            'type': _get_type_name, 'storey': _get_storey_id, None: None}
+        if group_by not in group_keys:
+            raise ValueError('Invalid group_by: {}'.format(group_by))
+        return IfcQuantityTable(
+            self._ifcos_file, self.ifc_schema,
+            accepted_type_names=accepted_type_names,
+            group_key=group_keys[group_by],
+            codename_table=self._codename_table)
 
     def get_object(self, entity):
         """Simple conversion method: get an IfcObjectEntity from a raw entity
@@ -186,4 +928,49 @@ class IfcDataReader():
         :param raw entity entity: An IFC entity
         :return IfcObjectEntity: The converted entity
         """
-        return IfcObjectEntity(entity, schema=self.ifc_schema)
+        return self.get_wrapper(
+            entity, IfcObjectEntity, expected_types=('IfcObject',))
+
+    def _is_shared_type(self, type_name):
+        # True if the entities of a type are shared by many others.
+        return any(
+            self.ifc_schema.entity_is_a(type_name, cur_type_name)
+            for cur_type_name in self.SHARED_TYPE_NAMES)
+
+    def get_wrapper(self, raw_data, factory, **kwargs):
+        """Get the canonical wrapper of a raw entity of the file.
+
+        Wrappers of shared entities (see `SHARED_TYPE_NAMES`) are kept by
+        STEP id for the reader's life. The other ones are kept while they are
+        referenced (by the caller, or by another wrapper as its kids...):
+        while they are, the same instance is returned.
+
+        :param ifcopenshell.entity_instance raw_data: An entity of the file.
+        :param callable factory:
+            Creates the wrapper when none is found, called with `raw_data`,
+            reader's schema, the reader and `kwargs` (a wrapper class or its
+            `create` class method). Can return None.
+        :param kwargs: Keyword arguments given to `factory`.
+            When `expected_types` is defined, a wrapper found is checked too.
+        :return IfcBaseEntity: The wrapper (None if `factory` returned None).
+        :raises ValueError:
+            When wrapper found does not inherit from one of `expected_types`.
+            When `factory` fails validating `raw_data` (see `IfcBaseEntity`).
+        """
+        step_id = raw_data.id()
+        entity = self._entities_by_id.get(step_id)
+        if entity is None:
+            entity = factory(
+                raw_data, schema=self.ifc_schema, reader=self, **kwargs)
+            if entity is not None:
+                self._entities_by_id[step_id] = entity
+                if self._is_shared_type(raw_data.is_a()):
+                    self._shared_entities_by_id[step_id] = entity
+        else:
+            expected_types = kwargs.get('expected_types') or ()
+            for cur_expected_type in expected_types:
+                if not entity.is_a(cur_expected_type):
+                    raise ValueError(
+                        'Invalid entity type: `{}`. {} expected.'.format(
+                            entity.type_name, expected_types))
+        return entity
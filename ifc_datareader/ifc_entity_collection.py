@@ -0,0 +1,239 @@
+"""IFC entity collection (lazy query)"""
+
+from collections import OrderedDict
+
+from .ifc_entity_set import IfcEntitySet
+from .tools import build_column
+
+
+class _IdsFilter():
+    """Filter keeping the raw entities whose STEP id is in a set of ids,
+    read on first filtering only (collections are lazy).
+
+    :param callable get_ids: Function giving the STEP ids to keep.
+    """
+
+    def __init__(self, get_ids):
+        self._get_ids = get_ids
+        self._ids = None
+
+    def __call__(self, raw_entity):
+        if self._ids is None:
+            self._ids = set(self._get_ids())
+        return raw_entity.id() in self._ids
+
+
+class IfcEntityCollection():
+    """Lazy, chainable query on the objects of a file read by an
+    `IfcDataReader`.
+
+    Each step (`filter`, `within`, `select`) returns a new collection and
+    reads nothing: the raw instances are only read when the collection is
+    iterated (or counted, or projected), in a single pass applying all the
+    steps in turn. Entities are only wrapped (see `IfcDataReader.get_object`)
+    when iterated, or to call a `filter` predicate.
+
+    Property values are read from the reader's property index (see
+    `IfcDataReader.property_index`) and spatial links from its spatial tree.
+
+    :param IfcDataReader reader: The data reader of the entities.
+    :param tuple type_names: (optional, default ('IfcObject',))
+        IFC entity class names of the entities to read (see
+        `IfcDataReader.iter_entities`). Ignored if `step_ids` is defined.
+    :param iterable step_ids: (optional, default None)
+        If defined, the STEP ids of the entities to read (in that order).
+    """
+
+    def __init__(self, reader, type_names=('IfcObject',), *, step_ids=None):
+        self._reader = reader
+        if isinstance(type_names, str):
+            type_names = (type_names,)
+        self._type_names = tuple(type_names)
+        if step_ids is not None:
+            step_ids = tuple(step_ids)
+        else:
+            # check type names now, not on first read
+            self._reader._resolve_type_names(self._type_names)
+        self._step_ids = step_ids
+        # steps: [(function(raw entity) -> bool)]
+        self._filters = ()
+        # projected attributes: [(selector, function(raw entities) -> values)]
+        self._selectors = ()
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'type_names={self._type_names}'
+            ', nb_filters={nb_filters}'
+            ', selectors={selectors}'
+            ')'.format(
+                self=self, nb_filters=len(self._filters),
+                selectors=tuple(
+                    cur_selector for cur_selector, _ in self._selectors)))
+
+    def __iter__(self):
+        return map(self._reader.get_object, self._iter_raw())
+
+    def __len__(self):
+        return sum(1 for _ in self._iter_raw())
+
+    @classmethod
+    def from_entities(cls, reader, entities):
+        """Create a collection from entities (a `read_*` result...).
+
+        :param IfcDataReader reader: The data reader of the entities.
+        :param iterable entities: IfcObjectEntity instances of `IfcObject`
+            entities (not object types, as collections wrap the entities
+            they read with `IfcDataReader.get_object`).
+        :return IfcEntityCollection: The collection, in `entities` order.
+        :raises ValueError: When an entity instance is not valid.
+        """
+        step_ids = []
+        for cur_entity in entities:
+            reader._check_entity(cur_entity)
+            if not cur_entity.is_a('IfcObject'):
+                raise ValueError(
+                    'Invalid entity type: `{}`. IfcObject expected.'.format(
+                        cur_entity.type_name))
+            step_ids.append(cur_entity._raw.id())
+        return cls(reader, step_ids=step_ids)
+
+    def _copy(self, *, filters=(), selectors=()):
+        # A new collection, with more steps.
+        collection = self.__class__.__new__(self.__class__)
+        collection.__dict__.update(self.__dict__)
+        collection._filters = self._filters + tuple(filters)
+        collection._selectors = self._selectors + tuple(selectors)
+        return collection
+
+    def _iter_raw(self):
+        # The single pass: raw instances filtered by all steps.
+        if self._step_ids is not None:
+            raw_entities = map(self._reader._ifcos_file.by_id, self._step_ids)
+        else:
+            raw_entities = self._reader._iter_raw_entities(self._type_names)
+        for cur_filter in self._filters:
+            raw_entities = filter(cur_filter, raw_entities)
+        return raw_entities
+
+    def filter(self, *, type_name=None, name=None, pset=None,
+               predicate=None):
+        """Filter the entities of the collection (all criteria defined must
+        be met).
+
+        :param str type_name: (optional, default None)
+            IFC entity class name the entities are (or inherit from).
+        :param str name: (optional, default None)
+            The entities `Name`.
+        :param str pset: (optional, default None)
+            A property set (name or codename) entities have (with simple
+            properties, see `IfcPropertyIndex`).
+        :param callable predicate: (optional, default None)
+            A function called with the entity (`IfcObjectEntity`), returning
+            True to keep it.
+        :return IfcEntityCollection: The filtered collection.
+        :raises ValueError: When type_name is not valid.
+        """
+        filters = []
+        if type_name is not None:
+            self._reader._check_entity_name(type_name)
+            schema = self._reader.ifc_schema
+            filters.append(
+                lambda raw: schema.entity_is_a(raw.is_a(), type_name))
+        if name is not None:
+            get_attribute = self._reader.ifc_schema.get_raw_attribute
+            filters.append(lambda raw: get_attribute(raw, 'Name') == name)
+        if pset is not None:
+            pset_codename = self._reader.codename_table.get_codename(pset)
+            filters.append(_IdsFilter(
+                lambda: self._reader.property_index.get_entity_ids_with_pset(
+                    pset_codename)))
+        if predicate is not None:
+            filters.append(
+                lambda raw: predicate(self._reader.get_object(raw)))
+        return self._copy(filters=filters)
+
+    def within(self, parent_entity):
+        """Keep the entities of the collection that are descendants of an
+        entity (see `IfcDataReader.read_descendants`).
+
+        :param IfcObjectEntity parent_entity: The ascendant entity.
+        :return IfcEntityCollection: The filtered collection.
+        :raises ValueError: When parent_entity instance is not valid.
+        """
+        self._reader._check_entity(parent_entity)
+        step_id = parent_entity._raw.id()
+
+        def _get_descendant_ids():
+            spatial_tree = self._reader.spatial_tree
+            if step_id not in spatial_tree:
+                return ()
+            return spatial_tree.get_descendant_ids(step_id)
+        return self._copy(filters=(_IdsFilter(_get_descendant_ids),))
+
+    def select(self, *selectors):
+        """Choose the attributes projected by `to_columns`.
+
+        :param str selectors: Entity attribute names ('Name', 'GlobalId'...)
+            or property set and property names separated by a dot
+            ('Pset_SpaceCommon.NetFloorArea'), or '*.PropertyName' to look
+            for the property in all property sets. Property values are the
+            ones `IfcObjectEntity.get_property_value` gives (the first one
+            found in each entity's property sets).
+        :return IfcEntityCollection: The collection, with its projection.
+        """
+        return self._copy(selectors=tuple(
+            (cur_selector, self._get_projection(cur_selector),)
+            for cur_selector in selectors))
+
+    def _get_projection(self, selector):
+        # A function giving the values of the `selector` attribute, from
+        #  raw entities.
+        if '.' not in selector:
+            get_attribute = self._reader.ifc_schema.get_raw_attribute
+            return lambda raw_entities: [
+                get_attribute(cur_raw, selector) for cur_raw in raw_entities]
+        get_codename = self._reader.codename_table.get_codename
+        pset_name, prop_name = selector.split('.', 1)
+        pset_codename = None if pset_name == '*' else get_codename(pset_name)
+        prop_codename = get_codename(prop_name)
+
+        def _project(raw_entities):
+            values_by_id = self._reader.property_index.get_entity_values(
+                prop_codename, pset_codename=pset_codename)
+            return [values_by_id.get(cur_raw.id()) for cur_raw in raw_entities]
+        return _project
+
+    def to_columns(self):
+        """Read the collection and project its selected attributes (see
+        `select`) as columns.
+
+        Numeric columns are NumPy arrays when NumPy is installed, other
+        columns are tuples (see `tools.build_column`).
+
+        :return OrderedDict: Columns by selector, in selection order, after
+            the entities STEP ids (by 'step_id'), in collection order.
+        """
+        raw_entities = list(self._iter_raw())
+        columns = OrderedDict()
+        columns['step_id'] = build_column([
+            cur_raw.id() for cur_raw in raw_entities])
+        for cur_selector, cur_projection in self._selectors:
+            columns[cur_selector] = build_column(
+                cur_projection(raw_entities))
+        return columns
+
+    def to_entity_set(self):
+        """Read the collection as an `IfcEntitySet` (entities not wrapped).
+
+        :return IfcEntitySet: The entity set.
+        """
+        return IfcEntitySet(
+            self._reader, (cur_raw.id() for cur_raw in self._iter_raw()))
+
+    def to_tuple(self):
+        """Read the collection as a tuple of entities.
+
+        :return tuple: IfcObjectEntity instances.
+        """
+        return tuple(self)
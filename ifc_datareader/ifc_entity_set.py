@@ -0,0 +1,173 @@
+"""IFC entity set"""
+
+import array
+import bisect
+
+from .ifc_object_entity import IfcObjectEntity
+
+
+class IfcEntitySet():
+    """Set of entities of a file read by an `IfcDataReader`, stored as a sorted
+    array of unique STEP ids (wrappers are not kept).
+
+    Set algebra (union, intersection, difference) runs in linear time on the
+    id arrays and membership is a binary search. Iterating a set gives the
+    entities wrappers, in STEP id order, from the reader's identity map (see
+    `IfcDataReader.get_wrapper`): those still referenced (for example by the
+    `read_*` result a set is built from) are not wrapped again.
+
+    :param IfcDataReader reader: The data reader of the entities.
+    :param iterable step_ids: (optional, default ())
+        The STEP ids of the entities (in any order, duplicates allowed).
+    """
+
+    # identity map wrappers are checked against this type (object types and
+    #  property sets... are `IfcObjectDefinition` too)
+    _EXPECTED_TYPES = ('IfcObjectDefinition',)
+
+    def __init__(self, reader, step_ids=()):
+        self._reader = reader
+        self._ids = array.array('q', sorted(set(step_ids)))
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_entities={nb_entities}'
+            ')'.format(self=self, nb_entities=len(self)))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        for cur_id in self._ids:
+            yield self._reader.get_wrapper(
+                self._reader._ifcos_file.by_id(cur_id), IfcObjectEntity,
+                expected_types=self._EXPECTED_TYPES)
+
+    def __contains__(self, entity):
+        try:
+            step_id = self._get_step_id(entity)
+        except ValueError:
+            return False
+        index = bisect.bisect_left(self._ids, step_id)
+        return index < len(self._ids) and self._ids[index] == step_id
+
+    def __eq__(self, other):
+        if isinstance(other, IfcEntitySet):
+            return self._reader is other._reader and self._ids == other._ids
+        return False
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    @property
+    def step_ids(self):
+        """Get the sorted STEP ids of the entities (a copy of the array)."""
+        return array.array('q', self._ids)
+
+    @classmethod
+    def from_entities(cls, reader, entities):
+        """Create a set from entities wrappers (`read_*` results...), without
+        wrapping them again.
+
+        :param IfcDataReader reader: The data reader of the entities.
+        :param iterable entities: IfcObjectEntity instances.
+        :return IfcEntitySet: The entity set.
+        :raises ValueError: When an entity instance is not valid.
+        """
+        return cls(reader, map(cls._get_step_id, entities))
+
+    @classmethod
+    def _from_sorted_ids(cls, reader, sorted_ids):
+        # Create a set from an array of sorted unique ids (not copied).
+        entity_set = cls(reader)
+        entity_set._ids = sorted_ids
+        return entity_set
+
+    @staticmethod
+    def _get_step_id(entity):
+        # STEP id of an entity wrapper (or a STEP id itself).
+        if isinstance(entity, int):
+            return entity
+        if not isinstance(entity, IfcObjectEntity):
+            raise ValueError('Invalid entity instance: {}'.format(entity))
+        return entity._raw.id()
+
+    def _check_other(self, other):
+        # Sets algebra only makes sense with sets of the same reader.
+        if not isinstance(other, IfcEntitySet) or (
+                other._reader is not self._reader):
+            raise ValueError('Invalid entity set: {}'.format(other))
+
+    def union(self, other):
+        """Get the entities of this set or of `other`.
+
+        :param IfcEntitySet other: Another set of the same reader.
+        :return IfcEntitySet: The union set.
+        :raises ValueError: When other set is not valid.
+        """
+        self._check_other(other)
+        ids, other_ids = self._ids, other._ids
+        union_ids = array.array('q')
+        # merge of the 2 sorted arrays (linear time)
+        index = other_index = 0
+        while index < len(ids) and other_index < len(other_ids):
+            cur_id, cur_other_id = ids[index], other_ids[other_index]
+            if cur_id <= cur_other_id:
+                union_ids.append(cur_id)
+                index += 1
+                if cur_id == cur_other_id:
+                    other_index += 1
+            else:
+                union_ids.append(cur_other_id)
+                other_index += 1
+        union_ids.extend(ids[index:])
+        union_ids.extend(other_ids[other_index:])
+        return self._from_sorted_ids(self._reader, union_ids)
+
+    def intersection(self, other):
+        """Get the entities of both this set and `other`.
+
+        :param IfcEntitySet other: Another set of the same reader.
+        :return IfcEntitySet: The intersection set.
+        :raises ValueError: When other set is not valid.
+        """
+        self._check_other(other)
+        smaller, larger = sorted((self._ids, other._ids,), key=len)
+        larger_ids = set(larger)
+        return self._from_sorted_ids(self._reader, array.array('q', (
+            cur_id for cur_id in smaller if cur_id in larger_ids)))
+
+    def difference(self, other):
+        """Get the entities of this set that are not in `other`.
+
+        :param IfcEntitySet other: Another set of the same reader.
+        :return IfcEntitySet: The difference set.
+        :raises ValueError: When other set is not valid.
+        """
+        self._check_other(other)
+        other_ids = set(other._ids)
+        return self._from_sorted_ids(self._reader, array.array('q', (
+            cur_id for cur_id in self._ids if cur_id not in other_ids)))
+
+    def filter_type(self, type_name, *, include_subtypes=True):
+        """Get the entities of this set of a type.
+
+        :param str type_name: IFC entity class name.
+        :param bool include_subtypes: (optional, default True)
+            If True, entities of `type_name` subtypes are kept too.
+        :return IfcEntitySet: The filtered set.
+        :raises ValueError: When type_name is not valid.
+        """
+        _, accepted_type_names = self._reader._resolve_type_names(
+            (type_name,), include_subtypes=include_subtypes)
+        by_id = self._reader._ifcos_file.by_id
+        return self._from_sorted_ids(self._reader, array.array('q', (
+            cur_id for cur_id in self._ids
+            if by_id(cur_id).is_a() in accepted_type_names)))
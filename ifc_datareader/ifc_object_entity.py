@@ -1,6 +1,8 @@
 """IFC object entity"""
 
+from collections import OrderedDict
 import copy
+import types
 
 from .ifc_base_entity import IfcBaseEntity
 from .ifc_object_entity_pset import IfcObjectEntityPropertySetBase
@@ -15,14 +17,17 @@ class IfcObjectEntity(IfcBaseEntity):
     :param IfcSchema schema: The IFC schema specification description of data.
     :param tuple expected_types: (optional, default ('IfcObject',))
         A tuple of IFC types that validates `raw_obj_entity`.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_obj_entity`, `schema` or `expected_types` is not valid.
         When `raw_obj_entity` does not inherit from one of `expected_types`.
     """
 
     def __init__(self, raw_obj_entity, schema, *,
-                 expected_types=('IfcObject',)):
-        super().__init__(raw_obj_entity, schema, expected_types=expected_types)
+                 expected_types=('IfcObject',), reader=None):
+        super().__init__(raw_obj_entity, schema,
+                         expected_types=expected_types, reader=reader)
 
         # attributes below are in 'lazy' load style (loaded on call)
         self._parent = None
@@ -30,6 +35,11 @@ class IfcObjectEntity(IfcBaseEntity):
         self._property_sets = None
         self._quantities = None
         self._object_type = None
+        self._effective_properties = None
+        # codename hash indexes (see `_load_codename_indexes`)
+        self._property_sets_by_codename = None
+        self._properties_by_codename = None
+        self._properties_by_pset_codename = None
         # TODO: treat materials case
         # Add a 'self._materials = None' and all related code to get
         #  information about entity's relations with materials.
@@ -60,8 +70,8 @@ class IfcObjectEntity(IfcBaseEntity):
         attribute, which values are described by `IfcElementCompositionEnum`
         and can be a choice between [COMPLEX, ELEMENT, PARTIAL])."""
         # get CompositionType value only for IfcSpatialStructureElement
-        if self._raw.is_a('IfcSpatialStructureElement'):
-            return self.info.get('CompositionType')
+        if self.is_a('IfcSpatialStructureElement'):
+            return self.get_attribute('CompositionType')
         return None
 
     @property
@@ -114,6 +124,23 @@ class IfcObjectEntity(IfcBaseEntity):
             self._quantities = self._load_quantities()
         return self._quantities
 
+    @property
+    def effective_properties(self):
+        """Get the entity's properties merged with its object type's ones
+        (see `object_type`), as a read-only mapping of property instances by
+        (property set codename, property codename).
+
+        As IFC specifies, an occurrence property overrides the type property
+        of the same property set and name. Type properties are read once per
+        object type wrapper: when entities are read by an `IfcDataReader`,
+        the reader keeps a single wrapper of each object type, by STEP id,
+        for its whole life (see `IfcDataReader.SHARED_TYPE_NAMES`), so they
+        are read once per file, even when occurrences are streamed.
+        Occurrence properties come first in mapping order."""
+        if self._effective_properties is None:
+            self._effective_properties = self._load_effective_properties()
+        return self._effective_properties
+
     def get_relations(self, relation):
         """Get a tuple of relations identifier by the relation name"""
         return self._raw.__getattr__(relation)
@@ -129,13 +156,14 @@ class IfcObjectEntity(IfcBaseEntity):
 
         :return IfcObjectEntity: The object type instance if any, else None.
         """
-        if self._raw.is_a('IfcObject'):
+        if self.is_a('IfcObject'):
             for cur_rel in self._raw.IsDefinedBy:
-                if cur_rel.is_a('IfcRelDefinesByType'):
+                if self._is_a(
+                        cur_rel, 'IfcRelDefinesByType', self._schema):
                     # Return the first occurence found (in principle
                     #  IFC specification allows one at max in `IsDefinedBy`).
-                    return IfcObjectEntity(
-                        cur_rel.RelatingType, self._schema,
+                    return self._wrap(
+                        cur_rel.RelatingType, IfcObjectEntity,
                         expected_types=('IfcTypeProduct',))
         return None
 
@@ -146,7 +174,7 @@ class IfcObjectEntity(IfcBaseEntity):
         """
         raw_parent_entity = self._get_relating_object()
         if raw_parent_entity is not None:
-            return IfcObjectEntity(raw_parent_entity, schema=self._schema)
+            return self._wrap(raw_parent_entity, IfcObjectEntity)
         return None
 
     def _load_kids(self):
@@ -158,7 +186,7 @@ class IfcObjectEntity(IfcBaseEntity):
         raw_kid_entities = self._get_related_objects()
         if raw_kid_entities is not None:
             return tuple(
-                IfcObjectEntity(cur_raw_kid_entity, schema=self._schema)
+                self._wrap(cur_raw_kid_entity, IfcObjectEntity)
                 for cur_raw_kid_entity in raw_kid_entities)
         return None
 
@@ -181,13 +209,13 @@ class IfcObjectEntity(IfcBaseEntity):
         """
         # /!\ try entity types in reverse inheritance order
         #  (for example `IfcElement` is a subtype of `IfcObjectDefinition`)
-        if (self._raw.is_a('IfcFeatureElementSubtraction')
+        if (self.is_a('IfcFeatureElementSubtraction')
                 and len(self._raw.VoidsElements) == 1):
             return self._raw.VoidsElements[0].RelatingBuildingElement
-        elif (self._raw.is_a('IfcElement')
+        elif (self.is_a('IfcElement')
               and len(self._raw.ContainedInStructure) == 1):
             return self._raw.ContainedInStructure[0].RelatingStructure
-        elif (self._raw.is_a('IfcObjectDefinition')
+        elif (self.is_a('IfcObjectDefinition')
               and len(self._raw.Decomposes) == 1):
             return self._raw.Decomposes[0].RelatingObject
         return None
@@ -205,10 +233,10 @@ class IfcObjectEntity(IfcBaseEntity):
             Objects are `IfcObjectDefinition` instances (do not forget later
             to instanciate `IfcObjectEntity` with these raw entity instances).
         """
-        if self._raw.is_a('IfcObjectDefinition'):
-            if self._raw.is_a('IfcZone'):
+        if self.is_a('IfcObjectDefinition'):
+            if self.is_a('IfcZone'):
                 entity_relations = self._raw.IsGroupedBy
-            elif self._raw.is_a('IfcWall'):
+            elif self.is_a('IfcWall'):
                 return map(lambda x: x.RelatingSpace,
                            self._raw.ProvidesBoundaries)
             else:
@@ -243,16 +271,19 @@ class IfcObjectEntity(IfcBaseEntity):
         raw_psets = ()
         # get data from `IfcObjectDefinition` entities...
         # ...which can be an `IfcObject`...
-        if self._raw.is_a('IfcObject'):
+        if self.is_a('IfcObject'):
             for cur_rel in self._raw.IsDefinedBy:
-                if cur_rel.is_a('IfcRelDefinesByProperties'):
+                if self._is_a(
+                        cur_rel, 'IfcRelDefinesByProperties', self._schema):
                     cur_raw_pset = cur_rel.RelatingPropertyDefinition
                     # ignore `IfcElementQuantity` properties (see quantities)
-                    if not cur_raw_pset.is_a('IfcElementQuantity'):
+                    if not self._is_a(
+                            cur_raw_pset, 'IfcElementQuantity', self._schema):
                         raw_psets += (cur_raw_pset,)
         # ...or an `IfcTypeObject`
-        elif self._raw.is_a('IfcTypeObject'):
-            raw_psets = self._raw.HasPropertySets
+        elif self.is_a('IfcTypeObject'):
+            # `HasPropertySets` is optional (None when not set)
+            raw_psets = self._raw.HasPropertySets or ()
         else:
             # print some debug alerts about the ignored `raw_data` property set
             IfcBaseEntity._print_debug_warning(self._raw, item='pset')
@@ -261,13 +292,33 @@ class IfcObjectEntity(IfcBaseEntity):
         if len(raw_psets) > 0:
             psets = ()
             for cur_raw_pset in raw_psets:
-                pset = IfcObjectEntityPropertySetBase.create(
-                    cur_raw_pset, schema=self._schema)
+                pset = self._wrap(
+                    cur_raw_pset, IfcObjectEntityPropertySetBase.create)
                 if pset is not None:
                     psets += (pset,)
             return psets
         return None
 
+    def _load_effective_properties(self):
+        """Merge the entity's properties with its object type's ones
+        (see `effective_properties`).
+
+        :return mappingproxy:
+            Property instances (`IfcObjectEntityPropertyBase`) by
+            (property set codename, property codename).
+        """
+        effective_props = OrderedDict()
+        for pset in self.property_sets or ():
+            for prop in pset.properties or ():
+                effective_props.setdefault(
+                    (pset.codename, prop.codename,), prop)
+        if self.object_type is not None:
+            # the type's mapping is loaded once (cached by the type entity,
+            #  kept by the reader)
+            for key, prop in self.object_type.effective_properties.items():
+                effective_props.setdefault(key, prop)
+        return types.MappingProxyType(effective_props)
+
     def _load_quantities(self):
         """Try to get a set of the entity's quantities.
 
@@ -287,14 +338,16 @@ class IfcObjectEntity(IfcBaseEntity):
         :return tuple:
             All entity's quantity instances (`IfcObjectEntityQuantityBase`).
         """
-        if self._raw.is_a('IfcObject'):
+        if self.is_a('IfcObject'):
             # focus on `IfcRelDefinesByProperties` and `IfcElementQuantity`
             raw_elmt_qty = tuple(
                 cur_rel.RelatingPropertyDefinition
                 for cur_rel in self._raw.IsDefinedBy
-                if (cur_rel.is_a('IfcRelDefinesByProperties')
-                    and cur_rel.RelatingPropertyDefinition.is_a(
-                        'IfcElementQuantity')))
+                if (self._is_a(
+                        cur_rel, 'IfcRelDefinesByProperties', self._schema)
+                    and self._is_a(
+                        cur_rel.RelatingPropertyDefinition,
+                        'IfcElementQuantity', self._schema)))
 
             # Each `IfcElementQuantity` has a `Quantities` attribute that
             #  returns a set of `IfcPhysicalQuantity`.
@@ -302,13 +355,31 @@ class IfcObjectEntity(IfcBaseEntity):
             all_quantities = ()
             for cur_elmt_qty in raw_elmt_qty:
                 for cur_qty in cur_elmt_qty.Quantities:
-                    qty = IfcObjectEntityQuantityBase.create(
-                        cur_qty, schema=self._schema)
+                    qty = self._wrap(
+                        cur_qty, IfcObjectEntityQuantityBase.create)
                     if qty is not None:
                         all_quantities += (qty,)
             return all_quantities
         return None
 
+    def _load_codename_indexes(self):
+        """Build the codename hash indexes of property sets and properties,
+        keeping the first occurence of each codename (as linear searches
+        would find it): property sets by codename, properties by codename
+        and properties by codename of each property set codename."""
+        psets_by_codename = {}
+        props_by_codename = {}
+        props_by_pset_codename = {}
+        for pset in self.property_sets or ():
+            psets_by_codename.setdefault(pset.codename, pset)
+            pset_props = props_by_pset_codename.setdefault(pset.codename, {})
+            for prop_codename, prop in pset.properties_by_codename.items():
+                props_by_codename.setdefault(prop_codename, prop)
+                pset_props.setdefault(prop_codename, prop)
+        self._property_sets_by_codename = psets_by_codename
+        self._properties_by_codename = props_by_codename
+        self._properties_by_pset_codename = props_by_pset_codename
+
     def get_property_set_codenames(self):
         """Get a tuple of all entity's property sets codename.
 
@@ -323,10 +394,9 @@ class IfcObjectEntity(IfcBaseEntity):
         :return IfcObjectEntityPropertySetBase:
             The entity's property set instance found.
         """
-        for pset in self.property_sets or ():
-            if pset_codename == pset.codename:
-                return pset
-        return None
+        if self._property_sets_by_codename is None:
+            self._load_codename_indexes()
+        return self._property_sets_by_codename.get(pset_codename)
 
     def get_property_codenames(self, *, pset_codename=None):
         """Get a tuple of all property's codenames in the entity's
@@ -369,10 +439,12 @@ class IfcObjectEntity(IfcBaseEntity):
             (returning the first occurence found).
         :return IfcObjectEntityPropertyBase: The entity's property found.
         """
-        for prop in self.get_properties(pset_codename=pset_codename):
-            if property_codename == prop.codename:
-                return prop
-        return None
+        if self._properties_by_codename is None:
+            self._load_codename_indexes()
+        if pset_codename is None:
+            return self._properties_by_codename.get(property_codename)
+        return self._properties_by_pset_codename.get(
+            pset_codename, {}).get(property_codename)
 
     def get_property_value(self, property_codename, *, pset_codename=None):
         """Try to get an entity property's value/unit.
@@ -389,3 +461,29 @@ class IfcObjectEntity(IfcBaseEntity):
         if prop is not None:
             return (prop.value, prop.unit,)
         return (None, None)
+
+    def get_effective_property_value(
+            self, property_codename, *, pset_codename=None):
+        """Try to get an entity property's value/unit, falling back to the
+        object type's properties (see `effective_properties`).
+
+        :param str property_codename: The entity's property codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename in which the property is searched.
+            If `None`, the property is looked into all property sets
+            (returning the first occurence found, entity's ones first).
+        :return tuple: (property_value, property_unit,)
+        """
+        if pset_codename is not None:
+            prop = self.effective_properties.get(
+                (pset_codename, property_codename,))
+        else:
+            # codename hash indexes: occurrence property first, else the
+            #  object type's one
+            prop = self.get_property(property_codename)
+            if prop is None and self.object_type is not None:
+                return self.object_type.get_effective_property_value(
+                    property_codename)
+        if prop is not None:
+            return (prop.value, prop.unit,)
+        return (None, None)
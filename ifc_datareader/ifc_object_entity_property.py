@@ -3,6 +3,7 @@
 import abc
 
 from .ifc_base_entity import IfcBaseEntity
+from .ifc_unit_context import IfcUnitContext
 
 
 # TODO: treat IfcComplexProperty case?
@@ -19,15 +20,18 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
         A tuple of IFC types that validates `raw_property`.
     :param IfcObjectEntityPropertySetBase pset: (optional, default None)
         The property set instance that contains the property.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_property`, `schema` or `expected_types` is not valid.
         When `raw_property` does not inherit from one of `expected_types`.
     """
 
     @abc.abstractmethod
-    def __init__(
-            self, raw_property, schema, *, expected_types=None, pset=None):
-        super().__init__(raw_property, schema, expected_types=expected_types)
+    def __init__(self, raw_property, schema, *, expected_types=None,
+                 pset=None, reader=None):
+        super().__init__(raw_property, schema, expected_types=expected_types,
+                         reader=reader)
 
         self.property_set = pset
 
@@ -35,6 +39,8 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
         self._value = None
         self._value_type_name = None
         self._unit = None
+        # units context of the explicit unit, if no reader
+        self._unit_context = None
 
     def __repr__(self):
         return (
@@ -52,10 +58,17 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
 
     def __eq__(self, other):
         if self.global_id is not None and other.global_id is not None:
-            return super().__eq__(other)
-        return (self.name == other.name
+            # object type properties share their property set definition
+            return super().__eq__(other) and self.name == other.name
+        return (self._raw.id() == other._raw.id()
+                and self.name == other.name
                 and self.property_set == other.property_set)
 
+    def __hash__(self):
+        # hashable by STEP identity and name (object type properties share
+        #  their property set definition's STEP id)
+        return hash((self._raw.id(), self.name,))
+
     @property
     def value(self):
         """Get the property's value."""
@@ -66,11 +79,56 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
         """Get the property value's type (IFC class name)."""
         return self._value_type_name
 
+    @property
+    def value_kind(self):
+        """Get what the property value is made of: a simple type ('REAL',
+        'STRING', 'BOOLEAN'...), 'ENUM', 'SELECT' or 'ENTITY'
+        (see `IfcSchema.resolve_type`)."""
+        try:
+            # value type is resolved by schema, with one lookup
+            return self._schema.resolve_type(self.value_type_name).kind
+        except (KeyError, AttributeError):
+            # no value type (or no schema)
+            return None
+
     @property
     def unit(self):
         """Get the property's unit."""
         return self._unit
 
+    def _get_unit_context(self):
+        # Units context of the reader's project (see `IfcUnitContext`), a
+        #  context without project's units (created once) for the property's
+        #  explicit unit if no reader, None if neither.
+        unit_context = super()._get_unit_context()
+        if unit_context is None and self.unit is not None:
+            if self._unit_context is None:
+                self._unit_context = IfcUnitContext(schema=self._schema)
+            unit_context = self._unit_context
+        return unit_context
+
+    @property
+    def unit_resolved(self):
+        """Get the property's unit: its own unit if defined, else the
+        project's unit of its value type (see `IfcUnitContext`)."""
+        if self.unit is not None:
+            return self.unit
+        unit_context = self._get_unit_context()
+        if unit_context is None:
+            return None
+        return unit_context.get_measure_unit(self.value_type_name)
+
+    @property
+    def value_si(self):
+        """Get the property's value converted to SI units (see
+        `IfcUnitContext`), None if value is not a number (or can not be
+        converted, or has no unit without reader's project)."""
+        unit_context = self._get_unit_context()
+        if unit_context is None:
+            return None
+        return unit_context.to_si(
+            self.value, self.value_type_name, raw_unit=self.unit)
+
     @property
     def property_set_name(self):
         """Get the attached property set's name."""
@@ -79,7 +137,8 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
         return None
 
     @classmethod
-    def create(cls, raw_data, schema, *, pset=None, prop_name=None):
+    def create(cls, raw_data, schema, *, pset=None, prop_name=None,
+               reader=None):
         """Try to instanciate the appropriate property child class,
         according to what `raw_data` describes.
 
@@ -92,17 +151,22 @@ class IfcObjectEntityPropertyBase(IfcBaseEntity, abc.ABC):
         :param str prop_name: (optional, default None)
             The property's name (in fact it is an object type
             `IfcPropertySetDefinition`'s attribute name).
+        :param IfcDataReader reader: (optional, default None)
+            The data reader the entity is read by (see `IfcBaseEntity`).
         :return IfcObjectEntityPropertyBase: The property instance created.
         :raises ValueError:
             When `raw_data`, `schema` or `expected_types` is not valid.
             When `raw_data` does not inherit from one of `expected_types`.
         """
-        if raw_data.is_a('IfcSimpleProperty'):
+        raw_type_name = raw_data.is_a()
+        if cls._is_a(raw_data, 'IfcSimpleProperty', schema,
+                     raw_type_name=raw_type_name):
             return IfcObjectEntitySimpleProperty(
-                raw_data, schema, pset=pset)
-        elif raw_data.is_a('IfcPropertySetDefinition'):
+                raw_data, schema, pset=pset, reader=reader)
+        elif cls._is_a(raw_data, 'IfcPropertySetDefinition', schema,
+                       raw_type_name=raw_type_name):
             return IfcObjectEntityTypeProperty(
-                raw_data, prop_name, schema, pset=pset)
+                raw_data, prop_name, schema, pset=pset, reader=reader)
         else:
             # print some debug alerts about the ignored `raw_data` property
             IfcBaseEntity._print_debug_warning(raw_data, item='property')
@@ -117,21 +181,25 @@ class IfcObjectEntitySimpleProperty(IfcObjectEntityPropertyBase):
     :param IfcShema schema: The IFC schema specification description of data.
     :param IfcObjectEntityPropertySetBase pset:
         The property set instance that contains the property.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_property`, `schema` or `expected_types` is not valid.
         When `raw_property` does not inherit from one of `expected_types`.
     """
 
-    def __init__(self, raw_property, schema, *, pset=None):
+    def __init__(self, raw_property, schema, *, pset=None, reader=None):
         super().__init__(raw_property, schema,
-                         expected_types=('IfcSimpleProperty',), pset=pset)
+                         expected_types=('IfcSimpleProperty',), pset=pset,
+                         reader=reader)
 
     @property
     def value(self):
         """Get the property's value."""
         if self._value is None:
             try:
-                self._value = self.info['NominalValue'].wrappedValue
+                self._value = self.get_attribute(
+                    'NominalValue').wrappedValue
             except (KeyError, AttributeError):
                 pass
         return super().value
@@ -141,7 +209,8 @@ class IfcObjectEntitySimpleProperty(IfcObjectEntityPropertyBase):
         """Get the property value's type (IFC class name)."""
         if self._value_type_name is None:
             try:
-                self._value_type_name = self.info['NominalValue'].is_a()
+                self._value_type_name = self.get_attribute(
+                    'NominalValue').is_a()
             except (KeyError, AttributeError):
                 pass
         return super().value_type_name
@@ -150,7 +219,7 @@ class IfcObjectEntitySimpleProperty(IfcObjectEntityPropertyBase):
     def unit(self):
         """Get the property's unit."""
         if self._unit is None:
-            self._unit = self.info.get('Unit')
+            self._unit = self.get_attribute('Unit')
         return super().unit
 
 
@@ -171,15 +240,19 @@ class IfcObjectEntityTypeProperty(IfcObjectEntityPropertyBase):
     :param IfcShema schema: The IFC schema specification description of data.
     :param IfcObjectEntityPropertySetBase pset: (optional, default None)
         The property set instance that contains the property.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_type_pset`, `schema` or `expected_types` is not valid.
         When `raw_type_pset` does not inherit from one of `expected_types`.
     """
 
-    def __init__(self, raw_type_pset, prop_name, schema, *, pset=None):
+    def __init__(self, raw_type_pset, prop_name, schema, *, pset=None,
+                 reader=None):
         super().__init__(
             raw_type_pset, schema,
-            expected_types=('IfcPropertySetDefinition',), pset=pset)
+            expected_types=('IfcPropertySetDefinition',), pset=pset,
+            reader=reader)
 
         self._prop_name = prop_name
 
@@ -193,7 +266,7 @@ class IfcObjectEntityTypeProperty(IfcObjectEntityPropertyBase):
         """Get the property's value."""
         if self._value is None:
             try:
-                self._value = self.info[self._prop_name]
+                self._value = self.get_attribute(self._prop_name)
             except (KeyError, AttributeError):
                 pass
         return super().value
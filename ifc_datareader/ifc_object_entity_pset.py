@@ -1,6 +1,7 @@
 """IFC object entity property set"""
 
 import abc
+from collections import OrderedDict
 
 from .ifc_base_entity import IfcBaseEntity
 from .ifc_object_entity_property import IfcObjectEntityPropertyBase
@@ -14,17 +15,22 @@ class IfcObjectEntityPropertySetBase(IfcBaseEntity, abc.ABC):
     :param IfcSchema schema: The IFC schema specification description of data.
     :param tuple expected_types: (optional, default ('IfcObject',))
         A tuple of IFC types that validates `raw_pset`.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_pset`, `schema` or `expected_types` is not valid.
         When `raw_pset` does not inherit from one of `expected_types`.
     """
 
     @abc.abstractmethod
-    def __init__(self, raw_pset, schema, *, expected_types=None):
-        super().__init__(raw_pset, schema, expected_types=expected_types)
+    def __init__(self, raw_pset, schema, *, expected_types=None,
+                 reader=None):
+        super().__init__(raw_pset, schema, expected_types=expected_types,
+                         reader=reader)
 
         # attributes below are in 'lazy' load style (loaded on call)
         self._properties = None
+        self._properties_by_codename = None
 
     def __repr__(self):
         props_count = len(self.properties or ())
@@ -44,6 +50,16 @@ class IfcObjectEntityPropertySetBase(IfcBaseEntity, abc.ABC):
             self._properties = self._load_properties()
         return self._properties
 
+    @property
+    def properties_by_codename(self):
+        """Get an ordered dict of properties by codename (the first occurence
+        of each codename, in properties order), built on first call."""
+        if self._properties_by_codename is None:
+            self._properties_by_codename = OrderedDict()
+            for prop in self.properties or ():
+                self._properties_by_codename.setdefault(prop.codename, prop)
+        return self._properties_by_codename
+
     @abc.abstractmethod
     def _load_properties(self):
         return self._properties
@@ -52,8 +68,16 @@ class IfcObjectEntityPropertySetBase(IfcBaseEntity, abc.ABC):
         """Get a tuple of all available property's codename."""
         return tuple(prop.codename for prop in self.properties or ())
 
+    def get_property(self, property_codename):
+        """Get a property, searching by its codename.
+
+        :param str property_codename: The property's codename.
+        :return IfcObjectEntityPropertyBase: The property found, else None.
+        """
+        return self.properties_by_codename.get(property_codename)
+
     @classmethod
-    def create(cls, raw_data, schema):
+    def create(cls, raw_data, schema, *, reader=None):
         """Try to instanciate the appropriate property set child class,
         according to what `raw_data` describes.
 
@@ -61,15 +85,21 @@ class IfcObjectEntityPropertySetBase(IfcBaseEntity, abc.ABC):
             The property set's raw data instance.
         :param IfcSchema schema:
             The IFC schema specification description of data.
+        :param IfcDataReader reader: (optional, default None)
+            The data reader the entity is read by (see `IfcBaseEntity`).
         :return IfcObjectEntityPropertySetBase: The property set instance.
         :raises ValueError:
             When `raw_data`, `schema` or `expected_types` is not valid.
             When `raw_data` does not inherit from one of `expected_types`.
         """
-        if raw_data.is_a('IfcPropertySet'):
-            return IfcObjectEntityPropertySet(raw_data, schema)
-        elif raw_data.is_a('IfcPropertySetDefinition'):
-            return IfcObjectEntityTypePropertySet(raw_data, schema)
+        raw_type_name = raw_data.is_a()
+        if cls._is_a(raw_data, 'IfcPropertySet', schema,
+                     raw_type_name=raw_type_name):
+            return IfcObjectEntityPropertySet(raw_data, schema, reader=reader)
+        elif cls._is_a(raw_data, 'IfcPropertySetDefinition', schema,
+                       raw_type_name=raw_type_name):
+            return IfcObjectEntityTypePropertySet(
+                raw_data, schema, reader=reader)
         else:
             # print some debug alerts about the ignored `raw_data` property set
             IfcBaseEntity._print_debug_warning(raw_data, item='pset')
@@ -83,20 +113,23 @@ class IfcObjectEntityPropertySet(IfcObjectEntityPropertySetBase):
     :param ifcopenshell.entity_instance raw_pset:
         An entity's raw data instance.
     :param IfcSchema schema: The IFC schema specification description of data.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_pset`, `schema` or `expected_types` is not valid.
         When `raw_pset` does not inherit from one of `expected_types`.
     """
 
-    def __init__(self, raw_pset, schema):
-        super().__init__(raw_pset, schema, expected_types=('IfcPropertySet',))
+    def __init__(self, raw_pset, schema, *, reader=None):
+        super().__init__(raw_pset, schema, expected_types=('IfcPropertySet',),
+                         reader=reader)
 
     def _load_properties(self):
         if self._properties is None:
             self._properties = ()
             for cur_prop in self._raw.HasProperties:
                 prop = IfcObjectEntityPropertyBase.create(
-                    cur_prop, self._schema, pset=self)
+                    cur_prop, self._schema, pset=self, reader=self._reader)
                 if prop is not None:
                     self._properties += (prop,)
         return super()._load_properties()
@@ -109,14 +142,17 @@ class IfcObjectEntityTypePropertySet(IfcObjectEntityPropertySetBase):
     :param ifcopenshell.entity_instance raw_pset:
         The property set definition's raw data instance.
     :param IfcSchema schema: The IFC schema specification description of data.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_pset`, `schema` or `expected_types` is not valid.
         When `raw_pset` does not inherit from one of `expected_types`.
     """
 
-    def __init__(self, raw_pset_def, schema):
+    def __init__(self, raw_pset_def, schema, *, reader=None):
         super().__init__(
-            raw_pset_def, schema, expected_types=('IfcPropertySetDefinition',))
+            raw_pset_def, schema, expected_types=('IfcPropertySetDefinition',),
+            reader=reader)
 
     def _load_properties(self):
         if self._properties is None:
@@ -124,7 +160,8 @@ class IfcObjectEntityTypePropertySet(IfcObjectEntityPropertySetBase):
             # use schema metadata to get current entity's attributes
             for p_name in self.schema_metadata.attribute_names:
                 prop = IfcObjectEntityPropertyBase.create(
-                    self._raw, self._schema, pset=self, prop_name=p_name)
+                    self._raw, self._schema, pset=self, prop_name=p_name,
+                    reader=self._reader)
                 if prop is not None:
                     self._properties += (prop,)
         return super()._load_properties()
@@ -3,6 +3,7 @@
 import abc
 
 from .ifc_base_entity import IfcBaseEntity
+from .ifc_unit_context import IfcUnitContext, QUANTITY_MEASURE_TYPES
 
 
 # TODO: treat IfcPhysicalComplexQuantity case?
@@ -17,6 +18,8 @@ class IfcObjectEntityQuantityBase(IfcBaseEntity, abc.ABC):
     :param IfcSchema schema: The IFC schema specification description of data.
     :param tuple expected_types: (optional, default ('IfcPhysicalQuantity',))
         A tuple of IFC types that validates `raw_data`.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_data`, `schema` or `expected_types` is not valid.
         When `raw_data` does not inherit from one of `expected_types`.
@@ -24,12 +27,15 @@ class IfcObjectEntityQuantityBase(IfcBaseEntity, abc.ABC):
 
     @abc.abstractmethod
     def __init__(self, raw_data, schema, *,
-                 expected_types=('IfcPhysicalQuantity',)):
-        super().__init__(raw_data, schema, expected_types=expected_types)
+                 expected_types=('IfcPhysicalQuantity',), reader=None):
+        super().__init__(raw_data, schema, expected_types=expected_types,
+                         reader=reader)
 
         # attributes below are in 'lazy' load style (loaded on call)
         self._value = None
         self._unit = None
+        # units context of the explicit unit, if no reader
+        self._unit_context = None
 
     def __repr__(self):
         return (
@@ -53,8 +59,43 @@ class IfcObjectEntityQuantityBase(IfcBaseEntity, abc.ABC):
         """Get the quantity's unit."""
         return self._unit
 
+    def _get_unit_context(self):
+        # Units context of the reader's project (see `IfcUnitContext`), a
+        #  context without project's units (created once) for the quantity's
+        #  explicit unit if no reader, None if neither.
+        unit_context = super()._get_unit_context()
+        if unit_context is None and self.unit is not None:
+            if self._unit_context is None:
+                self._unit_context = IfcUnitContext(schema=self._schema)
+            unit_context = self._unit_context
+        return unit_context
+
+    @property
+    def unit_resolved(self):
+        """Get the quantity's unit: its own unit if defined, else the
+        project's unit of its measure (see `IfcUnitContext`)."""
+        if self.unit is not None:
+            return self.unit
+        unit_context = self._get_unit_context()
+        if unit_context is None:
+            return None
+        return unit_context.get_measure_unit(
+            QUANTITY_MEASURE_TYPES.get(self.type_name))
+
+    @property
+    def value_si(self):
+        """Get the quantity's value converted to SI units (see
+        `IfcUnitContext`), None if value is not defined (or can not be
+        converted, or has no unit without reader's project)."""
+        unit_context = self._get_unit_context()
+        if unit_context is None:
+            return None
+        return unit_context.to_si(
+            self.value, QUANTITY_MEASURE_TYPES.get(self.type_name),
+            raw_unit=self.unit)
+
     @classmethod
-    def create(cls, raw_data, schema):
+    def create(cls, raw_data, schema, *, reader=None):
         """Try to instanciate the appropriate quantity child class,
         according to what `raw_data` describes.
 
@@ -62,13 +103,16 @@ class IfcObjectEntityQuantityBase(IfcBaseEntity, abc.ABC):
             The quantity's raw data instance.
         :param IfcSchema schema:
             The IFC schema specification description of data.
+        :param IfcDataReader reader: (optional, default None)
+            The data reader the entity is read by (see `IfcBaseEntity`).
         :return IfcObjectEntityQuantityBase: The quantity instance created.
         :raises ValueError:
             When `raw_data`, `schema` or `expected_types` is not valid.
             When `raw_data` does not inherit from one of `expected_types`.
         """
-        if raw_data.is_a('IfcPhysicalSimpleQuantity'):
-            return IfcObjectEntitySimpleQuantity(raw_data, schema)
+        if cls._is_a(raw_data, 'IfcPhysicalSimpleQuantity', schema):
+            return IfcObjectEntitySimpleQuantity(
+                raw_data, schema, reader=reader)
         else:
             # print some debug alerts about the ignored `raw_data` quantity
             IfcBaseEntity._print_debug_warning(raw_data, item='quantity')
@@ -82,14 +126,17 @@ class IfcObjectEntitySimpleQuantity(IfcObjectEntityQuantityBase):
     :param ifcopenshell.entity_instance raw_data:
         The quantity's raw data instance.
     :param IfcSchema schema: The IFC schema specification description of data.
+    :param IfcDataReader reader: (optional, default None)
+        The data reader the entity is read by (see `IfcBaseEntity`).
     :raises ValueError:
         When `raw_data`, `schema` or `expected_types` is not valid.
         When `raw_data` does not inherit from one of `expected_types`.
     """
 
-    def __init__(self, raw_data, schema):
+    def __init__(self, raw_data, schema, *, reader=None):
         super().__init__(
-            raw_data, schema, expected_types=('IfcPhysicalSimpleQuantity',))
+            raw_data, schema, expected_types=('IfcPhysicalSimpleQuantity',),
+            reader=reader)
 
     @property
     def value(self):
@@ -98,7 +145,7 @@ class IfcObjectEntitySimpleQuantity(IfcObjectEntityQuantityBase):
             try:
                 value_name = '{}Value'.format(
                     self.type_name[len('IfcQuantity'):])
-                self._value = self.info[value_name]
+                self._value = self.get_attribute(value_name)
             except (KeyError, AttributeError):
                 pass
         return super().value
@@ -107,5 +154,5 @@ class IfcObjectEntitySimpleQuantity(IfcObjectEntityQuantityBase):
     def unit(self):
         """Get the quantity's unit."""
         if self._unit is None:
-            self._unit = self.info.get('Unit')
+            self._unit = self.get_attribute('Unit')
         return super().unit
@@ -0,0 +1,303 @@
+"""IFC property inverted index"""
+
+from collections import OrderedDict
+import bisect
+import numbers
+
+from .ifc_codename_table import IfcCodenameTable
+
+
+class IfcPropertyIndex():
+    """Inverted index of the property values of the objects of an IFC file:
+    from a (property set codename, property codename) to the property values,
+    and from a value to the STEP ids of the objects having it.
+
+    It is built with one pass over the `IfcRelDefinesByProperties` relations
+    of the file, reading each `IfcPropertySet` once, whatever the number of
+    objects it is related to. As `IfcObjectEntity.get_property_value` does,
+    only simple properties are indexed (their value is the `NominalValue`
+    wrapped value, if any), property sets of `IfcElementQuantity` and object
+    types are ignored. Values are indexed by type and value, so that values
+    equal in Python but of different types (`True`, `1` and `1.0` of an
+    `IfcBoolean`, an `IfcInteger` and an `IfcReal`) are never mixed.
+
+    :param ifcopenshell.file ifcos_file: The IFC file to index.
+    :param IfcSchema schema: The IFC schema specification description of data.
+    :param IfcCodenameTable codename_table: (optional, default None)
+        The table giving the codenames of property set and property names.
+        If `None`, a private table is used.
+    """
+
+    def __init__(self, ifcos_file, schema, *, codename_table=None):
+        self._schema = schema
+        if codename_table is None:
+            codename_table = IfcCodenameTable()
+        self._codename_table = codename_table
+        # {(pset codename, property codename):
+        #  {(value type, value): [object ids]}}
+        self._ids_by_value_by_key = {}
+        # {property codename: [pset codenames]}
+        self._pset_codenames_by_prop = {}
+        # {pset codename: [object ids]} (with simple properties)
+        self._ids_by_pset = {}
+        # {object id: [pset ids]} (in relations order, with simple
+        #  properties)
+        self._pset_ids_by_id = {}
+        # {pset id: (pset codename, {property codename: value})} (first
+        #  occurrence of each property codename)
+        self._values_by_pset_id = {}
+        # {(pset codename, property codename): ([values], [object ids])}
+        #  with numeric values sorted (built on first range lookup)
+        self._sorted_numbers_by_key = {}
+        # {(pset codename or None, property codename): {object id: value}}
+        #  (built on first per object lookup)
+        self._values_by_id_by_key = {}
+        self._read_relations(ifcos_file)
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_properties={nb_properties}'
+            ')'.format(
+                self=self, nb_properties=len(self._ids_by_value_by_key)))
+
+    def _read_relations(self, ifcos_file):
+        # Read all (pset, property, value) of each relation's property set,
+        #  for all relation's objects.
+        schema = self._schema
+        # a property set can be related to objects by several relations
+        pset_values_by_id = {}
+        for cur_rel in ifcos_file.by_type('IfcRelDefinesByProperties'):
+            raw_pset = schema.get_raw_attribute(
+                cur_rel, 'RelatingPropertyDefinition')
+            if not schema.entity_is_a(raw_pset.is_a(), 'IfcPropertySet'):
+                continue
+            object_ids = [
+                cur_raw_obj.id()
+                for cur_raw_obj in schema.get_raw_attribute(
+                    cur_rel, 'RelatedObjects')
+                if schema.entity_is_a(cur_raw_obj.is_a(), 'IfcObject')]
+            if len(object_ids) == 0:
+                continue
+            pset_values = pset_values_by_id.get(raw_pset.id())
+            if pset_values is None:
+                pset_values = pset_values_by_id[raw_pset.id()] = (
+                    self._read_pset_values(raw_pset))
+            if len(pset_values) > 0:
+                pset_codename = pset_values[0][0][0]
+                self._ids_by_pset.setdefault(pset_codename, []).extend(
+                    object_ids)
+                if raw_pset.id() not in self._values_by_pset_id:
+                    values = {}
+                    for (_, cur_prop_codename), cur_value in pset_values:
+                        values.setdefault(cur_prop_codename, cur_value)
+                    self._values_by_pset_id[raw_pset.id()] = (
+                        pset_codename, values,)
+                for cur_id in object_ids:
+                    self._pset_ids_by_id.setdefault(cur_id, []).append(
+                        raw_pset.id())
+            for cur_key, cur_value in pset_values:
+                ids_by_value = self._ids_by_value_by_key.get(cur_key)
+                if ids_by_value is None:
+                    ids_by_value = self._ids_by_value_by_key[cur_key] = {}
+                    self._pset_codenames_by_prop.setdefault(
+                        cur_key[1], []).append(cur_key[0])
+                ids_by_value.setdefault(
+                    self._get_value_key(cur_value), []).extend(object_ids)
+
+    def _read_pset_values(self, raw_pset):
+        # The ((pset codename, property codename), value) of all the simple
+        #  properties of a property set.
+        schema = self._schema
+        get_codename = self._codename_table.get_codename
+        pset_codename = get_codename(
+            schema.get_raw_attribute(raw_pset, 'Name'))
+        pset_values = []
+        for cur_raw_prop in schema.get_raw_attribute(
+                raw_pset, 'HasProperties'):
+            if not schema.entity_is_a(
+                    cur_raw_prop.is_a(), 'IfcSimpleProperty'):
+                continue
+            prop_codename = get_codename(
+                schema.get_raw_attribute(cur_raw_prop, 'Name'))
+            pset_values.append((
+                (pset_codename, prop_codename,),
+                self._read_value(cur_raw_prop),))
+        return pset_values
+
+    def _read_value(self, raw_prop):
+        # The `NominalValue` wrapped value of a simple property, if any
+        #  (as `IfcObjectEntitySimpleProperty.value`).
+        nominal_value = self._schema.get_raw_attribute(
+            raw_prop, 'NominalValue')
+        if nominal_value is None:
+            return None
+        return self._normalize_value(nominal_value.wrappedValue)
+
+    @staticmethod
+    def _normalize_value(value):
+        # The indexed form of a value: lists (of list values) as tuples.
+        if isinstance(value, list):
+            value = tuple(value)
+        return value
+
+    @classmethod
+    def _get_value_key(cls, value):
+        # The key of a value in its index bucket: its type and itself, as
+        #  `True == 1 == 1.0` (and they hash the same).
+        value = cls._normalize_value(value)
+        return (type(value), value,)
+
+    def _get_keys(self, property_codename, pset_codename):
+        # The (pset codename, property codename) keys to look into.
+        if pset_codename is not None:
+            return ((pset_codename, property_codename,),)
+        return tuple(
+            (cur_pset_codename, property_codename,)
+            for cur_pset_codename in self._pset_codenames_by_prop.get(
+                property_codename, ()))
+
+    @staticmethod
+    def _merge_ids(ids_lists):
+        # Merge lists of ids, keeping the first occurrence of each id.
+        return tuple(OrderedDict.fromkeys(
+            cur_id for cur_ids in ids_lists for cur_id in cur_ids))
+
+    def _get_sorted_numbers(self, key):
+        # Numeric values of a key, sorted, with the matching object ids.
+        sorted_numbers = self._sorted_numbers_by_key.get(key)
+        if sorted_numbers is None:
+            pairs = sorted(
+                (cur_value, cur_id,) for (_, cur_value), cur_ids in
+                self._ids_by_value_by_key.get(key, {}).items()
+                if isinstance(cur_value, numbers.Real)
+                and not isinstance(cur_value, bool)
+                for cur_id in cur_ids)
+            sorted_numbers = self._sorted_numbers_by_key[key] = (
+                [cur_value for cur_value, _ in pairs],
+                [cur_id for _, cur_id in pairs],)
+        return sorted_numbers
+
+    def _get_values_by_id(self, property_codename, pset_codename):
+        # Value of each object having a property: the first one found in
+        #  object's property sets, in object's relations order (as
+        #  `IfcObjectEntity.get_property_value` finds it).
+        key = (pset_codename, property_codename,)
+        values_by_id = self._values_by_id_by_key.get(key)
+        if values_by_id is None:
+            values_by_id = self._values_by_id_by_key[key] = {}
+            values_by_pset_id = self._values_by_pset_id
+            for cur_id, cur_pset_ids in self._pset_ids_by_id.items():
+                for cur_pset_id in cur_pset_ids:
+                    cur_pset_codename, values = values_by_pset_id[
+                        cur_pset_id]
+                    if pset_codename is not None and (
+                            cur_pset_codename != pset_codename):
+                        continue
+                    if property_codename in values:
+                        values_by_id[cur_id] = values[property_codename]
+                        break
+        return values_by_id
+
+    def get_values(self, property_codename, *, pset_codename=None):
+        """Get the distinct values of a property, in the file.
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return tuple: The property values.
+        """
+        return tuple(
+            cur_value for _, cur_value in OrderedDict.fromkeys(
+                cur_value_key
+                for cur_key in self._get_keys(
+                    property_codename, pset_codename)
+                for cur_value_key in self._ids_by_value_by_key.get(
+                    cur_key, {})))
+
+    def get_entity_values(self, property_codename, *, pset_codename=None):
+        """Get the value of a property for each object having it.
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return dict: The property values by object STEP id. As
+            `IfcObjectEntity.get_property_value` does, an object's value is
+            the first one found in its property sets (in order of its
+            relations in the file).
+        """
+        return dict(self._get_values_by_id(property_codename, pset_codename))
+
+    def get_entity_ids_with_pset(self, pset_codename):
+        """Get the STEP ids of the objects having a property set (with
+        simple properties).
+
+        :param str pset_codename: The property set's codename.
+        :return tuple: The objects STEP ids.
+        """
+        return self._merge_ids((self._ids_by_pset.get(pset_codename, ()),))
+
+    def get_entity_ids(self, property_codename, *, pset_codename=None):
+        """Get the STEP ids of the objects having a property (whatever its
+        value).
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return tuple: The objects STEP ids.
+        """
+        return self._merge_ids(
+            cur_ids
+            for cur_key in self._get_keys(property_codename, pset_codename)
+            for cur_ids in self._ids_by_value_by_key.get(
+                cur_key, {}).values())
+
+    def get_entity_ids_by_value(
+            self, property_codename, value, *, pset_codename=None):
+        """Get the STEP ids of the objects having a property value.
+
+        :param str property_codename: The property's codename.
+        :param value: The property value (compared with equality, values of
+            another type never match: `True`, `1` and `1.0` are distinct).
+            List values are indexed as tuples: a list or a tuple matches.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :return tuple: The objects STEP ids.
+        """
+        value_key = self._get_value_key(value)
+        return self._merge_ids(
+            self._ids_by_value_by_key.get(cur_key, {}).get(value_key, ())
+            for cur_key in self._get_keys(property_codename, pset_codename))
+
+    def get_entity_ids_in_range(
+            self, property_codename, *, pset_codename=None, min_value=None,
+            max_value=None):
+        """Get the STEP ids of the objects having a numeric property value
+        in a range (bounds included).
+
+        :param str property_codename: The property's codename.
+        :param str pset_codename: (optional, default None)
+            The property set's codename. If `None`, the property is looked
+            into all property sets.
+        :param float min_value: (optional, default None)
+            The range's lower bound. If `None`, the range has no lower bound.
+        :param float max_value: (optional, default None)
+            The range's upper bound. If `None`, the range has no upper bound.
+        :return tuple: The objects STEP ids, in ascending value order (of
+            each property set, when several are looked into).
+        """
+        ids_lists = []
+        for cur_key in self._get_keys(property_codename, pset_codename):
+            values, ids = self._get_sorted_numbers(cur_key)
+            start = 0
+            if min_value is not None:
+                start = bisect.bisect_left(values, min_value)
+            end = len(values)
+            if max_value is not None:
+                end = bisect.bisect_right(values, max_value)
+            ids_lists.append(ids[start:end])
+        return self._merge_ids(ids_lists)
@@ -0,0 +1,296 @@
+"""IFC quantity table (columnar quantities)"""
+
+import array
+from collections import OrderedDict
+
+from .ifc_codename_table import IfcCodenameTable
+from .ifc_unit_context import QUANTITY_MEASURE_TYPES
+from .tools import numpy
+
+
+class IfcQuantityTable():
+    """Columnar table of the simple quantities of the objects of an IFC file
+    (see `IfcElementQuantity`), as a struct of arrays: one row per quantity
+    of an object.
+
+    It is built with one pass over the `IfcRelDefinesByProperties` relations
+    of the file, reading each `IfcElementQuantity` once, whatever the number
+    of objects it is related to. As `IfcObjectEntity.quantities` does, only
+    simple quantities are read (see `IfcObjectEntitySimpleQuantity`).
+
+    Columns (see `get_columns`):
+        - 'object_id': the object's STEP id
+        - 'codename_code': the quantity name's codename code
+            (see `IfcCodenameTable`)
+        - 'kind_code': the quantity kind's position in `KINDS`
+        - 'value': the quantity value (float, NaN when not defined)
+        - 'unit_code': the quantity unit's position in `units`
+            (-1 when no unit is defined: the project's default unit applies)
+
+    Rows are grouped by a key of their object (see `group_key`): a group is a
+    contiguous range of rows, which `get_group` gives as a table of slices of
+    these columns (no copy). Objects are in STEP id order within a group,
+    quantities in file order within an object. Rows are sorted for this
+    grouping only: groups of another key (types within a storey...) are not
+    contiguous, build another table for them.
+
+    :param ifcopenshell.file ifcos_file: The IFC file to read.
+    :param IfcSchema schema: The IFC schema specification description of data.
+    :param set accepted_type_names: (optional, default None)
+        The exact type names of the objects whose quantities are read.
+        If `None`, quantities of all objects are read.
+    :param callable group_key: (optional, default None)
+        A function giving the group key of an object (called with its
+        `ifcopenshell.entity_instance`). Groups are in order of their first
+        object. If `None`, all rows are in a single group (key `None`).
+    :param IfcCodenameTable codename_table: (optional, default None)
+        The table giving the codenames of quantity names.
+        If `None`, a private table is used.
+    """
+
+    # quantity kinds, from the simple quantity type names ('IfcQuantityArea')
+    KINDS = ('Length', 'Area', 'Volume', 'Count', 'Weight', 'Time',)
+
+    # column names and array type codes
+    _COLUMN_TYPES = (
+        ('object_id', 'q',),
+        ('codename_code', 'q',),
+        ('kind_code', 'b',),
+        ('value', 'd',),
+        ('unit_code', 'q',),
+    )
+
+    def __init__(self, ifcos_file, schema, *, accepted_type_names=None,
+                 group_key=None, codename_table=None):
+        self._schema = schema
+        if codename_table is None:
+            codename_table = IfcCodenameTable()
+        self._codename_table = codename_table
+        # [unit raw entity] (by unit code), {unit STEP id: unit code}
+        self._units = []
+        self._unit_codes_by_id = {}
+        # {quantity type name: layout} (see `_get_quantity_layout`)
+        self._quantity_layouts = {}
+        # {column name: memoryview of column array}
+        self._columns = {}
+        # {group key: (first row, end row)} (in rows order)
+        self._row_ranges_by_group = OrderedDict()
+        self._read_relations(ifcos_file, accepted_type_names, group_key)
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_quantities={nb_quantities}'
+            ', nb_groups={nb_groups}'
+            ')'.format(
+                self=self, nb_quantities=len(self),
+                nb_groups=len(self._row_ranges_by_group)))
+
+    def __len__(self):
+        return len(self._columns['object_id'])
+
+    @property
+    def codename_table(self):
+        """Get the table giving the codenames of the quantity codes."""
+        return self._codename_table
+
+    @property
+    def units(self):
+        """Get the units of the quantities (raw `IfcNamedUnit` entities...),
+        by unit code."""
+        return tuple(self._units)
+
+    @property
+    def groups(self):
+        """Get the group keys of the rows, in rows order."""
+        return tuple(self._row_ranges_by_group)
+
+    def _read_relations(self, ifcos_file, accepted_type_names, group_key):
+        # Read the rows of each relation's quantity set, for all relation's
+        #  objects, then store them by group.
+        schema = self._schema
+        # a quantity set can be related to objects by several relations
+        qset_rows_by_id = {}
+        rows_by_object_id = {}
+        raw_objects_by_id = {}
+        for cur_rel in ifcos_file.by_type('IfcRelDefinesByProperties'):
+            raw_qset = schema.get_raw_attribute(
+                cur_rel, 'RelatingPropertyDefinition')
+            if not schema.entity_is_a(raw_qset.is_a(), 'IfcElementQuantity'):
+                continue
+            raw_objects = [
+                cur_raw_obj
+                for cur_raw_obj in schema.get_raw_attribute(
+                    cur_rel, 'RelatedObjects')
+                if schema.entity_is_a(cur_raw_obj.is_a(), 'IfcObject') and (
+                    accepted_type_names is None
+                    or cur_raw_obj.is_a() in accepted_type_names)]
+            if len(raw_objects) == 0:
+                continue
+            qset_rows = qset_rows_by_id.get(raw_qset.id())
+            if qset_rows is None:
+                qset_rows = qset_rows_by_id[raw_qset.id()] = (
+                    self._read_qset_rows(raw_qset))
+            for cur_raw_obj in raw_objects:
+                raw_objects_by_id[cur_raw_obj.id()] = cur_raw_obj
+                rows_by_object_id.setdefault(cur_raw_obj.id(), []).extend(
+                    qset_rows)
+
+        # objects ordered by group (in order of first object), then STEP id
+        object_ids_by_group = OrderedDict()
+        for cur_id in sorted(rows_by_object_id):
+            key = None
+            if group_key is not None:
+                key = group_key(raw_objects_by_id[cur_id])
+            object_ids_by_group.setdefault(key, []).append(cur_id)
+
+        columns = {
+            cur_name: array.array(cur_type_code)
+            for cur_name, cur_type_code in self._COLUMN_TYPES}
+        for cur_key, cur_object_ids in object_ids_by_group.items():
+            start = len(columns['object_id'])
+            for cur_id in cur_object_ids:
+                rows = rows_by_object_id[cur_id]
+                columns['object_id'].extend([cur_id] * len(rows))
+                for cur_name, cur_column in zip(
+                        ('codename_code', 'kind_code', 'value', 'unit_code',),
+                        zip(*rows)):
+                    columns[cur_name].extend(cur_column)
+            self._row_ranges_by_group[cur_key] = (
+                start, len(columns['object_id']),)
+        self._columns = {
+            cur_name: memoryview(cur_array)
+            for cur_name, cur_array in columns.items()}
+
+    def _get_quantity_layout(self, type_name):
+        # The (kind code, Name, value and Unit attribute positions) of a
+        #  simple quantity type (computed once per type), None for the
+        #  other types.
+        if type_name not in self._quantity_layouts:
+            layout = None
+            # as `IfcObjectEntitySimpleQuantity.value`
+            kind = type_name[len('IfcQuantity'):]
+            if kind in self.KINDS and self._schema.entity_is_a(
+                    type_name, 'IfcPhysicalSimpleQuantity'):
+                indexes = self._schema.get_entity_attribute_indexes(
+                    type_name)
+                layout = (
+                    self.KINDS.index(kind), indexes['Name'],
+                    indexes['{}Value'.format(kind)], indexes['Unit'],)
+            self._quantity_layouts[type_name] = layout
+        return self._quantity_layouts[type_name]
+
+    def _read_qset_rows(self, raw_qset):
+        # The (codename code, kind code, value, unit code) of all the simple
+        #  quantities of a quantity set.
+        rows = []
+        for cur_raw_qty in self._schema.get_raw_attribute(
+                raw_qset, 'Quantities'):
+            layout = self._get_quantity_layout(cur_raw_qty.is_a())
+            if layout is None:
+                continue
+            kind_code, name_index, value_index, unit_index = layout
+            value = cur_raw_qty[value_index]
+            rows.append((
+                self._codename_table.get_code(cur_raw_qty[name_index]),
+                kind_code,
+                float('nan') if value is None else float(value),
+                self._get_unit_code(cur_raw_qty[unit_index]),
+            ))
+        return rows
+
+    def _get_unit_code(self, raw_unit):
+        # The code of a unit (interned on first call), -1 for no unit.
+        if raw_unit is None:
+            return -1
+        unit_code = self._unit_codes_by_id.get(raw_unit.id())
+        if unit_code is None:
+            unit_code = self._unit_codes_by_id[raw_unit.id()] = len(
+                self._units)
+            self._units.append(raw_unit)
+        return unit_code
+
+    def get_column(self, name):
+        """Get a column of the table (see class description).
+
+        :param str name: The column name ('object_id', 'value'...).
+        :return numpy.ndarray|memoryview: The column, a NumPy array when
+            NumPy is installed (sharing the table memory, no copy).
+        :raises KeyError: When the column does not exist.
+        """
+        column = self._columns[name]
+        if numpy is not None:
+            return numpy.frombuffer(column, dtype=column.format)
+        return column
+
+    def get_columns(self):
+        """Get all the columns of the table (see `get_column`).
+
+        :return dict: Columns by name.
+        """
+        return {
+            cur_name: self.get_column(cur_name)
+            for cur_name, _ in self._COLUMN_TYPES}
+
+    def get_group(self, key):
+        """Get the rows of a group, as a table of slices of this table's
+        columns (no copy).
+
+        :param key: The group key (see `groups`).
+        :return IfcQuantityTable: The group's table.
+        :raises KeyError: When the group does not exist.
+        """
+        start, end = self._row_ranges_by_group[key]
+        table = self.__class__.__new__(self.__class__)
+        table.__dict__.update(self.__dict__)
+        table._columns = {
+            cur_name: cur_column[start:end]
+            for cur_name, cur_column in self._columns.items()}
+        table._row_ranges_by_group = OrderedDict(((key, (0, end - start,)),))
+        return table
+
+    def _get_conversion_table(self, unit_context):
+        # The (factor, offset) of each (kind code, unit code + 1) couple
+        #  (NaN factor when not convertible), as 2 lists of rows.
+        factors = []
+        offsets = []
+        for cur_kind in self.KINDS:
+            measure_type_name = QUANTITY_MEASURE_TYPES[
+                'IfcQuantity{}'.format(cur_kind)]
+            conversions = [
+                unit_context.get_measure_conversion(
+                    measure_type_name, raw_unit=cur_raw_unit)
+                for cur_raw_unit in [None] + self._units]
+            factors.append([
+                float('nan') if cur_conversion is None else cur_conversion[0]
+                for cur_conversion in conversions])
+            offsets.append([
+                0. if cur_conversion is None else cur_conversion[1]
+                for cur_conversion in conversions])
+        return factors, offsets
+
+    def get_values_si(self, unit_context):
+        """Get the quantity values converted to SI units: a multiply (and
+        an add) by conversions looked up by kind and unit codes, over the
+        whole column when NumPy is installed.
+
+        :param IfcUnitContext unit_context: The units of the file's project
+            (see `IfcDataReader.unit_context`), for the quantities without
+            unit.
+        :return numpy.ndarray|array.array: The values in SI units (NaN when
+            a value can not be converted).
+        """
+        factors, offsets = self._get_conversion_table(unit_context)
+        if numpy is not None:
+            kind_codes = self.get_column('kind_code')
+            unit_codes = self.get_column('unit_code') + 1
+            return (
+                self.get_column('value')
+                * numpy.array(factors)[kind_codes, unit_codes]
+                + numpy.array(offsets)[kind_codes, unit_codes])
+        return array.array('d', (
+            cur_value * factors[cur_kind_code][cur_unit_code + 1]
+            + offsets[cur_kind_code][cur_unit_code + 1]
+            for cur_value, cur_kind_code, cur_unit_code in zip(
+                self._columns['value'], self._columns['kind_code'],
+                self._columns['unit_code'])))
@@ -0,0 +1,114 @@
+"""IFC spatial tree"""
+
+
+class IfcSpatialTree():
+    """Tree of the entities of an IFC file, following the parent links of the
+    containment index (project, sites, buildings, storeys, spaces,
+    elements...), materialized by one depth-first traversal.
+
+    Entities are stored in traversal (pre)order, so that an entity's
+    descendants are a contiguous range: they are found in O(descendants),
+    whatever the depth. Entities are identified by their STEP id.
+
+    :param ifcopenshell.file ifcos_file: The IFC file.
+    :param IfcContainmentIndex containment_index:
+        The containment index of the file (see `IfcContainmentIndex`).
+    :param IfcSchema schema: The IFC schema specification description of data.
+    """
+
+    def __init__(self, ifcos_file, containment_index, schema):
+        self._containment_index = containment_index
+        self._schema = schema
+        self._root_ids = containment_index.get_root_ids()
+        # entities' ids and type names, in traversal order
+        self._ids = []
+        self._type_names = []
+        # entity's id: (position, end of its descendants range, depth)
+        self._nodes_by_id = {}
+        self._build(ifcos_file)
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'nb_roots={nb_roots}'
+            ', nb_entities={nb_entities}'
+            ')'.format(
+                self=self, nb_roots=len(self.root_ids),
+                nb_entities=len(self._ids)))
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, step_id):
+        return step_id in self._nodes_by_id
+
+    @property
+    def root_ids(self):
+        """Get the STEP ids of the tree roots (entities without parent, the
+        project in a valid file)."""
+        return self._root_ids
+
+    def _build(self, ifcos_file):
+        # Iterative depth-first traversal (no recursion limit), setting the
+        #  end of an entity's descendants range once all of them are visited.
+        for cur_root_id in self.root_ids:
+            stack = [(cur_root_id, 0, False,)]
+            while stack:
+                step_id, depth, is_visited = stack.pop()
+                if is_visited:
+                    position, _, _ = self._nodes_by_id[step_id]
+                    self._nodes_by_id[step_id] = (
+                        position, len(self._ids), depth,)
+                    continue
+                self._nodes_by_id[step_id] = (len(self._ids), None, depth,)
+                self._ids.append(step_id)
+                self._type_names.append(ifcos_file.by_id(step_id).is_a())
+                stack.append((step_id, depth, True,))
+                stack.extend(
+                    (cur_child_id, depth + 1, False,)
+                    for cur_child_id in reversed(
+                        self._containment_index.get_child_ids(step_id)))
+
+    def get_depth(self, step_id):
+        """Get the depth of an entity in the tree (0 for a root).
+
+        :param int step_id: The entity's STEP id.
+        :return int: The entity's depth.
+        :raises KeyError: When the entity is not in the tree.
+        """
+        return self._nodes_by_id[step_id][2]
+
+    def get_descendant_ids(self, step_id, *, entity_name=None):
+        """Get the STEP ids of all the descendants of an entity (its children,
+        their children...), in traversal order.
+
+        :param int step_id: The entity's STEP id.
+        :param str entity_name: (optional, default None)
+            If defined, only the descendants that are `entity_name` entities
+            (or one of its subtypes) are returned.
+        :return tuple: The descendants STEP ids.
+        :raises KeyError: When the entity is not in the tree.
+        """
+        position, end, _ = self._nodes_by_id[step_id]
+        if entity_name is None:
+            return tuple(self._ids[position + 1:end])
+        return tuple(
+            cur_id for cur_id, cur_type_name in zip(
+                self._ids[position + 1:end],
+                self._type_names[position + 1:end])
+            if self._schema.entity_is_a(cur_type_name, entity_name))
+
+    def get_ancestor_ids(self, step_id):
+        """Get the STEP ids of the ancestors of an entity, from its parent to
+        its tree root.
+
+        :param int step_id: The entity's STEP id.
+        :return tuple: The ancestors STEP ids.
+        :raises KeyError: When the entity is not in the tree.
+        """
+        depth = self._nodes_by_id[step_id][2]
+        ancestor_ids = []
+        for _ in range(depth):
+            step_id = self._containment_index.get_parent_id(step_id)
+            ancestor_ids.append(step_id)
+        return tuple(ancestor_ids)
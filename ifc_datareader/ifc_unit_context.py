@@ -0,0 +1,360 @@
+"""IFC unit context (unit resolution and SI conversions)"""
+
+import numbers
+
+from .tools import numpy
+
+
+# SI prefixes (see `IfcSIPrefix`)
+SI_PREFIX_FACTORS = {
+    'EXA': 1e18, 'PETA': 1e15, 'TERA': 1e12, 'GIGA': 1e9, 'MEGA': 1e6,
+    'KILO': 1e3, 'HECTO': 1e2, 'DECA': 1e1, 'DECI': 1e-1, 'CENTI': 1e-2,
+    'MILLI': 1e-3, 'MICRO': 1e-6, 'NANO': 1e-9, 'PICO': 1e-12,
+    'FEMTO': 1e-15, 'ATTO': 1e-18,
+}
+# SI unit names (see `IfcSIUnitName`) whose prefix applies with an exponent
+SI_UNIT_EXPONENTS = {'SQUARE_METRE': 2, 'CUBIC_METRE': 3}
+# SI unit names that are not the SI (base or derived) unit of their measure:
+#  (factor, offset) to it
+SI_UNIT_CONVERSIONS = {
+    # SI base unit of mass is the kilogram
+    'GRAM': (1e-3, 0.,),
+    'DEGREE_CELSIUS': (1., 273.15,),
+}
+
+# unit type of each measure type with a unit: named units (see `IfcUnitEnum`),
+#  derived units (see `IfcDerivedUnitEnum`) and monetary units
+MEASURE_UNIT_TYPES = {
+    # named units
+    'IfcAbsorbedDoseMeasure': 'ABSORBEDDOSEUNIT',
+    'IfcAmountOfSubstanceMeasure': 'AMOUNTOFSUBSTANCEUNIT',
+    'IfcAreaMeasure': 'AREAUNIT',
+    'IfcDoseEquivalentMeasure': 'DOSEEQUIVALENTUNIT',
+    'IfcElectricCapacitanceMeasure': 'ELECTRICCAPACITANCEUNIT',
+    'IfcElectricChargeMeasure': 'ELECTRICCHARGEUNIT',
+    'IfcElectricConductanceMeasure': 'ELECTRICCONDUCTANCEUNIT',
+    'IfcElectricCurrentMeasure': 'ELECTRICCURRENTUNIT',
+    'IfcElectricResistanceMeasure': 'ELECTRICRESISTANCEUNIT',
+    'IfcElectricVoltageMeasure': 'ELECTRICVOLTAGEUNIT',
+    'IfcEnergyMeasure': 'ENERGYUNIT',
+    'IfcForceMeasure': 'FORCEUNIT',
+    'IfcFrequencyMeasure': 'FREQUENCYUNIT',
+    'IfcIlluminanceMeasure': 'ILLUMINANCEUNIT',
+    'IfcInductanceMeasure': 'INDUCTANCEUNIT',
+    'IfcLengthMeasure': 'LENGTHUNIT',
+    'IfcPositiveLengthMeasure': 'LENGTHUNIT',
+    'IfcNonNegativeLengthMeasure': 'LENGTHUNIT',
+    'IfcLuminousFluxMeasure': 'LUMINOUSFLUXUNIT',
+    'IfcLuminousIntensityMeasure': 'LUMINOUSINTENSITYUNIT',
+    'IfcMagneticFluxDensityMeasure': 'MAGNETICFLUXDENSITYUNIT',
+    'IfcMagneticFluxMeasure': 'MAGNETICFLUXUNIT',
+    'IfcMassMeasure': 'MASSUNIT',
+    'IfcPlaneAngleMeasure': 'PLANEANGLEUNIT',
+    'IfcPositivePlaneAngleMeasure': 'PLANEANGLEUNIT',
+    'IfcPowerMeasure': 'POWERUNIT',
+    'IfcPressureMeasure': 'PRESSUREUNIT',
+    'IfcRadioActivityMeasure': 'RADIOACTIVITYUNIT',
+    'IfcSolidAngleMeasure': 'SOLIDANGLEUNIT',
+    'IfcThermodynamicTemperatureMeasure': 'THERMODYNAMICTEMPERATUREUNIT',
+    'IfcTimeMeasure': 'TIMEUNIT',
+    'IfcVolumeMeasure': 'VOLUMEUNIT',
+    # derived units
+    'IfcAccelerationMeasure': 'ACCELERATIONUNIT',
+    'IfcAngularVelocityMeasure': 'ANGULARVELOCITYUNIT',
+    'IfcAreaDensityMeasure': 'AREADENSITYUNIT',
+    'IfcCompoundPlaneAngleMeasure': 'COMPOUNDPLANEANGLEUNIT',
+    'IfcCurvatureMeasure': 'CURVATUREUNIT',
+    'IfcDynamicViscosityMeasure': 'DYNAMICVISCOSITYUNIT',
+    'IfcHeatFluxDensityMeasure': 'HEATFLUXDENSITYUNIT',
+    'IfcHeatingValueMeasure': 'HEATINGVALUEUNIT',
+    'IfcIntegerCountRateMeasure': 'INTEGERCOUNTRATEUNIT',
+    'IfcIonConcentrationMeasure': 'IONCONCENTRATIONUNIT',
+    'IfcIsothermalMoistureCapacityMeasure': 'ISOTHERMALMOISTURECAPACITYUNIT',
+    'IfcKinematicViscosityMeasure': 'KINEMATICVISCOSITYUNIT',
+    'IfcLinearForceMeasure': 'LINEARFORCEUNIT',
+    'IfcLinearMomentMeasure': 'LINEARMOMENTUNIT',
+    'IfcLinearStiffnessMeasure': 'LINEARSTIFFNESSUNIT',
+    'IfcLinearVelocityMeasure': 'LINEARVELOCITYUNIT',
+    'IfcLuminousIntensityDistributionMeasure':
+        'LUMINOUSINTENSITYDISTRIBUTIONUNIT',
+    'IfcMassDensityMeasure': 'MASSDENSITYUNIT',
+    'IfcMassFlowRateMeasure': 'MASSFLOWRATEUNIT',
+    'IfcMassPerLengthMeasure': 'MASSPERLENGTHUNIT',
+    'IfcModulusOfElasticityMeasure': 'MODULUSOFELASTICITYUNIT',
+    'IfcModulusOfLinearSubgradeReactionMeasure':
+        'MODULUSOFLINEARSUBGRADEREACTIONUNIT',
+    'IfcModulusOfRotationalSubgradeReactionMeasure':
+        'MODULUSOFROTATIONALSUBGRADEREACTIONUNIT',
+    'IfcModulusOfSubgradeReactionMeasure': 'MODULUSOFSUBGRADEREACTIONUNIT',
+    'IfcMoistureDiffusivityMeasure': 'MOISTUREDIFFUSIVITYUNIT',
+    'IfcMolecularWeightMeasure': 'MOLECULARWEIGHTUNIT',
+    'IfcMomentOfInertiaMeasure': 'MOMENTOFINERTIAUNIT',
+    'IfcPHMeasure': 'PHUNIT',
+    'IfcPlanarForceMeasure': 'PLANARFORCEUNIT',
+    'IfcRotationalFrequencyMeasure': 'ROTATIONALFREQUENCYUNIT',
+    'IfcRotationalMassMeasure': 'ROTATIONALMASSUNIT',
+    'IfcRotationalStiffnessMeasure': 'ROTATIONALSTIFFNESSUNIT',
+    'IfcSectionModulusMeasure': 'SECTIONMODULUSUNIT',
+    'IfcSectionalAreaIntegralMeasure': 'SECTIONAREAINTEGRALUNIT',
+    'IfcShearModulusMeasure': 'SHEARMODULUSUNIT',
+    'IfcSoundPowerLevelMeasure': 'SOUNDPOWERLEVELUNIT',
+    'IfcSoundPowerMeasure': 'SOUNDPOWERUNIT',
+    'IfcSoundPressureLevelMeasure': 'SOUNDPRESSURELEVELUNIT',
+    'IfcSoundPressureMeasure': 'SOUNDPRESSUREUNIT',
+    'IfcSpecificHeatCapacityMeasure': 'SPECIFICHEATCAPACITYUNIT',
+    'IfcTemperatureGradientMeasure': 'TEMPERATUREGRADIENTUNIT',
+    'IfcTemperatureRateOfChangeMeasure': 'TEMPERATURERATEOFCHANGEUNIT',
+    'IfcThermalAdmittanceMeasure': 'THERMALADMITTANCEUNIT',
+    'IfcThermalConductivityMeasure': 'THERMALCONDUCTANCEUNIT',
+    'IfcThermalExpansionCoefficientMeasure': 'THERMALEXPANSIONCOEFFICIENTUNIT',
+    'IfcThermalResistanceMeasure': 'THERMALRESISTANCEUNIT',
+    'IfcThermalTransmittanceMeasure': 'THERMALTRANSMITTANCEUNIT',
+    'IfcTorqueMeasure': 'TORQUEUNIT',
+    'IfcVaporPermeabilityMeasure': 'VAPORPERMEABILITYUNIT',
+    'IfcVolumetricFlowRateMeasure': 'VOLUMETRICFLOWRATEUNIT',
+    'IfcWarpingConstantMeasure': 'WARPINGCONSTANTUNIT',
+    'IfcWarpingMomentMeasure': 'WARPINGMOMENTUNIT',
+    'IfcMonetaryMeasure': 'MONETARYUNIT',
+}
+
+# measure types without unit (their values are the same in any unit system)
+UNITLESS_MEASURE_TYPES = frozenset((
+    'IfcCountMeasure', 'IfcInteger', 'IfcNormalisedRatioMeasure',
+    'IfcNumericMeasure', 'IfcParameterValue', 'IfcPositiveInteger',
+    'IfcPositiveRatioMeasure', 'IfcRatioMeasure', 'IfcReal',
+))
+
+# measure type of each simple quantity type
+QUANTITY_MEASURE_TYPES = {
+    'IfcQuantityLength': 'IfcLengthMeasure',
+    'IfcQuantityArea': 'IfcAreaMeasure',
+    'IfcQuantityVolume': 'IfcVolumeMeasure',
+    'IfcQuantityCount': 'IfcCountMeasure',
+    'IfcQuantityWeight': 'IfcMassMeasure',
+    'IfcQuantityTime': 'IfcTimeMeasure',
+}
+
+# conversion of values already in SI units (or without unit)
+_NO_CONVERSION = (1., 0.,)
+
+
+class IfcUnitContext():
+    """Units of an IFC file's project (see `IfcUnitAssignment`), resolved
+    once to their conversion to SI units.
+
+    A conversion is a (factor, offset) couple: `value_si = value * factor +
+    offset`. It is computed once per unit (SI units with a prefix,
+    conversion based units, derived units), and once per measure type for
+    the project's default units, so that a column of values is converted by
+    one (vectorized) multiply.
+
+    Values of a measure type without project's unit (and without explicit
+    unit) are considered in SI units, as values of measure types without
+    unit type (`IfcReal`, `IfcCountMeasure`...). Monetary units (and unknown
+    units) can not be converted.
+
+    :param iterable raw_units: (optional, default ())
+        The project's units (raw `IfcNamedUnit`, `IfcDerivedUnit`...
+        entities).
+    :param IfcSchema schema: (optional, default None)
+        The IFC schema specification description of data.
+    """
+
+    def __init__(self, raw_units=(), schema=None):
+        self._schema = schema
+        # {unit type: raw unit}
+        self._units_by_type = {}
+        for cur_raw_unit in raw_units:
+            unit_type = self._get_unit_type(cur_raw_unit)
+            if unit_type is not None:
+                self._units_by_type.setdefault(unit_type, cur_raw_unit)
+        # {unit STEP id: conversion}
+        self._conversions_by_unit_id = {}
+        # {measure type name: conversion} (with project's default units)
+        self._conversions_by_measure_type = {}
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'unit_types={unit_types}'
+            ')'.format(self=self, unit_types=tuple(self._units_by_type)))
+
+    def _is_a(self, raw_data, type_name):
+        # Check a raw entity type (using schema's type masks, if any).
+        if self._schema is not None:
+            return self._schema.entity_is_a(raw_data.is_a(), type_name)
+        return raw_data.is_a(type_name)
+
+    def _get_unit_type(self, raw_unit):
+        # The unit type of a raw unit (see `IfcUnitEnum`), 'MONETARYUNIT'
+        #  for monetary units, None for the others.
+        if self._is_a(raw_unit, 'IfcMonetaryUnit'):
+            return 'MONETARYUNIT'
+        unit_type = getattr(raw_unit, 'UnitType', None)
+        if unit_type == 'USERDEFINED':
+            return getattr(raw_unit, 'UserDefinedType', None) or unit_type
+        return unit_type
+
+    def _resolve_conversion(self, raw_unit):
+        # The conversion of a raw unit to SI, None if it can not be resolved.
+        if self._is_a(raw_unit, 'IfcSIUnit'):
+            factor, offset = SI_UNIT_CONVERSIONS.get(
+                raw_unit.Name, _NO_CONVERSION)
+            if raw_unit.Prefix is not None:
+                factor *= SI_PREFIX_FACTORS[raw_unit.Prefix] ** (
+                    SI_UNIT_EXPONENTS.get(raw_unit.Name, 1))
+            return (factor, offset,)
+        if self._is_a(raw_unit, 'IfcConversionBasedUnit'):
+            # 1 unit = `ValueComponent` of `UnitComponent`
+            measure = raw_unit.ConversionFactor
+            conversion = self.get_conversion(measure.UnitComponent)
+            if conversion is None:
+                return None
+            factor = measure.ValueComponent.wrappedValue * conversion[0]
+            offset = conversion[1]
+            if self._is_a(raw_unit, 'IfcConversionBasedUnitWithOffset'):
+                # (value - `ConversionOffset`) in `UnitComponent`
+                offset -= raw_unit.ConversionOffset * factor
+            return (factor, offset,)
+        if self._is_a(raw_unit, 'IfcDerivedUnit'):
+            # (offsets do not apply to derived units, as to differences)
+            factor = 1.
+            for cur_element in raw_unit.Elements:
+                conversion = self.get_conversion(cur_element.Unit)
+                if conversion is None:
+                    return None
+                factor *= conversion[0] ** cur_element.Exponent
+            return (factor, 0.,)
+        # monetary units, ...
+        return None
+
+    def get_unit(self, unit_type):
+        """Get the project's unit of a unit type.
+
+        :param str unit_type: The unit type ('LENGTHUNIT', 'AREAUNIT'...).
+        :return ifcopenshell.entity_instance: The raw unit, None if project
+            has no unit of this type.
+        """
+        return self._units_by_type.get(unit_type)
+
+    def get_measure_unit(self, measure_type_name):
+        """Get the project's unit of a measure type.
+
+        :param str measure_type_name: The measure type ('IfcLengthMeasure',
+            'IfcAreaMeasure'...).
+        :return ifcopenshell.entity_instance: The raw unit, None if measure
+            type has no unit type or project has no unit of this type.
+        """
+        unit_type = MEASURE_UNIT_TYPES.get(measure_type_name)
+        if unit_type is None:
+            return None
+        return self.get_unit(unit_type)
+
+    def get_conversion(self, raw_unit):
+        """Get the conversion of a unit to SI (computed once per unit).
+
+        :param ifcopenshell.entity_instance raw_unit: The raw unit.
+        :return tuple: (factor, offset,) to SI, None if unit can not be
+            converted (monetary unit...).
+        """
+        try:
+            return self._conversions_by_unit_id[raw_unit.id()]
+        except KeyError:
+            conversion = self._conversions_by_unit_id[raw_unit.id()] = (
+                self._resolve_conversion(raw_unit))
+            return conversion
+
+    def get_measure_conversion(self, measure_type_name, *, raw_unit=None):
+        """Get the conversion to SI of values of a measure type (computed
+        once per measure type).
+
+        :param str measure_type_name: The measure type ('IfcLengthMeasure',
+            'IfcAreaMeasure'...).
+        :param ifcopenshell.entity_instance raw_unit: (optional, default None)
+            The values' explicit unit. If `None`, project's unit of the
+            measure type applies.
+        :return tuple: (factor, offset,) to SI, None if values can not be
+            converted (monetary values, unknown measure type...).
+        """
+        if raw_unit is not None:
+            return self.get_conversion(raw_unit)
+        try:
+            return self._conversions_by_measure_type[measure_type_name]
+        except KeyError:
+            unit_type = MEASURE_UNIT_TYPES.get(measure_type_name)
+            raw_unit = self.get_measure_unit(measure_type_name)
+            if raw_unit is not None:
+                conversion = self.get_conversion(raw_unit)
+            elif unit_type is not None and unit_type != 'MONETARYUNIT':
+                # no project's unit: values are in SI units
+                conversion = _NO_CONVERSION
+            elif measure_type_name in UNITLESS_MEASURE_TYPES:
+                conversion = _NO_CONVERSION
+            else:
+                # monetary or unknown measure type
+                conversion = None
+            self._conversions_by_measure_type[measure_type_name] = (
+                conversion)
+            return conversion
+
+    def to_si(self, value, measure_type_name, *, raw_unit=None):
+        """Convert a value to SI units.
+
+        :param value: The value.
+        :param str measure_type_name: The value's measure type.
+        :param ifcopenshell.entity_instance raw_unit: (optional, default None)
+            The value's explicit unit. If `None`, project's unit of the
+            measure type applies.
+        :return float: The value in SI units, None if value is not a number
+            or can not be converted.
+        """
+        if not isinstance(value, numbers.Real) or isinstance(value, bool):
+            return None
+        conversion = self.get_measure_conversion(
+            measure_type_name, raw_unit=raw_unit)
+        if conversion is None:
+            return None
+        factor, offset = conversion
+        return value * factor + offset
+
+    def to_si_column(self, values, measure_type_name, *, raw_units=None):
+        """Convert a column of values of a measure type to SI units, with
+        one multiply when the column is a NumPy array (see
+        `IfcDataReader.get_property_matrix`).
+
+        :param numpy.ndarray|iterable values: The values (numbers).
+        :param str measure_type_name: The values' measure type.
+        :param iterable raw_units: (optional, default None)
+            The values' explicit units (raw unit or None, by value).
+            If `None`, project's unit of the measure type applies to all.
+        :return numpy.ndarray|tuple: The values in SI units (NaN, or None
+            without NumPy, when a value can not be converted).
+        """
+        default_conversion = self.get_measure_conversion(measure_type_name)
+        if raw_units is None or all(
+                cur_raw_unit is None for cur_raw_unit in raw_units):
+            conversions = None
+            if default_conversion is None:
+                conversions = [None] * len(values)
+        else:
+            conversions = [
+                default_conversion if cur_raw_unit is None
+                else self.get_conversion(cur_raw_unit)
+                for cur_raw_unit in raw_units]
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if conversions is None:
+                factor, offset = default_conversion
+            else:
+                factor = numpy.array([
+                    numpy.nan if cur_conversion is None else cur_conversion[0]
+                    for cur_conversion in conversions])
+                offset = numpy.array([
+                    0. if cur_conversion is None else cur_conversion[1]
+                    for cur_conversion in conversions])
+            return values * factor + offset
+        if conversions is None:
+            conversions = [default_conversion] * len(values)
+        return tuple(
+            None if cur_value is None or cur_conversion is None
+            else cur_value * cur_conversion[0] + cur_conversion[1]
+            for cur_value, cur_conversion in zip(values, conversions))
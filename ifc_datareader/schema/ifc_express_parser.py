@@ -0,0 +1,405 @@
+"""EXPRESS (ISO 10303-11) schema parser.
+
+The schema text is walked once, declaration after declaration, and emits
+defined types, select types, enumerations and entities (with attributes,
+inverses, DERIVE, UNIQUE and WHERE clauses) as plain named tuples.
+
+Each declaration is split into its statements (the `;` separated parts),
+which are tokenized independently of any layout (newlines, indentation...).
+Only the declarative part of the language is parsed: bodies of functions,
+rules and procedures are skipped at once, and expressions of DERIVE, UNIQUE
+and WHERE clauses are kept as raw text (whitespaces normalized).
+"""
+
+from collections import namedtuple
+import functools
+import re
+
+
+# A defined type, for example `TYPE IfcLabel = STRING;`.
+#  `underlying_type` is the raw type definition (whitespaces normalized).
+ExpressDefinedType = namedtuple(
+    'ExpressDefinedType', ('name', 'underlying_type', 'where_rules',))
+
+# A select type, `items` are the selectable type names (declaration order).
+ExpressSelectType = namedtuple(
+    'ExpressSelectType', ('name', 'items', 'where_rules',))
+
+# An enumeration, `items` are the enumeration values (declaration order).
+ExpressEnumeration = namedtuple(
+    'ExpressEnumeration', ('name', 'items', 'where_rules',))
+
+# An entity. `attributes`, `inverses` and `derives` are tuples of
+#  `ExpressAttribute`, `unique_rules` and `where_rules` are tuples of
+#  `ExpressRule`. `span` is the (start, end) position of the entity body
+#  (between `ENTITY ` and `END_ENTITY;`) in the schema text.
+ExpressEntity = namedtuple(
+    'ExpressEntity', (
+        'name', 'is_abstract', 'supertype_name', 'attributes', 'inverses',
+        'derives', 'unique_rules', 'where_rules', 'span',))
+
+# An entity header only, what is declared before its attributes (see
+#  `parse_schema` with `headers_only`).
+ExpressEntityHeader = namedtuple(
+    'ExpressEntityHeader', ('name', 'is_abstract', 'supertype_name', 'span',))
+
+# An entity attribute (explicit, inverse or derived).
+#  `raw_type` is the raw type definition (whitespaces normalized),
+#  `type` is its `ExpressAttributeType` parsed version and `expression` the
+#  raw derivation expression (DERIVE clause only).
+ExpressAttribute = namedtuple(
+    'ExpressAttribute', ('name', 'raw_type', 'type', 'expression',))
+
+# An attribute type, `aggregates` is a tuple of `ExpressAggregate` (from
+#  outer to inner), `base_type` the named or simple type aggregated and
+#  `for_attr` the inverted attribute's name (INVERSE clause only).
+ExpressAttributeType = namedtuple(
+    'ExpressAttributeType', (
+        'is_optional', 'aggregates', 'base_type', 'for_attr',))
+
+# An aggregation type: SET, LIST, BAG or ARRAY [lower:upper] OF ...
+#  Bounds are raw strings ('?' for an unbounded upper bound).
+ExpressAggregate = namedtuple(
+    'ExpressAggregate', ('kind', 'lower', 'upper', 'is_unique',))
+
+# A rule of a UNIQUE or WHERE clause (label is None when unlabeled).
+ExpressRule = namedtuple('ExpressRule', ('label', 'expression',))
+
+# The whole schema, elements are dicts by name (declaration order).
+ExpressSchema = namedtuple(
+    'ExpressSchema', (
+        'name', 'defined_types', 'select_types', 'enumerations',
+        'entities',))
+
+
+class ExpressSyntaxError(ValueError):
+    """Raised when the EXPRESS text can not be parsed."""
+
+
+_COMMENTS = r'\s*(?:\(\*.*?\*\)\s*)*'
+
+# tokens: names, integers, strings, multi-chars operators or a single char
+#  (whitespaces and comments are ignored)
+_TOKEN_RE = re.compile(
+    _COMMENTS +
+    r"([A-Za-z_][A-Za-z0-9_]*|[0-9]+|'(?:[^']|'')*'|:=|<\*|\S)", re.DOTALL)
+
+# statements, ended by a semicolon (which may be in a string or a comment)
+_STATEMENT_RE = re.compile(
+    r"((?:[^;'(]+|'(?:[^']|'')*'|\(\*.*?\*\)|\()*);", re.DOTALL)
+
+# a clause keyword always starts a statement
+_ENTITY_SECTION_RE = re.compile(
+    r';' + _COMMENTS + r'(DERIVE|INVERSE|UNIQUE|WHERE)\b', re.DOTALL)
+_TYPE_SECTION_RE = re.compile(r';' + _COMMENTS + r'(WHERE)\b', re.DOTALL)
+
+_DECLARATION_END_RES = {
+    keyword: re.compile(r'END_{}'.format(keyword) + _COMMENTS + ';')
+    for keyword in (
+        'TYPE', 'ENTITY', 'FUNCTION', 'RULE', 'PROCEDURE', 'CONSTANT',
+        'SUBTYPE_CONSTRAINT',)}
+
+# entity header: [name] [ABSTRACT] [SUPERTYPE OF (...)] [SUBTYPE OF (...)]
+_ENTITY_HEADER_RE = re.compile(
+    r'\s*(?!(?:ABSTRACT|SUPERTYPE|SUBTYPE)\b)([A-Za-z_][A-Za-z0-9_]*)')
+_ENTITY_ABSTRACT_RE = re.compile(r'\bABSTRACT\b')
+_ENTITY_SUBTYPE_RE = re.compile(
+    r'\bSUBTYPE\s+OF\s*\(\s*([A-Za-z_][A-Za-z0-9_]*)\s*\)')
+
+# label of a UNIQUE or WHERE rule
+_RULE_LABEL_RE = re.compile(r'\s*([A-Za-z_][A-Za-z0-9_]*)\s*:(?!=)')
+
+_COMMENT_RE = re.compile(r'\(\*.*?\*\)', re.DOTALL)
+
+_AGGREGATE_KINDS = frozenset(('SET', 'LIST', 'BAG', 'ARRAY',))
+
+
+def _normalize(raw_text):
+    # normalize whitespaces of a raw text
+    return ' '.join(raw_text.split())
+
+
+def _tokenize(text):
+    return _TOKEN_RE.findall(text)
+
+
+def parse_attribute_type(raw_type):
+    """Parse an attribute type definition.
+
+    :param str raw_type: The raw type definition,
+        for example 'OPTIONAL SET [1:?] OF IfcLabel'.
+    :return ExpressAttributeType: The parsed type.
+    :raises ExpressSyntaxError: When the type definition is invalid.
+    """
+    return _parse_normalized_type(_normalize(raw_type))
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_normalized_type(raw_type):
+    # parse a type definition (whitespaces normalized), most of them are
+    #  shared by a lot of attributes, so result (immutable) is memoized
+    if '[' in raw_type or '(' in raw_type:
+        return _parse_type_tokens(_tokenize(raw_type))
+    return _parse_type_tokens(raw_type.split())
+
+
+def _parse_type_tokens(tokens):
+    # parse the tokens of an attribute type definition
+    nb_tokens = len(tokens)
+    idx = 0
+    is_optional = False
+    if nb_tokens > 0 and tokens[0] == 'OPTIONAL':
+        is_optional = True
+        idx += 1
+    aggregates = []
+    while idx < nb_tokens and tokens[idx] in _AGGREGATE_KINDS:
+        kind, lower, upper, is_unique = tokens[idx], None, None, False
+        idx += 1
+        if idx < nb_tokens and tokens[idx] == '[':
+            # [lower:upper]
+            if idx + 4 >= nb_tokens or tokens[idx + 2] != ':' or (
+                    tokens[idx + 4] != ']'):
+                raise ExpressSyntaxError(
+                    'Invalid aggregation bounds: {}'.format(tokens))
+            lower, upper = tokens[idx + 1], tokens[idx + 3]
+            idx += 5
+        if idx < nb_tokens and tokens[idx] == 'OF':
+            idx += 1
+        if idx < nb_tokens and tokens[idx] == 'UNIQUE':
+            is_unique = True
+            idx += 1
+        aggregates.append(ExpressAggregate(kind, lower, upper, is_unique))
+    base_type = None
+    if idx < nb_tokens:
+        base_type = tokens[idx]
+        idx += 1
+        if idx < nb_tokens and tokens[idx] == '(':
+            # width specification, for example STRING(22) FIXED
+            while idx < nb_tokens and tokens[idx] != ')':
+                idx += 1
+            idx += 1
+            if idx < nb_tokens and tokens[idx] == 'FIXED':
+                idx += 1
+    for_attr = None
+    if idx + 1 < nb_tokens and tokens[idx] == 'FOR':
+        for_attr = tokens[idx + 1]
+        idx += 2
+    if idx != nb_tokens:
+        raise ExpressSyntaxError(
+            'Invalid attribute type: {}'.format(' '.join(tokens)))
+    return ExpressAttributeType(
+        is_optional, tuple(aggregates), base_type, for_attr)
+
+
+def _parse_attribute_names(names_text):
+    # `Name1, Name2` or a redeclaration like `SELF\IfcNamedUnit.Dimensions`
+    names = ['']
+    for token in _tokenize(names_text):
+        if token == ',':
+            names.append('')
+        else:
+            names[-1] += token
+    return [name for name in names if name]
+
+
+def _parse_attribute_statement(statement, *, is_derived=False):
+    # `Name1, Name2 : type` (or `Name : type := expression` when derived)
+    expression = None
+    if is_derived:
+        statement, _, expression = statement.partition(':=')
+        expression = _normalize(expression)
+    names_text, sep, type_text = statement.partition(':')
+    if not sep:
+        raise ExpressSyntaxError(
+            'Invalid attribute statement: {}'.format(_normalize(statement)))
+    raw_type = _normalize(type_text)
+    attr_type = _parse_normalized_type(raw_type)
+    names_text = names_text.strip()
+    # fast path: most attributes are declared one by one
+    if names_text.isidentifier():
+        return [ExpressAttribute(names_text, raw_type, attr_type, expression)]
+    return [ExpressAttribute(name, raw_type, attr_type, expression)
+            for name in _parse_attribute_names(names_text)]
+
+
+def _parse_rule_statement(statement):
+    # `label : expression` or just `expression`
+    match = _RULE_LABEL_RE.match(statement)
+    if match is not None:
+        return ExpressRule(
+            match.group(1), _normalize(statement[match.end():]))
+    return ExpressRule(None, _normalize(statement))
+
+
+def _split_statements(text, start, end):
+    # split a part of text into its statements (without their semicolon)
+    part = text[start:end]
+    if "'" in part or '(*' in part:
+        # a semicolon may be in a string or a comment
+        return _STATEMENT_RE.findall(part)
+    # fast path, text after the last semicolon is not a statement
+    return part.split(';')[:-1]
+
+
+def _split_sections(text, start, end, section_re):
+    # yield (section keyword, statements) parts of a declaration body
+    #  (first part, before any clause keyword, has None as keyword)
+    section, section_start = None, start
+    for match in section_re.finditer(text, start, end):
+        yield section, _split_statements(
+            text, section_start, match.start() + 1)
+        section, section_start = match.group(1), match.end()
+    yield section, _split_statements(text, section_start, end)
+
+
+def parse_entity_body(raw_data, *, name=None, span=None):
+    """Parse an entity body, that is to say everything written between
+    `ENTITY` and `END_ENTITY;` keywords.
+
+    :param str raw_data: The entity body. It may start with the entity name.
+    :param str name: (optional, default None)
+        The entity's name. If not defined it is read from `raw_data`.
+    :param tuple span: (optional, default None)
+        The (start, end) position of the body in the schema text.
+    :return ExpressEntity: The parsed entity.
+    :raises ExpressSyntaxError: When the entity body is invalid.
+    """
+    return _parse_entity(raw_data, 0, len(raw_data), name=name, span=span)
+
+
+def _parse_entity_header(header, *, name=None, span=None):
+    # [name] [ABSTRACT] [SUPERTYPE OF (...)] [SUBTYPE OF (...)]
+    if '(*' in header:
+        header = _COMMENT_RE.sub(' ', header)
+    if name is None:
+        name_match = _ENTITY_HEADER_RE.match(header)
+        if name_match is None:
+            raise ExpressSyntaxError(
+                'Missing entity name: {}'.format(_normalize(header)))
+        name = name_match.group(1)
+    is_abstract = _ENTITY_ABSTRACT_RE.search(header) is not None
+    # IFC schemas only use single inheritance
+    supertype_name = None
+    subtype_match = _ENTITY_SUBTYPE_RE.search(header)
+    if subtype_match is not None:
+        supertype_name = subtype_match.group(1)
+    return ExpressEntityHeader(name, is_abstract, supertype_name, span)
+
+
+def _parse_entity(text, start, end, *, name=None, span=None):
+    attributes, inverses, derives, unique_rules, where_rules = (
+        [], [], [], [], [])
+    for section, statements in _split_sections(
+            text, start, end, _ENTITY_SECTION_RE):
+        if section is None:
+            name, is_abstract, supertype_name, _ = _parse_entity_header(
+                statements[0] if statements else '', name=name)
+            for statement in statements[1:]:
+                attributes.extend(_parse_attribute_statement(statement))
+        elif section == 'INVERSE':
+            for statement in statements:
+                inverses.extend(_parse_attribute_statement(statement))
+        elif section == 'DERIVE':
+            for statement in statements:
+                derives.extend(_parse_attribute_statement(
+                    statement, is_derived=True))
+        elif section == 'UNIQUE':
+            unique_rules.extend(map(_parse_rule_statement, statements))
+        else:
+            where_rules.extend(map(_parse_rule_statement, statements))
+
+    return ExpressEntity(
+        name, is_abstract, supertype_name, tuple(attributes),
+        tuple(inverses), tuple(derives), tuple(unique_rules),
+        tuple(where_rules), span)
+
+
+def _parse_type(text, start, end):
+    where_rules = []
+    element = None
+    for section, statements in _split_sections(
+            text, start, end, _TYPE_SECTION_RE):
+        if section == 'WHERE':
+            where_rules.extend(
+                _parse_rule_statement(statement) for statement in statements)
+            continue
+        # `name = underlying type`
+        name, sep, type_text = statements[0].partition('=')
+        if not sep:
+            raise ExpressSyntaxError(
+                'Invalid type declaration: {}'.format(_normalize(name)))
+        name = name.strip()
+        type_tokens = _tokenize(type_text)
+        if type_tokens[:1] == ['SELECT'] or type_tokens[:2] == [
+                'ENUMERATION', 'OF']:
+            items = tuple(
+                token for token in type_tokens[type_tokens.index('(') + 1:]
+                if token not in (',', ')',))
+            if type_tokens[0] == 'SELECT':
+                element = ExpressSelectType(name, items, ())
+            else:
+                element = ExpressEnumeration(name, items, ())
+        else:
+            # validate underlying type syntax
+            _parse_type_tokens(type_tokens)
+            element = ExpressDefinedType(name, _normalize(type_text), ())
+    return element._replace(where_rules=tuple(where_rules))
+
+
+def parse_schema(text, *, headers_only=False):
+    """Parse an EXPRESS schema, in a single pass.
+
+    :param str text: The EXPRESS schema text.
+    :param bool headers_only: (optional, default False)
+        If True entities are only `ExpressEntityHeader` instances: their
+        bodies are not parsed, so that it can be done later, on demand
+        (see `parse_entity_body` and entities' `span`).
+    :return ExpressSchema: The parsed schema.
+    :raises ExpressSyntaxError: When the schema text is invalid.
+    """
+    schema_name = None
+    defined_types, select_types, enumerations, entities = {}, {}, {}, {}
+    elements_by_class = {
+        ExpressDefinedType: defined_types,
+        ExpressSelectType: select_types,
+        ExpressEnumeration: enumerations,
+    }
+
+    pos = 0
+    while True:
+        match = _TOKEN_RE.match(text, pos)
+        if match is None:
+            break
+        keyword = match.group(1)
+        pos = match.end()
+        if keyword in _DECLARATION_END_RES:
+            end_match = _DECLARATION_END_RES[keyword].search(text, pos)
+            if end_match is None:
+                raise ExpressSyntaxError('Missing `END_{}`'.format(keyword))
+            start, end = pos, end_match.start()
+            if keyword == 'ENTITY':
+                start = _TOKEN_RE.match(text, start).start(1)
+                if headers_only:
+                    entity = _parse_entity_header(
+                        _STATEMENT_RE.match(text, start, end).group(1),
+                        span=(start, end))
+                else:
+                    entity = _parse_entity(
+                        text, start, end, span=(start, end))
+                entities[entity.name] = entity
+            elif keyword == 'TYPE':
+                element = _parse_type(text, start, end)
+                elements_by_class[element.__class__][element.name] = element
+            pos = end_match.end()
+        elif keyword == 'SCHEMA':
+            statement = _STATEMENT_RE.match(text, pos)
+            schema_name = statement.group(1).strip()
+            pos = statement.end()
+        elif keyword == 'END_SCHEMA':
+            pos = _STATEMENT_RE.match(text, pos).end()
+        else:
+            raise ExpressSyntaxError(
+                'Unexpected `{}` at position {}'.format(keyword, pos))
+
+    return ExpressSchema(
+        schema_name, defined_types, select_types, enumerations, entities)
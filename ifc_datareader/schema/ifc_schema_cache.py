@@ -0,0 +1,167 @@
+"""IFC schema compiled cache."""
+
+from pathlib import Path
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+# Environment variable that overrides the default cache directory.
+CACHE_DIR_ENV_VAR = 'IFC_DATAREADER_CACHE_DIR'
+
+# Bump this value whenever the compiled schema layout changes, so that
+#  artifacts written by a previous version are never loaded.
+_CACHE_FORMAT_VERSION = 6
+
+# Pickle protocol of artifacts, readable by all supported Python versions
+#  (the cache directory can be shared by several interpreters).
+_PICKLE_PROTOCOL = 4
+
+
+class _Pickler(pickle.Pickler):
+    # Replace external objects by their reference name (they are not stored).
+
+    def __init__(self, file, external_refs):
+        super().__init__(file, _PICKLE_PROTOCOL)
+        self._ref_names_by_id = {
+            id(obj): ref_name for ref_name, obj in external_refs.items()}
+
+    def persistent_id(self, obj):
+        return self._ref_names_by_id.get(id(obj))
+
+
+class _Unpickler(pickle.Unpickler):
+    # Restore external objects from their reference name.
+
+    def __init__(self, file, external_refs):
+        super().__init__(file)
+        self._external_refs = external_refs
+
+    def persistent_load(self, pid):
+        try:
+            return self._external_refs[pid]
+        except KeyError:
+            raise pickle.UnpicklingError(
+                'Unknown external reference: {}'.format(pid))
+
+
+def get_default_cache_dirpath():
+    """Get the default user cache directory for compiled schemas.
+
+    The directory can be set with the `IFC_DATAREADER_CACHE_DIR` environment
+    variable, else it is deduced from `XDG_CACHE_HOME` (or `~/.cache`).
+
+    :return Path: The cache directory path (not necessarily existing).
+    """
+    cache_dirpath = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dirpath:
+        return Path(cache_dirpath)
+    xdg_cache_dirpath = os.environ.get('XDG_CACHE_HOME')
+    if xdg_cache_dirpath:
+        return Path(xdg_cache_dirpath) / 'ifc_datareader'
+    return Path.home() / '.cache' / 'ifc_datareader'
+
+
+class IfcSchemaCache:
+    """Persistent store of compiled IFC schemas, keyed by a content hash of
+    the schema specification file.
+
+    :param str|Path cache_dirpath: (optional, default None)
+        If not defined, cache directory is `get_default_cache_dirpath()`.
+    """
+
+    def __init__(self, cache_dirpath=None):
+        if cache_dirpath is None:
+            cache_dirpath = get_default_cache_dirpath()
+        self.cache_dirpath = Path(cache_dirpath)
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'cache_dirpath="{self.cache_dirpath}"'
+            ')'.format(self=self))
+
+    @staticmethod
+    def build_key(raw_data, *, variant=None):
+        """Build the cache key of a schema specification content.
+
+        :param str raw_data: The schema file content.
+        :param str variant: (optional, default None)
+            The name of a compiled data variant, when a schema can be
+            compiled in different ways (for example 'lazy').
+        :return str: The key (a hash of content, variant and cache format
+            version).
+        """
+        hasher = hashlib.sha256()
+        hasher.update(str(_CACHE_FORMAT_VERSION).encode())
+        if variant is not None:
+            hasher.update(':{}:'.format(variant).encode('utf-8'))
+        hasher.update(raw_data.encode('utf-8'))
+        return hasher.hexdigest()
+
+    def get_filepath(self, key):
+        """Get the compiled schema file path of a cache key.
+
+        :param str key: A cache key (see `build_key`).
+        :return Path: The compiled schema file path.
+        """
+        return self.cache_dirpath / 'schema-{}.pickle'.format(key)
+
+    def load(self, key, *, external_refs=None):
+        """Load a compiled schema.
+
+        :param str key: A cache key (see `build_key`).
+        :param dict external_refs: (optional, default None)
+            Objects that were excluded from stored data, by reference name
+            (see `dump`). They are bound again in the loaded data.
+        :return: The compiled schema data, or None if not found or unreadable.
+        """
+        try:
+            with open(str(self.get_filepath(key)), 'rb') as cache_file:
+                return _Unpickler(cache_file, external_refs or {}).load()
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError,
+                AttributeError, ImportError, IndexError, TypeError,
+                ValueError):
+            # corrupted or obsolete artifact: will be rebuilt
+            return None
+
+    def dump(self, key, data, *, external_refs=None):
+        """Store a compiled schema.
+
+        Writing is atomic (a temporary file is renamed), so concurrent
+        processes never read a partially written artifact.
+
+        :param str key: A cache key (see `build_key`).
+        :param data: The compiled schema data (must be picklable).
+        :param dict external_refs: (optional, default None)
+            Objects referenced by data that must not be stored, by reference
+            name. For example the `IfcSchema` instance itself, referenced by
+            all of its elements.
+        :return bool: True if data has been stored, else False.
+        """
+        try:
+            self.cache_dirpath.mkdir(parents=True, exist_ok=True)
+            tmp_fd, tmp_filepath = tempfile.mkstemp(
+                dir=str(self.cache_dirpath), suffix='.tmp')
+            try:
+                with os.fdopen(tmp_fd, 'wb') as tmp_file:
+                    _Pickler(tmp_file, external_refs or {}).dump(data)
+                os.replace(tmp_filepath, str(self.get_filepath(key)))
+            except BaseException:
+                os.remove(tmp_filepath)
+                raise
+        except (OSError, pickle.PicklingError):
+            # cache is an optimization, never a requirement
+            return False
+        return True
+
+    def clear(self):
+        """Remove all compiled schemas from cache directory."""
+        for cur_filepath in self.cache_dirpath.glob('schema-*.pickle'):
+            try:
+                cur_filepath.unlink()
+            except OSError:
+                pass
@@ -1,21 +1,42 @@
 """IFC schema base element."""
 
+from collections import OrderedDict, namedtuple
 import re
-import copy
 import abc
 
+from .ifc_express_parser import (
+    ExpressSyntaxError, parse_attribute_type, parse_entity_body)
+
+
+# EXPRESS simple types, which are the kinds of resolved simple values.
+SIMPLE_TYPE_KINDS = (
+    'BINARY', 'BOOLEAN', 'INTEGER', 'LOGICAL', 'NUMBER', 'REAL', 'STRING',)
+
+# A schema type resolved down to what its values are made of
+#  (see `IfcSchema.resolve_type`).
+#  `kind` is a simple type (see `SIMPLE_TYPE_KINDS`), 'ENUM', 'SELECT' or
+#  'ENTITY', `type_name` the name of the enumeration, select type or entity
+#  (None for a simple type) and `aggregates` the `ExpressAggregate` instances
+#  (with bounds) wrapping values, outermost first.
+IfcSchemaResolvedType = namedtuple(
+    'IfcSchemaResolvedType', ('kind', 'type_name', 'aggregates',))
+
 
 class IfcSchemaBaseObject(abc.ABC):
     """IFC schema generic element.
 
+    Schema elements are immutable: their fields (including derived ones) are
+    computed once, when the element is built.
+
     :param str name: The element's name.
     :param IfcSchema schema: An `IfcSchema` instance.
     """
 
+    __slots__ = ('name', 'schema',)
+
     @abc.abstractmethod
     def __init__(self, name, schema):
-        self.name = name
-        self.schema = schema
+        self._init_fields(name=name, schema=schema)
 
     def __repr__(self):
         return (
@@ -29,6 +50,32 @@ class IfcSchemaBaseObject(abc.ABC):
             return self.name == other.name and self.schema == other.schema
         return False
 
+    def __setattr__(self, name, value):
+        raise AttributeError('{} instance is read-only'.format(
+            self.__class__.__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError('{} instance is read-only'.format(
+            self.__class__.__name__))
+
+    def _init_fields(self, **fields):
+        # the only way to set fields, while element is being built
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+    def __getstate__(self):
+        # fields of all classes (stored in slots, or in a dict for
+        #  subclasses that do not define slots)
+        state = dict(getattr(self, '__dict__', {}))
+        for cls in self.__class__.__mro__:
+            for name in getattr(cls, '__slots__', ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __setstate__(self, state):
+        self._init_fields(**state)
+
 
 class IfcSchemaDefinedType(IfcSchemaBaseObject):
     """IFC schema defined type definition.
@@ -39,12 +86,17 @@ class IfcSchemaDefinedType(IfcSchemaBaseObject):
     :param IfcSchema schema: An `IfcSchema` instance.
     """
 
+    __slots__ = ('_raw_value', 'type_name', 'is_ref',)
+
     _SIMPLE_TYPES = [
         'INTEGER', 'REAL', 'STRING', 'NUMBER', 'LOGICAL', 'BOOLEAN']
 
     def __init__(self, name, raw_value, schema):
         super().__init__(name, schema)
-        self._raw_value = raw_value
+        type_name = self._build_type_name(raw_value)
+        self._init_fields(
+            _raw_value=raw_value, type_name=type_name,
+            is_ref=type_name.startswith('#'))
 
     def __repr__(self):
         return (
@@ -55,20 +107,15 @@ class IfcSchemaDefinedType(IfcSchemaBaseObject):
             ', ref_type={self.ref_type}'
             ')'.format(self=self))
 
-    @property
-    def type_name(self):
-        """Get the type's name. It can be a simple type or another referenced
-        defined type (the type's name is then prefixed with a '#')."""
-        raw_values = re.split(' |\\) |\\(', self._raw_value)
+    @classmethod
+    def _build_type_name(cls, raw_value):
+        # The type's name can be a simple type or another referenced
+        #  defined type (the type's name is then prefixed with a '#').
+        raw_values = re.split(' |\\) |\\(', raw_value)
         # add the reference prefix (#) if it is not a simple type
-        if len(set(raw_values) & set(self._SIMPLE_TYPES)) <= 0:
-            return '#{}'.format(self._raw_value)
-        return self._raw_value
-
-    @property
-    def is_ref(self):
-        """True if defined type is a reference to another defined type."""
-        return self.type_name.startswith('#')
+        if len(set(raw_values) & set(cls._SIMPLE_TYPES)) <= 0:
+            return '#{}'.format(raw_value)
+        return raw_value
 
     @property
     def ref_type(self):
@@ -87,9 +134,13 @@ class IfcSchemaSelectType(IfcSchemaBaseObject):
     :param IfcSchema schema: An `IfcSchema` instance.
     """
 
+    __slots__ = ('entity_names',)
+
     def __init__(self, name, raw_types, schema):
         super().__init__(name, schema)
-        self._raw_types = raw_types
+        # tuple of the entity's name selected, ascendingly sorted
+        self._init_fields(entity_names=tuple(
+            sorted(raw_types.replace('\n\t', '').split(','))))
 
     def __repr__(self):
         return (
@@ -98,11 +149,6 @@ class IfcSchemaSelectType(IfcSchemaBaseObject):
             ', entity_names={self.entity_names}'
             ')'.format(self=self))
 
-    @property
-    def entity_names(self):
-        """Get a tuple of the entity's name selected, ascendingly sorted."""
-        return tuple(sorted(self._raw_types.replace('\n\t', '').split(',')))
-
     @property
     def entities(self):
         """Get a tuple of entities selected, ascendingly sorted by name."""
@@ -119,9 +165,13 @@ class IfcSchemaEnum(IfcSchemaBaseObject):
     :param IfcSchema schema: An `IfcSchema` instance.
     """
 
+    __slots__ = ('values',)
+
     def __init__(self, name, raw_values, schema):
         super().__init__(name, schema)
-        self._raw_values = raw_values
+        # tuple of the enumeration's values, ascendingly sorted
+        self._init_fields(values=tuple(
+            sorted(raw_values.replace('\n\t', '').split(','))))
 
     def __repr__(self):
         return (
@@ -130,11 +180,6 @@ class IfcSchemaEnum(IfcSchemaBaseObject):
             ', values={self.values}'
             ')'.format(self=self))
 
-    @property
-    def values(self):
-        """Get a tuple of the enumeration's values, ascendingly sorted."""
-        return tuple(sorted(self._raw_values.replace('\n\t', '').split(',')))
-
 
 class IfcSchemaEntityAttribute(IfcSchemaBaseObject):
     """IFC schema entity property (attribute or inverse) definition.
@@ -144,20 +189,31 @@ class IfcSchemaEntityAttribute(IfcSchemaBaseObject):
         The attribute's raw type definition (as read from schema file).
     :param IfcSchemaEntity entity:
         The entity instance that contains this attribute instance.
+    :param ExpressAttributeType type_declaration: (optional, default None)
+        The already parsed type definition. If not defined, it is parsed
+        from `attr_raw_type`.
     """
 
-    def __init__(self, attr_name, attr_raw_type, entity):
+    __slots__ = (
+        '_raw_type', 'entity', 'is_optional', 'is_set_of', 'set_of_min',
+        'set_of_max', 'ifc_type_name', 'resolved_type',)
+
+    _IFC_TYPE_NAME_RE = re.compile('Ifc[a-zA-Z]+')
+    _UPPER_BOUND_RE = re.compile('[\\?0-9]+')
+
+    def __init__(self, attr_name, attr_raw_type, entity, *,
+                 type_declaration=None):
         super().__init__(attr_name, entity.schema)
-        self._raw_type = attr_raw_type
-        self.entity = entity
-        self.is_set_of = False
-        self.set_of_min = None
-        self.set_of_max = None
-        self.ifc_type_name = self._raw_type
-        if self.is_optional:
-            self.ifc_type_name = self._raw_type.replace('OPTIONAL ', '')
+        is_optional = attr_raw_type.startswith('OPTIONAL')
+        ifc_type_name = attr_raw_type
+        if is_optional:
+            ifc_type_name = attr_raw_type.replace('OPTIONAL ', '')
+        self._init_fields(
+            _raw_type=attr_raw_type, entity=entity, is_optional=is_optional,
+            is_set_of=False, set_of_min=None, set_of_max=None,
+            ifc_type_name=ifc_type_name, resolved_type=None)
 
-        self._extract_raw_type()
+        self._extract_raw_type(type_declaration=type_declaration)
 
     def __repr__(self):
         def _get_and_format_field_value(field_name):
@@ -175,28 +231,47 @@ class IfcSchemaEntityAttribute(IfcSchemaBaseObject):
                 field_name, _get_and_format_field_value(field_name)
             ) for field_name in _field_names]))
 
-    @property
-    def is_optional(self):
-        """Is it an optional attribute?"""
-        return self._raw_type.startswith('OPTIONAL')
-
     @property
     def ifc_type_info(self):
         """Get the attribute type info."""
         return self.schema.get_element(self.ifc_type_name)
 
-    def _extract_raw_type(self):
-        extracted_meta = re.search(
-            ('(?:(?:SET|LIST)\\s(?:\\[([0-9]+):([\\?0-9]+)\\])?(?:\\sOF\\s)?)?'
-             '(Ifc[a-zA-Z]+)(?:\\sFOR (.*))?$'),
-            self._raw_type)
-        if extracted_meta is not None:
-            self.set_of_min = extracted_meta.groups()[0]
-            self.set_of_max = extracted_meta.groups()[1]
-            if self.set_of_min is not None or self.set_of_max is not None:
-                self.is_set_of = True
-            self.ifc_type_name = extracted_meta.groups()[2]
-        return extracted_meta
+    def _extract_raw_type(self, *, type_declaration=None):
+        # Only a named type (Ifc...) is extracted, with the bounds of the
+        #  SET or LIST directly aggregating it, if any.
+        if type_declaration is None:
+            try:
+                type_declaration = parse_attribute_type(self._raw_type)
+            except ExpressSyntaxError:
+                return None
+        # attribute's type resolved by schema (see `IfcSchemaResolvedType`)
+        try:
+            resolved_type = self.schema.resolve_type(
+                type_declaration.base_type)
+        except KeyError:
+            # not a schema type
+            pass
+        else:
+            if type_declaration.aggregates:
+                resolved_type = IfcSchemaResolvedType(
+                    resolved_type.kind, resolved_type.type_name,
+                    type_declaration.aggregates + resolved_type.aggregates)
+            self._init_fields(resolved_type=resolved_type)
+        if not self._IFC_TYPE_NAME_RE.fullmatch(
+                type_declaration.base_type or ''):
+            return None
+        if type_declaration.aggregates:
+            aggregate = type_declaration.aggregates[-1]
+            if (aggregate.kind in ('SET', 'LIST',)
+                    and not aggregate.is_unique
+                    and (aggregate.lower or '').isdigit()
+                    and self._UPPER_BOUND_RE.fullmatch(
+                        aggregate.upper or '')):
+                self._init_fields(
+                    set_of_min=aggregate.lower, set_of_max=aggregate.upper,
+                    is_set_of=True)
+        self._init_fields(ifc_type_name=type_declaration.base_type)
+        return type_declaration
 
 
 class IfcSchemaEntityInverse(IfcSchemaEntityAttribute):
@@ -207,11 +282,19 @@ class IfcSchemaEntityInverse(IfcSchemaEntityAttribute):
         The inverse's raw type definition (as read from schema file).
     :param IfcSchemaEntity entity:
         The entity instance that contains this attribute instance.
+    :param ExpressAttributeType type_declaration: (optional, default None)
+        The already parsed type definition. If not defined, it is parsed
+        from `inv_raw_type`.
     """
 
-    def __init__(self, inverse_name, inv_raw_type, entity):
-        self.for_attr = None
-        super().__init__(inverse_name, inv_raw_type, entity)
+    __slots__ = ('for_attr',)
+
+    def __init__(self, inverse_name, inv_raw_type, entity, *,
+                 type_declaration=None):
+        self._init_fields(for_attr=None)
+        super().__init__(
+            inverse_name, inv_raw_type, entity,
+            type_declaration=type_declaration)
 
     @property
     def is_relation(self):
@@ -220,10 +303,12 @@ class IfcSchemaEntityInverse(IfcSchemaEntityAttribute):
         return self.schema.entity_inherits(
             self.ifc_type_name, 'IfcRelationship')
 
-    def _extract_raw_type(self):
-        extracted_meta = super()._extract_raw_type()
-        if extracted_meta is not None:
-            self.for_attr = extracted_meta.groups()[3]
+    def _extract_raw_type(self, *, type_declaration=None):
+        type_declaration = super()._extract_raw_type(
+            type_declaration=type_declaration)
+        if type_declaration is not None:
+            self._init_fields(for_attr=type_declaration.for_attr)
+        return type_declaration
 
 
 class IfcSchemaEntity(IfcSchemaBaseObject):
@@ -231,20 +316,27 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
 
     :param str name: The entity's name.
     :param str raw_data: The entity's raw data (as read from schema file).
+        It is only parsed, not kept.
     :param IfcSchema schema: An `IfcSchema` instance.
+    :param ExpressEntity declaration: (optional, default None)
+        The already parsed entity. If not defined, it is parsed from
+        `raw_data`.
     """
 
-    _NO_ATTR = [
-        'WHERE', 'INVERSE', 'WR2', 'WR3', 'WR4', 'WR5', 'UNIQUE', 'DERIVE']
+    __slots__ = (
+        'supertype_name', '_attributes_by_name', '_inverse_by_name',
+        'attribute_names', 'inverse_names', '_layouts',)
 
-    def __init__(self, name, raw_data, schema):
+    def __init__(self, name, raw_data, schema, *, declaration=None):
         super().__init__(name, schema)
-        self._raw_data = raw_data
-        self.supertype_name = None
-        self._attributes_by_name = {}
-        self._inverse_by_name = {}
+        # attributes and inverse are kept in declaration order (STEP
+        #  positional order), `_layouts` memoizes layouts, including
+        #  inherited attributes and inverse
+        self._init_fields(
+            supertype_name=None, _attributes_by_name=OrderedDict(),
+            _inverse_by_name=OrderedDict(), _layouts={})
 
-        self._extract_raw_data()
+        self._extract_raw_data(raw_data, declaration=declaration)
 
     def __repr__(self):
         return (
@@ -264,11 +356,6 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
             return self.schema.get_entity(self.supertype_name)
         return None
 
-    @property
-    def attribute_names(self):
-        """Get a tuple of the attributes's names, ascendingly sorted."""
-        return tuple(sorted(self._attributes_by_name))
-
     @property
     def attributes(self):
         """Get a tuple of the attributes, ascendingly sorted by name."""
@@ -289,49 +376,29 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         return tuple(self._attributes_by_name[name]
                      for name in self.not_optional_attribute_names)
 
-    @property
-    def inverse_names(self):
-        """Get a tuple of the inverse's names, ascendingly sorted."""
-        return tuple(sorted(self._inverse_by_name))
-
     @property
     def inverse(self):
         """Get a tuple of the inverse, ascendingly sorted by name."""
         return tuple(
             self._inverse_by_name[name] for name in self.inverse_names)
 
-    def _extract_raw_data(self):
-        # extract supertype_name from _raw_data
-        subtypeofmatch = re.search('.*SUBTYPE OF \\((.*?)\\);', self._raw_data)
-        if subtypeofmatch:
-            self.supertype_name = subtypeofmatch.groups()[0]
-
-        # Find the shortest string matched from the end of the entity
-        #  type header to the first occurence of a _NO_ATTR string
-        #  (when it occurs on a new line).
-        inner_raw_data = re.search(
-            ';(.*?)$', self._raw_data, re.DOTALL).groups()[0]
-
-        # extract attributes from inner_raw_data
-        attrs_str = min([
-            inner_raw_data.partition('\n ' + noa)[0] for noa in self._NO_ATTR])
-        for cur_iter_attr in re.finditer(
-                '(.*?) : (.*?);', attrs_str, re.DOTALL):
-            attr_name, attr_type = [
-                s.replace('\n\t', '') for s in cur_iter_attr.groups()]
-            self._attributes_by_name[attr_name] = IfcSchemaEntityAttribute(
-                attr_name, attr_type, self)
-
-        # extract inverse from inner_raw_data
-        inverse_str = inner_raw_data.partition('\n INVERSE')[2]
-        inverse_str = min([
-            inverse_str.partition('\n ' + noa)[0] for noa in self._NO_ATTR])
-        for cur_iter_inverse in re.finditer(
-                '(.*?) : (.*?);', inverse_str, re.DOTALL):
-            inv_name, inv_type = [
-                s.replace('\n\t', '') for s in cur_iter_inverse.groups()]
-            self._inverse_by_name[inv_name] = IfcSchemaEntityInverse(
-                inv_name, inv_type, self)
+    def _extract_raw_data(self, raw_data, *, declaration=None):
+        if declaration is None:
+            declaration = parse_entity_body(raw_data, name=self.name)
+        self._init_fields(supertype_name=declaration.supertype_name)
+        for attr_decl in declaration.attributes:
+            self._attributes_by_name[attr_decl.name] = (
+                IfcSchemaEntityAttribute(
+                    attr_decl.name, attr_decl.raw_type, self,
+                    type_declaration=attr_decl.type))
+        for inv_decl in declaration.inverses:
+            self._inverse_by_name[inv_decl.name] = IfcSchemaEntityInverse(
+                inv_decl.name, inv_decl.raw_type, self,
+                type_declaration=inv_decl.type)
+        # tuples of the attributes's (and inverse's) names, ascendingly sorted
+        self._init_fields(
+            attribute_names=tuple(sorted(self._attributes_by_name)),
+            inverse_names=tuple(sorted(self._inverse_by_name)))
 
     def get_attribute(self, attribute_name):
         """Search an `IfcSchemaEntityAttribute` instance by its name.
@@ -342,26 +409,56 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         """
         return self._attributes_by_name[attribute_name]
 
-    def get_all_attributes(self, *, include_optional=True):
+    def _get_layout(self, key, build_layout):
+        # schema elements are read-only, so a layout is built once
+        try:
+            return self._layouts[key]
+        except KeyError:
+            layout = self._layouts[key] = build_layout()
+            return layout
+
+    @staticmethod
+    def _build_name(classname, name, include_classname):
+        if include_classname:
+            return '{}.{}'.format(classname, name)
+        return name
+
+    def get_all_attributes(self, *, include_optional=True, step_order=False):
         """Get a tuple of all attributes, including inherited.
         (different to `attributes` property which scope is only entity)
 
+        Inherited attributes come first. The tuple is computed once.
+
         :param bool include_optional: (optional, default True)
             If False ignore attributes marked as optional.
+        :param bool step_order: (optional, default False)
+            If True attributes of each class are in declaration order, which
+            is the positional order of STEP entity instance attributes.
+            Else they are ascendingly sorted by name.
         :return tuple: All the entity's attributes (with inheritance).
         """
-        inner_attr_name = 'attributes'
-        if not include_optional:
-            inner_attr_name = 'not_optional_{}'.format(inner_attr_name)
-        all_attrs = copy.deepcopy(getattr(self, inner_attr_name, ()))
-        # get inherited attribute_names, recursively
-        if self.supertype is not None:
-            all_attrs = self.supertype.get_all_attributes(
-                include_optional=include_optional) + all_attrs
-        return all_attrs
+        def _build_layout():
+            if step_order:
+                attrs = tuple(
+                    attr for attr in self._attributes_by_name.values()
+                    if include_optional or not attr.is_optional)
+            elif include_optional:
+                attrs = self.attributes
+            else:
+                attrs = self.not_optional_attributes
+            # get inherited attributes, recursively
+            if self.supertype is not None:
+                attrs = self.supertype.get_all_attributes(
+                    include_optional=include_optional,
+                    step_order=step_order) + attrs
+            return attrs
+
+        return self._get_layout(
+            ('attributes', include_optional, step_order,), _build_layout)
 
     def get_all_attribute_names(
-            self, *, include_optional=True, include_classname=False):
+            self, *, include_optional=True, include_classname=False,
+            step_order=False):
         """Get a tuple of all attribute's name, including inherited.
         (different to `attribute_names` property which scope is only entity)
 
@@ -370,17 +467,20 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         :param bool include_classname: (optional, default False)
             If True prefix each attribute's name with its origin class name.
             For example: 'IfcRoot.GlobalId' instead of just 'GlobalId'
+        :param bool step_order: (optional, default False)
+            If True names are in STEP positional order
+            (see `get_all_attributes`).
         :return tuple: All attribute's names.
         """
-        def _build_name(classname, name):
-            if include_classname:
-                return '{}.{}'.format(classname, name)
-            return name
-
-        return tuple(
-            _build_name(attr.entity.name, attr.name)
-            for attr in self.get_all_attributes(
-                include_optional=include_optional))
+        return self._get_layout(
+            ('attribute_names', include_optional, include_classname,
+             step_order,),
+            lambda: tuple(
+                self._build_name(
+                    attr.entity.name, attr.name, include_classname)
+                for attr in self.get_all_attributes(
+                    include_optional=include_optional,
+                    step_order=step_order)))
 
     def get_inverse(self, inverse_name):
         """Search an `IfcSchemaEntityInverse` instance by its name.
@@ -391,36 +491,48 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         """
         return self._inverse_by_name[inverse_name]
 
-    def get_all_inverse(self):
+    def get_all_inverse(self, *, step_order=False):
         """Get a tuple of all inverse, including inherited.
         (different to `inverse` property which scope is only entity)
 
+        Inherited inverse come first. The tuple is computed once.
+
+        :param bool step_order: (optional, default False)
+            If True inverse of each class are in declaration order.
+            Else they are ascendingly sorted by name.
         :return tuple:
             All inverse's entity attribute instances (with inheritance).
         """
-        all_inv = copy.deepcopy(self.inverse)
-        # get inherited inverse, recursively
-        if self.supertype is not None:
-            all_inv = self.supertype.get_all_inverse() + all_inv
-        return all_inv
+        def _build_layout():
+            if step_order:
+                all_inv = tuple(self._inverse_by_name.values())
+            else:
+                all_inv = self.inverse
+            # get inherited inverse, recursively
+            if self.supertype is not None:
+                all_inv = self.supertype.get_all_inverse(
+                    step_order=step_order) + all_inv
+            return all_inv
+
+        return self._get_layout(('inverse', step_order,), _build_layout)
 
-    def get_all_inverse_names(self, *, include_classname=False):
+    def get_all_inverse_names(self, *, include_classname=False,
+                              step_order=False):
         """Get a tuple of all inverse's name, including inherited.
         (different to `inverse_names` property which scope is only entity)
 
         :param bool include_classname: (optional, default False)
             If True prefix each inverse's name with its origin class name.
             For example: 'IfcObject.IsDefinedBy' instead of just 'IsDefinedBy'
+        :param bool step_order: (optional, default False)
+            If True names are in declaration order (see `get_all_inverse`).
         :return tuple: All inverse's names.
         """
-        def _build_name(classname, name):
-            if include_classname:
-                return '{}.{}'.format(classname, name)
-            return name
-
-        return tuple(
-            _build_name(inv.entity.name, inv.name)
-            for inv in self.get_all_inverse())
+        return self._get_layout(
+            ('inverse_names', include_classname, step_order,),
+            lambda: tuple(
+                self._build_name(inv.entity.name, inv.name, include_classname)
+                for inv in self.get_all_inverse(step_order=step_order)))
 
     def inherits(self, parent_entity_name, *, deep_inheritance=True):
         """Return True if `parent_entity_name` is a supertype.
@@ -432,11 +544,10 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         """
         if self.supertype_name == parent_entity_name:
             return True
-        if deep_inheritance:
-            # check inheritance from parent's supertype, recursively
-            if self.supertype is not None:
-                return self.supertype.inherits(
-                    parent_entity_name, deep_inheritance=deep_inheritance)
+        if deep_inheritance and self.supertype_name is not None:
+            # supertype's ancestors are precomputed by schema
+            return self.schema.entity_inherits(
+                self.supertype_name, parent_entity_name)
         return False
 
     def get_subtypes(self, *, deep_inheritance=False):
@@ -447,8 +558,8 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
         :return tuple: All entity's subtype instances.
         """
         return tuple(
-            cur_ent for cur_ent in self.schema.entities
-            if cur_ent.inherits(self.name, deep_inheritance=deep_inheritance))
+            self.schema.get_entity(name) for name in self.get_subtype_names(
+                deep_inheritance=deep_inheritance))
 
     def get_subtype_names(self, *, deep_inheritance=False):
         """Get a tuple of all entity subtype's name.
@@ -457,6 +568,9 @@ class IfcSchemaEntity(IfcSchemaBaseObject):
             If False ignore child subtypes.
         :return tuple: All entity's subtype names.
         """
-        return tuple(
-            cur_ent.name for cur_ent in self.get_subtypes(
-                deep_inheritance=deep_inheritance))
+        try:
+            return self.schema.get_entity_subtype_names(
+                self.name, deep_inheritance=deep_inheritance)
+        except KeyError:
+            # entity is not defined in schema, so nothing inherits from it
+            return ()
@@ -2,9 +2,15 @@
 
 from pathlib import Path
 import re
+import threading
 
 from .ifc_schema_objects import (
-    IfcSchemaDefinedType, IfcSchemaSelectType, IfcSchemaEnum, IfcSchemaEntity)
+    IfcSchemaDefinedType, IfcSchemaSelectType, IfcSchemaEnum, IfcSchemaEntity,
+    IfcSchemaResolvedType, SIMPLE_TYPE_KINDS)
+from .ifc_schema_cache import IfcSchemaCache
+from .ifc_express_parser import (
+    ExpressEntityHeader, ExpressSyntaxError, parse_attribute_type,
+    parse_schema)
 
 
 IFC_SCHEMAS = {
@@ -20,11 +26,24 @@ class IfcSchema:
     :param str|Path schema_filepath: (optional, default None)
         If not defined, schema file is deduced from schema_name.
         Else overrides default schema file corresponding to schema_name.
+    :param bool|IfcSchemaCache cache: (optional, default True)
+        If True, compiled schema is loaded from (or stored in) the default
+        user cache directory, instead of parsing the schema file.
+        An `IfcSchemaCache` instance can also be given. If False no cache.
+    :param bool lazy: (optional, default False)
+        If True, only entity names (and inheritance) are indexed at load.
+        An entity is parsed on its first access (`get_entity`,
+        `get_element`...), while methods that enumerate all entities still
+        see (and so parse) all of them.
     :raises ValueError:
         When `schema_name` not in available choices (see IFC_SCHEMAS).
     """
 
-    def __init__(self, schema_name, *, schema_filepath=None):
+    # external reference name of the schema instance in compiled data
+    _CACHE_SCHEMA_REF = 'schema'
+
+    def __init__(self, schema_name, *, schema_filepath=None, cache=True,
+                 lazy=False):
         if schema_filepath is None:
             if schema_name not in IFC_SCHEMAS:
                 raise ValueError('Invalid schema name: {}'.format(schema_name))
@@ -34,12 +53,40 @@ class IfcSchema:
             schema_filepath = Path(schema_filepath)
 
         with open(str(schema_filepath)) as schema_file:
-            self._raw_data = schema_file.read()
-
-        self._defined_types_by_name = self._read_defined_types()
-        self._select_types_by_name = self._read_select_types()
-        self._enumerations_by_name = self._read_enumerations()
-        self._entities_by_name = self._read_entities()
+            raw_data = schema_file.read()
+        self._version = re.search('SCHEMA (.*);', raw_data).groups()[0]
+        # schema raw data is only kept to parse entities on demand
+        self._raw_data = raw_data if lazy else None
+
+        if cache is True:
+            cache = IfcSchemaCache()
+        self.cache = cache or None
+        self.lazy = lazy
+        # protects on demand entities parsing (schema can be shared)
+        self._lock = threading.Lock()
+
+        if not self._load_compiled(raw_data):
+            # schema file is parsed once, for all kinds of elements
+            #  (only entity headers are read in lazy mode)
+            declarations = parse_schema(raw_data, headers_only=self.lazy)
+            self._defined_types_by_name = self._read_defined_types(
+                declarations)
+            self._select_types_by_name = self._read_select_types(declarations)
+            self._enumerations_by_name = self._read_enumerations(declarations)
+            self._entity_headers_by_name = self._read_entity_headers(
+                declarations)
+            # types are resolved before entities, to resolve attribute types
+            self._resolved_types_by_name = self._read_resolved_types()
+            self._entities_by_name = {}
+            if not self.lazy:
+                self._entities_by_name = self._read_entities(
+                    declarations, raw_data)
+            self._dump_compiled(raw_data)
+
+        self._build_element_index()
+        self._build_inheritance_index()
+        # entity attribute positions, computed on demand
+        self._attribute_indexes_by_name = {}
 
     def __repr__(self):
         return (
@@ -53,7 +100,7 @@ class IfcSchema:
                 self=self, nb_defined_types=len(self._defined_types_by_name),
                 nb_select_types=len(self._select_types_by_name),
                 nb_enumerations=len(self._enumerations_by_name),
-                nb_entities=len(self._entities_by_name)))
+                nb_entities=len(self._entity_headers_by_name)))
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
@@ -62,8 +109,8 @@ class IfcSchema:
 
     @property
     def version(self):
-        """Parse schema raw data to get its version."""
-        return re.search('SCHEMA (.*);', self._raw_data).groups()[0]
+        """Get schema version (read from schema raw data at load)."""
+        return self._version
 
     @property
     def defined_type_names(self):
@@ -102,54 +149,173 @@ class IfcSchema:
     @property
     def entity_names(self):
         """Get a tuple of the entities's name, ascendingly sorted."""
-        return tuple(sorted(self._entities_by_name))
+        return tuple(sorted(self._entity_headers_by_name))
 
     @property
     def entities(self):
         """Get a tuple of the entities, ascendingly sorted by name."""
-        return tuple(self._entities_by_name[name]
-                     for name in self.entity_names)
-
-    def _read_defined_types(self):
-        # parse schema raw data to return `IfcSchemaDefinedType` instances
-        def_types = {}
-        for cur_iter in re.finditer('TYPE (.*) = (.*);', self._raw_data):
-            name, value = cur_iter.groups()
-            def_types[name] = IfcSchemaDefinedType(name, value, self)
-        return def_types
-
-    def _read_select_types(self):
-        # parse schema raw data to return `IfcSchemaSelectType` instances
-        sel_types = {}
-        for cur_iter in re.finditer(
-                'TYPE (.*) = SELECT\\n\\t\\((.*(?:\\n\\t,.*)*)\\);',
-                self._raw_data):
-            name, values = cur_iter.groups()
-            sel_types[name] = IfcSchemaSelectType(name, values, self)
-        return sel_types
-
-    def _read_enumerations(self):
-        # parse schema raw data to return `IfcSchemaEnum` instances
-        enums = {}
-        for cur_iter in re.finditer(
-                'TYPE (.*) = ENUMERATION OF\\n\\t\\((.*(?:\\n\\t,.*)*)\\);',
-                self._raw_data):
-            name, values = cur_iter.groups()
-            enums[name] = IfcSchemaEnum(name, values, self)
-        return enums
-
-    def _read_entities(self):
-        # parse schema raw data to return `IfcSchemaEntity` instances
+        return tuple(self.get_entity(name) for name in self.entity_names)
+
+    def _build_cache_key(self, raw_data):
+        # lazy schemas are compiled without their entities
+        return self.cache.build_key(
+            raw_data, variant='lazy' if self.lazy else None)
+
+    def _load_compiled(self, raw_data):
+        # load elements from the compiled schema cache, if available
+        if self.cache is None:
+            return False
+        compiled_data = self.cache.load(
+            self._build_cache_key(raw_data),
+            external_refs={self._CACHE_SCHEMA_REF: self})
+        if compiled_data is None:
+            return False
+        (self._defined_types_by_name, self._select_types_by_name,
+         self._enumerations_by_name, self._entity_headers_by_name,
+         self._resolved_types_by_name, self._entities_by_name,) = (
+             compiled_data)
+        return True
+
+    def _dump_compiled(self, raw_data):
+        # store elements in the compiled schema cache
+        # (elements reference the schema instance, which is not stored)
+        if self.cache is not None:
+            self.cache.dump(
+                self._build_cache_key(raw_data),
+                (self._defined_types_by_name, self._select_types_by_name,
+                 self._enumerations_by_name, self._entity_headers_by_name,
+                 self._resolved_types_by_name, self._entities_by_name,),
+                external_refs={self._CACHE_SCHEMA_REF: self})
+
+    def _read_defined_types(self, declarations):
+        # build `IfcSchemaDefinedType` instances from parsed schema
+        return {
+            name: IfcSchemaDefinedType(name, decl.underlying_type, self)
+            for name, decl in declarations.defined_types.items()}
+
+    def _read_select_types(self, declarations):
+        # build `IfcSchemaSelectType` instances from parsed schema
+        return {
+            name: IfcSchemaSelectType(name, ','.join(decl.items), self)
+            for name, decl in declarations.select_types.items()}
+
+    def _read_enumerations(self, declarations):
+        # build `IfcSchemaEnum` instances from parsed schema
+        return {
+            name: IfcSchemaEnum(name, ','.join(decl.items), self)
+            for name, decl in declarations.enumerations.items()}
+
+    def _read_entity_headers(self, declarations):
+        # index entity names, supertypes and positions in schema raw data
+        return {
+            name: ExpressEntityHeader(
+                name, decl.is_abstract, decl.supertype_name, decl.span)
+            for name, decl in declarations.entities.items()}
+
+    def _read_resolved_types(self):
+        # resolve all schema types (simple types included), following defined
+        #  type chains down to a simple type, an enumeration, a select type or
+        #  an entity, and gathering aggregates on the way
+        resolved_types_by_name = {
+            name: IfcSchemaResolvedType(name, None, ())
+            for name in SIMPLE_TYPE_KINDS}
+        for kind, elements_by_name in (
+                ('ENUM', self._enumerations_by_name),
+                ('SELECT', self._select_types_by_name),
+                ('ENTITY', self._entity_headers_by_name),):
+            for name in elements_by_name:
+                resolved_types_by_name[name] = IfcSchemaResolvedType(
+                    kind, name, ())
+
+        def _resolve_defined_type(name, seen_names):
+            try:
+                return resolved_types_by_name[name]
+            except KeyError:
+                pass
+            if name in seen_names or name not in self._defined_types_by_name:
+                # circular or unknown reference
+                return None
+            try:
+                type_decl = parse_attribute_type(
+                    self._defined_types_by_name[name]._raw_value)
+            except ExpressSyntaxError:
+                return None
+            resolved_type = _resolve_defined_type(
+                type_decl.base_type, seen_names + (name,))
+            if resolved_type is not None:
+                resolved_type = resolved_types_by_name[name] = (
+                    IfcSchemaResolvedType(
+                        resolved_type.kind, resolved_type.type_name,
+                        type_decl.aggregates + resolved_type.aggregates))
+            return resolved_type
+
+        for name in self._defined_types_by_name:
+            _resolve_defined_type(name, ())
+        return resolved_types_by_name
+
+    def _read_entities(self, declarations, raw_data):
+        # build `IfcSchemaEntity` instances from parsed schema
         ents = {}
-        # Regexes must be greedy to prevent matching outer ENTITY and
-        #  END_ENTITY strings. Regexes have re.DOTALL to match newlines.
-        for cur_iter in re.finditer(
-                'ENTITY (.*?)END_ENTITY;', self._raw_data, re.DOTALL):
-            raw_entity_str = cur_iter.groups()[0]
-            name = re.search('(.*?)[;|\\s]', raw_entity_str).groups()[0]
-            ents[name] = IfcSchemaEntity(name, raw_entity_str, self)
+        for name, decl in declarations.entities.items():
+            start, end = decl.span
+            ents[name] = IfcSchemaEntity(
+                name, raw_data[start:end], self, declaration=decl)
         return ents
 
+    def _build_element_index(self):
+        # unified name index of all schema elements (parsed entities only,
+        #  in lazy mode the others are added once parsed)
+        # Element names are unique in a schema, yet the previous lookup
+        #  order (defined types first, entities last) is kept.
+        self._elements_by_name = {}
+        for elements_by_name in (
+                self._entities_by_name, self._enumerations_by_name,
+                self._select_types_by_name, self._defined_types_by_name,):
+            self._elements_by_name.update(elements_by_name)
+
+    def _build_inheritance_index(self):
+        # compute once, for each entity, its ancestors (from its supertype to
+        #  root entity) and its subtypes (direct ones, then all of them)
+        # Each entity also gets a dense integer ID (in name order), its bit
+        #  (1 << ID) and a mask combining its bit and all its ancestor bits,
+        #  so that an `is_a` check is just a bitwise AND.
+        self._type_ids_by_name = {
+            name: type_id for type_id, name in enumerate(
+                sorted(self._entity_headers_by_name))}
+        self._type_bits_by_name = {
+            name: 1 << type_id
+            for name, type_id in self._type_ids_by_name.items()}
+        self._type_masks_by_name = {}
+        self._ancestor_names_by_name = {}
+        headers_by_name = self._entity_headers_by_name
+        subtype_names_by_name = {name: [] for name in headers_by_name}
+        deep_subtype_names_by_name = {
+            name: [] for name in headers_by_name}
+        for name in sorted(headers_by_name):
+            ancestor_names = []
+            supertype_name = headers_by_name[name].supertype_name
+            if supertype_name in subtype_names_by_name:
+                subtype_names_by_name[supertype_name].append(name)
+            while supertype_name is not None:
+                ancestor_names.append(supertype_name)
+                if supertype_name not in headers_by_name:
+                    # supertype not defined in schema
+                    break
+                deep_subtype_names_by_name[supertype_name].append(name)
+                supertype_name = headers_by_name[
+                    supertype_name].supertype_name
+            self._ancestor_names_by_name[name] = tuple(ancestor_names)
+            type_mask = self._type_bits_by_name[name]
+            for ancestor_name in ancestor_names:
+                type_mask |= self._type_bits_by_name.get(ancestor_name, 0)
+            self._type_masks_by_name[name] = type_mask
+        self._subtype_names_by_name = {
+            name: tuple(subtype_names)
+            for name, subtype_names in subtype_names_by_name.items()}
+        self._deep_subtype_names_by_name = {
+            name: tuple(subtype_names)
+            for name, subtype_names in deep_subtype_names_by_name.items()}
+
     def get_defined_type(self, defined_type_name):
         """Search an defined type instance by its name.
 
@@ -184,7 +350,25 @@ class IfcSchema:
         :return IfcSchemaEntity: The entity instance found.
         :raises KeyError: When entity_name does not exist.
         """
-        return self._entities_by_name[entity_name]
+        try:
+            return self._entities_by_name[entity_name]
+        except KeyError:
+            # lazy schema: entity not parsed yet (or not in schema)
+            return self._load_entity(entity_name)
+
+    def _load_entity(self, entity_name):
+        # parse an entity on its first access, from its header's position
+        #  in schema raw data (raise KeyError if entity does not exist)
+        header = self._entity_headers_by_name[entity_name]
+        with self._lock:
+            entity = self._entities_by_name.get(entity_name)
+            if entity is None:
+                start, end = header.span
+                entity = IfcSchemaEntity(
+                    entity_name, self._raw_data[start:end], self)
+                self._entities_by_name[entity_name] = entity
+                self._elements_by_name.setdefault(entity_name, entity)
+        return entity
 
     def get_element(self, element_name):
         """Search for the element in schema.
@@ -192,15 +376,106 @@ class IfcSchema:
         :param str element_name: The element name to search for.
         :return IfcSchemaBaseElement: The found element or None.
         """
-        # search in defined types, select types, enumerations and entities
-        for get_func_name in ('get_defined_type', 'get_select_type',
-                              'get_enumeration', 'get_entity',):
-            try:
-                return getattr(self, get_func_name)(element_name)
-            except KeyError:
-                pass
+        # search in the unified index of all kinds of elements
+        element = self._elements_by_name.get(element_name)
+        if element is None and element_name in self._entity_headers_by_name:
+            # lazy schema: entity not parsed yet
+            element = self._load_entity(element_name)
         # not found, so maybe it is nothing...
-        return None
+        return element
+
+    def resolve_type(self, type_name):
+        """Get a type resolved down to what its values are made of: a simple
+        type (REAL, INTEGER, STRING...), an enumeration, a select type or an
+        entity, with all the aggregates (and their bounds) wrapping values.
+
+        All schema types are resolved once, at load.
+
+        :param str type_name:
+            A defined type's, select type's, enumeration's, entity's or
+            simple type's name.
+        :return IfcSchemaResolvedType: The resolved type.
+        :raises KeyError: When type_name does not exist (or can not be
+            resolved).
+        """
+        return self._resolved_types_by_name[type_name]
+
+    def get_entity_ancestor_names(self, entity_name):
+        """Get a tuple of all the entity's supertype names, from its direct
+        supertype to the root entity.
+
+        :param str entity_name: An entity's name.
+        :return tuple: All entity's supertype names.
+        :raises KeyError: When entity_name does not exist.
+        """
+        return self._ancestor_names_by_name[entity_name]
+
+    def get_entity_type_id(self, entity_name):
+        """Get the entity's type ID, a dense integer (from 0 to the number of
+        entities) attributed in entity's name order.
+
+        :param str entity_name: An entity's name.
+        :return int: The entity's type ID.
+        :raises KeyError: When entity_name does not exist.
+        """
+        return self._type_ids_by_name[entity_name]
+
+    def get_entity_attribute_indexes(self, entity_name):
+        """Get the positions of all the entity's attributes (including
+        inherited), by attribute's name.
+
+        Positions follow STEP attribute order, so that an attribute can be
+        read by index from an `ifcopenshell.entity_instance` (`raw[index]`),
+        instead of building the dict of all its attributes (`get_info`).
+        The table is computed once per entity.
+
+        :param str entity_name: An entity's name.
+        :return dict: Attribute positions, by attribute's name.
+        :raises KeyError: When entity_name does not exist.
+        """
+        try:
+            return self._attribute_indexes_by_name[entity_name]
+        except KeyError:
+            attribute_names = self.get_entity(
+                entity_name).get_all_attribute_names(step_order=True)
+            attribute_indexes = self._attribute_indexes_by_name[
+                entity_name] = {
+                    name: index for index, name in enumerate(attribute_names)}
+            return attribute_indexes
+
+    def get_raw_attribute(self, raw_entity, name, *, type_name=None):
+        """Read an attribute of an `ifcopenshell.entity_instance` by its
+        position (see `get_entity_attribute_indexes`), much faster than by
+        its name with ifcopenshell.
+
+        :param ifcopenshell.entity_instance raw_entity: An entity instance.
+        :param str name: The attribute's name.
+        :param str type_name: (optional, default None)
+            The entity instance's type name, if already known.
+            If `None`, it is read from `raw_entity`.
+        :return: The attribute value, None if entity has no `name` attribute.
+        :raises KeyError: When entity's type does not exist.
+        """
+        if type_name is None:
+            type_name = raw_entity.is_a()
+        index = self.get_entity_attribute_indexes(type_name).get(name)
+        if index is None:
+            return None
+        return raw_entity[index]
+
+    def get_entity_subtype_names(
+            self, entity_name, *, deep_inheritance=False):
+        """Get a tuple of the entity's subtype names, ascendingly sorted.
+
+        :param str entity_name: An entity's name.
+        :param bool deep_inheritance: (optional, default False)
+            If False ignore child subtypes.
+        :return tuple: All entity's subtype names.
+        :raises KeyError: When entity_name does not exist.
+        """
+        if deep_inheritance:
+            return self._deep_subtype_names_by_name[entity_name]
+        return self._subtype_names_by_name[entity_name]
 
     def entity_inherits(
             self, entity_name, parent_entity_name, *, deep_inheritance=True):
@@ -212,5 +487,25 @@ class IfcSchema:
         :return bool: True if inheritance could be verified, else False.
         :raises KeyError: When entity_name does not exist.
         """
-        return self._entities_by_name[entity_name].inherits(
-            parent_entity_name, deep_inheritance=deep_inheritance)
+        if not deep_inheritance:
+            return self._entity_headers_by_name[
+                entity_name].supertype_name == parent_entity_name
+        type_mask = self._type_masks_by_name[entity_name]
+        return entity_name != parent_entity_name and bool(
+            type_mask & self._type_bits_by_name.get(parent_entity_name, 0))
+
+    def entity_is_a(self, entity_name, type_name):
+        """Return True if `entity_name` is `type_name` or one of its subtypes.
+
+        This is a single bitwise AND on precomputed entity type masks, for
+        example to check an `ifcopenshell.entity_instance` type from its
+        type's name (`raw.is_a()`).
+
+        :param str entity_name: An entity's name.
+        :param str type_name: The possibly inherited entity's name.
+        :return bool: True if `entity_name` is a `type_name`, else False
+            (also when one of the names is not an entity of the schema).
+        """
+        return bool(
+            self._type_masks_by_name.get(entity_name, 0)
+            & self._type_bits_by_name.get(type_name, 0))
@@ -0,0 +1,94 @@
+"""IFC schema registry."""
+
+from pathlib import Path
+import threading
+
+from .ifc_schema_reader import IfcSchema
+
+
+class IfcSchemaRegistry:
+    """Thread-safe registry of shared `IfcSchema` instances.
+
+    Each schema (identified by its name, or its custom schema file path, and
+    its loading mode) is loaded once and the same instance is then handed out
+    to every caller.
+    Shared instances must be considered as read-only.
+    """
+
+    def __init__(self):
+        self._schemas_by_key = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            '<{self.__class__.__name__}>('
+            'schemas={nb_schemas}'
+            ')'.format(self=self, nb_schemas=len(self)))
+
+    def __len__(self):
+        return len(self._schemas_by_key)
+
+    def __contains__(self, schema_name):
+        # schema loaded, whatever its loading mode
+        return any(
+            self._build_key(schema_name, lazy=lazy) in self._schemas_by_key
+            for lazy in (False, True,))
+
+    @staticmethod
+    def _build_key(schema_name, schema_filepath=None, lazy=False):
+        if schema_filepath is not None:
+            return (schema_name, str(Path(schema_filepath).resolve()), lazy,)
+        return (schema_name, None, lazy,)
+
+    def get_schema(self, schema_name, *, schema_filepath=None, lazy=False):
+        """Get the shared schema instance, loading it on first call.
+
+        :param str schema_name: The schema name to load.
+        :param str|Path schema_filepath: (optional, default None)
+            If not defined, schema file is deduced from schema_name.
+            Else overrides default schema file corresponding to schema_name.
+        :param bool lazy: (optional, default False)
+            If True, the shared schema parses its entities on demand (see
+            `IfcSchema`). Lazy and eager schemas are distinct instances.
+        :return IfcSchema: The shared schema instance.
+        :raises ValueError:
+            When `schema_name` not in available choices (see IFC_SCHEMAS).
+        """
+        key = self._build_key(schema_name, schema_filepath, lazy)
+        # lock-free fast path, once the schema has been loaded
+        try:
+            return self._schemas_by_key[key]
+        except KeyError:
+            pass
+        with self._lock:
+            # another thread may have loaded the schema meanwhile
+            if key not in self._schemas_by_key:
+                self._schemas_by_key[key] = IfcSchema(
+                    schema_name, schema_filepath=schema_filepath, lazy=lazy)
+            return self._schemas_by_key[key]
+
+    def clear(self):
+        """Forget all shared schema instances."""
+        with self._lock:
+            self._schemas_by_key.clear()
+
+
+# process-wide default registry
+_registry = IfcSchemaRegistry()
+
+
+def get_schema(schema_name, *, schema_filepath=None, lazy=False):
+    """Get a process-wide shared schema instance (see `IfcSchemaRegistry`).
+
+    :param str schema_name: The schema name to load.
+    :param str|Path schema_filepath: (optional, default None)
+        If not defined, schema file is deduced from schema_name.
+        Else overrides default schema file corresponding to schema_name.
+    :param bool lazy: (optional, default False)
+        If True, the shared schema parses its entities on demand.
+    :return IfcSchema: The shared schema instance.
+    :raises ValueError:
+        When `schema_name` not in available choices (see IFC_SCHEMAS).
+    """
+    return _registry.get_schema(
+        schema_name, schema_filepath=schema_filepath, lazy=lazy)
@@ -1,7 +1,22 @@
 """A toolbox."""
 
+import numbers
 import string
 
+try:
+    import numpy
+except ImportError:  # optional dependency (columns are tuples without it)
+    numpy = None
+
+
+# translation tables, compiled once: 'punctuation' characters are removed
+#  (and spaces too, for codenames)
+# forbidden chars: !"#$%&'()*+,-./:;<=>?@[\]^_`{|}~
+_CLEAN_STR_TABLE = str.maketrans('', '', string.punctuation)
+_CODENAME_TABLE = str.maketrans('', '', string.punctuation + ' ')
+# bytes to delete, for the (much faster) ASCII translation
+_CODENAME_DELETE_BYTES = (string.punctuation + ' ').encode('ascii')
+
 
 def clean_str(str_in):
     """Clean a string by removing 'punctuation' characters.
@@ -11,10 +26,42 @@ def clean_str(str_in):
     """
     if str_in is None:
         return None
+    return str_in.translate(_CLEAN_STR_TABLE)
 
-    # forbidden chars: !"#$%&'()*+,-./:;<=>?@[\]^_`{|}~
-    for cur_char in string.punctuation:
-        if cur_char in str_in:
-            str_in = str_in.replace(cur_char, '')
 
-    return str_in
+def build_codename(name):
+    """Build a codename from a name: cleaned (see `clean_str`), lowered and
+    without spaces, as a python object attribute name.
+
+    :param str name: The name.
+    :return str: The codename.
+    """
+    # same as `clean_str(name).lower().replace(' ', '')`, in one translation
+    try:
+        return name.encode('ascii').translate(
+            None, _CODENAME_DELETE_BYTES).decode('ascii').lower()
+    except UnicodeEncodeError:
+        return name.translate(_CODENAME_TABLE).lower()
+
+
+def build_column(values):
+    """Build a column of values: a NumPy array (of int64, or of float64 with
+    NaN for missing values) when values are numbers or None and NumPy is
+    installed, else a tuple.
+
+    :param list values: The column values.
+    :return numpy.ndarray|tuple: The column.
+    """
+    if numpy is not None and any(
+            cur_value is not None for cur_value in values) and all(
+            cur_value is None or (
+                isinstance(cur_value, numbers.Real)
+                and not isinstance(cur_value, bool))
+            for cur_value in values):
+        if all(isinstance(cur_value, numbers.Integral)
+               for cur_value in values):
+            return numpy.array(values, dtype=numpy.int64)
+        return numpy.array([
+            numpy.nan if cur_value is None else cur_value
+            for cur_value in values], dtype=numpy.float64)
+    return tuple(values)
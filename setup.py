@@ -75,5 +75,9 @@ setup(
             'pytest-cov>=2.4.0',
             'tox>=2.0',
         ],
+        # optional: numeric columns as arrays (see `IfcEntityCollection`)
+        'numpy': [
+            'numpy',
+        ],
     },
 )
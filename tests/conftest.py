@@ -6,6 +6,18 @@ import ifcopenshell
 
 from ifc_datareader import IfcSchema
 from ifc_datareader.schema import IfcSchemaEntity
+from ifc_datareader.schema.ifc_schema_cache import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(scope='session')
+def schema_cache_dirpath(tmpdir_factory):
+    return tmpdir_factory.mktemp('schema_cache')
+
+
+@pytest.fixture(autouse=True)
+def isolated_schema_cache(monkeypatch, schema_cache_dirpath):
+    """Do not write compiled schemas in user cache directory during tests."""
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(schema_cache_dirpath))
 
 
 @pytest.fixture
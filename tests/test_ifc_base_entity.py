@@ -31,6 +31,8 @@ class TestIfcBaseEntity:
             raw_obj.Description
         assert custom_ent.codename == custom_ent.name.lower().replace(
             ' ', '_').replace('(', '').replace(')', '')
+        # codename is computed once
+        assert custom_ent.codename is custom_ent.codename
 
         assert isinstance(custom_ent.schema_metadata, IfcSchemaEntity)
         assert custom_ent.schema_metadata.name == 'IfcProject'
@@ -47,6 +49,52 @@ class TestIfcBaseEntity:
         other_raw_obj = ifc_file.by_type('IfcSite')[0]
         assert other_raw_obj != raw_obj
 
+    def test_ifc_base_entity_is_a(self, schema_2x3, sample_ifcos):
+
+        raw_obj = sample_ifcos.by_type('IfcSite')[0]
+        custom_ent = IfcCustomEntity(raw_obj, schema_2x3)
+        for type_name in (
+                'IfcSite', 'IfcSpatialStructureElement', 'IfcProduct',
+                'IfcObject', 'IfcRoot', 'IfcBuilding', 'IfcElement',
+                'IfcPropertySet', 'IfcLabel', 'unknown',):
+            # same answers as ifcopenshell
+            assert custom_ent.is_a(type_name) == raw_obj.is_a(type_name)
+            assert IfcBaseEntity._is_a(
+                raw_obj, type_name, schema_2x3) == raw_obj.is_a(type_name)
+            # without schema, ifcopenshell is asked
+            assert IfcBaseEntity._is_a(
+                raw_obj, type_name, None) == raw_obj.is_a(type_name)
+
+        # a file instance is checked against all the entities of the schema
+        for raw_obj in sample_ifcos.by_type('IfcRoot')[:50]:
+            for entity_name in schema_2x3.entity_names:
+                assert IfcBaseEntity._is_a(
+                    raw_obj, entity_name, schema_2x3) == (
+                        raw_obj.is_a(entity_name))
+
+    def test_ifc_base_entity_attributes(self, schema_2x3, sample_ifcos):
+
+        raw_obj = sample_ifcos.by_type('IfcSite')[0]
+        custom_ent = IfcCustomEntity(raw_obj, schema_2x3)
+        # attributes are read by position, no attribute dict is built...
+        assert custom_ent.type_name == 'IfcSite'
+        assert custom_ent.name == raw_obj.Name
+        assert custom_ent.get_attribute('RefLatitude') == raw_obj.RefLatitude
+        assert custom_ent.get_attribute('unknown') is None
+        assert custom_ent._info is None
+        # ...until it is asked for
+        raw_info = raw_obj.get_info()
+        assert custom_ent.get_attribute('id') == raw_info['id']
+        assert custom_ent.info == raw_info
+        for attr_name, value in raw_info.items():
+            assert custom_ent.get_attribute(attr_name) == value
+
+        # without schema, attributes are read from attribute dict
+        custom_ent = IfcCustomEntity(raw_obj, None)
+        assert custom_ent.type_name == 'IfcSite'
+        assert custom_ent.name == raw_obj.Name
+        assert custom_ent._info is not None
+
     def test_ifc_base_entity_errors(self, schema_2x3, sample_ifcos):
 
         # IfcBaseEntity is an abstract class
@@ -62,3 +110,6 @@ class TestIfcBaseEntity:
         # invalid expected_types
         with pytest.raises(ValueError):
             IfcCustomEntity(raw_obj, schema_2x3, check_types='IfcObject')
+        # raw_obj_entity does not inherit from expected_types
+        with pytest.raises(ValueError):
+            IfcCustomEntity(raw_obj, schema_2x3, check_types=('IfcElement',))
@@ -0,0 +1,62 @@
+"""Tests on IfcCodenameTable"""
+
+import pytest
+
+from ifc_datareader.ifc_codename_table import IfcCodenameTable
+from ifc_datareader.tools import build_codename
+
+
+class TestIfcCodenameTable():
+
+    def test_ifc_codename_table(self):
+
+        table = IfcCodenameTable()
+        assert '<{}>('.format(table.__class__.__name__) in repr(table)
+        assert len(table) == 0
+
+        # a name is normalized once, codenames are interned
+        codename = table.get_codename('Pset_WallCommon')
+        assert codename == build_codename('Pset_WallCommon')
+        assert table.get_codename(''.join('Pset_WallCommon')) is codename
+        assert codename in table
+        assert len(table) == 1
+        assert table.get_codename(None) is None
+
+        # integer codes, in order of appearance
+        assert table.get_code('Pset_WallCommon') == 0
+        assert table.get_code('Is External') == 1
+        assert table.get_code(None) is None
+        assert table.get_codename_code('isexternal') == 1
+        assert table.get_codename_code('unknown') is None
+        assert table.get_codename_by_code(1) == 'isexternal'
+        with pytest.raises(IndexError):
+            table.get_codename_by_code(2)
+        with pytest.raises(IndexError):
+            table.get_codename_by_code(-1)
+
+        # collisions: distinct names giving the same codename
+        assert table.get_collisions() == {}
+        assert table.get_code('IsExternal') == 1
+        assert table.get_code('Is-External') == 1
+        assert len(table) == 2
+        assert table.get_names('isexternal') == (
+            'Is External', 'IsExternal', 'Is-External',)
+        assert table.get_names('unknown') == ()
+        assert table.get_collisions() == {
+            'isexternal': ('Is External', 'IsExternal', 'Is-External',)}
+
+    def test_ifc_codename_table_file(self, sample_ifcos):
+
+        table = IfcCodenameTable()
+        names = {
+            cur_raw.Name for cur_raw_type in ('IfcPropertySet', 'IfcProperty')
+            for cur_raw in sample_ifcos.by_type(cur_raw_type)}
+        for cur_name in names:
+            assert table.get_codename(cur_name) == build_codename(cur_name)
+        assert len(table) == len({
+            build_codename(cur_name) for cur_name in names})
+        for cur_codename, cur_names in table.get_collisions().items():
+            assert len(cur_names) > 1
+            assert all(
+                build_codename(cur_name) == cur_codename
+                for cur_name in cur_names)
@@ -0,0 +1,34 @@
+"""Tests on IfcContainmentIndex"""
+
+from ifc_datareader.ifc_containment_index import IfcContainmentIndex
+from ifc_datareader.ifc_object_entity import IfcObjectEntity
+
+
+class TestIfcContainmentIndex():
+
+    def test_ifc_containment_index(self, schema_2x3, sample_ifcos):
+
+        index = IfcContainmentIndex(sample_ifcos, schema_2x3)
+        assert '<{}>('.format(index.__class__.__name__) in repr(index)
+
+        # an IfcSpace (line 124), in a storey
+        raw_space = sample_ifcos.by_guid('3VbjARZ9f3feA5ls423TIy')
+        raw_storey = sample_ifcos.by_guid('3bhrzEe_P3q8bqpKn5gzPC')
+        assert index.get_parent_id(raw_space.id()) == raw_storey.id()
+        assert raw_space.id() in index.get_child_ids(raw_storey.id())
+        # the project has no parent
+        raw_project = sample_ifcos.by_type('IfcProject')[0]
+        assert index.get_parent_id(raw_project.id()) is None
+        assert index.get_child_ids(raw_project.id()) == (
+            sample_ifcos.by_type('IfcSite')[0].id(),)
+        assert index.get_child_ids(-1) == ()
+
+        # index gives the same parents as entities do
+        for cur_raw_obj in sample_ifcos.by_type('IfcObject'):
+            parent = IfcObjectEntity(cur_raw_obj, schema_2x3).parent
+            parent_id = index.get_parent_id(cur_raw_obj.id())
+            if parent is None:
+                assert parent_id is None
+            else:
+                assert parent_id == parent._raw.id()
+                assert cur_raw_obj.id() in index.get_child_ids(parent_id)
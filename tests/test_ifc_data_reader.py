@@ -1,8 +1,14 @@
 """Tests for IFC data reader tool."""
 
+import gc
+import tracemalloc
+import weakref
+
 import pytest
 
 from ifc_datareader import IfcDataReader, IfcObjectEntity, IfcSchema
+from ifc_datareader.ifc_object_entity_pset import (
+    IfcObjectEntityPropertySetBase)
 
 
 class TestIfcDataReader:
@@ -107,6 +113,590 @@ class TestIfcDataReader:
         assert ifc_door_entity.get_property_value(
             'unknown_property') == (None, None,)
 
+    def test_ifc_datareader_shared_schema(self, ifc_filepath):
+
+        # by default, readers share the same schema instance
+        data_reader = IfcDataReader(ifc_filepath)
+        other_data_reader = IfcDataReader(ifc_filepath)
+        assert data_reader.ifc_schema is other_data_reader.ifc_schema
+
+        # opt-out: a private schema instance is loaded
+        private_data_reader = IfcDataReader(ifc_filepath, shared_schema=False)
+        assert private_data_reader.ifc_schema is not data_reader.ifc_schema
+        assert private_data_reader.ifc_schema == data_reader.ifc_schema
+
+        def _measure_readers_memory(nb_readers, **kwargs):
+            tracemalloc.start()
+            try:
+                readers = [  # noqa
+                    IfcDataReader(ifc_filepath, **kwargs)
+                    for _ in range(nb_readers)]
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        # memory stays flat as the number of readers grows...
+        shared_size_1 = _measure_readers_memory(1)
+        shared_size_10 = _measure_readers_memory(10)
+        private_size_1 = _measure_readers_memory(1, shared_schema=False)
+        assert shared_size_10 - shared_size_1 < private_size_1
+        # ...whereas each private schema is kept in memory
+        private_size_3 = _measure_readers_memory(3, shared_schema=False)
+        assert private_size_3 > 2 * private_size_1
+
+    def test_ifc_datareader_identity_map(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        # the same file entity is wrapped once, whatever the access path
+        sites = data_reader.read_sites()
+        assert data_reader.read_sites() == sites
+        assert all(
+            cur_site is other_site for cur_site, other_site in zip(
+                sites, data_reader.read_entity('IfcSite')))
+        assert sites[0].parent is data_reader.ifc_project
+        assert sites[0] in data_reader.ifc_project.kids
+        assert any(kid is sites[0] for kid in data_reader.ifc_project.kids)
+        assert data_reader.get_object(sites[0]._raw) is sites[0]
+
+        # elements share their parent storey (and its lazy loaded data)
+        walls = data_reader.read_walls()
+        assert len(walls) > 1
+        storey = walls[0].parent
+        assert storey.type_name == 'IfcBuildingStorey'
+        for cur_wall in walls:
+            if cur_wall.parent == storey:
+                assert cur_wall.parent is storey
+        assert storey.kids is data_reader.get_object(storey._raw).kids
+
+        # object types, property sets and quantities too
+        door = data_reader.read_entity('IfcDoor')[0]
+        assert door.object_type is data_reader.get_wrapper(
+            door.object_type._raw, IfcObjectEntity,
+            expected_types=('IfcTypeProduct',))
+        # wrapper found is checked as a new one would be
+        with pytest.raises(ValueError):
+            data_reader.get_object(door.object_type._raw)
+        pset = door.property_sets[0]
+        assert data_reader.get_wrapper(
+            pset._raw, IfcObjectEntityPropertySetBase.create) is pset
+        assert pset.properties[0]._reader is data_reader
+
+        # wrappers are only kept while they are referenced...
+        step_id = door._raw.id()
+        object_type_ref = weakref.ref(door.object_type)
+        pset_ref = weakref.ref(pset)
+        site_ref = weakref.ref(sites[0])
+        assert step_id in data_reader._entities_by_id
+        del door, pset, storey, walls, sites
+        gc.collect()
+        assert step_id not in data_reader._entities_by_id
+        # ...but the shared ones (project, object types), kept for the
+        #  reader's life, unlike property sets and spatial parents
+        assert pset_ref() is None
+        assert site_ref() is None
+        door = data_reader.read_entity('IfcDoor')[0]
+        assert object_type_ref() is not None
+        assert door.object_type is object_type_ref()
+        sites = data_reader.read_sites()
+        assert sites[0].parent is data_reader.ifc_project
+        assert all(
+            cur_ent.is_a('IfcProject') or cur_ent.is_a('IfcTypeObject')
+            for cur_ent in data_reader._shared_entities_by_id.values())
+
+        # wrappers created out of a reader are not shared
+        raw_site = sites[0]._raw
+        site = IfcObjectEntity(raw_site, data_reader.ifc_schema)
+        assert site is not sites[0]
+        assert site.parent is not data_reader.ifc_project
+        assert site.parent == data_reader.ifc_project
+
+    def test_ifc_datareader_containment_index(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        assert data_reader._containment_index is None
+        storeys = data_reader.read_building_storeys()
+        assert data_reader._containment_index is None
+        assert len(storeys) > 0
+        # reads filtered by parent only visit parent's children
+        all_spaces = data_reader.read_spaces()
+        nb_spaces = 0
+        for cur_storey in storeys:
+            spaces = data_reader.read_spaces(parent_entity=cur_storey)
+            assert data_reader.containment_index is (
+                data_reader._containment_index)
+            assert {cur_space.global_id for cur_space in spaces} <= {
+                cur_space.global_id for cur_space in all_spaces}
+            assert all(
+                cur_space.parent is cur_storey for cur_space in spaces)
+            nb_spaces += len(spaces)
+        assert nb_spaces == len(all_spaces)
+        assert data_reader.read_entity(
+            'IfcSpace', parent_entity=data_reader.ifc_project) == ()
+        # subtypes are read too
+        elements = data_reader.read_entity(
+            'IfcElement', parent_entity=storeys[0])
+        assert len(elements) > 0
+        assert all(cur_elmt.is_a('IfcElement') for cur_elmt in elements)
+
+        with pytest.raises(ValueError):
+            data_reader.read_entity(
+                'IfcWrongClassName', parent_entity=storeys[0])
+
+    def test_ifc_datareader_spatial_tree(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        assert data_reader._spatial_tree is None
+        project = data_reader.ifc_project
+        site = data_reader.read_sites()[0]
+        storeys = data_reader.read_building_storeys()
+        spaces = data_reader.read_spaces()
+
+        # recursive descendants (direct children only are read by parent)
+        assert data_reader.read_entity('IfcSpace', parent_entity=site) == ()
+        site_spaces = data_reader.read_descendants(
+            site, entity_name='IfcSpace')
+        assert data_reader.spatial_tree is data_reader._spatial_tree
+        assert {cur_space.global_id for cur_space in site_spaces} == {
+            cur_space.global_id for cur_space in spaces}
+        assert all(
+            cur_space is other_space
+            for cur_space, other_space in zip(
+                sorted(site_spaces, key=lambda x: x.global_id),
+                sorted(spaces, key=lambda x: x.global_id)))
+        project_descendants = data_reader.read_descendants(project)
+        assert len(project_descendants) == len(data_reader.spatial_tree) - 1
+        for cur_storey in storeys:
+            storey_elements = data_reader.read_descendants(
+                cur_storey, entity_name='IfcElement')
+            assert all(
+                cur_elmt.is_a('IfcElement') for cur_elmt in storey_elements)
+            assert set(
+                cur_elmt.global_id for cur_elmt in data_reader.read_entity(
+                    'IfcElement', parent_entity=cur_storey)) <= set(
+                cur_elmt.global_id for cur_elmt in storey_elements)
+
+        # ancestors, up to the project
+        for cur_space in spaces:
+            ancestors = data_reader.read_ancestors(cur_space)
+            assert ancestors[0] is cur_space.parent
+            assert ancestors[-1] is project
+            for cur_ancestor, cur_parent in zip(ancestors, ancestors[1:]):
+                assert cur_ancestor.parent is cur_parent
+        assert data_reader.read_ancestors(project) == ()
+        # entities out of the tree
+        door_type = data_reader.read_entity('IfcDoor')[0].object_type
+        assert data_reader.read_ancestors(door_type) == ()
+        assert data_reader.read_descendants(door_type) == ()
+
+        with pytest.raises(ValueError):
+            data_reader.read_descendants('bad')
+        with pytest.raises(ValueError):
+            data_reader.read_descendants(
+                project, entity_name='IfcWrongClassName')
+        with pytest.raises(ValueError):
+            data_reader.read_ancestors(None)
+
+    def test_ifc_datareader_iter_entities(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        # same entities as read_*, yielded one at a time
+        spaces = data_reader.iter_spaces()
+        assert not isinstance(spaces, tuple)
+        assert next(spaces) is data_reader.read_spaces()[0]
+        assert tuple(data_reader.iter_entities('IfcSite')) == (
+            data_reader.read_sites())
+        for iter_func_name in (
+                'iter_sites', 'iter_buildings', 'iter_building_storeys',
+                'iter_spaces', 'iter_zones', 'iter_walls', 'iter_slabs',
+                'iter_windows',):
+            read_func_name = iter_func_name.replace('iter_', 'read_')
+            assert tuple(getattr(data_reader, iter_func_name)()) == (
+                getattr(data_reader, read_func_name)())
+        storey = data_reader.read_building_storeys()[0]
+        assert tuple(data_reader.iter_spaces(parent_entity=storey)) == (
+            data_reader.read_spaces(parent_entity=storey))
+
+        # several types, in batches
+        products = data_reader.read_entity('IfcProduct')
+        elements = tuple(data_reader.iter_entities(('IfcElement',)))
+        batches = tuple(data_reader.iter_entities(
+            ('IfcSpatialStructureElement', 'IfcElement',), batch_size=4))
+        assert all(len(cur_batch) == 4 for cur_batch in batches[:-1])
+        assert 0 < len(batches[-1]) <= 4
+        batched = tuple(
+            cur_ent for cur_batch in batches for cur_ent in cur_batch)
+        assert len(batched) <= len(products)
+        assert batched[-len(elements):] == elements
+        assert tuple(data_reader.iter_walls(batch_size=1000)) == (
+            data_reader.read_walls(),)
+
+        # errors are raised on call, not when iterating
+        with pytest.raises(ValueError):
+            data_reader.iter_entities('IfcWrongClassName')
+        with pytest.raises(ValueError):
+            data_reader.iter_entities(('IfcSite', 'IfcWrongClassName',))
+        with pytest.raises(ValueError):
+            data_reader.iter_spaces(parent_entity='bad')
+        for cur_batch_size in (0, -1, 'bad',):
+            with pytest.raises(ValueError):
+                data_reader.iter_entities(
+                    'IfcSite', batch_size=cur_batch_size)
+
+    def test_ifc_datareader_iter_entities_memory(self, ifc_filepath2):
+
+        data_reader = IfcDataReader(ifc_filepath2)
+
+        def _measure_peak_memory(read_func):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                read_func()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        def _read_names():
+            entities = data_reader.read_entity('IfcElement')
+            return [cur_ent.name for cur_ent in entities]
+
+        def _iter_names(**kwargs):
+            return [
+                cur_ent.name
+                for cur_ent in data_reader.iter_entities(
+                    'IfcElement', **kwargs)]
+
+        def _iter_batch_names():
+            return [
+                cur_ent.name
+                for cur_batch in data_reader.iter_entities(
+                    'IfcElement', batch_size=100)
+                for cur_ent in cur_batch]
+
+        assert len(_iter_names()) > 1000
+        assert _iter_names() == _read_names() == _iter_batch_names()
+        # wrappers are not all kept in memory at the same time
+        read_peak = _measure_peak_memory(_read_names)
+        assert _measure_peak_memory(_iter_names) < read_peak / 2
+        assert _measure_peak_memory(_iter_batch_names) < read_peak / 2
+
+        # property sets and parents read while streaming are not all kept
+        #  (only the project and object types are, for the reader's life)
+        def _iter_psets_and_parents():
+            for cur_ent in data_reader.iter_entities('IfcElement'):
+                for cur_pset in cur_ent.property_sets:
+                    cur_pset.properties
+                cur_ent.parent
+
+        def _measure_retained_memory(read_func):
+            gc.collect()
+            tracemalloc.start()
+            try:
+                read_func()
+                gc.collect()
+                return tracemalloc.get_traced_memory()[0]
+            finally:
+                tracemalloc.stop()
+
+        ifcos_file = data_reader._ifcos_file
+        max_shared_count = (
+            len(ifcos_file.by_type('IfcProject')) +
+            len(ifcos_file.by_type('IfcTypeObject')))
+        # first pass loads the lazy indexes and the shared wrappers
+        _iter_psets_and_parents()
+        shared_count = len(data_reader._shared_entities_by_id)
+        assert shared_count <= max_shared_count
+        # next passes retain nothing more
+        assert _measure_retained_memory(_iter_psets_and_parents) < 1000000
+        assert len(data_reader._shared_entities_by_id) == shared_count
+
+        # early termination
+        elements = data_reader.iter_entities('IfcElement')
+        first_elements = [next(elements) for _ in range(10)]
+        assert len(first_elements) == 10
+        del elements
+        gc.collect()
+        assert len(data_reader._entities_by_id) < 100
+
+    def test_ifc_datareader_type_set_queries(self, ifc_filepath):
+
+        def _ids(entities):
+            return [cur_ent._raw.id() for cur_ent in entities]
+
+        data_reader = IfcDataReader(ifc_filepath)
+        ifcos_file = data_reader._ifcos_file
+        # walls are all standard case walls: read once
+        walls = data_reader.read_walls()
+        assert len(walls) == len(ifcos_file.by_type('IfcWall')) > 0
+        assert len(set(_ids(walls))) == len(walls)
+        assert all(
+            cur_wall.type_name == 'IfcWallStandardCase' for cur_wall in walls)
+        assert tuple(data_reader.iter_walls()) == walls
+        for read_func_name in ('read_slabs', 'read_windows',):
+            entities = getattr(data_reader, read_func_name)()
+            assert len(set(_ids(entities))) == len(entities)
+
+        # overlapping type names: each entity is read once
+        for type_names in (
+                ('IfcWall', 'IfcWallStandardCase',),
+                ['IfcWallStandardCase', 'IfcWall', 'IfcWall'],
+                {'IfcBuildingElement', 'IfcWall', 'IfcDoor'},):
+            entities = data_reader.read_entity(type_names)
+            assert len(set(_ids(entities))) == len(entities)
+            assert set(_ids(entities)) == {
+                cur_raw.id() for cur_type_name in type_names
+                for cur_raw in ifcos_file.by_type(cur_type_name)}
+        elements = data_reader.read_entity(
+            ('IfcWallStandardCase', 'IfcElement', 'IfcSpace',))
+        assert len(elements) == len(ifcos_file.by_type('IfcElement')) + len(
+            ifcos_file.by_type('IfcSpace'))
+
+        # exact types only
+        assert data_reader.read_entity(
+            'IfcWall', include_subtypes=False) == ()
+        assert data_reader.read_entity(
+            ('IfcWall', 'IfcWallStandardCase',),
+            include_subtypes=False) == walls
+        assert data_reader.read_entity(
+            'IfcBuildingElement', include_subtypes=False) == ()
+        storey = walls[0].parent
+        storey_walls = data_reader.read_entity(
+            ('IfcWall', 'IfcWallStandardCase',), parent_entity=storey)
+        assert len(storey_walls) > 0
+        assert data_reader.read_entity(
+            ('IfcWall', 'IfcWallStandardCase',), parent_entity=storey,
+            include_subtypes=False) == storey_walls
+        assert data_reader.read_entity(
+            'IfcWall', parent_entity=storey, include_subtypes=False) == ()
+
+        with pytest.raises(ValueError):
+            data_reader.read_entity(('IfcWall', 'IfcWrongClassName',))
+
+    def test_ifc_datareader_property_index(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        assert data_reader._property_index is None
+        walls = data_reader.read_walls()
+        ext_walls = data_reader.read_entities_by_property_value(
+            'isexternal', True, pset_codename='psetwallcommon')
+        assert data_reader.property_index is data_reader._property_index
+        assert {cur_wall.global_id for cur_wall in ext_walls} == {
+            cur_wall.global_id for cur_wall in walls}
+        assert all(
+            cur_wall is data_reader.get_object(cur_wall._raw)
+            for cur_wall in ext_walls)
+        assert len(data_reader.read_entities_with_property(
+            'isexternal', pset_codename='psetwallcommon')) == len(walls)
+        door = data_reader.read_entity('IfcDoor')[0]
+        doors = data_reader.read_entities_by_property_range(
+            'height', min_value=2000, max_value=2200)
+        assert door in doors
+        assert all(
+            2000 <= cur_door.get_property_value('height')[0] <= 2200
+            for cur_door in doors)
+        assert data_reader.read_entities_by_property_value(
+            'isexternal', 'bad') == ()
+
+    def test_ifc_datareader_load_property_sets(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        entities = data_reader.read_entity('IfcObject')
+        assert data_reader.load_property_sets(entities) == entities
+        for cur_entity in entities:
+            legacy_entity = IfcObjectEntity(
+                cur_entity._raw, data_reader.ifc_schema)
+            assert (cur_entity.get_property_set_codenames()
+                    == legacy_entity.get_property_set_codenames())
+            assert [
+                (cur_prop.codename, cur_prop.value,)
+                for cur_prop in cur_entity.get_properties()] == [
+                (cur_prop.codename, cur_prop.value,)
+                for cur_prop in legacy_entity.get_properties()]
+        # a property set related to several objects is wrapped once
+        psets_by_id = {}
+        for cur_entity in entities:
+            for cur_pset in cur_entity.property_sets or ():
+                psets_by_id.setdefault(cur_pset._raw.id(), []).append(
+                    cur_pset)
+        shared_psets = [
+            cur_psets for cur_psets in psets_by_id.values()
+            if len(cur_psets) > 1]
+        assert len(shared_psets) > 0
+        for cur_psets in shared_psets:
+            assert all(cur_pset is cur_psets[0] for cur_pset in cur_psets)
+            # properties were decoded by the extraction
+            assert cur_psets[0]._properties is not None
+
+        with pytest.raises(ValueError):
+            data_reader.load_property_sets(['bad'])
+
+    def test_ifc_datareader_get_property_matrix(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        entities = data_reader.read_spaces() + data_reader.read_walls()
+        property_codenames = (
+            'isexternal', 'netfloorarea', 'height', 'reference', 'bad',)
+        values, units = data_reader.get_property_matrix(
+            entities, property_codenames)
+        assert tuple(values) == tuple(units) == property_codenames
+        for cur_codename in property_codenames:
+            assert len(values[cur_codename]) == len(entities)
+            for cur_entity, cur_value, cur_unit in zip(
+                    entities, values[cur_codename], units[cur_codename]):
+                value, unit = cur_entity.get_property_value(cur_codename)
+                # missing values are NaN in float columns
+                assert cur_value == value or (
+                    value is None and cur_value != cur_value)
+                assert cur_unit == unit
+        assert all(cur_value is None for cur_value in values['bad'])
+
+        # properties of a property set only
+        values, _ = data_reader.get_property_matrix(
+            entities, ('isexternal',), pset_codename='psetwallcommon')
+        assert list(values['isexternal']) == [
+            cur_entity.get_property_value(
+                'isexternal', pset_codename='psetwallcommon')[0]
+            for cur_entity in entities]
+        assert data_reader.get_property_matrix((), ('isexternal',)) == (
+            {'isexternal': ()}, {'isexternal': ()},)
+
+        with pytest.raises(ValueError):
+            data_reader.get_property_matrix(['bad'], ('isexternal',))
+
+    def test_ifc_datareader_read_quantity_table(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        spaces = data_reader.read_spaces()
+        table = data_reader.read_quantity_table()
+        assert table.groups == ('IfcSpace',)
+        assert table.codename_table is data_reader.codename_table
+        assert len(data_reader.read_quantity_table('IfcWall')) == 0
+        # grouped by storey
+        table = data_reader.read_quantity_table(
+            'IfcSpace', group_by='storey')
+        storey_ids = {cur_space.parent._raw.id() for cur_space in spaces}
+        assert set(table.groups) == storey_ids
+        for cur_storey_id in table.groups:
+            assert set(table.get_group(cur_storey_id).get_column(
+                'object_id')) == {
+                cur_space._raw.id() for cur_space in spaces
+                if cur_space.parent._raw.id() == cur_storey_id}
+        table = data_reader.read_quantity_table(group_by=None)
+        assert table.groups == (None,)
+        assert len(table) == sum(
+            len(cur_space.quantities) for cur_space in spaces)
+
+        with pytest.raises(ValueError):
+            data_reader.read_quantity_table('IfcWrongClassName')
+        with pytest.raises(ValueError):
+            data_reader.read_quantity_table(group_by='bad')
+
+    def test_ifc_datareader_unit_context(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        assert data_reader._unit_context is None
+        context = data_reader.unit_context
+        assert context is data_reader.unit_context
+        assert context.get_unit('LENGTHUNIT') in (
+            data_reader.ifc_project.get_attribute('UnitsInContext').Units)
+        # shared by the reader's entities
+        space = data_reader.read_spaces()[0]
+        prop = space.get_property('perimeter')
+        assert prop.value_si == context.to_si(
+            prop.value, prop.value_type_name)
+
+    def test_ifc_datareader_codename_table(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        table = data_reader.codename_table
+        doors = data_reader.read_entity('IfcDoor')
+        assert doors[0].codename in table
+        # entities and indexes share the reader's interned codenames
+        for cur_door in doors:
+            for cur_pset in cur_door.property_sets:
+                assert cur_pset.codename is table.get_codename(cur_pset.name)
+                for cur_prop in cur_pset.properties:
+                    assert cur_prop.codename is table.get_codename(
+                        cur_prop.name)
+        nb_codenames = len(table)
+        data_reader.property_index
+        assert data_reader.property_index._codename_table is table
+        assert len(table) >= nb_codenames
+        assert IfcObjectEntity(
+            doors[0]._raw, data_reader.ifc_schema).codename == (
+            doors[0].codename)
+
+    def test_ifc_datareader_entity_set(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        walls = data_reader.read_walls()
+        # wrappers are hashable by STEP identity
+        assert len(set(walls + walls)) == len(walls)
+        assert {cur_wall: cur_wall.name for cur_wall in walls}[walls[0]] == (
+            walls[0].name)
+        assert hash(walls[0]) == hash(IfcObjectEntity(
+            walls[0]._raw, data_reader.ifc_schema))
+
+        wall_set = data_reader.get_entity_set(walls)
+        assert len(wall_set) == len(walls)
+        assert set(wall_set) == set(walls)
+        assert data_reader.read_entity_set('IfcWall') == wall_set
+        assert data_reader.read_entity_set(
+            ('IfcWall', 'IfcWallStandardCase',)) == wall_set
+        storey = walls[0].parent
+        assert data_reader.read_entity_set(
+            'IfcElement', parent_entity=storey) == data_reader.get_entity_set(
+            data_reader.read_entity('IfcElement', parent_entity=storey))
+        with pytest.raises(ValueError):
+            data_reader.read_entity_set('IfcWrongClassName')
+        with pytest.raises(ValueError):
+            data_reader.get_entity_set(['bad'])
+
+    def test_ifc_datareader_effective_properties(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        doors = data_reader.read_entity('IfcDoor')
+        doors_by_type_id = {}
+        for cur_door in doors:
+            doors_by_type_id.setdefault(
+                cur_door.object_type._raw.id(), []).append(cur_door)
+        shared_doors = max(doors_by_type_id.values(), key=len)
+        assert len(shared_doors) > 1
+        # type properties are read once, by the shared type wrapper
+        object_type = shared_doors[0].object_type
+        for cur_door in shared_doors:
+            assert cur_door.object_type is object_type
+            occurrence_keys = {
+                (pset.codename, prop.codename,)
+                for pset in cur_door.property_sets for prop in pset.properties}
+            for key, prop in object_type.effective_properties.items():
+                if key not in occurrence_keys:
+                    assert cur_door.effective_properties[key] is prop
+
+    def test_ifc_datareader_effective_properties_streamed(
+            self, ifc_filepath2, monkeypatch):
+
+        # type properties are read once per object type, even when the
+        #  occurrences (and so their type wrappers) are not kept
+        load_effective_properties = IfcObjectEntity._load_effective_properties
+        type_ids = []
+
+        def _load_effective_properties(entity):
+            if entity.is_a('IfcTypeObject'):
+                type_ids.append(entity._raw.id())
+            return load_effective_properties(entity)
+
+        monkeypatch.setattr(
+            IfcObjectEntity, '_load_effective_properties',
+            _load_effective_properties)
+        data_reader = IfcDataReader(ifc_filepath2)
+        nb_elements = 0
+        for cur_element in data_reader.iter_entities('IfcElement'):
+            cur_element.effective_properties
+            nb_elements += 1
+        gc.collect()
+        assert len(type_ids) > 1
+        assert len(type_ids) == len(set(type_ids)) < nb_elements
+
     @pytest.mark.parametrize(
         'ifc_filepath', ['bad_sample_test.ifc'], indirect=True)
     def test_ifc_datareader_errors(self, ifc_filepath):
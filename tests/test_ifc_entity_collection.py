@@ -0,0 +1,166 @@
+"""Tests on IfcEntityCollection"""
+
+import ifcopenshell
+import pytest
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader import tools
+from ifc_datareader.ifc_entity_collection import IfcEntityCollection
+from ifc_datareader.ifc_entity_set import IfcEntitySet
+
+
+class TestIfcEntityCollection():
+
+    def test_ifc_entity_collection(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        spaces = data_reader.read_entity('IfcSpace')
+        collection = IfcEntityCollection(data_reader, 'IfcSpace')
+        assert '<{}>('.format(collection.__class__.__name__) in repr(
+            collection)
+        assert len(collection) == len(spaces)
+        assert collection.to_tuple() == spaces
+        assert all(
+            cur_entity is cur_space
+            for cur_entity, cur_space in zip(collection, spaces))
+        assert collection.to_entity_set() == IfcEntitySet.from_entities(
+            data_reader, spaces)
+
+        # steps are lazy, and return new collections
+        assert data_reader._property_index is None
+        walls = collection.filter(type_name='IfcElement')
+        assert len(collection) == len(spaces)
+        collection = IfcEntityCollection(data_reader).filter(
+            type_name='IfcWall', pset='Pset_WallCommon')
+        assert data_reader._property_index is None
+        assert set(collection) == set(data_reader.read_walls())
+        assert len(walls) == 0
+        assert len(IfcEntityCollection(data_reader).filter(
+            type_name='IfcWall', pset='unknown')) == 0
+        # ids of a filter are read once, on first filtering
+        property_index = data_reader.property_index
+        calls = []
+        get_entity_ids_with_pset = property_index.get_entity_ids_with_pset
+        property_index.get_entity_ids_with_pset = lambda *args: (
+            calls.append(args) or get_entity_ids_with_pset(*args))
+        collection = IfcEntityCollection(data_reader).filter(
+            pset='Pset_WallCommon')
+        assert len(collection) == len(data_reader.read_walls())
+        assert len(calls) == 1
+        del property_index.get_entity_ids_with_pset
+
+        # filters
+        space = spaces[0]
+        assert collection.filter(name=space.name).to_tuple() == ()
+        assert IfcEntityCollection(data_reader, 'IfcSpace').filter(
+            name=space.name).to_tuple() == (space,)
+        assert IfcEntityCollection(data_reader, 'IfcSpace').filter(
+            predicate=lambda entity: entity is space).to_tuple() == (space,)
+        storey = space.parent
+        # (in file order, not tree order)
+        assert set(IfcEntityCollection(data_reader, 'IfcElement').within(
+            storey)) == set(data_reader.read_descendants(
+                storey, entity_name='IfcElement'))
+        assert len(IfcEntityCollection(data_reader).within(space)) == len(
+            data_reader.read_descendants(space))
+
+        with pytest.raises(ValueError):
+            IfcEntityCollection(data_reader, 'IfcWrongClassName')
+        with pytest.raises(ValueError):
+            collection.filter(type_name='IfcWrongClassName')
+        with pytest.raises(ValueError):
+            collection.within('bad')
+
+    def test_ifc_entity_collection_columns(self, ifc_filepath, monkeypatch):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        spaces = data_reader.read_entity('IfcSpace')
+        collection = IfcEntityCollection.from_entities(
+            data_reader, spaces).select(
+            'Name', 'Dimensions.Area', '*.Area', 'Pset_SpaceCommon.Unknown')
+        columns = collection.to_columns()
+        assert list(columns) == [
+            'step_id', 'Name', 'Dimensions.Area', '*.Area',
+            'Pset_SpaceCommon.Unknown']
+        assert list(columns['step_id']) == [
+            cur_space._raw.id() for cur_space in spaces]
+        assert columns['Name'] == tuple(
+            cur_space.name for cur_space in spaces)
+        assert list(columns['Dimensions.Area']) == [
+            cur_space.get_property_value(
+                'area', pset_codename='dimensions')[0]
+            for cur_space in spaces]
+        assert list(columns['*.Area']) == list(columns['Dimensions.Area'])
+        assert columns['Pset_SpaceCommon.Unknown'] == (None,) * len(spaces)
+
+        # numeric columns are NumPy arrays, if installed
+        numpy = pytest.importorskip('numpy')
+        assert isinstance(columns['Dimensions.Area'], numpy.ndarray)
+        assert columns['Dimensions.Area'].dtype == numpy.float64
+        assert columns['step_id'].dtype == numpy.int64
+        monkeypatch.setattr(tools, 'numpy', None)
+        columns = collection.to_columns()
+        assert isinstance(columns['Dimensions.Area'], tuple)
+
+        with pytest.raises(ValueError):
+            IfcEntityCollection.from_entities(data_reader, ['bad'])
+        # object types are not objects: rejected on creation, not iteration
+        door_type = data_reader.read_entity('IfcDoor')[0].object_type
+        assert door_type is not None
+        with pytest.raises(ValueError):
+            IfcEntityCollection.from_entities(data_reader, [door_type])
+
+    def test_ifc_entity_collection_property_order(self, tmpdir):
+
+        # a same property in several property sets, related to walls in
+        #  another order than the property sets are first found in the file
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        ifcos_file.create_entity(
+            'IfcProject', GlobalId=ifcopenshell.guid.new(), Name='Project')
+        raw_walls = [
+            ifcos_file.create_entity(
+                'IfcWall', GlobalId=ifcopenshell.guid.new())
+            for _ in range(2)]
+        raw_psets = [
+            ifcos_file.create_entity(
+                'IfcPropertySet', GlobalId=ifcopenshell.guid.new(),
+                Name=cur_name,
+                HasProperties=(ifcos_file.create_entity(
+                    'IfcPropertySingleValue', Name='Area',
+                    NominalValue=ifcos_file.create_entity(
+                        'IfcAreaMeasure', cur_value)),))
+            for cur_name, cur_value in (
+                ('Pset_B', 1.), ('Pset_A', 2.), ('Pset_A', 3.),)]
+        for cur_wall_index, cur_pset_index in (
+                (1, 0,), (1, 1,), (0, 2,), (0, 1,), (0, 0,),):
+            ifcos_file.create_entity(
+                'IfcRelDefinesByProperties',
+                GlobalId=ifcopenshell.guid.new(),
+                RelatedObjects=(raw_walls[cur_wall_index],),
+                RelatingPropertyDefinition=raw_psets[cur_pset_index])
+        filepath = tmpdir / 'property_order.ifc'
+        ifcos_file.write(str(filepath))
+
+        # projected values are the ones walls give, from their own property
+        #  sets order
+        data_reader = IfcDataReader(str(filepath))
+        walls = data_reader.read_walls()
+        columns = data_reader.get_collection(walls).select(
+            '*.Area', 'Pset_A.Area').to_columns()
+        assert list(columns['*.Area']) == [3., 1.]
+        assert list(columns['Pset_A.Area']) == [3., 2.]
+        for cur_selector, cur_pset_codename in (
+                ('*.Area', None,), ('Pset_A.Area', 'pseta',),):
+            assert list(columns[cur_selector]) == [
+                cur_wall.get_property_value(
+                    'area', pset_codename=cur_pset_codename)[0]
+                for cur_wall in walls]
+
+    def test_ifc_entity_collection_reader(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        walls = data_reader.read_walls()
+        assert data_reader.query('IfcWall').to_tuple() == walls
+        assert data_reader.query().filter(
+            type_name='IfcWall').to_tuple() == walls
+        assert data_reader.get_collection(walls).to_tuple() == walls
@@ -0,0 +1,78 @@
+"""Tests on IfcEntitySet"""
+
+import pytest
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader.ifc_entity_set import IfcEntitySet
+
+
+class TestIfcEntitySet():
+
+    def test_ifc_entity_set(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        walls = data_reader.read_entity('IfcWall')
+        elements = data_reader.read_entity('IfcElement')
+        wall_set = IfcEntitySet.from_entities(data_reader, walls)
+        element_set = IfcEntitySet.from_entities(
+            data_reader, elements + elements)
+        assert '<{}>('.format(wall_set.__class__.__name__) in repr(wall_set)
+        assert len(wall_set) == len(walls)
+        assert len(element_set) == len(elements)
+        assert list(wall_set.step_ids) == sorted(
+            cur_wall._raw.id() for cur_wall in walls)
+
+        # wrappers are not created again
+        assert all(
+            cur_wall is next(
+                cur_other for cur_other in walls if cur_other == cur_wall)
+            for cur_wall in wall_set)
+        assert set(wall_set) == set(walls)
+
+        # membership (of entities or STEP ids)
+        assert walls[0] in wall_set
+        assert walls[0]._raw.id() in wall_set
+        assert data_reader.ifc_project not in wall_set
+        assert 'bad' not in wall_set
+        assert None not in wall_set
+
+        # set algebra
+        space_set = IfcEntitySet(
+            data_reader, (
+                cur_raw.id()
+                for cur_raw in data_reader._ifcos_file.by_type('IfcSpace')))
+        assert wall_set & element_set == wall_set
+        assert wall_set | element_set == element_set
+        assert len(wall_set | space_set) == len(wall_set) + len(space_set)
+        assert (wall_set | space_set) - wall_set == space_set
+        assert len(element_set - wall_set) == len(elements) - len(walls)
+        assert len(wall_set & space_set) == 0
+        assert wall_set.union(space_set).intersection(
+            space_set) == space_set
+        assert list((element_set | space_set).step_ids) == sorted(
+            set(element_set.step_ids) | set(space_set.step_ids))
+        odd_set = IfcEntitySet(data_reader, (7, 1, 5, 3,))
+        assert list((odd_set | IfcEntitySet(
+            data_reader, (2, 3, 8,))).step_ids) == [1, 2, 3, 5, 7, 8]
+        assert odd_set | IfcEntitySet(data_reader) == odd_set
+        assert IfcEntitySet(data_reader) | odd_set == odd_set
+        assert wall_set != IfcEntitySet(data_reader)
+        other_reader = IfcDataReader(ifc_filepath)
+        other_set = IfcEntitySet(other_reader, wall_set.step_ids)
+        assert other_set != wall_set
+        with pytest.raises(ValueError):
+            wall_set | other_set
+        with pytest.raises(ValueError):
+            wall_set & 'bad'
+
+        # type filtering
+        assert element_set.filter_type('IfcWall') == wall_set
+        assert len(element_set.filter_type(
+            'IfcWall', include_subtypes=False)) == len(
+            data_reader.read_entity('IfcWall', include_subtypes=False))
+        assert len(element_set.filter_type('IfcSpace')) == 0
+        with pytest.raises(ValueError):
+            element_set.filter_type('IfcWrongClassName')
+
+        with pytest.raises(ValueError):
+            IfcEntitySet.from_entities(data_reader, ['bad'])
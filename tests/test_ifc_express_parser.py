@@ -0,0 +1,269 @@
+"""Tests for EXPRESS schema parser."""
+
+from pathlib import Path
+import pytest
+
+from ifc_datareader.schema import IfcSchema, IFC_SCHEMAS
+from ifc_datareader.schema import ifc_express_parser
+from ifc_datareader.schema.ifc_express_parser import (
+    ExpressAggregate, ExpressAttributeType, ExpressDefinedType,
+    ExpressEntity, ExpressEntityHeader, ExpressEnumeration, ExpressRule,
+    ExpressSelectType, ExpressSyntaxError, parse_attribute_type,
+    parse_entity_body, parse_schema)
+
+
+SCHEMA_DATA = '''(* a custom schema *)
+SCHEMA IFC42;
+
+TYPE IfcLabel = STRING;
+END_TYPE;
+
+TYPE IfcGloballyUniqueId = STRING(22) FIXED;
+END_TYPE;
+
+TYPE IfcPositiveLengthMeasure = IfcLengthMeasure;
+ WHERE
+  WR1 : SELF > 0.;
+END_TYPE;
+
+TYPE IfcLengthMeasure = REAL;
+END_TYPE;
+
+TYPE IfcValue = SELECT (IfcLabel, IfcLengthMeasure,
+    IfcPositiveLengthMeasure);
+END_TYPE;
+
+TYPE IfcWallTypeEnum = ENUMERATION OF (STANDARD,NOTDEFINED);
+END_TYPE;
+
+ENTITY IfcRoot
+ ABSTRACT SUPERTYPE OF (ONEOF (IfcWall));
+    GlobalId : IfcGloballyUniqueId;
+    Name, LongName : OPTIONAL IfcLabel;
+ UNIQUE
+    UR1 : GlobalId;
+END_ENTITY;
+
+ENTITY IfcWall SUBTYPE OF ( IfcRoot );
+    Heights : LIST [1:?] OF UNIQUE IfcPositiveLengthMeasure;
+    Grid : OPTIONAL ARRAY [1:2] OF LIST [2:3] OF IfcLengthMeasure;
+ DERIVE
+    SELF\\IfcRoot.LongName : IfcLabel := 'wall; (* not a comment *)';
+ INVERSE
+    Walls : SET [0:?] OF IfcWall FOR Wall;
+ WHERE
+    WR1 : SIZEOF(Heights) > 0;
+    EXISTS(Name);
+END_ENTITY;
+
+FUNCTION IfcDummy (Arg : IfcWall) : BOOLEAN;
+  IF EXISTS(Arg) THEN RETURN (TRUE); END_IF;
+  RETURN (FALSE);
+END_FUNCTION;
+
+RULE IfcSingleRoot FOR (IfcRoot);
+ WHERE
+  WR1 : SIZEOF(IfcRoot) <= 1;
+END_RULE;
+
+END_SCHEMA;
+'''
+
+
+class TestExpressParser:
+
+    def test_parse_attribute_type(self):
+
+        assert parse_attribute_type('IfcLabel') == ExpressAttributeType(
+            False, (), 'IfcLabel', None)
+        assert parse_attribute_type(
+            'OPTIONAL SET [1:?] OF IfcLabel') == ExpressAttributeType(
+                True, (ExpressAggregate('SET', '1', '?', False),),
+                'IfcLabel', None)
+        assert parse_attribute_type(
+            '\n\tLIST  [2:2]OF\tLIST[1:?] OF UNIQUE IfcLengthMeasure'
+        ) == ExpressAttributeType(
+            False, (ExpressAggregate('LIST', '2', '2', False),
+                    ExpressAggregate('LIST', '1', '?', True),),
+            'IfcLengthMeasure', None)
+        assert parse_attribute_type(
+            'SET [0:1] OF IfcRelAssigns FOR RelatedObjects'
+        ) == ExpressAttributeType(
+            False, (ExpressAggregate('SET', '0', '1', False),),
+            'IfcRelAssigns', 'RelatedObjects')
+        assert parse_attribute_type('STRING(22) FIXED') == (
+            ExpressAttributeType(False, (), 'STRING', None))
+        assert parse_attribute_type('') == ExpressAttributeType(
+            False, (), None, None)
+
+    def test_parse_attribute_type_errors(self):
+
+        with pytest.raises(AttributeError):
+            parse_attribute_type(None)
+        with pytest.raises(ExpressSyntaxError):
+            parse_attribute_type('SET [1:? OF IfcLabel')
+        with pytest.raises(ExpressSyntaxError):
+            parse_attribute_type('IfcLabel IfcText')
+
+    def test_parse_entity_body(self):
+
+        raw_data = (
+            'SUBTYPE OF (IfcSpatialStructureElement);'
+            '\n\tRefLatitude : OPTIONAL IfcCompoundPlaneAngleMeasure;'
+            '\n\tLandTitleNumber : OPTIONAL IfcLabel;')
+        entity = parse_entity_body(raw_data, name='IfcSite')
+        assert isinstance(entity, ExpressEntity)
+        assert entity.name == 'IfcSite'
+        assert not entity.is_abstract
+        assert entity.supertype_name == 'IfcSpatialStructureElement'
+        assert [attr.name for attr in entity.attributes] == [
+            'RefLatitude', 'LandTitleNumber']
+        assert entity.attributes[0].raw_type == (
+            'OPTIONAL IfcCompoundPlaneAngleMeasure')
+        assert entity.attributes[0].type.is_optional
+        assert entity.inverses == entity.derives == ()
+        assert entity.span is None
+
+        # entity's name is read from body
+        entity = parse_entity_body('IfcThing;\n\tName : IfcLabel;')
+        assert entity.name == 'IfcThing'
+        assert entity.supertype_name is None
+
+        with pytest.raises(ExpressSyntaxError):
+            parse_entity_body('SUBTYPE OF (IfcRoot);')
+        with pytest.raises(ExpressSyntaxError):
+            parse_entity_body('IfcThing;\n\tName IfcLabel;')
+
+    def test_parse_schema(self):
+
+        schema = parse_schema(SCHEMA_DATA)
+        assert schema.name == 'IFC42'
+
+        assert list(schema.defined_types) == [
+            'IfcLabel', 'IfcGloballyUniqueId', 'IfcPositiveLengthMeasure',
+            'IfcLengthMeasure']
+        assert schema.defined_types['IfcGloballyUniqueId'] == (
+            ExpressDefinedType('IfcGloballyUniqueId', 'STRING(22) FIXED', ()))
+        assert schema.defined_types['IfcPositiveLengthMeasure'] == (
+            ExpressDefinedType(
+                'IfcPositiveLengthMeasure', 'IfcLengthMeasure',
+                (ExpressRule('WR1', 'SELF > 0.'),)))
+
+        # select and enumeration lists do not depend on layout
+        assert schema.select_types == {'IfcValue': ExpressSelectType(
+            'IfcValue', (
+                'IfcLabel', 'IfcLengthMeasure', 'IfcPositiveLengthMeasure',),
+            ())}
+        assert schema.enumerations == {
+            'IfcWallTypeEnum': ExpressEnumeration(
+                'IfcWallTypeEnum', ('STANDARD', 'NOTDEFINED',), ())}
+
+        assert list(schema.entities) == ['IfcRoot', 'IfcWall']
+        root = schema.entities['IfcRoot']
+        assert root.is_abstract
+        assert root.supertype_name is None
+        assert [(attr.name, attr.raw_type) for attr in root.attributes] == [
+            ('GlobalId', 'IfcGloballyUniqueId'),
+            ('Name', 'OPTIONAL IfcLabel'),
+            ('LongName', 'OPTIONAL IfcLabel')]
+        assert root.unique_rules == (ExpressRule('UR1', 'GlobalId'),)
+        start, end = root.span
+        assert SCHEMA_DATA[start:end].startswith('IfcRoot\n ABSTRACT')
+        assert SCHEMA_DATA[end:].startswith('END_ENTITY;')
+
+        wall = schema.entities['IfcWall']
+        assert not wall.is_abstract
+        assert wall.supertype_name == 'IfcRoot'
+        heights, grid = wall.attributes
+        assert heights.type.aggregates == (
+            ExpressAggregate('LIST', '1', '?', True),)
+        assert grid.type.is_optional
+        assert grid.type.aggregates == (
+            ExpressAggregate('ARRAY', '1', '2', False),
+            ExpressAggregate('LIST', '2', '3', False),)
+        assert grid.type.base_type == 'IfcLengthMeasure'
+        derive, = wall.derives
+        assert derive.name == 'SELF\\IfcRoot.LongName'
+        assert derive.raw_type == 'IfcLabel'
+        assert derive.expression == "'wall; (* not a comment *)'"
+        inverse, = wall.inverses
+        assert inverse.name == 'Walls'
+        assert inverse.type.for_attr == 'Wall'
+        assert wall.where_rules == (
+            ExpressRule('WR1', 'SIZEOF(Heights) > 0'),
+            ExpressRule(None, 'EXISTS(Name)'),)
+
+    def test_parse_schema_headers_only(self):
+
+        schema = parse_schema(SCHEMA_DATA)
+        headers_schema = parse_schema(SCHEMA_DATA, headers_only=True)
+        assert headers_schema.defined_types == schema.defined_types
+        assert headers_schema.select_types == schema.select_types
+        assert headers_schema.enumerations == schema.enumerations
+        assert headers_schema.entities == {
+            name: ExpressEntityHeader(
+                name, entity.is_abstract, entity.supertype_name, entity.span)
+            for name, entity in schema.entities.items()}
+
+        # an entity body is parsed later, from its span
+        start, end = headers_schema.entities['IfcWall'].span
+        assert parse_entity_body(
+            SCHEMA_DATA[start:end], span=(start, end)) == (
+                schema.entities['IfcWall'])
+
+    def test_parse_schema_errors(self):
+
+        with pytest.raises(ExpressSyntaxError):
+            parse_schema('SCHEMA IFC42;\nENTITY IfcRoot;\nEND_SCHEMA;')
+        with pytest.raises(ExpressSyntaxError):
+            parse_schema('SCHEMA IFC42;\nIfcRoot;\nEND_SCHEMA;')
+        with pytest.raises(ExpressSyntaxError):
+            parse_schema('SCHEMA IFC42;\nTYPE IfcLabel STRING;\nEND_TYPE;')
+
+    @pytest.mark.parametrize('schema_name', sorted(IFC_SCHEMAS))
+    def test_parse_ifc_schemas(self, schema_name):
+
+        schema_filepath = (
+            Path(ifc_express_parser.__file__).parent /
+            IFC_SCHEMAS[schema_name])
+        with open(str(schema_filepath)) as schema_file:
+            schema = parse_schema(schema_file.read())
+        assert schema.name == schema_name
+        ifc_schema = IfcSchema(schema_name, cache=False)
+        assert sorted(schema.defined_types) == list(
+            ifc_schema.defined_type_names)
+        assert sorted(schema.select_types) == list(
+            ifc_schema.select_type_names)
+        assert sorted(schema.enumerations) == list(
+            ifc_schema.enumeration_names)
+        assert sorted(schema.entities) == list(ifc_schema.entity_names)
+
+    def test_ifc_schema_layout(self, tmpdir):
+
+        # select lists not indented with a new line and a tabulation
+        schema_filepath = tmpdir / 'custom_schema.exp'
+        with open(str(schema_filepath), 'w') as schema_file:
+            schema_file.write(SCHEMA_DATA)
+
+        ifc_schema = IfcSchema('IFC42', schema_filepath=str(schema_filepath))
+        assert ifc_schema.select_type_names == ('IfcValue',)
+        assert ifc_schema.get_select_type('IfcValue').entity_names == (
+            'IfcLabel', 'IfcLengthMeasure', 'IfcPositiveLengthMeasure',)
+        assert ifc_schema.get_enumeration('IfcWallTypeEnum').values == (
+            'NOTDEFINED', 'STANDARD',)
+
+        wall = ifc_schema.get_entity('IfcWall')
+        assert wall.attribute_names == ('Grid', 'Heights',)
+        assert wall.inverse_names == ('Walls',)
+        assert wall.get_all_attribute_names() == (
+            'GlobalId', 'LongName', 'Name', 'Grid', 'Heights',)
+        heights = wall.get_attribute('Heights')
+        assert heights.ifc_type_name == 'IfcPositiveLengthMeasure'
+        assert not heights.is_set_of
+        grid = wall.get_attribute('Grid')
+        assert grid.is_optional
+        assert grid.is_set_of
+        assert (grid.set_of_min, grid.set_of_max) == ('2', '3')
+        inverse = wall.get_inverse('Walls')
+        assert inverse.for_attr == 'Wall'
+        assert inverse.ifc_type_name == 'IfcWall'
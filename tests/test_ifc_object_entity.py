@@ -108,6 +108,81 @@ class TestIfcObjectEntity():
         assert obj_ent.get_property_value(
             prop.codename, pset_codename='unknown') == (None, None,)
 
+        # hash index lookups find the first occurence, as linear searches
+        raw_door = ifc_file.by_type('IfcDoor')[0]
+        door = IfcObjectEntity(raw_door, schema_2x3)
+        pset_codenames = door.get_property_set_codenames()
+        assert len(set(pset_codenames)) < len(pset_codenames)
+        for pset_codename in pset_codenames:
+            assert door.get_property_set(pset_codename) is next(
+                pset for pset in door.property_sets
+                if pset.codename == pset_codename)
+            for prop_codename in door.get_property_codenames(
+                    pset_codename=pset_codename):
+                assert door.get_property(
+                    prop_codename, pset_codename=pset_codename) is next(
+                    prop for prop in door.get_properties(
+                        pset_codename=pset_codename)
+                    if prop.codename == prop_codename)
+        for prop_codename in door.get_property_codenames():
+            assert door.get_property(prop_codename) is next(
+                prop for prop in door.get_properties()
+                if prop.codename == prop_codename)
+        assert door.get_property('unknown') is None
+        assert door.get_property('height', pset_codename='unknown') is None
+
+    def test_ifc_object_entity_effective_properties(
+            self, schema_2x3, sample_ifcos):
+
+        raw_door = sample_ifcos.by_type('IfcDoor')[0]
+        door = IfcObjectEntity(raw_door, schema_2x3)
+        effective_props = door.effective_properties
+        assert door.effective_properties is effective_props
+        with pytest.raises(TypeError):
+            effective_props['key'] = None
+
+        # occurrence properties come first and override type's ones...
+        occurrence_keys = [
+            (pset.codename, prop.codename,)
+            for pset in door.property_sets for prop in pset.properties]
+        assert list(effective_props)[:len(set(occurrence_keys))] == list(
+            dict.fromkeys(occurrence_keys))
+        for pset in door.property_sets:
+            for prop in pset.properties:
+                cur_prop = effective_props[(pset.codename, prop.codename,)]
+                assert cur_prop.codename == prop.codename
+        # ...which are merged too (read once by the type entity)
+        object_type = door.object_type
+        assert object_type.effective_properties is (
+            object_type.effective_properties)
+        type_pset = object_type.property_sets[0]
+        for prop in type_pset.properties:
+            assert effective_props[(type_pset.codename, prop.codename,)] is (
+                prop)
+        assert len(effective_props) == len(set(occurrence_keys)) + len(
+            type_pset.properties)
+
+        assert door.get_effective_property_value('height') == (
+            door.get_property_value('height'))
+        assert door.get_effective_property_value(
+            'height', pset_codename='dimensions') == (2110, None,)
+        prop = type_pset.properties[0]
+        assert door.get_property_value(prop.codename) == (None, None,)
+        assert door.get_effective_property_value(
+            prop.codename, pset_codename=type_pset.codename) == (
+            prop.value, prop.unit,)
+        # a type only property, without property set
+        assert door.get_effective_property_value(prop.codename) == (
+            prop.value, prop.unit,)
+        assert door.get_effective_property_value('unknown') == (None, None,)
+
+        # an entity without object type only has its own properties
+        raw_space = sample_ifcos.by_guid('3VbjARZ9f3feA5ls423TIy')
+        space = IfcObjectEntity(raw_space, schema_2x3)
+        assert set(space.effective_properties) == {
+            (pset.codename, prop.codename,)
+            for pset in space.property_sets for prop in pset.properties}
+
     def test_ifc_object_entity_errors(self, schema_2x3, sample_ifcos):
 
         # load a non valid ifcopenshell entity instance
@@ -1,7 +1,9 @@
 """Tests on IFC object entity property."""
 
 import pytest
+import ifcopenshell
 
+from ifc_datareader import IfcDataReader
 from ifc_datareader.ifc_object_entity_property import (
     IfcObjectEntityPropertyBase, IfcObjectEntitySimpleProperty,
     IfcObjectEntityTypeProperty)
@@ -100,6 +102,70 @@ class TestIfcObjectEntityProperty:
         assert prop != tprop2 and prop_bis != tprop2_bis
         assert tprop != tprop2 and tprop_bis != tprop2_bis
 
+    def test_ifc_object_entity_property_value_kind(
+            self, schema_2x3, sample_ifcos):
+
+        raw_obj = sample_ifcos.by_guid('3XVK9DSXz5VBeIwkdMkNOi')
+        # IfcLengthMeasure is a REAL
+        prop = IfcObjectEntityPropertyBase.create(
+            raw_obj.HasProperties[0], schema_2x3)
+        assert prop.value_kind == 'REAL'
+
+        # IfcDoorLiningProperties attributes
+        raw_pset_def = sample_ifcos.by_guid('0gLqRgVw5CUfhJ9lHgf5OT')
+        for attr_name, expected_kind in (
+                ('LiningDepth', 'REAL'), ('ShapeAspectStyle', 'ENTITY'),):
+            tprop = IfcObjectEntityTypeProperty(
+                raw_pset_def, attr_name, schema_2x3)
+            assert tprop.value_kind == expected_kind
+            assert tprop.value_kind == schema_2x3.get_entity(
+                'IfcDoorLiningProperties').get_attribute(
+                    attr_name).resolved_type.kind
+
+        # no schema, no value kind
+        assert IfcObjectEntitySimpleProperty(
+            raw_obj.HasProperties[0], None).value_kind is None
+
+    def test_ifc_object_entity_property_si(
+            self, schema_2x3, schema_4, sample_ifcos, ifc_filepath):
+
+        raw_obj = sample_ifcos.by_guid('3XVK9DSXz5VBeIwkdMkNOi')
+        raw_prop = raw_obj.HasProperties[0]
+        # without reader: no project's units
+        prop = IfcObjectEntitySimpleProperty(raw_prop, schema_2x3)
+        assert prop.unit_resolved is None
+        assert prop.value == 4000.0
+        assert prop.value_si is None
+        # without reader, but explicit unit (millimetres)
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        raw_unit = ifcos_file.create_entity(
+            'IfcSIUnit', UnitType='LENGTHUNIT', Prefix='MILLI', Name='METRE')
+        raw_prop = ifcos_file.create_entity(
+            'IfcPropertySingleValue', Name='Width',
+            NominalValue=ifcos_file.create_entity(
+                'IfcLengthMeasure', 4000.),
+            Unit=raw_unit)
+        prop = IfcObjectEntitySimpleProperty(raw_prop, schema_4)
+        assert prop.unit_resolved == raw_unit
+        assert prop.value_si == 4.
+        assert prop._get_unit_context() is prop._get_unit_context()
+
+        # project's units in millimetres
+        data_reader = IfcDataReader(ifc_filepath)
+        space = data_reader.read_spaces()[0]
+        prop = space.get_property('unboundedheight')
+        assert prop.unit is None
+        assert prop.unit_resolved is data_reader.unit_context.get_unit(
+            'LENGTHUNIT')
+        assert prop.value_si == prop.value / 1000.
+        prop = space.get_property('area')
+        assert prop.value_si == prop.value
+        # not a number
+        prop = next(
+            cur_prop for cur_prop in space.get_properties()
+            if isinstance(cur_prop.value, str))
+        assert prop.value_si is None
+
     def test_ifc_object_entity_property_errors(self, schema_2x3, sample_ifcos):
 
         # IfcObjectEntityPropertyBase is an abstract class
@@ -33,9 +33,24 @@ class TestIfcObjectEntityPropertySet:
             assert prop.property_set_name == pset_bis.name
 
         assert pset == pset_bis
+        # hashable by STEP identity (properties by STEP identity and name)
+        assert hash(pset) == hash(pset_bis)
+        assert len({pset, pset_bis}) == 1
+        assert len(set(pset.properties + pset_bis.properties)) == len(
+            pset.properties)
 
         assert '<{}>('.format(pset.__class__.__name__) in repr(pset)
 
+        # properties hash index, by codename
+        props_by_codename = pset.properties_by_codename
+        assert pset.properties_by_codename is props_by_codename
+        assert list(props_by_codename) == list(dict.fromkeys(
+            pset.get_property_codenames()))
+        for prop in pset.properties:
+            assert pset.get_property(prop.codename) is (
+                props_by_codename[prop.codename])
+        assert pset.get_property('unknown') is None
+
         # get an IfcDoorLiningProperties (IfcPropertySetDefinition), line 49393
         raw_pset_def = ifc_file.by_guid('0gLqRgVw5CUfhJ9lHgf5OT')
         pset_attrs = schema_2x3.get_entity(raw_pset_def.is_a()).attributes
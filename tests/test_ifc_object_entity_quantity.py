@@ -2,6 +2,7 @@
 
 import pytest
 
+from ifc_datareader import IfcDataReader
 from ifc_datareader.ifc_object_entity_quantity import (
     IfcObjectEntityQuantityBase, IfcObjectEntitySimpleQuantity)
 
@@ -39,6 +40,29 @@ class TestIfcObjectEntityQuantity:
             ', unit="{self.unit}"'
             ')'.format(self=quantity))
 
+    def test_ifc_object_entity_quantity_si(
+            self, schema_2x3, sample_ifcos, ifc_filepath2):
+
+        raw_qty = sample_ifcos.by_guid('0y1XPVQ2bFi962bGE5XTfW').Quantities[0]
+        # without reader: no project's units
+        quantity = IfcObjectEntitySimpleQuantity(raw_qty, schema_2x3)
+        assert quantity.unit_resolved is None
+        assert quantity.value_si is None
+
+        # project's units in feet
+        data_reader = IfcDataReader(ifc_filepath2)
+        quantities = {
+            cur_qty.codename: cur_qty
+            for cur_qty in data_reader.read_spaces()[0].quantities}
+        quantity = quantities['height']
+        assert quantity.unit is None
+        assert quantity.unit_resolved.Name == 'FOOT'
+        assert quantity.value_si == pytest.approx(quantity.value * 0.3048)
+        quantity = quantities['netfloorarea']
+        assert quantity.unit_resolved.Name == 'SQUARE FOOT'
+        assert quantity.value_si == pytest.approx(
+            quantity.value * 0.09290304)
+
     def test_ifc_object_entity_quantity_errors(self, schema_2x3, sample_ifcos):
 
         # IfcObjectEntityQuantityBase is an abstract class
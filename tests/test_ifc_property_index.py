@@ -0,0 +1,243 @@
+"""Tests on IfcPropertyIndex"""
+
+import ifcopenshell
+
+from ifc_datareader import IfcSchema
+from ifc_datareader.ifc_codename_table import IfcCodenameTable
+from ifc_datareader.ifc_object_entity import IfcObjectEntity
+from ifc_datareader.ifc_property_index import IfcPropertyIndex
+
+
+class TestIfcPropertyIndex():
+
+    def test_ifc_property_index(self, schema_2x3, sample_ifcos):
+
+        index = IfcPropertyIndex(sample_ifcos, schema_2x3)
+        assert '<{}>('.format(index.__class__.__name__) in repr(index)
+        raw_walls = sample_ifcos.by_type('IfcWall')
+        wall_ids = {cur_raw_wall.id() for cur_raw_wall in raw_walls}
+
+        # equality
+        assert set(index.get_entity_ids_by_value(
+            'isexternal', True, pset_codename='psetwallcommon')) == wall_ids
+        assert index.get_entity_ids_by_value(
+            'isexternal', False, pset_codename='psetwallcommon') == ()
+        # any property set
+        ext_ids = index.get_entity_ids_by_value('isexternal', True)
+        assert wall_ids < set(ext_ids)
+        assert len(set(ext_ids)) == len(ext_ids)
+        assert index.get_values(
+            'isexternal', pset_codename='psetwallcommon') == (True,)
+
+        # existence
+        assert set(index.get_entity_ids(
+            'isexternal', pset_codename='psetwallcommon')) == wall_ids
+        assert index.get_entity_ids('unknown') == ()
+        assert index.get_entity_ids(
+            'isexternal', pset_codename='unknown') == ()
+
+        # range (bounds included)
+        areas = index.get_values('area', pset_codename='dimensions')
+        assert len(areas) > 2
+        min_area, max_area = min(areas), max(areas)
+        all_ids = index.get_entity_ids('area', pset_codename='dimensions')
+        assert set(index.get_entity_ids_in_range(
+            'area', pset_codename='dimensions')) == set(all_ids)
+        assert set(index.get_entity_ids_in_range(
+            'area', pset_codename='dimensions', min_value=min_area,
+            max_value=max_area)) == set(all_ids)
+        assert index.get_entity_ids_in_range(
+            'area', pset_codename='dimensions', min_value=max_area + 1) == ()
+        assert index.get_entity_ids_in_range(
+            'area', pset_codename='dimensions', max_value=min_area - 1) == ()
+        # ids in ascending value order
+        range_ids = index.get_entity_ids_in_range(
+            'area', pset_codename='dimensions', min_value=min_area + 1e-6)
+        assert 0 < len(range_ids) < len(all_ids)
+        range_values = [
+            IfcObjectEntity(sample_ifcos.by_id(cur_id), schema_2x3)
+            .get_property_value('area', pset_codename='dimensions')[0]
+            for cur_id in range_ids]
+        assert range_values == sorted(range_values)
+        assert all(cur_value > min_area for cur_value in range_values)
+        # non numeric values are not in ranges
+        assert index.get_entity_ids_in_range(
+            'isexternal', min_value=0) == ()
+
+        # index gives the same values as objects do
+        for cur_raw_obj in sample_ifcos.by_type('IfcObject'):
+            obj = IfcObjectEntity(cur_raw_obj, schema_2x3)
+            for cur_pset in obj.property_sets or ():
+                for cur_prop in cur_pset.properties or ():
+                    assert cur_raw_obj.id() in index.get_entity_ids_by_value(
+                        cur_prop.codename, cur_prop.value,
+                        pset_codename=cur_pset.codename)
+
+    def test_ifc_property_index_codename_table(
+            self, schema_2x3, sample_ifcos):
+
+        # codenames are read from a shared table
+        table = IfcCodenameTable()
+        index = IfcPropertyIndex(
+            sample_ifcos, schema_2x3, codename_table=table)
+        assert 'psetwallcommon' in table
+        assert 'isexternal' in table
+        assert index.get_entity_ids(
+            'isexternal', pset_codename='psetwallcommon') == (
+            IfcPropertyIndex(sample_ifcos, schema_2x3).get_entity_ids(
+                'isexternal', pset_codename='psetwallcommon'))
+
+    def test_ifc_property_index_entity_values(self, schema_2x3, sample_ifcos):
+
+        index = IfcPropertyIndex(sample_ifcos, schema_2x3)
+        raw_walls = sample_ifcos.by_type('IfcWall')
+        wall_ids = {cur_raw_wall.id() for cur_raw_wall in raw_walls}
+
+        # property values by object
+        values_by_id = index.get_entity_values(
+            'isexternal', pset_codename='psetwallcommon')
+        assert values_by_id == {cur_id: True for cur_id in wall_ids}
+        for cur_raw_wall in raw_walls:
+            wall = IfcObjectEntity(cur_raw_wall, schema_2x3)
+            assert index.get_entity_values('isexternal')[
+                cur_raw_wall.id()] == wall.get_property_value(
+                'isexternal')[0]
+        assert index.get_entity_values('unknown') == {}
+
+        # objects having a property set
+        assert set(index.get_entity_ids_with_pset(
+            'psetwallcommon')) == wall_ids
+        assert index.get_entity_ids_with_pset('unknown') == ()
+        for cur_pset_codename in {
+                cur_key[0] for cur_key in index._ids_by_value_by_key}:
+            pset_ids = index.get_entity_ids_with_pset(cur_pset_codename)
+            assert len(set(pset_ids)) == len(pset_ids)
+            assert set(pset_ids) == {
+                cur_id
+                for cur_key, cur_ids_by_value in (
+                    index._ids_by_value_by_key.items())
+                if cur_key[0] == cur_pset_codename
+                for cur_ids in cur_ids_by_value.values()
+                for cur_id in cur_ids}
+
+    def test_ifc_property_index_value_types(self):
+
+        # a same property, as IfcBoolean, IfcInteger and IfcReal values
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        raw_objs = []
+        for cur_type_name, cur_value in (
+                ('IfcBoolean', True), ('IfcInteger', 1), ('IfcReal', 1.),
+                ('IfcInteger', 1),):
+            raw_obj = ifcos_file.create_entity(
+                'IfcWall', GlobalId=ifcopenshell.guid.new())
+            raw_pset = ifcos_file.create_entity(
+                'IfcPropertySet', GlobalId=ifcopenshell.guid.new(),
+                Name='Pset_Test',
+                HasProperties=(ifcos_file.create_entity(
+                    'IfcPropertySingleValue', Name='Flag',
+                    NominalValue=ifcos_file.create_entity(
+                        cur_type_name, cur_value)),))
+            ifcos_file.create_entity(
+                'IfcRelDefinesByProperties',
+                GlobalId=ifcopenshell.guid.new(), RelatedObjects=(raw_obj,),
+                RelatingPropertyDefinition=raw_pset)
+            raw_objs.append(raw_obj)
+        bool_id, int_id, real_id, int_id2 = (
+            cur_raw_obj.id() for cur_raw_obj in raw_objs)
+
+        index = IfcPropertyIndex(ifcos_file, IfcSchema('IFC4'))
+        # values equal in Python are not mixed
+        assert index.get_entity_ids_by_value('flag', True) == (bool_id,)
+        assert index.get_entity_ids_by_value('flag', 1) == (
+            int_id, int_id2,)
+        assert index.get_entity_ids_by_value('flag', 1.) == (real_id,)
+        values = index.get_values('flag', pset_codename='psettest')
+        assert [type(cur_value) for cur_value in values] == [
+            bool, int, float]
+        # objects keep their own value
+        values_by_id = index.get_entity_values('flag')
+        assert values_by_id[bool_id] is True
+        assert type(values_by_id[int_id]) is int
+        assert type(values_by_id[real_id]) is float
+        # booleans are not in numeric ranges
+        assert set(index.get_entity_ids_in_range(
+            'flag', min_value=0)) == {int_id, real_id, int_id2}
+
+    def test_ifc_property_index_list_values(self):
+
+        # a list value (`IfcComplexNumber` is an ARRAY of REAL)
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        raw_obj = ifcos_file.create_entity(
+            'IfcWall', GlobalId=ifcopenshell.guid.new())
+        raw_pset = ifcos_file.create_entity(
+            'IfcPropertySet', GlobalId=ifcopenshell.guid.new(),
+            Name='Pset_Test',
+            HasProperties=(ifcos_file.create_entity(
+                'IfcPropertySingleValue', Name='Impedance',
+                NominalValue=ifcos_file.create_entity(
+                    'IfcComplexNumber', (1., 2.,))),))
+        ifcos_file.create_entity(
+            'IfcRelDefinesByProperties',
+            GlobalId=ifcopenshell.guid.new(), RelatedObjects=(raw_obj,),
+            RelatingPropertyDefinition=raw_pset)
+
+        index = IfcPropertyIndex(ifcos_file, IfcSchema('IFC4'))
+        assert index.get_values('impedance') == ((1., 2.,),)
+        # list values are looked up as lists or tuples
+        assert index.get_entity_ids_by_value(
+            'impedance', [1., 2.]) == (raw_obj.id(),)
+        assert index.get_entity_ids_by_value(
+            'impedance', (1., 2.,)) == (raw_obj.id(),)
+        assert index.get_entity_ids_by_value('impedance', [2., 1.]) == ()
+
+    def test_ifc_property_index_entity_values_order(self):
+
+        # a same property in several property sets, related to objects in
+        #  another order than the property sets are first found in the file
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+
+        def _create_pset(name, value):
+            return ifcos_file.create_entity(
+                'IfcPropertySet', GlobalId=ifcopenshell.guid.new(),
+                Name=name,
+                HasProperties=(ifcos_file.create_entity(
+                    'IfcPropertySingleValue', Name='Area',
+                    NominalValue=ifcos_file.create_entity(
+                        'IfcAreaMeasure', value)),))
+
+        def _relate(raw_obj, raw_pset):
+            ifcos_file.create_entity(
+                'IfcRelDefinesByProperties',
+                GlobalId=ifcopenshell.guid.new(), RelatedObjects=(raw_obj,),
+                RelatingPropertyDefinition=raw_pset)
+
+        raw_obj, raw_obj2 = (
+            ifcos_file.create_entity(
+                'IfcWall', GlobalId=ifcopenshell.guid.new())
+            for _ in range(2))
+        raw_pset_b = _create_pset('Pset_B', 1.)
+        raw_pset_a = _create_pset('Pset_A', 2.)
+        raw_pset_a2 = _create_pset('Pset_A', 3.)
+        _relate(raw_obj2, raw_pset_b)
+        _relate(raw_obj2, raw_pset_a)
+        _relate(raw_obj, raw_pset_a2)
+        _relate(raw_obj, raw_pset_a)
+        _relate(raw_obj, raw_pset_b)
+
+        schema = IfcSchema('IFC4')
+        index = IfcPropertyIndex(ifcos_file, schema)
+        # values are the ones objects give, from their own property sets
+        #  order (not the order property sets are found in the file)
+        for pset_codename, expected_values in (
+                (None, (3., 1.,)),
+                ('pseta', (3., 2.,)),
+                ('psetb', (1., 1.,)),):
+            values_by_id = index.get_entity_values(
+                'area', pset_codename=pset_codename)
+            assert values_by_id == {
+                raw_obj.id(): expected_values[0],
+                raw_obj2.id(): expected_values[1]}
+            for cur_raw_obj in (raw_obj, raw_obj2,):
+                assert values_by_id[cur_raw_obj.id()] == IfcObjectEntity(
+                    cur_raw_obj, schema).get_property_value(
+                    'area', pset_codename=pset_codename)[0]
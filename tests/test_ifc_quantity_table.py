@@ -0,0 +1,147 @@
+"""Tests on IfcQuantityTable"""
+
+import array
+import math
+
+import pytest
+import ifcopenshell
+import ifcopenshell.guid
+
+from ifc_datareader import IfcDataReader
+from ifc_datareader import ifc_quantity_table
+from ifc_datareader.ifc_quantity_table import IfcQuantityTable
+
+
+class TestIfcQuantityTable():
+
+    def test_ifc_quantity_table(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        table = IfcQuantityTable(
+            data_reader._ifcos_file, data_reader.ifc_schema)
+        assert '<{}>('.format(table.__class__.__name__) in repr(table)
+        assert table.groups == (None,)
+        # same quantities as the wrappers
+        quantities = [
+            (cur_entity._raw.id(), cur_qty,)
+            for cur_entity in data_reader.read_entity('IfcObject')
+            for cur_qty in cur_entity.quantities or ()]
+        assert len(table) == len(quantities) > 0
+        columns = table.get_columns()
+        assert tuple(columns) == (
+            'object_id', 'codename_code', 'kind_code', 'value', 'unit_code',)
+        for cur_row, (cur_id, cur_qty,) in enumerate(quantities):
+            assert columns['object_id'][cur_row] == cur_id
+            assert table.codename_table.get_codename_by_code(
+                columns['codename_code'][cur_row]) == cur_qty.codename
+            assert cur_qty.type_name == 'IfcQuantity{}'.format(
+                IfcQuantityTable.KINDS[columns['kind_code'][cur_row]])
+            assert math.isclose(columns['value'][cur_row], cur_qty.value)
+            unit_code = columns['unit_code'][cur_row]
+            if cur_qty.unit is None:
+                assert unit_code == -1
+            else:
+                assert table.units[unit_code] == cur_qty.unit
+
+        # objects filtered by type
+        table = IfcQuantityTable(
+            data_reader._ifcos_file, data_reader.ifc_schema,
+            accepted_type_names={'IfcWall'})
+        assert len(table) == 0
+        assert table.groups == ()
+        assert len(table.get_column('value')) == 0
+
+    def test_ifc_quantity_table_groups(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        spaces = data_reader.read_spaces()
+        table = IfcQuantityTable(
+            data_reader._ifcos_file, data_reader.ifc_schema,
+            group_key=lambda raw: raw.id() % 2)
+        assert set(table.groups) == {0, 1}
+        nb_rows = 0
+        for cur_key in table.groups:
+            group = table.get_group(cur_key)
+            assert group.groups == (cur_key,)
+            assert len(group) > 0
+            assert all(
+                cur_id % 2 == cur_key
+                for cur_id in group.get_column('object_id'))
+            nb_rows += len(group)
+        assert nb_rows == len(table) == sum(
+            len(cur_space.quantities) for cur_space in spaces)
+        # groups share the table memory
+        group = table.get_group(table.groups[-1])
+        assert group.get_column('value').base is not None
+        assert group._columns['value'].obj is table._columns['value'].obj
+
+        with pytest.raises(KeyError):
+            table.get_group('bad')
+
+    def test_ifc_quantity_table_storey_groups(self, ifc_filepath, tmpdir):
+
+        # a quantity set related to each element (of several types)
+        ifcos_file = ifcopenshell.open(ifc_filepath)
+        for cur_raw_elmt in ifcos_file.by_type('IfcElement'):
+            ifcos_file.create_entity(
+                'IfcRelDefinesByProperties',
+                GlobalId=ifcopenshell.guid.new(),
+                RelatedObjects=[cur_raw_elmt],
+                RelatingPropertyDefinition=ifcos_file.create_entity(
+                    'IfcElementQuantity', GlobalId=ifcopenshell.guid.new(),
+                    Name='BaseQuantities',
+                    Quantities=[ifcos_file.create_entity(
+                        'IfcQuantityLength', Name='Width',
+                        LengthValue=float(cur_raw_elmt.id()))]))
+        filepath = str(tmpdir / 'sample_quantities.ifc')
+        ifcos_file.write(filepath)
+
+        data_reader = IfcDataReader(filepath)
+        table = data_reader.read_quantity_table(group_by='storey')
+        storey_ids_by_id = {
+            cur_id: data_reader._get_storey_id(cur_id)
+            for cur_id in table.get_column('object_id').tolist()}
+        assert set(table.groups) == set(storey_ids_by_id.values())
+        for cur_storey_id in table.groups:
+            group = table.get_group(cur_storey_id)
+            object_ids = group.get_column('object_id').tolist()
+            assert set(object_ids) == {
+                cur_id for cur_id, cur_group_id in storey_ids_by_id.items()
+                if cur_group_id == cur_storey_id}
+            # objects in STEP id order: types are not contiguous in a storey
+            assert object_ids == sorted(object_ids)
+        storey_id = ifcos_file.by_type('IfcBuildingStorey')[0].id()
+        type_names = {
+            ifcos_file.by_id(cur_id).is_a()
+            for cur_id in table.get_group(storey_id).get_column(
+                'object_id').tolist()}
+        assert {'IfcSpace', 'IfcWallStandardCase', 'IfcDoor'} <= type_names
+
+    def test_ifc_quantity_table_values_si(self, ifc_filepath2):
+
+        data_reader = IfcDataReader(ifc_filepath2)
+        table = data_reader.read_quantity_table()
+        quantities = data_reader.read_spaces()[0].quantities
+        values_si = table.get_values_si(data_reader.unit_context)
+        assert len(values_si) == len(quantities) == len(table)
+        assert list(values_si) == pytest.approx([
+            cur_qty.value_si for cur_qty in quantities])
+        # project's units in feet
+        assert values_si[0] == pytest.approx(
+            table.get_column('value')[0] * 0.09290304)
+
+    def test_ifc_quantity_table_no_numpy(self, ifc_filepath, monkeypatch):
+
+        monkeypatch.setattr(ifc_quantity_table, 'numpy', None)
+        data_reader = IfcDataReader(ifc_filepath)
+        table = IfcQuantityTable(
+            data_reader._ifcos_file, data_reader.ifc_schema)
+        column = table.get_column('value')
+        assert isinstance(column, memoryview)
+        assert isinstance(column.obj, array.array)
+        assert column.format == 'd'
+        values_si = table.get_values_si(data_reader.unit_context)
+        assert isinstance(values_si, array.array)
+        assert values_si.tolist() == column.tolist()
+        with pytest.raises(KeyError):
+            table.get_column('bad')
@@ -0,0 +1,145 @@
+"""Tests for IFC schema compiled cache."""
+
+from pathlib import Path
+
+from ifc_datareader.schema import IfcSchema, IFC_SCHEMAS
+from ifc_datareader.schema import ifc_schema_reader
+from ifc_datareader.schema.ifc_schema_cache import (
+    IfcSchemaCache, get_default_cache_dirpath, CACHE_DIR_ENV_VAR)
+
+
+def _read_schema_file(schema_name):
+    schema_filepath = (
+        Path(ifc_schema_reader.__file__).parent / IFC_SCHEMAS[schema_name])
+    with open(str(schema_filepath)) as schema_file:
+        return schema_file.read()
+
+
+class TestIfcSchemaCache:
+
+    def test_ifc_schema_cache(self, tmpdir):
+
+        schema_cache = IfcSchemaCache(str(tmpdir))
+        assert str(schema_cache.cache_dirpath) == str(tmpdir)
+        assert repr(schema_cache) == (
+            '<{self.__class__.__name__}>('
+            'cache_dirpath="{self.cache_dirpath}"'
+            ')'.format(self=schema_cache))
+
+        key = schema_cache.build_key('SCHEMA IFC42;')
+        assert key == schema_cache.build_key('SCHEMA IFC42;')
+        assert key != schema_cache.build_key('SCHEMA IFC43;')
+        assert key != schema_cache.build_key('SCHEMA IFC42;', variant='lazy')
+        assert schema_cache.load(key) is None
+
+        # external references are not stored, but bound again when loaded
+        ext_obj, other_ext_obj = object(), object()
+        assert schema_cache.dump(
+            key, ('data', ext_obj,), external_refs={'obj': ext_obj})
+        assert schema_cache.get_filepath(key).is_file()
+        assert schema_cache.load(
+            key, external_refs={'obj': other_ext_obj}) == (
+                'data', other_ext_obj,)
+        # missing external reference
+        assert schema_cache.load(key) is None
+
+        schema_cache.clear()
+        assert not schema_cache.get_filepath(key).exists()
+
+    def test_ifc_schema_cache_default_dirpath(self, monkeypatch, tmpdir):
+
+        monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmpdir))
+        assert str(get_default_cache_dirpath()) == str(tmpdir)
+        assert str(IfcSchemaCache().cache_dirpath) == str(tmpdir)
+
+        monkeypatch.delenv(CACHE_DIR_ENV_VAR)
+        monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir))
+        assert get_default_cache_dirpath() == tmpdir / 'ifc_datareader'
+
+    def test_ifc_schema_cache_schema(self, tmpdir, schema_custom_filepath):
+
+        schema_cache = IfcSchemaCache(str(tmpdir))
+
+        # first load: schema file is parsed and compiled schema is stored
+        ifc_schema = IfcSchema('IFC2X3', cache=schema_cache)
+        assert ifc_schema.cache is schema_cache
+        key = schema_cache.build_key(_read_schema_file('IFC2X3'))
+        assert schema_cache.get_filepath(key).is_file()
+
+        # second load: compiled schema is loaded from cache
+        cached_schema = IfcSchema('IFC2X3', cache=schema_cache)
+        assert cached_schema == ifc_schema
+        assert cached_schema.entity_names == ifc_schema.entity_names
+        assert cached_schema.defined_type_names == (
+            ifc_schema.defined_type_names)
+        assert cached_schema.select_type_names == ifc_schema.select_type_names
+        assert cached_schema.enumeration_names == ifc_schema.enumeration_names
+        # schema elements are bound to the new schema instance
+        ent_site = cached_schema.get_entity('IfcSite')
+        assert ent_site.schema is cached_schema
+        assert ent_site.supertype is cached_schema.get_entity(
+            'IfcSpatialStructureElement')
+        assert ent_site.get_attribute('RefLatitude').schema is cached_schema
+        assert ent_site.get_all_attribute_names() == (
+            ifc_schema.get_entity('IfcSite').get_all_attribute_names())
+        assert ent_site.inherits('IfcProduct')
+
+        # lazy schemas are compiled apart (entities are not stored)
+        lazy_schema = IfcSchema('IFC2X3', cache=schema_cache, lazy=True)
+        assert schema_cache.get_filepath(schema_cache.build_key(
+            _read_schema_file('IFC2X3'), variant='lazy')).is_file()
+        cached_lazy_schema = IfcSchema('IFC2X3', cache=schema_cache, lazy=True)
+        assert cached_lazy_schema._entities_by_name == {}
+        assert cached_lazy_schema.entity_names == lazy_schema.entity_names
+        lazy_ent_site = cached_lazy_schema.get_entity('IfcSite')
+        assert lazy_ent_site.get_all_attribute_names() == (
+            ent_site.get_all_attribute_names())
+
+        # schema file content changes: compiled schema is rebuilt
+        custom_schema = IfcSchema(
+            None, schema_filepath=schema_custom_filepath, cache=schema_cache)
+        assert custom_schema.version == 'IFC42'
+        with open(schema_custom_filepath, 'a') as schema_file:
+            schema_file.write('\n')
+        custom_schema_bis = IfcSchema(
+            None, schema_filepath=schema_custom_filepath, cache=schema_cache)
+        assert custom_schema_bis.version == 'IFC42'
+        assert len(tmpdir.listdir('schema-*.pickle')) == 4
+
+    def test_ifc_schema_cache_errors(self, tmpdir):
+
+        schema_cache = IfcSchemaCache(str(tmpdir))
+        key = schema_cache.build_key('')
+
+        # corrupted artifact is ignored, and rebuilt
+        with open(str(schema_cache.get_filepath(key)), 'wb') as cache_file:
+            cache_file.write(b'not a pickle')
+        assert schema_cache.load(key) is None
+        # artifact of a newer pickle protocol (written by another Python)
+        with open(str(schema_cache.get_filepath(key)), 'wb') as cache_file:
+            cache_file.write(b'\x80\x63N.')
+        assert schema_cache.load(key) is None
+        # artifacts are readable by all supported Python versions
+        assert schema_cache.dump(key, 'data')
+        with open(str(schema_cache.get_filepath(key)), 'rb') as cache_file:
+            assert cache_file.read(2) == b'\x80\x04'
+
+        ifc_schema = IfcSchema('IFC2X3', cache=schema_cache)
+        key = schema_cache.build_key(_read_schema_file('IFC2X3'))
+        with open(str(schema_cache.get_filepath(key)), 'wb') as cache_file:
+            cache_file.write(b'not a pickle')
+        assert IfcSchema('IFC2X3', cache=schema_cache) == ifc_schema
+        assert schema_cache.load(
+            key, external_refs={'schema': ifc_schema}) is not None
+
+        # unwritable cache directory: schema is still loaded
+        not_a_dir = tmpdir / 'not_a_dir'
+        not_a_dir.write('')
+        bad_cache = IfcSchemaCache(str(not_a_dir))
+        assert not bad_cache.dump(key, 'data')
+        assert IfcSchema('IFC2X3', cache=bad_cache) == ifc_schema
+
+        # no cache at all
+        no_cache_schema = IfcSchema('IFC2X3', cache=False)
+        assert no_cache_schema.cache is None
+        assert no_cache_schema == ifc_schema
@@ -34,6 +34,13 @@ class TestIfcSchemaBaseElement:
 
         assert schema_elt != 'fifth_element'
 
+        # schema elements are read-only
+        with pytest.raises(AttributeError):
+            schema_elt.name = 'sixth_element'
+        with pytest.raises(AttributeError):
+            del schema_elt.name
+        assert schema_elt.name == 'fifth_element'
+
     def test_ifc_schema_base_object_errors(self):
 
         # IfcSchemaBaseObject is an abstract class
@@ -68,6 +75,11 @@ class TestIfcSchemaDefinedType:
         assert other_def_type.is_ref
         assert other_def_type.ref_type == def_type
 
+        # derived fields are computed once, and read-only
+        with pytest.raises(AttributeError):
+            def_type.type_name = 'INTEGER'
+        assert not hasattr(def_type, '__dict__')
+
     def test_ifc_schema_defined_type_errors(self, schema_2x3):
 
         bad_def_type = IfcSchemaDefinedType(
@@ -91,7 +103,6 @@ class TestIfcSchemaSelectType:
         sel_type = IfcSchemaSelectType('IfcUnit', raw_types, schema_2x3)
         assert sel_type.name == 'IfcUnit'
         assert sel_type.schema == schema_2x3
-        assert sel_type._raw_types == raw_types
         assert sel_type.entity_names == (
             'IfcDerivedUnit', 'IfcMonetaryUnit', 'IfcNamedUnit',)
         assert len(sel_type.entities) == 3
@@ -109,20 +120,13 @@ class TestIfcSchemaSelectType:
 
     def test_ifc_schema_select_type_errors(self, schema_2x3):
 
-        bad_sel_type = IfcSchemaSelectType('IfcCustom', None, schema_2x3)
-        assert bad_sel_type.name == 'IfcCustom'
-        assert bad_sel_type.schema == schema_2x3
-        assert bad_sel_type._raw_types is None
         # /!\ as raw_types is None, no entity names could be found...
         with pytest.raises(AttributeError):
-            bad_sel_type.entity_names
-        with pytest.raises(AttributeError):
-            bad_sel_type.entities
+            IfcSchemaSelectType('IfcCustom', None, schema_2x3)
 
         bad_sel_type = IfcSchemaSelectType('IfcCustom', 'IfcBad', schema_2x3)
         assert bad_sel_type.name == 'IfcCustom'
         assert bad_sel_type.schema == schema_2x3
-        assert bad_sel_type._raw_types == 'IfcBad'
         assert bad_sel_type.entity_names == ('IfcBad',)
         # /!\ as raw_types is unknown, no entity instance could be found...
         with pytest.raises(KeyError):
@@ -137,7 +141,6 @@ class TestIfcSchemaEnum:
         enum = IfcSchemaEnum('IfcBoilerTypeEnum', raw_values, schema_2x3)
         assert enum.name == 'IfcBoilerTypeEnum'
         assert enum.schema == schema_2x3
-        assert enum._raw_values == raw_values
         assert enum.values == ('NOTDEFINED', 'STEAM', 'USERDEFINED', 'WATER',)
 
         assert repr(enum) == (
@@ -148,13 +151,9 @@ class TestIfcSchemaEnum:
 
     def test_ifc_schema_enum_errors(self, schema_2x3):
 
-        bad_enum = IfcSchemaEnum('IfcCustom', None, schema_2x3)
-        assert bad_enum.name == 'IfcCustom'
-        assert bad_enum.schema == schema_2x3
-        assert bad_enum._raw_values is None
         # /!\ as raw_values is None, no enum values could be found...
         with pytest.raises(AttributeError):
-            bad_enum.values
+            IfcSchemaEnum('IfcCustom', None, schema_2x3)
 
 
 class TestIfcSchemaEntityAttribute:
@@ -334,7 +333,6 @@ class TestIfcSchemaEntity:
         ent = IfcSchemaEntity('IfcSite', raw_ent, schema_2x3)
         assert ent.name == 'IfcSite'
         assert ent.schema == schema_2x3
-        assert ent._raw_data == raw_ent
         assert ent.supertype_name == 'IfcSpatialStructureElement'
         assert isinstance(ent.supertype, IfcSchemaBaseObject)
 
@@ -457,7 +455,6 @@ class TestIfcSchemaEntity:
         ent = IfcSchemaEntity(ent_name, raw_data, schema_2x3)
         assert ent.name == ent_name
         assert ent.schema == schema_2x3
-        assert ent._raw_data == raw_data
         assert ent.supertype_name == 'IfcObjectDefinition'
         assert isinstance(ent.supertype, IfcSchemaBaseObject)
 
@@ -481,6 +478,37 @@ class TestIfcSchemaEntity:
             assert isinstance(inv, IfcSchemaEntityInverse)
             assert inv.name in expected_all_inv_names
 
+    def test_ifc_schema_entity_layout(self, schema_4):
+
+        ent = schema_4.get_entity('IfcWallStandardCase')
+
+        # STEP positional order, inherited attributes first
+        assert ent.get_all_attribute_names(step_order=True) == (
+            'GlobalId', 'OwnerHistory', 'Name', 'Description', 'ObjectType',
+            'ObjectPlacement', 'Representation', 'Tag', 'PredefinedType',)
+        assert ent.get_all_attribute_names(
+            step_order=True, include_classname=True)[-2:] == (
+                'IfcElement.Tag', 'IfcWall.PredefinedType',)
+        assert ent.get_all_attribute_names(
+            include_optional=False, step_order=True) == ('GlobalId',)
+        assert ent.get_all_inverse_names(step_order=True)[:3] == (
+            'HasAssignments', 'Nests', 'IsNestedBy',)
+        assert sorted(ent.get_all_inverse_names(step_order=True)) == sorted(
+            ent.get_all_inverse_names())
+
+        # layouts are computed once and share schema's attribute instances
+        all_attrs = ent.get_all_attributes(step_order=True)
+        assert ent.get_all_attributes(step_order=True) is all_attrs
+        assert all_attrs[0] is schema_4.get_entity('IfcRoot').get_attribute(
+            'GlobalId')
+        assert all_attrs[0].entity is schema_4.get_entity('IfcRoot')
+        assert ent.get_all_attribute_names() is (
+            ent.get_all_attribute_names())
+        assert ent.get_all_inverse() is ent.get_all_inverse()
+        assert ent.get_all_attributes() != all_attrs
+        assert sorted(id(attr) for attr in ent.get_all_attributes()) == (
+            sorted(id(attr) for attr in all_attrs))
+
     def test_ifc_schema_entity_errors(self, schema_2x3):
 
         raw_ent = (
@@ -3,9 +3,10 @@
 import pytest
 
 from ifc_datareader.schema import IfcSchema
+from ifc_datareader.schema.ifc_express_parser import ExpressAggregate
 from ifc_datareader.schema.ifc_schema_objects import (
     IfcSchemaDefinedType, IfcSchemaSelectType, IfcSchemaEnum, IfcSchemaEntity,
-    IfcSchemaEntityAttribute, IfcSchemaEntityInverse)
+    IfcSchemaEntityAttribute, IfcSchemaEntityInverse, IfcSchemaResolvedType)
 
 
 class TestIfcSchemaReader:
@@ -236,6 +237,221 @@ class TestIfcSchemaReader:
             assert isinstance(cur_subtype, IfcSchemaEntity)
         assert len(ent_bld_elmt_subtypes) == len(ent_bld_elmt_subtype_names)
 
+    def test_ifc_schema_reader_inheritance(self, schema_4):
+
+        assert schema_4.get_entity_ancestor_names('IfcWallStandardCase') == (
+            'IfcWall', 'IfcBuildingElement', 'IfcElement', 'IfcProduct',
+            'IfcObject', 'IfcObjectDefinition', 'IfcRoot',)
+        assert schema_4.get_entity_ancestor_names('IfcRoot') == ()
+        assert schema_4.get_entity_subtype_names('IfcWall') == (
+            'IfcWallElementedCase', 'IfcWallStandardCase',)
+        assert schema_4.get_entity_subtype_names('IfcWallStandardCase') == ()
+        assert len(schema_4.get_entity_subtype_names('IfcRoot')) == 3
+
+        # index is consistent with a walk through supertypes
+        for ent in schema_4.entities:
+            ancestor_names = []
+            supertype = ent.supertype
+            while supertype is not None:
+                ancestor_names.append(supertype.name)
+                supertype = supertype.supertype
+            assert schema_4.get_entity_ancestor_names(ent.name) == tuple(
+                ancestor_names)
+            for ancestor_name in ancestor_names:
+                assert ent.inherits(ancestor_name)
+                assert schema_4.entity_inherits(ent.name, ancestor_name)
+                assert ent.name in schema_4.get_entity_subtype_names(
+                    ancestor_name, deep_inheritance=True)
+            if ent.supertype_name is not None:
+                assert ent.name in schema_4.get_entity_subtype_names(
+                    ent.supertype_name)
+            deep_subtype_names = ent.get_subtype_names(deep_inheritance=True)
+            assert deep_subtype_names == tuple(sorted(deep_subtype_names))
+            assert all(
+                schema_4.entity_inherits(name, ent.name)
+                for name in deep_subtype_names)
+        assert sum(
+            len(ent.get_subtype_names(deep_inheritance=True))
+            for ent in schema_4.entities) == sum(
+                len(schema_4.get_entity_ancestor_names(name))
+                for name in schema_4.entity_names)
+
+        # dense type IDs and type masks
+        type_ids = [
+            schema_4.get_entity_type_id(name)
+            for name in schema_4.entity_names]
+        assert type_ids == list(range(len(schema_4.entity_names)))
+        assert schema_4.entity_is_a('IfcWallStandardCase', 'IfcWall')
+        assert schema_4.entity_is_a('IfcWallStandardCase', 'IfcRoot')
+        assert schema_4.entity_is_a('IfcWall', 'IfcWall')
+        assert not schema_4.entity_is_a('IfcWall', 'IfcWallStandardCase')
+        assert not schema_4.entity_is_a('IfcWall', 'IfcSlab')
+        assert not schema_4.entity_is_a('IfcWall', 'IfcLabel')
+        assert not schema_4.entity_is_a('IfcWall', 'unknown')
+        assert not schema_4.entity_is_a('unknown', 'IfcRoot')
+        assert not schema_4.entity_inherits('IfcWall', 'IfcWall')
+
+        # unknown entity
+        with pytest.raises(KeyError):
+            schema_4.get_entity_type_id('unknown')
+        with pytest.raises(KeyError):
+            schema_4.get_entity_ancestor_names('unknown')
+        with pytest.raises(KeyError):
+            schema_4.get_entity_subtype_names('unknown')
+
+    def test_ifc_schema_reader_attribute_indexes(self, schema_4):
+
+        # STEP order: inherited attributes first, in declaration order
+        indexes = schema_4.get_entity_attribute_indexes('IfcWallStandardCase')
+        assert list(indexes) == [
+            'GlobalId', 'OwnerHistory', 'Name', 'Description', 'ObjectType',
+            'ObjectPlacement', 'Representation', 'Tag', 'PredefinedType']
+        assert list(indexes.values()) == list(range(len(indexes)))
+        # table is computed once
+        assert schema_4.get_entity_attribute_indexes(
+            'IfcWallStandardCase') is indexes
+        for entity in schema_4.entities:
+            assert tuple(schema_4.get_entity_attribute_indexes(
+                entity.name)) == entity.get_all_attribute_names(
+                    step_order=True)
+
+        with pytest.raises(KeyError):
+            schema_4.get_entity_attribute_indexes('unknown')
+
+    def test_ifc_schema_reader_attribute_indexes_step_order(
+            self, schema_2x3, sample_ifcos):
+
+        # positions match the attributes of the STEP entity instances
+        for raw_wall in sample_ifcos.by_type('IfcWall'):
+            indexes = schema_2x3.get_entity_attribute_indexes(raw_wall.is_a())
+            info = raw_wall.get_info(recursive=False)
+            del info['id'], info['type']
+            assert list(indexes) == list(info)
+            for cur_name, cur_index in indexes.items():
+                assert raw_wall[cur_index] == info[cur_name]
+
+    def test_ifc_schema_reader_raw_attribute(self, schema_2x3, sample_ifcos):
+
+        for raw_wall in sample_ifcos.by_type('IfcWall'):
+            info = raw_wall.get_info(recursive=False)
+            for cur_name in schema_2x3.get_entity_attribute_indexes(
+                    raw_wall.is_a()):
+                assert schema_2x3.get_raw_attribute(
+                    raw_wall, cur_name) == info[cur_name]
+            assert schema_2x3.get_raw_attribute(
+                raw_wall, 'Name', type_name='IfcWall') == info['Name']
+            assert schema_2x3.get_raw_attribute(raw_wall, 'unknown') is None
+            with pytest.raises(KeyError):
+                schema_2x3.get_raw_attribute(
+                    raw_wall, 'Name', type_name='unknown')
+
+    def test_ifc_schema_reader_resolve_type(self, schema_4):
+
+        # defined type chains are followed down to a simple type
+        assert schema_4.resolve_type('IfcPositiveLengthMeasure') == (
+            IfcSchemaResolvedType('REAL', None, ()))
+        assert schema_4.resolve_type('IfcLabel') == (
+            IfcSchemaResolvedType('STRING', None, ()))
+        assert schema_4.resolve_type('IfcBoolean').kind == 'BOOLEAN'
+        assert schema_4.resolve_type('IfcLogical').kind == 'LOGICAL'
+        assert schema_4.resolve_type('IfcInteger').kind == 'INTEGER'
+        assert schema_4.resolve_type('IfcBinary').kind == 'BINARY'
+        assert schema_4.resolve_type('REAL').kind == 'REAL'
+        # aggregates are gathered on the way
+        assert schema_4.resolve_type('IfcLineIndex') == IfcSchemaResolvedType(
+            'INTEGER', None, (ExpressAggregate('LIST', '2', '?', False),))
+        assert schema_4.resolve_type('IfcPropertySetDefinitionSet') == (
+            IfcSchemaResolvedType(
+                'ENTITY', 'IfcPropertySetDefinition',
+                (ExpressAggregate('SET', '1', '?', False),)))
+        # other kinds of elements
+        assert schema_4.resolve_type('IfcValue') == IfcSchemaResolvedType(
+            'SELECT', 'IfcValue', ())
+        assert schema_4.resolve_type('IfcWallTypeEnum') == (
+            IfcSchemaResolvedType('ENUM', 'IfcWallTypeEnum', ()))
+        assert schema_4.resolve_type('IfcWall') == IfcSchemaResolvedType(
+            'ENTITY', 'IfcWall', ())
+        # all schema types are resolved
+        for type_names in (
+                schema_4.defined_type_names, schema_4.select_type_names,
+                schema_4.enumeration_names, schema_4.entity_names,):
+            for type_name in type_names:
+                assert schema_4.resolve_type(type_name) is not None
+
+        # attribute types are resolved too, with their own aggregates
+        site = schema_4.get_entity('IfcSite')
+        assert site.get_attribute('RefLatitude').resolved_type == (
+            IfcSchemaResolvedType(
+                'INTEGER', None, (ExpressAggregate('LIST', '3', '4', False),)))
+        assert site.get_attribute('SiteAddress').resolved_type == (
+            IfcSchemaResolvedType('ENTITY', 'IfcPostalAddress', ()))
+        segments = schema_4.get_entity('IfcIndexedPolyCurve').get_attribute(
+            'Segments')
+        assert segments.resolved_type == IfcSchemaResolvedType(
+            'SELECT', 'IfcSegmentIndexSelect',
+            (ExpressAggregate('LIST', '1', '?', False),))
+
+        with pytest.raises(KeyError):
+            schema_4.resolve_type('unknown')
+
+        # unified element index
+        assert schema_4.get_element('IfcLabel') is (
+            schema_4.get_defined_type('IfcLabel'))
+        assert schema_4.get_element('IfcValue') is (
+            schema_4.get_select_type('IfcValue'))
+        assert schema_4.get_element('IfcWallTypeEnum') is (
+            schema_4.get_enumeration('IfcWallTypeEnum'))
+        assert schema_4.get_element('IfcWall') is (
+            schema_4.get_entity('IfcWall'))
+        assert schema_4.get_element('unknown') is None
+
+    def test_ifc_schema_reader_lazy(self, schema_4):
+
+        lazy_schema = IfcSchema('IFC4', cache=False, lazy=True)
+        assert lazy_schema.lazy
+        assert not schema_4.lazy
+        assert lazy_schema == schema_4
+        assert repr(lazy_schema) == repr(schema_4)
+
+        # schema raw data is only kept to parse entities on demand
+        assert schema_4._raw_data is None
+        assert lazy_schema._raw_data is not None
+
+        # only entity names and inheritance are known at load
+        assert lazy_schema._entities_by_name == {}
+        assert lazy_schema.entity_names == schema_4.entity_names
+        assert lazy_schema.get_entity_ancestor_names('IfcWall') == (
+            schema_4.get_entity_ancestor_names('IfcWall'))
+        assert lazy_schema.get_entity_subtype_names(
+            'IfcElement', deep_inheritance=True) == (
+                schema_4.get_entity_subtype_names(
+                    'IfcElement', deep_inheritance=True))
+        assert lazy_schema.entity_inherits(
+            'IfcWallStandardCase', 'IfcWall', deep_inheritance=False)
+        assert lazy_schema.entity_is_a('IfcWall', 'IfcProduct')
+        assert lazy_schema._entities_by_name == {}
+
+        # an entity is parsed on first access, then kept
+        ent_wall = lazy_schema.get_entity('IfcWall')
+        assert list(lazy_schema._entities_by_name) == ['IfcWall']
+        assert lazy_schema.get_entity('IfcWall') is ent_wall
+        assert lazy_schema.get_element('IfcSlab').name == 'IfcSlab'
+        assert ent_wall.get_all_attribute_names() == (
+            schema_4.get_entity('IfcWall').get_all_attribute_names())
+        assert ent_wall.get_all_inverse_names() == (
+            schema_4.get_entity('IfcWall').get_all_inverse_names())
+        assert ent_wall.supertype.name == 'IfcBuildingElement'
+
+        # enumerating entities parses all of them
+        assert [ent.name for ent in lazy_schema.entities] == list(
+            schema_4.entity_names)
+        assert len(lazy_schema._entities_by_name) == len(
+            schema_4.entity_names)
+
+        with pytest.raises(KeyError):
+            lazy_schema.get_entity('unknown')
+        assert lazy_schema.get_element('unknown') is None
+
     def test_ifc_schema_reader_version(
             self, schema_2x3, schema_4, schema_custom_filepath):
 
@@ -0,0 +1,102 @@
+"""Tests for IFC schema registry."""
+
+import threading
+import tracemalloc
+
+import pytest
+
+from ifc_datareader.schema import IfcSchema, IfcSchemaRegistry, get_schema
+
+
+class TestIfcSchemaRegistry:
+
+    def test_ifc_schema_registry(self, schema_custom_filepath):
+
+        registry = IfcSchemaRegistry()
+        assert len(registry) == 0
+        assert 'IFC2X3' not in registry
+
+        schema_2x3 = registry.get_schema('IFC2X3')
+        assert isinstance(schema_2x3, IfcSchema)
+        assert schema_2x3.version == 'IFC2X3'
+        assert 'IFC2X3' in registry
+        assert len(registry) == 1
+        # the same instance is handed out
+        assert registry.get_schema('IFC2X3') is schema_2x3
+
+        schema_4 = registry.get_schema('IFC4')
+        assert schema_4 is not schema_2x3
+        assert schema_4.version == 'IFC4'
+        assert registry.get_schema('IFC4') is schema_4
+
+        # custom schema files are registered by path
+        custom_schema = registry.get_schema(
+            None, schema_filepath=schema_custom_filepath)
+        assert custom_schema.version == 'IFC42'
+        assert registry.get_schema(
+            None, schema_filepath=schema_custom_filepath) is custom_schema
+        assert len(registry) == 3
+
+        # lazy and eager schemas are distinct instances
+        lazy_schema_4 = registry.get_schema('IFC4', lazy=True)
+        assert lazy_schema_4 is not schema_4
+        assert lazy_schema_4.lazy and not schema_4.lazy
+        assert registry.get_schema('IFC4', lazy=True) is lazy_schema_4
+        assert len(registry) == 4
+
+        assert repr(registry) == (
+            '<{self.__class__.__name__}>('
+            'schemas=4'
+            ')'.format(self=registry))
+
+        registry.clear()
+        assert len(registry) == 0
+        assert registry.get_schema('IFC2X3') is not schema_2x3
+
+        # process-wide registry
+        assert get_schema('IFC2X3') is get_schema('IFC2X3')
+
+    def test_ifc_schema_registry_threads(self):
+
+        registry = IfcSchemaRegistry()
+        barrier = threading.Barrier(8)
+        schemas = []
+
+        def _get_schema():
+            barrier.wait()
+            schemas.append(registry.get_schema('IFC4'))
+
+        threads = [threading.Thread(target=_get_schema) for _ in range(8)]
+        for cur_thread in threads:
+            cur_thread.start()
+        for cur_thread in threads:
+            cur_thread.join()
+
+        assert len(schemas) == 8
+        assert all(cur_schema is schemas[0] for cur_schema in schemas)
+        assert len(registry) == 1
+
+    def test_ifc_schema_registry_memory(self):
+
+        registry = IfcSchemaRegistry()
+
+        tracemalloc.start()
+        try:
+            registry.get_schema('IFC4')
+            one_schema_size = tracemalloc.get_traced_memory()[0]
+            for _ in range(20):
+                registry.get_schema('IFC4')
+            all_schemas_size = tracemalloc.get_traced_memory()[0]
+        finally:
+            tracemalloc.stop()
+
+        # memory stays flat: no schema is loaded again
+        assert all_schemas_size < one_schema_size * 1.01
+
+    def test_ifc_schema_registry_errors(self):
+
+        registry = IfcSchemaRegistry()
+        # load a not supported schema version
+        with pytest.raises(ValueError):
+            registry.get_schema('not_available_schema')
+        assert len(registry) == 0
@@ -0,0 +1,50 @@
+"""Tests on IfcSpatialTree"""
+
+from ifc_datareader.ifc_containment_index import IfcContainmentIndex
+from ifc_datareader.ifc_spatial_tree import IfcSpatialTree
+
+
+class TestIfcSpatialTree():
+
+    def test_ifc_spatial_tree(self, schema_2x3, sample_ifcos):
+
+        index = IfcContainmentIndex(sample_ifcos, schema_2x3)
+        tree = IfcSpatialTree(sample_ifcos, index, schema_2x3)
+        assert '<{}>('.format(tree.__class__.__name__) in repr(tree)
+
+        # the project is the only root, all other entities are under it
+        raw_project = sample_ifcos.by_type('IfcProject')[0]
+        assert tree.root_ids == (raw_project.id(),)
+        assert tree.get_depth(raw_project.id()) == 0
+        assert tree.get_ancestor_ids(raw_project.id()) == ()
+        project_descendant_ids = tree.get_descendant_ids(raw_project.id())
+        assert len(project_descendant_ids) == len(tree) - 1
+        assert set(project_descendant_ids) == set(
+            index._parent_ids_by_id)
+
+        # an IfcSpace (line 124), in a storey
+        raw_space = sample_ifcos.by_guid('3VbjARZ9f3feA5ls423TIy')
+        raw_storey = sample_ifcos.by_guid('3bhrzEe_P3q8bqpKn5gzPC')
+        raw_site = sample_ifcos.by_type('IfcSite')[0]
+        raw_building = sample_ifcos.by_type('IfcBuilding')[0]
+        assert raw_space.id() in tree
+        assert -1 not in tree
+        assert tree.get_ancestor_ids(raw_space.id()) == (
+            raw_storey.id(), raw_building.id(), raw_site.id(),
+            raw_project.id(),)
+        assert tree.get_depth(raw_space.id()) == 4
+
+        # descendants are recursive, and can be filtered by type
+        space_ids = tree.get_descendant_ids(
+            raw_project.id(), entity_name='IfcSpace')
+        assert raw_space.id() in space_ids
+        assert set(space_ids) == {
+            cur_raw_space.id()
+            for cur_raw_space in sample_ifcos.by_type('IfcSpace')}
+        storey_descendant_ids = tree.get_descendant_ids(raw_storey.id())
+        assert set(index.get_child_ids(raw_storey.id())) < set(
+            storey_descendant_ids)
+        for cur_id in storey_descendant_ids:
+            assert raw_storey.id() in tree.get_ancestor_ids(cur_id)
+        assert tree.get_descendant_ids(
+            raw_storey.id(), entity_name='IfcSite') == ()
@@ -0,0 +1,166 @@
+"""Tests on IfcUnitContext"""
+
+import math
+
+import pytest
+import ifcopenshell
+
+from ifc_datareader import IfcDataReader, IfcSchema
+from ifc_datareader import ifc_unit_context
+from ifc_datareader.ifc_unit_context import IfcUnitContext
+
+
+class TestIfcUnitContext():
+
+    def test_ifc_unit_context(self, ifc_filepath):
+
+        data_reader = IfcDataReader(ifc_filepath)
+        ifcos_file = data_reader._ifcos_file
+        raw_units = ifcos_file.by_type('IfcProject')[0].UnitsInContext.Units
+        context = IfcUnitContext(raw_units, data_reader.ifc_schema)
+        assert '<{}>('.format(context.__class__.__name__) in repr(context)
+
+        # SI units with prefix (millimetre)
+        raw_length_unit = context.get_unit('LENGTHUNIT')
+        assert raw_length_unit.Prefix == 'MILLI'
+        assert context.get_measure_unit('IfcLengthMeasure') is (
+            raw_length_unit)
+        assert context.get_measure_unit('IfcPositiveLengthMeasure') is (
+            raw_length_unit)
+        assert context.get_measure_unit('IfcLabel') is None
+        assert context.get_conversion(raw_length_unit) == (1e-3, 0.,)
+        assert context.get_measure_conversion('IfcLengthMeasure') == (
+            1e-3, 0.,)
+        assert context.to_si(4000., 'IfcLengthMeasure') == 4.
+        assert context.to_si(4000, 'IfcAreaMeasure') == 4000.
+        # kilogram
+        assert context.to_si(2., 'IfcMassMeasure') == 2.
+        # conversion based units (degree)
+        assert math.isclose(
+            context.to_si(180., 'IfcPlaneAngleMeasure'), math.pi)
+        # derived units (W/m2K)
+        assert context.to_si(.5, 'IfcThermalTransmittanceMeasure') == .5
+        # no unit type, or no project's unit: values are SI already
+        assert context.to_si(3, 'IfcInteger') == 3
+        assert context.to_si(3., 'IfcElectricCurrentMeasure') == 3.
+        # not numbers, or not convertible
+        assert context.to_si('3', 'IfcLabel') is None
+        assert context.to_si(True, 'IfcBoolean') is None
+        assert context.to_si(None, 'IfcLengthMeasure') is None
+        assert context.to_si(3., 'IfcMonetaryMeasure') is None
+        # unknown measure types
+        assert context.get_measure_conversion('IfcUnknownMeasure') is None
+        assert context.to_si(3., 'IfcUnknownMeasure') is None
+        # explicit unit
+        raw_area_unit = context.get_unit('AREAUNIT')
+        assert context.to_si(
+            4000., 'IfcLengthMeasure', raw_unit=raw_area_unit) == 4000.
+
+        # a context without project's units
+        context = IfcUnitContext()
+        assert context.get_unit('LENGTHUNIT') is None
+        assert context.to_si(4000., 'IfcLengthMeasure') == 4000.
+        assert context.to_si(
+            4000., 'IfcLengthMeasure', raw_unit=raw_length_unit) == 4.
+
+    def test_ifc_unit_context_conversions(self, ifc_filepath2):
+
+        data_reader = IfcDataReader(ifc_filepath2)
+        context = data_reader.unit_context
+        assert context is data_reader.unit_context
+        # imperial units (conversion based on SI units)
+        assert context.get_unit('LENGTHUNIT').Name == 'FOOT'
+        assert math.isclose(context.to_si(10., 'IfcLengthMeasure'), 3.048)
+        assert math.isclose(
+            context.to_si(1., 'IfcAreaMeasure'), 0.09290304)
+        assert math.isclose(
+            context.to_si(1., 'IfcVolumeMeasure'), 0.028316846592)
+        # degree Celsius
+        assert math.isclose(
+            context.to_si(20., 'IfcThermodynamicTemperatureMeasure'),
+            293.15)
+        # derived units (cubic metres per second)
+        assert context.to_si(2., 'IfcVolumetricFlowRateMeasure') == 2.
+
+    def test_ifc_unit_context_conversion_offset(self):
+
+        # degree Fahrenheit, as defined by IFC (based on the kelvin)
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        raw_kelvin = ifcos_file.create_entity(
+            'IfcSIUnit', UnitType='THERMODYNAMICTEMPERATUREUNIT',
+            Name='KELVIN')
+        raw_fahrenheit = ifcos_file.create_entity(
+            'IfcConversionBasedUnitWithOffset',
+            Dimensions=ifcos_file.create_entity(
+                'IfcDimensionalExponents', 0, 0, 0, 0, 1, 0, 0),
+            UnitType='THERMODYNAMICTEMPERATUREUNIT',
+            Name='DEGREE FAHRENHEIT',
+            ConversionFactor=ifcos_file.create_entity(
+                'IfcMeasureWithUnit',
+                ValueComponent=ifcos_file.create_entity(
+                    'IfcThermodynamicTemperatureMeasure', 5 / 9),
+                UnitComponent=raw_kelvin),
+            ConversionOffset=-459.67)
+        context = IfcUnitContext((raw_fahrenheit,), IfcSchema('IFC4'))
+        assert context.get_conversion(raw_kelvin) == (1., 0.,)
+        assert math.isclose(
+            context.to_si(32., 'IfcThermodynamicTemperatureMeasure'),
+            273.15)
+        assert math.isclose(
+            context.to_si(212., 'IfcThermodynamicTemperatureMeasure'),
+            373.15)
+
+    def test_ifc_unit_context_derived_units(self):
+
+        # kilograms per millimetre
+        ifcos_file = ifcopenshell.file(schema='IFC4')
+        raw_mass_per_length = ifcos_file.create_entity(
+            'IfcDerivedUnit',
+            Elements=(
+                ifcos_file.create_entity(
+                    'IfcDerivedUnitElement',
+                    Unit=ifcos_file.create_entity(
+                        'IfcSIUnit', UnitType='MASSUNIT', Prefix='KILO',
+                        Name='GRAM'),
+                    Exponent=1),
+                ifcos_file.create_entity(
+                    'IfcDerivedUnitElement',
+                    Unit=ifcos_file.create_entity(
+                        'IfcSIUnit', UnitType='LENGTHUNIT', Prefix='MILLI',
+                        Name='METRE'),
+                    Exponent=-1),
+            ),
+            UnitType='MASSPERLENGTHUNIT')
+        context = IfcUnitContext((raw_mass_per_length,), IfcSchema('IFC4'))
+        assert context.get_measure_unit('IfcMassPerLengthMeasure') is (
+            raw_mass_per_length)
+        assert math.isclose(
+            context.to_si(2., 'IfcMassPerLengthMeasure'), 2000.)
+        # derived measure types without project's unit are SI already
+        assert context.to_si(2., 'IfcLinearForceMeasure') == 2.
+
+    def test_ifc_unit_context_to_si_column(self, ifc_filepath, monkeypatch):
+
+        numpy = pytest.importorskip('numpy')
+        data_reader = IfcDataReader(ifc_filepath)
+        context = data_reader.unit_context
+        raw_area_unit = context.get_unit('AREAUNIT')
+        values = numpy.array([1000., 2500., numpy.nan])
+        column = context.to_si_column(values, 'IfcLengthMeasure')
+        assert column[:2].tolist() == [1., 2.5]
+        assert numpy.isnan(column[2])
+        column = context.to_si_column(
+            values, 'IfcLengthMeasure',
+            raw_units=(None, raw_area_unit, None,))
+        assert column[:2].tolist() == [1., 2500.]
+        assert numpy.isnan(context.to_si_column(
+            values, 'IfcMonetaryMeasure')).all()
+
+        monkeypatch.setattr(ifc_unit_context, 'numpy', None)
+        assert context.to_si_column(
+            (1000., None,), 'IfcLengthMeasure') == (1., None,)
+        assert context.to_si_column(
+            (1000., 2500.,), 'IfcLengthMeasure',
+            raw_units=(None, raw_area_unit,)) == (1., 2500.,)
+        assert context.to_si_column(
+            (1000.,), 'IfcMonetaryMeasure') == (None,)
@@ -1,6 +1,8 @@
 """Tests on toolbox."""
 
-from ifc_datareader.tools import clean_str
+import pytest
+
+from ifc_datareader.tools import clean_str, build_codename, build_column
 
 
 class TestTools:
@@ -20,3 +22,28 @@ class TestTools:
             'The Ultimate Question of Life the Universe and Everything'
         # nothing to clean
         assert clean_str('42') == '42'
+
+    def test_tools_build_codename(self):
+
+        assert build_codename('Pset_WallCommon') == 'psetwallcommon'
+        assert build_codename('Is External') == 'isexternal'
+        assert build_codename('Net Floor-Area (m2)') == 'netflooraream2'
+        assert build_codename('') == ''
+        # non ASCII names
+        assert build_codename('Hauteur (étage)') == 'hauteurétage'
+        assert build_codename('Épaisseur_Mur') == 'épaisseurmur'
+        with pytest.raises(AttributeError):
+            build_codename(None)
+
+    def test_tools_build_column(self):
+
+        numpy = pytest.importorskip('numpy')
+        column = build_column([1, None, 2.5])
+        assert column.dtype == numpy.float64
+        assert column[0] == 1 and numpy.isnan(column[1])
+        assert build_column([1, 2]).dtype == numpy.int64
+        # not numbers
+        assert build_column([True, False]) == (True, False,)
+        assert build_column(['a', 1]) == ('a', 1,)
+        assert build_column([None, None]) == (None, None,)
+        assert build_column([]) == ()